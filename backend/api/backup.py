@@ -6,7 +6,7 @@ Provides REST endpoints for managing Neo4j database backups.
 
 import json
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks
@@ -29,6 +29,8 @@ class BackupRequest(BaseModel):
     """Request model for creating a backup."""
     job_id: str
     description: str = None
+    mode: Optional[str] = None  # "snapshot" (online), "chunked" or "tarball"; defaults to NEO4J_BACKUP_MODE
+    namespace: Optional[str] = None  # Only snapshot this graph namespace
 
 
 class RestoreRequest(BaseModel):
@@ -37,11 +39,11 @@ class RestoreRequest(BaseModel):
 
 
 @router.get("/")
-async def list_all_backups() -> Dict[str, Any]:
-    """List all available database backups."""
+async def list_all_backups(limit: Optional[int] = None, offset: int = 0) -> Dict[str, Any]:
+    """List available database backups, newest first, optionally one page at a time."""
     
     try:
-        backups = await database_tracker.list_all_backups(include_missing=False)
+        backups = await database_tracker.list_all_backups(include_missing=False, limit=limit, offset=offset)
         
         return {
             "backups": [
@@ -55,7 +57,8 @@ async def list_all_backups() -> Dict[str, Any]:
                 }
                 for backup in backups
             ],
-            "total_backups": len(backups)
+            "total_backups": len(backups),
+            "offset": offset
         }
     except Exception as e:
         logger.error(f"Failed to list backups: {e}")
@@ -74,7 +77,9 @@ async def create_backup(
         async def backup_task():
             result = await backup_service.create_backup(
                 job_id=request.job_id,
-                description=request.description
+                description=request.description,
+                mode=request.mode,
+                namespace=request.namespace
             )
             
             if result.success:
@@ -214,6 +219,13 @@ async def download_backup_file(job_id: str) -> FileResponse:
                 detail=f"Backup file not found: {backup.backup_path}"
             )
         
+        if not backup_path.name.endswith(".tar.gz"):
+            # Snapshot directories and chunk store manifests are not single archives
+            raise HTTPException(
+                status_code=400,
+                detail=f"Backup for job {job_id} is not a tarball: {backup.backup_path}"
+            )
+        
         return FileResponse(
             path=str(backup_path),
             filename=f"neo4j_backup_{job_id}.tar.gz",
@@ -257,13 +269,13 @@ async def cleanup_old_backups(
 
 
 @router.post("/database/clear")
-async def clear_database(background_tasks: BackgroundTasks) -> Dict[str, str]:
-    """Clear the Neo4j database (with automatic backup)."""
+async def clear_database(background_tasks: BackgroundTasks, namespace: Optional[str] = None) -> Dict[str, str]:
+    """Clear the Neo4j database, or one namespace of it (with automatic backup); it stays online."""
     
     try:
         # Clear database in background
         async def clear_task():
-            result = await backup_service.clear_database()
+            result = await backup_service.clear_database(namespace)
             
             if result.success:
                 logger.info("Database cleared successfully")
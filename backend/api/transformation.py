@@ -30,7 +30,7 @@ websocket_connections: Dict[str, List[WebSocket]] = {}
 
 class TransformationRequest(BaseModel):
     """Request model for starting a transformation."""
-    extraction_file: str = Field(..., description="Path to extraction JSON file")
+    extraction_file: str = Field(..., description="Path to extraction output (JSON or NDJSON)")
     output_directory: Optional[str] = Field(".", description="Output directory for results")
     output_formats: List[str] = Field(["neo4j"], description="List of output formats")
     job_id: Optional[str] = Field(None, description="Optional custom job ID")
@@ -339,13 +339,9 @@ async def _run_transformation(
         output_formats: List of output formats
     """
     try:
-        # Load extraction data
-        with open(extraction_file, 'r', encoding='utf-8') as f:
-            extraction_data = json.load(f)
-        
-        # Run transformation
-        result = await orchestrator.transform_extraction_data(
-            extraction_data,
+        # Run transformation, reading the extraction file incrementally
+        result = await orchestrator.transform_extraction_file(
+            extraction_file,
             output_formats,
             output_directory
         )
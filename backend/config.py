@@ -36,6 +36,11 @@ class DatabaseSettings(BaseSettings):
     neo4j_data_dir: str = Field(default="/var/lib/neo4j/data", description="Neo4j data directory")
     neo4j_backup_dir: str = Field(default="./neo4j_backups", description="Backup storage directory")
     neo4j_service_name: str = Field(default="neo4j", description="Neo4j service name")
+    neo4j_backup_mode: str = Field(
+        default="snapshot",
+        description="Backup mode: online graph snapshot (snapshot), or stop-the-world data directory "
+        "backup into the deduplicating chunk store (chunked) or a tarball (tarball)",
+    )
 
     # Redis
     redis_url: str = Field(default="redis://localhost:6379/0", description="Redis URL")
@@ -4,7 +4,7 @@ Neo4j Manager Package
 Domain for managing Neo4j database versioning, backups, and restoration.
 """
 
-from .core import BackupManager, DatabaseTracker, Neo4jService, TarballManager
+from .core import BackupManager, ChunkStore, DatabaseTracker, Neo4jService, RegistryStore, TarballManager
 from .services import BackupService
 from .models import (
     BackupResult,
@@ -12,6 +12,7 @@ from .models import (
     BackupMetadata,
     ServiceOperationResult,
     TarballResult,
+    ChunkStoreResult,
     DatabaseVersion,
     VersionHistory,
     BackupRegistry
@@ -20,8 +21,10 @@ from .models import (
 __all__ = [
     # Core components
     "BackupManager",
+    "ChunkStore",
     "DatabaseTracker",
     "Neo4jService", 
+    "RegistryStore",
     "TarballManager",
     
     # Services
@@ -33,6 +36,7 @@ __all__ = [
     "BackupMetadata",
     "ServiceOperationResult",
     "TarballResult",
+    "ChunkStoreResult",
     "DatabaseVersion",
     "VersionHistory",
     "BackupRegistry"
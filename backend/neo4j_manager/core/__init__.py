@@ -5,13 +5,17 @@ Exports core components for backup management and database operations.
 """
 
 from .backup_manager import BackupManager
+from .chunk_store import ChunkStore
 from .database_tracker import DatabaseTracker
 from .neo4j_service import Neo4jService
+from .registry_store import RegistryStore
 from .tarball_manager import TarballManager
 
 __all__ = [
     "BackupManager",
+    "ChunkStore",
     "DatabaseTracker", 
     "Neo4jService",
+    "RegistryStore",
     "TarballManager"
 ]
\ No newline at end of file
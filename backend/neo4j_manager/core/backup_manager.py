@@ -2,8 +2,10 @@
 Backup Manager - Core Neo4j database backup and restore operations
 
 Handles:
+- Online graph snapshots, streamed into compressed columnar chunks while
+  Neo4j keeps serving queries (the default)
 - Neo4j service lifecycle management (stop/start)
-- Database file backup with tarball compression
+- Database file backup into a deduplicating chunk store, or as a tarball
 - Backup restoration with validation
 - Backup integrity verification
 """
@@ -14,14 +16,18 @@ import shutil
 import tarfile
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Any, Callable, Dict, Optional
 
+from .chunk_store import MANIFEST_SUFFIX, ChunkStore
 from .neo4j_service import Neo4jService
 from .tarball_manager import TarballManager
 from ..models.backup_metadata import BackupResult, RestoreResult
 
 logger = logging.getLogger(__name__)
 
+BACKUP_MODES = ("snapshot", "chunked", "tarball")
+DEFAULT_BACKUP_MODE = "snapshot"
+
 
 class BackupManager:
     """Manages Neo4j database backup and restore operations."""
@@ -30,7 +36,8 @@ class BackupManager:
         self,
         neo4j_data_dir: Optional[str] = None,
         backup_storage_dir: Optional[str] = None,
-        service_name: Optional[str] = None
+        service_name: Optional[str] = None,
+        backup_mode: Optional[str] = None
     ):
         # Initialize from config if not provided
         if not neo4j_data_dir or not backup_storage_dir or not service_name:
@@ -40,30 +47,61 @@ class BackupManager:
             self.neo4j_data_dir = Path(neo4j_data_dir or settings.database.neo4j_data_dir)
             self.backup_storage_dir = Path(backup_storage_dir or settings.database.neo4j_backup_dir)
             service_name = service_name or settings.database.neo4j_service_name
+            backup_mode = backup_mode or settings.database.neo4j_backup_mode
         else:
             self.neo4j_data_dir = Path(neo4j_data_dir)
             self.backup_storage_dir = Path(backup_storage_dir)
         
+        self.backup_mode = backup_mode or DEFAULT_BACKUP_MODE
+        if self.backup_mode not in BACKUP_MODES:
+            raise ValueError(f"Unknown backup mode: {self.backup_mode} (expected one of {', '.join(BACKUP_MODES)})")
+        
         # Ensure backup directory exists
         self.backup_storage_dir.mkdir(parents=True, exist_ok=True)
         
         # Services
         self.neo4j_service = Neo4jService(service_name)
         self.tarball_manager = TarballManager()
+        self.chunk_store = ChunkStore(self.backup_storage_dir)
         
-    async def create_backup(self, job_id: str) -> BackupResult:
-        """Create a complete backup of the current Neo4j database."""
+    async def create_backup(
+        self,
+        job_id: str,
+        mode: Optional[str] = None,
+        namespace: Optional[str] = None
+    ) -> BackupResult:
+        """
+        Back up the current Neo4j database.
+        
+        Args:
+            job_id: Job ID the backup is named after
+            mode: "snapshot" streams an online graph snapshot; "chunked" stops
+                Neo4j and stores its data directory in the deduplicating
+                chunk store; "tarball" stops Neo4j and archives its data
+                directory. Defaults to the manager's backup mode
+            namespace: Only snapshot this graph namespace (snapshot mode only)
+        """
+        mode = mode or self.backup_mode
+        if mode == "snapshot":
+            return await self._create_snapshot_backup(job_id, namespace)
+        if mode not in BACKUP_MODES:
+            result = BackupResult(job_id=job_id)
+            result.add_error(f"Unknown backup mode: {mode}")
+            return result
         
-        result = BackupResult(job_id=job_id)
+        result = BackupResult(job_id=job_id, backup_mode=mode)
         start_time = datetime.now()
+        neo4j_stopped = False
         
         try:
             logger.info(f"Starting database backup for job {job_id}")
             
             # Stop Neo4j service to ensure data consistency
             logger.info("Stopping Neo4j service for backup")
+            neo4j_stopped = True
             stop_result = await self.neo4j_service.stop()
             if not stop_result.success:
+                neo4j_stopped = False
                 result.add_error(f"Failed to stop Neo4j: {stop_result.error}")
                 return result
             
@@ -74,30 +112,45 @@ class BackupManager:
             
             # Create backup filename with job_id and timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_filename = f"neo4j_backup_{job_id}_{timestamp}.tar.gz"
-            backup_path = self.backup_storage_dir / backup_filename
-            
-            # Create tarball backup
-            logger.info(f"Creating tarball backup: {backup_path}")
-            tarball_result = await self.tarball_manager.create_tarball(
-                source_dir=self.neo4j_data_dir,
-                target_path=backup_path,
-                compression="gzip"
-            )
-            
-            if not tarball_result.success:
-                result.add_error(f"Tarball creation failed: {tarball_result.error}")
-                return result
+            
+            if mode == "chunked":
+                # Only chunks not stored by earlier backups are written
+                backup_path = self.backup_storage_dir / f"neo4j_backup_{job_id}_{timestamp}{MANIFEST_SUFFIX}"
+                logger.info(f"Storing data directory in chunk store: {backup_path}")
+                store_result = await self.chunk_store.store_directory(self.neo4j_data_dir, backup_path)
+                
+                if not store_result.success:
+                    result.add_error(f"Chunk store backup failed: {store_result.error}")
+                    return result
+                backup_size = store_result.stored_bytes
+                result.source_size_bytes = store_result.source_bytes
+                result.deduplication_ratio = store_result.deduplication_ratio
+            else:
+                backup_filename = f"neo4j_backup_{job_id}_{timestamp}.tar.gz"
+                backup_path = self.backup_storage_dir / backup_filename
+                
+                # Create tarball backup
+                logger.info(f"Creating tarball backup: {backup_path}")
+                tarball_result = await self.tarball_manager.create_tarball(
+                    source_dir=self.neo4j_data_dir,
+                    target_path=backup_path,
+                    compression="gzip"
+                )
+                
+                if not tarball_result.success:
+                    result.add_error(f"Tarball creation failed: {tarball_result.error}")
+                    return result
+                backup_size = backup_path.stat().st_size
             
             # Restart Neo4j service
             logger.info("Restarting Neo4j service")
+            neo4j_stopped = False
             start_result = await self.neo4j_service.start()
             if not start_result.success:
                 result.add_error(f"Failed to restart Neo4j: {start_result.error}")
                 # Continue - backup was successful even if restart failed
             
             # Calculate backup statistics
-            backup_size = backup_path.stat().st_size
             backup_duration = (datetime.now() - start_time).total_seconds()
             
             # Update result
@@ -113,17 +166,60 @@ class BackupManager:
         except Exception as e:
             logger.error(f"Backup failed for job {job_id}: {e}")
             result.add_error(str(e))
+            return result
+        
+        finally:
+            # Ensure Neo4j is restarted on every path that leaves it stopped
+            if neo4j_stopped:
+                try:
+                    await self.neo4j_service.start()
+                except Exception as restart_error:
+                    logger.error(f"Failed to restart Neo4j after backup failure: {restart_error}")
+    
+    async def _create_snapshot_backup(self, job_id: str, namespace: Optional[str]) -> BackupResult:
+        """Stream the graph into a snapshot directory while Neo4j stays online."""
+        from uploader import GraphSnapshot, Neo4jClient
+        
+        result = BackupResult(job_id=job_id, backup_mode="snapshot")
+        neo4j_client = None
+        
+        try:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            snapshot_dir = self.backup_storage_dir / f"neo4j_snapshot_{job_id}_{timestamp}"
+            logger.info(f"Creating online snapshot backup: {snapshot_dir}")
+            
+            neo4j_client = Neo4jClient()
+            snapshot_result = await GraphSnapshot(neo4j_client).snapshot(snapshot_dir, namespace)
+            
+            result.backup_duration_seconds = snapshot_result.duration_seconds
+            result.node_count = snapshot_result.nodes
+            result.relationship_count = snapshot_result.relationships
+            result.nodes_per_second = snapshot_result.nodes_per_second
+            result.relationships_per_second = snapshot_result.relationships_per_second
+            for error in snapshot_result.errors:
+                result.add_error(error)
+            
+            if snapshot_result.success:
+                result.backup_path = snapshot_result.snapshot_path
+                result.backup_size_bytes = snapshot_result.size_bytes
+                result.success = True
+                logger.info(f"Snapshot backup completed: {snapshot_dir} ({result.size_mb:.2f} MB, "
+                            f"{result.nodes_per_second:.0f} nodes/s, "
+                            f"{result.relationships_per_second:.0f} relationships/s)")
             
-            # Ensure Neo4j is restarted even if backup failed
-            try:
-                await self.neo4j_service.start()
-            except Exception as restart_error:
-                logger.error(f"Failed to restart Neo4j after backup failure: {restart_error}")
+            return result
             
+        except Exception as e:
+            logger.error(f"Snapshot backup failed for job {job_id}: {e}")
+            result.add_error(str(e))
             return result
+            
+        finally:
+            if neo4j_client is not None:
+                await neo4j_client.disconnect()
     
     async def restore_backup(self, job_id: str, backup_path: Optional[str] = None) -> RestoreResult:
-        """Restore a Neo4j database from backup."""
+        """Restore a Neo4j database from a snapshot, chunk store or tarball backup."""
         
         result = RestoreResult(job_id=job_id)
         start_time = datetime.now()
@@ -141,6 +237,9 @@ class BackupManager:
                 result.add_error(f"Backup file not found: {backup_path}")
                 return result
             
+            if backup_file.is_dir():
+                return await self._restore_snapshot_backup(result, backup_file)
+            
             logger.info(f"Starting database restore from: {backup_path}")
             
             # Stop Neo4j service
@@ -155,16 +254,25 @@ class BackupManager:
             if self.neo4j_data_dir.exists():
                 shutil.rmtree(self.neo4j_data_dir)
             
-            # Extract backup
-            logger.info("Extracting backup")
-            extract_result = await self.tarball_manager.extract_tarball(
-                tarball_path=backup_file,
-                target_dir=self.neo4j_data_dir.parent
-            )
-            
-            if not extract_result.success:
-                result.add_error(f"Backup extraction failed: {extract_result.error}")
-                return result
+            if backup_file.name.endswith(MANIFEST_SUFFIX):
+                # Reassemble the files, decompressing chunks in parallel
+                logger.info("Restoring data directory from chunk store")
+                store_result = await self.chunk_store.restore_directory(backup_file, self.neo4j_data_dir)
+                
+                if not store_result.success:
+                    result.add_error(f"Chunk store restore failed: {store_result.error}")
+                    return result
+            else:
+                # Extract backup
+                logger.info("Extracting backup")
+                extract_result = await self.tarball_manager.extract_tarball(
+                    tarball_path=backup_file,
+                    target_dir=self.neo4j_data_dir.parent
+                )
+                
+                if not extract_result.success:
+                    result.add_error(f"Backup extraction failed: {extract_result.error}")
+                    return result
             
             # Restart Neo4j service
             logger.info("Restarting Neo4j service")
@@ -199,58 +307,147 @@ class BackupManager:
             
             return result
     
-    async def clear_database(self) -> BackupResult:
-        """Clear the current Neo4j database completely."""
+    async def _restore_snapshot_backup(self, result: RestoreResult, snapshot_dir: Path) -> RestoreResult:
+        """Load a snapshot back through UNWIND batches while Neo4j stays online."""
+        from uploader import GraphSnapshot, Neo4jClient
         
-        result = BackupResult(job_id="clear_operation")
+        neo4j_client = None
         
         try:
-            logger.info("Clearing Neo4j database")
+            logger.info(f"Starting online restore from snapshot: {snapshot_dir}")
+            
+            neo4j_client = Neo4jClient()
+            snapshot_result = await GraphSnapshot(neo4j_client).restore(snapshot_dir, job_id=result.job_id)
+            
+            result.backup_path = str(snapshot_dir)
+            result.restore_duration_seconds = snapshot_result.duration_seconds
+            result.nodes_restored = snapshot_result.nodes
+            result.relationships_restored = snapshot_result.relationships
+            result.nodes_per_second = snapshot_result.nodes_per_second
+            result.relationships_per_second = snapshot_result.relationships_per_second
+            for error in snapshot_result.errors:
+                result.add_error(error)
+            
+            if snapshot_result.success:
+                result.success = True
+                logger.info(f"Database restore completed from: {snapshot_dir} "
+                            f"({result.nodes_per_second:.0f} nodes/s, "
+                            f"{result.relationships_per_second:.0f} relationships/s)")
             
-            # Stop Neo4j service
-            stop_result = await self.neo4j_service.stop()
-            if not stop_result.success:
-                result.add_error(f"Failed to stop Neo4j: {stop_result.error}")
-                return result
+            return result
             
-            # Remove database files
-            if self.neo4j_data_dir.exists():
-                shutil.rmtree(self.neo4j_data_dir)
-                logger.info(f"Removed database directory: {self.neo4j_data_dir}")
+        except Exception as e:
+            logger.error(f"Snapshot restore failed for job {result.job_id}: {e}")
+            result.add_error(str(e))
+            return result
             
-            # Recreate empty database directory
-            self.neo4j_data_dir.mkdir(parents=True, exist_ok=True)
+        finally:
+            if neo4j_client is not None:
+                await neo4j_client.disconnect()
+    
+    async def clear_database(
+        self,
+        namespace: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        progress_callback: Optional[Callable[[Any], None]] = None
+    ) -> BackupResult:
+        """
+        Clear the graph, or one namespace of it, while Neo4j stays online.
+        
+        Nodes and relationships are deleted in bounded batches, one write
+        transaction each (see the uploader's GraphCleaner), instead of
+        stopping the service and removing its data directory.
+        
+        Args:
+            namespace: Only clear this namespace; None clears the whole graph
+            batch_size: Nodes or relationships deleted per transaction
+            progress_callback: Called with the running ClearResult after every batch
+        """
+        from uploader import GraphCleaner, Neo4jClient
+        from uploader.core.graph_cleaner import DEFAULT_CLEAR_BATCH_SIZE
+        
+        result = BackupResult(job_id="clear_operation")
+        start_time = datetime.now()
+        neo4j_client = None
+        
+        try:
+            logger.info(f"Clearing Neo4j {'namespace ' + namespace if namespace else 'database'}")
             
-            # Restart Neo4j service
-            start_result = await self.neo4j_service.start()
-            if not start_result.success:
-                result.add_error(f"Failed to restart Neo4j: {start_result.error}")
-                return result
+            neo4j_client = Neo4jClient()
+            cleaner = GraphCleaner(neo4j_client, batch_size=batch_size or DEFAULT_CLEAR_BATCH_SIZE)
+            clear_result = await cleaner.clear(namespace, progress_callback)
             
-            result.success = True
-            logger.info("Database cleared successfully")
+            result.nodes_deleted = clear_result.nodes_deleted
+            result.relationships_deleted = clear_result.relationships_deleted
+            result.backup_duration_seconds = (datetime.now() - start_time).total_seconds()
+            for error in clear_result.errors:
+                result.add_error(error)
+            
+            if clear_result.success:
+                result.success = True
+                logger.info("Database cleared successfully")
             
             return result
             
         except Exception as e:
             logger.error(f"Database clear failed: {e}")
             result.add_error(str(e))
+            return result
             
-            # Ensure Neo4j is restarted
-            try:
-                await self.neo4j_service.start()
-            except Exception:
-                pass
+        finally:
+            if neo4j_client is not None:
+                await neo4j_client.disconnect()
+    
+    async def graph_fingerprint(
+        self,
+        namespace: Optional[str] = None,
+        recorded: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fingerprint of the graph, or one namespace of it, as it is now.
+        
+        A recorded fingerprint (kept up to date by the uploader) is trusted
+        when the live node and relationship counts still match it, which
+        takes a few count queries; otherwise every unique_key is read.
+        
+        Returns:
+            Fingerprint dictionary, or None if the graph cannot be read
+        """
+        from uploader import GraphFingerprinter, Neo4jClient
+        
+        neo4j_client = None
+        
+        try:
+            neo4j_client = Neo4jClient()
+            fingerprinter = GraphFingerprinter(neo4j_client)
             
-            return result
+            if recorded:
+                counts = await fingerprinter.counts(namespace)
+                if counts == (recorded.get("node_count"), recorded.get("relationship_count")):
+                    return recorded
+                logger.info(f"Graph changed since its fingerprint was recorded "
+                            f"({counts[0]} nodes, {counts[1]} relationships), fingerprinting again")
+            
+            return (await fingerprinter.fingerprint(namespace)).to_dict()
+            
+        except Exception as e:
+            logger.warning(f"Could not fingerprint the graph: {e}")
+            return None
+            
+        finally:
+            if neo4j_client is not None:
+                await neo4j_client.disconnect()
     
     async def _find_backup_for_job(self, job_id: str) -> Optional[str]:
-        """Find the most recent backup file for a given job ID."""
+        """Find the most recent backup file or snapshot directory for a given job ID."""
         
         try:
-            # Look for backup files matching the job_id pattern
-            pattern = f"neo4j_backup_{job_id}_*.tar.gz"
-            matching_files = list(self.backup_storage_dir.glob(pattern))
+            # Look for tarballs, manifests and snapshots matching the job_id pattern
+            matching_files = [
+                *self.backup_storage_dir.glob(f"neo4j_backup_{job_id}_*.tar.gz"),
+                *self.backup_storage_dir.glob(f"neo4j_backup_{job_id}_*{MANIFEST_SUFFIX}"),
+                *self.backup_storage_dir.glob(f"neo4j_snapshot_{job_id}_*")
+            ]
             
             if not matching_files:
                 return None
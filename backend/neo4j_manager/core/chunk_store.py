@@ -0,0 +1,412 @@
+"""
+Chunk Store - Deduplicating, content-addressed storage for data directory backups
+
+Successive backups of a nearly unchanged Neo4j data directory share most
+of their bytes. Instead of a full tarball per backup, files are split into
+content-defined chunks (short runs of bytes from a pseudo-random byte
+class pick the cut points, so an insertion only changes the chunks around
+it), and each chunk is stored
+once, compressed, under its SHA-256 digest. A backup is a small JSON
+manifest listing every file and its chunks.
+
+- Cut points are found with bytes.translate() and bytes.find(), so
+  chunking runs far ahead of compression
+- Chunking, hashing and compression run in a process pool, one task per
+  file segment, so large stores use every core
+- Files whose size and modification time match the previous manifest are
+  reused without being read
+- Restores recreate the files and decompress chunks into place from a
+  thread pool, verifying each chunk's digest
+- Chunks no longer referenced by any manifest are removed by
+  collect_garbage(); chunks touched within a grace period are kept, since
+  a backup still being stored references them before its manifest exists
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..models.backup_metadata import ChunkStoreResult
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FORMAT_VERSION = 1
+MANIFEST_SUFFIX = ".manifest.json"
+CHUNKS_DIR = "chunks"
+
+# Content-defined chunk sizes (bytes)
+MIN_CHUNK_SIZE = 16 * 1024
+AVG_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 256 * 1024
+
+# Files are chunked in segments of this size in parallel; each segment end is a forced cut
+SEGMENT_SIZE = 64 * 1024 * 1024
+
+COMPRESSION_LEVEL = 6
+
+# Chunks written or reused this recently are never collected: a concurrent
+# store_directory() references them before its manifest is written
+GC_GRACE_SECONDS = 3600
+
+# Stored chunks are named by their SHA-256 digest; anything else (e.g. an
+# in-flight *.tmp file) is left alone by garbage collection
+_CHUNK_NAME = re.compile(r"[0-9a-f]{64}")
+
+# Byte values in a deterministic pseudo-random order, identical in every
+# process and release; anchor classes are taken from its front. 0x00 and 0xFF
+# are left out, so zero-filled and erased pages are not cut at every min_size.
+_ANCHOR_ORDER = [
+    value for value in sorted(range(256), key=lambda value: hashlib.sha256(bytes([value])).digest())
+    if value not in (0x00, 0xFF)
+]
+# A cut point is the end of a run of this many anchor-class bytes
+_ANCHOR_LENGTH = 4
+
+# (digest, uncompressed size, compressed bytes added to the store)
+ChunkRecord = Tuple[str, int, int]
+
+
+@functools.lru_cache(maxsize=None)
+def _anchor_table(bits: int) -> bytes:
+    """Translation table marking an anchor class that starts a run at one in 2**bits random positions."""
+    size = round(256 * 2 ** (-bits / _ANCHOR_LENGTH))
+    members = set(_ANCHOR_ORDER[:max(1, min(len(_ANCHOR_ORDER), size))])
+    return bytes(1 if value in members else 0 for value in range(256))
+
+
+def chunk_boundaries(
+    data: bytes,
+    min_size: int = MIN_CHUNK_SIZE,
+    avg_size: int = AVG_CHUNK_SIZE,
+    max_size: int = MAX_CHUNK_SIZE
+) -> List[int]:
+    """
+    Find content-defined cut points in data.
+
+    A cut is made after the first run of anchor-class bytes that starts at
+    least min_size into a chunk; chunks never exceed max_size. The class is
+    sized so that in random data a run starts about once every
+    avg_size - min_size bytes. Bytes are marked with one translate() and
+    runs found with find(), both in C, instead of hashing byte by byte.
+
+    Returns:
+        End offsets of the chunks, the last one being len(data)
+    """
+    bits = max(1, (avg_size - min_size).bit_length() - 1)
+    marked = data.translate(_anchor_table(bits))
+    anchor = b"\x01" * _ANCHOR_LENGTH
+
+    cuts = []
+    start = 0
+    length = len(data)
+    while start < length:
+        end = min(length, start + max_size)
+        found = marked.find(anchor, start + min_size, end)
+        cut = end if found < 0 else found + _ANCHOR_LENGTH
+        cuts.append(cut)
+        start = cut
+    return cuts
+
+
+def _chunk_path(root: Path, digest: str) -> Path:
+    """Where a chunk is stored, fanned out by the first digest byte."""
+    return root / CHUNKS_DIR / digest[:2] / digest
+
+
+def _touch(path: Path) -> bool:
+    """Refresh a stored chunk's modification time; False if it is not stored."""
+    try:
+        os.utime(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def _store_segment(root: str, path: str, offset: int, length: int, sizes: Tuple[int, int, int]) -> List[ChunkRecord]:
+    """Chunk one file segment and store the chunks not stored yet (runs in a worker process)."""
+    with open(path, "rb") as source:
+        source.seek(offset)
+        data = source.read(length)
+
+    records = []
+    start = 0
+    for cut in chunk_boundaries(data, *sizes):
+        chunk = data[start:cut]
+        digest = hashlib.sha256(chunk).hexdigest()
+        target = _chunk_path(Path(root), digest)
+        stored = 0
+        if not _touch(target):
+            target.parent.mkdir(parents=True, exist_ok=True)
+            compressed = zlib.compress(chunk, COMPRESSION_LEVEL)
+            # Write then rename, so concurrent writers of the same chunk never expose a partial file
+            temporary = target.with_name(f"{digest}.{os.getpid()}.tmp")
+            temporary.write_bytes(compressed)
+            os.replace(temporary, target)
+            stored = len(compressed)
+        records.append((digest, len(chunk), stored))
+        start = cut
+    return records
+
+
+def _restore_chunk(root: str, path: str, offset: int, digest: str) -> None:
+    """Decompress a chunk into its place in a restored file (runs on a worker thread)."""
+    data = zlib.decompress(_chunk_path(Path(root), digest).read_bytes())
+    if hashlib.sha256(data).hexdigest() != digest:
+        raise ValueError(f"Chunk {digest} of {path} is corrupt")
+    with open(path, "r+b") as target:
+        target.seek(offset)
+        target.write(data)
+
+
+class ChunkStore:
+    """Content-addressed chunk store holding backup manifests and their chunks."""
+
+    def __init__(
+        self,
+        root: Path,
+        workers: Optional[int] = None,
+        min_chunk_size: int = MIN_CHUNK_SIZE,
+        avg_chunk_size: int = AVG_CHUNK_SIZE,
+        max_chunk_size: int = MAX_CHUNK_SIZE,
+        segment_size: int = SEGMENT_SIZE
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory holding the manifests and the chunks directory
+            workers: Processes (store) and threads (restore) to use; defaults to the CPU count
+            min_chunk_size: Smallest chunk, except at the end of a segment
+            avg_chunk_size: Target average chunk size
+            max_chunk_size: Largest chunk
+            segment_size: Bytes of a file chunked by one task
+        """
+        self.root = Path(root)
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunk_sizes = (min_chunk_size, avg_chunk_size, max_chunk_size)
+        self.segment_size = max(max_chunk_size, segment_size)
+
+    def manifests(self) -> List[Path]:
+        """Manifests in the store, oldest first."""
+        return sorted(self.root.glob(f"*{MANIFEST_SUFFIX}"), key=lambda path: path.stat().st_mtime)
+
+    async def store_directory(self, source_dir: Path, manifest_path: Path) -> ChunkStoreResult:
+        """
+        Store every file under source_dir and write its manifest.
+
+        Args:
+            source_dir: Directory to back up
+            manifest_path: Manifest to write, normally inside the store root
+
+        Returns:
+            ChunkStoreResult with file, chunk and byte counts
+        """
+        source_dir = Path(source_dir)
+        result = ChunkStoreResult(operation="store", manifest_path=str(manifest_path))
+        start = time.perf_counter()
+
+        try:
+            if not source_dir.exists():
+                result.error = f"Source directory does not exist: {source_dir}"
+                return result
+
+            self.root.mkdir(parents=True, exist_ok=True)
+            previous = self._previous_files(source_dir)
+            files: List[Dict[str, Any]] = []
+            directories: List[str] = []
+            pending: List[Tuple[Dict[str, Any], List[asyncio.Future]]] = []
+
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                for path in sorted(source_dir.rglob("*")):
+                    relative = path.relative_to(source_dir).as_posix()
+                    if path.is_dir():
+                        directories.append(relative)
+                        continue
+                    if not path.is_file():
+                        continue
+
+                    stat = path.stat()
+                    entry = {"path": relative, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+                             "mode": stat.st_mode & 0o7777}
+                    files.append(entry)
+
+                    reused = self._reusable_chunks(previous.get(relative), entry)
+                    if reused is not None:
+                        entry["chunks"] = reused
+                        result.files_unchanged += 1
+                        continue
+
+                    segments = [
+                        loop.run_in_executor(pool, _store_segment, str(self.root), str(path), offset,
+                                             min(self.segment_size, stat.st_size - offset), self.chunk_sizes)
+                        for offset in range(0, stat.st_size, self.segment_size)
+                    ]
+                    pending.append((entry, segments))
+
+                for entry, segments in pending:
+                    records = [record for segment in await asyncio.gather(*segments) for record in segment]
+                    entry["chunks"] = [[digest, size] for digest, size, _ in records]
+                    result.new_chunks += sum(1 for _, _, stored in records if stored)
+                    result.stored_bytes += sum(stored for _, _, stored in records)
+
+            result.files = len(files)
+            result.chunks = sum(len(entry["chunks"]) for entry in files)
+            result.source_bytes = sum(entry["size"] for entry in files)
+
+            manifest = {
+                "format_version": MANIFEST_FORMAT_VERSION,
+                "created_at": datetime.now().isoformat(),
+                "source_dir": str(source_dir.resolve()),
+                "stored_bytes": result.stored_bytes,
+                "source_bytes": result.source_bytes,
+                "directories": directories,
+                "files": files
+            }
+            manifest_path = Path(manifest_path)
+            temporary = manifest_path.with_name(manifest_path.name + ".tmp")
+            temporary.write_text(json.dumps(manifest))
+            os.replace(temporary, manifest_path)
+
+            result.success = True
+            logger.info(f"Stored {result.files} files ({result.source_bytes / 1024 / 1024:.2f} MB) as "
+                        f"{result.chunks} chunks, {result.new_chunks} new "
+                        f"({result.stored_bytes / 1024 / 1024:.2f} MB added, "
+                        f"{result.files_unchanged} files unchanged)")
+
+        except Exception as e:
+            logger.error(f"Chunk store backup of {source_dir} failed: {e}")
+            result.error = str(e)
+
+        result.duration_seconds = time.perf_counter() - start
+        return result
+
+    async def restore_directory(self, manifest_path: Path, target_dir: Path) -> ChunkStoreResult:
+        """
+        Recreate the files of a manifest under target_dir.
+
+        Args:
+            manifest_path: Manifest written by store_directory()
+            target_dir: Directory to restore into; existing files are overwritten
+
+        Returns:
+            ChunkStoreResult with file, chunk and byte counts
+        """
+        target_dir = Path(target_dir)
+        result = ChunkStoreResult(operation="restore", manifest_path=str(manifest_path))
+        start = time.perf_counter()
+
+        try:
+            manifest = json.loads(Path(manifest_path).read_text())
+            if manifest.get("format_version") != MANIFEST_FORMAT_VERSION:
+                raise ValueError(f"Unsupported manifest format version: {manifest.get('format_version')}")
+
+            target_dir.mkdir(parents=True, exist_ok=True)
+            for directory in manifest["directories"]:
+                (target_dir / directory).mkdir(parents=True, exist_ok=True)
+
+            tasks: List[Tuple[str, str, int, str]] = []
+            for entry in manifest["files"]:
+                path = target_dir / entry["path"]
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, "wb") as target:
+                    target.truncate(entry["size"])
+                offset = 0
+                for digest, size in entry["chunks"]:
+                    tasks.append((str(self.root), str(path), offset, digest))
+                    offset += size
+
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                await asyncio.gather(*(loop.run_in_executor(pool, _restore_chunk, *task) for task in tasks))
+
+            for entry in manifest["files"]:
+                path = target_dir / entry["path"]
+                os.chmod(path, entry["mode"])
+                os.utime(path, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+
+            result.files = len(manifest["files"])
+            result.chunks = len(tasks)
+            result.source_bytes = manifest["source_bytes"]
+            result.success = True
+            logger.info(f"Restored {result.files} files ({result.source_bytes / 1024 / 1024:.2f} MB) "
+                        f"from {result.chunks} chunks into {target_dir}")
+
+        except Exception as e:
+            logger.error(f"Chunk store restore from {manifest_path} failed: {e}")
+            result.error = str(e)
+
+        result.duration_seconds = time.perf_counter() - start
+        return result
+
+    def collect_garbage(self, grace_seconds: float = GC_GRACE_SECONDS) -> int:
+        """
+        Remove chunks that no manifest references any more.
+
+        Only digest-named chunk files are considered, and chunks written or
+        reused by store_directory() within grace_seconds are kept, so a
+        backup being stored concurrently never loses its chunks before its
+        manifest is written.
+
+        Args:
+            grace_seconds: Minimum age of a chunk before it may be removed
+
+        Returns:
+            Number of chunks removed
+        """
+        cutoff = time.time() - grace_seconds
+        live: Set[str] = set()
+        for manifest_path in self.manifests():
+            manifest = json.loads(manifest_path.read_text())
+            live.update(digest for entry in manifest["files"] for digest, _ in entry["chunks"])
+
+        removed = 0
+        for chunk in (self.root / CHUNKS_DIR).glob("*/*"):
+            if chunk.name in live or not _CHUNK_NAME.fullmatch(chunk.name):
+                continue
+            try:
+                if chunk.stat().st_mtime > cutoff:
+                    continue
+                chunk.unlink()
+            except FileNotFoundError:
+                continue
+            removed += 1
+
+        if removed:
+            logger.info(f"Removed {removed} unreferenced chunks")
+        return removed
+
+    def _previous_files(self, source_dir: Path) -> Dict[str, Dict[str, Any]]:
+        """File entries of the newest manifest of the same directory, by relative path."""
+        resolved = str(source_dir.resolve())
+        for manifest_path in reversed(self.manifests()):
+            try:
+                manifest = json.loads(manifest_path.read_text())
+            except (OSError, ValueError):
+                continue
+            if manifest.get("source_dir") == resolved:
+                return {entry["path"]: entry for entry in manifest["files"]}
+        return {}
+
+    def _reusable_chunks(self, previous: Optional[Dict[str, Any]], entry: Dict[str, Any]) -> Optional[List[List[Any]]]:
+        """
+        Chunks of an unchanged file (same size and modification time) that are all still stored.
+
+        Reused chunks are touched, so garbage collection keeps them until
+        the new manifest references them.
+        """
+        if not previous or previous["size"] != entry["size"] or previous["mtime_ns"] != entry["mtime_ns"]:
+            return None
+        if not all(_touch(_chunk_path(self.root, digest)) for digest, _ in previous["chunks"]):
+            return None
+        return previous["chunks"]
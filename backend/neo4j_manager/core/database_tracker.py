@@ -2,20 +2,35 @@
 Database Tracker - Manages job ID to backup location mapping
 
 Tracks database backups, versions, and provides lookup functionality.
+Everything is kept in a RegistryStore (SQLite) in the backup directory.
 """
 
 import json
 import logging
-from datetime import datetime
+import shutil
+from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
+from .chunk_store import MANIFEST_SUFFIX, ChunkStore
+from .registry_store import REGISTRY_DB_NAME, RegistryStore
 from ..models.backup_metadata import BackupMetadata
-from ..models.database_version import BackupRegistry, VersionHistory, DatabaseVersion
+from ..models.database_version import DatabaseVersion
 
 logger = logging.getLogger(__name__)
 
 
+def _backup_size(backup_path: Path) -> int:
+    """Size of a backup file, of all files in a snapshot directory, or of a manifest and the chunks it added."""
+    if backup_path.name.endswith(MANIFEST_SUFFIX):
+        manifest = json.loads(backup_path.read_text())
+        return backup_path.stat().st_size + manifest.get("stored_bytes", 0)
+    if backup_path.is_dir():
+        return sum(path.stat().st_size for path in backup_path.rglob("*") if path.is_file())
+    return backup_path.stat().st_size
+
+
 class DatabaseTracker:
     """Tracks database backups and versions."""
     
@@ -29,13 +44,9 @@ class DatabaseTracker:
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         
-        # Storage files
-        self.registry_file = self.storage_dir / "backup_registry.json"
-        self.version_history_file = self.storage_dir / "version_history.json"
-        
-        # Load existing data
-        self.backup_registry = self._load_backup_registry()
-        self.version_history = self._load_version_history()
+        # Registry database (imports JSON registries of earlier releases on first open)
+        self.registry_file = self.storage_dir / REGISTRY_DB_NAME
+        self.store = RegistryStore(self.registry_file)
     
     async def register_backup(self, job_id: str, backup_path: str, **metadata) -> BackupMetadata:
         """Register a new backup with the tracker."""
@@ -50,18 +61,17 @@ class DatabaseTracker:
             backup_metadata = BackupMetadata(
                 job_id=job_id,
                 backup_path=backup_path,
-                size_bytes=backup_file.stat().st_size,
+                size_bytes=_backup_size(backup_file),
                 description=metadata.get("description"),
                 neo4j_version=metadata.get("neo4j_version"),
                 node_count=metadata.get("node_count"),
-                relationship_count=metadata.get("relationship_count")
+                relationship_count=metadata.get("relationship_count"),
+                namespace=metadata.get("namespace"),
+                fingerprint=metadata.get("fingerprint")
             )
             
             # Register in backup registry
-            self.backup_registry.register_backup(backup_metadata)
-            
-            # Save registry
-            await self._save_backup_registry()
+            self.store.put_backup(backup_metadata)
             
             logger.info(f"Registered backup for job {job_id}: {backup_path}")
             return backup_metadata
@@ -82,6 +92,7 @@ class DatabaseTracker:
             # Create database version
             version = DatabaseVersion(
                 job_id=job_id,
+                version_number=0,  # Assigned by the store
                 backup_path=backup_path,
                 source_codebase=version_metadata.get("source_codebase"),
                 extraction_job_id=version_metadata.get("extraction_job_id"),
@@ -93,11 +104,8 @@ class DatabaseTracker:
                 tags=version_metadata.get("tags", [])
             )
             
-            # Add to version history
-            self.version_history.add_version(version)
-            
-            # Save version history
-            await self._save_version_history()
+            # Append to version history and activate
+            self.store.add_version(version)
             
             logger.info(f"Added database version for job {job_id}: v{version.version_number}")
             return version
@@ -108,33 +116,57 @@ class DatabaseTracker:
     
     async def get_backup_by_job_id(self, job_id: str) -> Optional[BackupMetadata]:
         """Get backup metadata by job ID."""
-        return self.backup_registry.get_backup(job_id)
+        return self.store.get_backup(job_id)
     
     async def list_all_backups(
         self, 
         include_missing: bool = False,
-        max_age_days: Optional[int] = None
+        max_age_days: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
     ) -> List[BackupMetadata]:
-        """List all registered backups."""
-        return self.backup_registry.list_backups(include_missing, max_age_days)
+        """
+        List registered backups, newest first.
+        
+        Args:
+            include_missing: Whether to include backups whose files no longer exist
+            max_age_days: Only list backups at most this many days old
+            limit: Page size, or None for every backup
+            offset: Backups to skip, counted after filtering
+        """
+        created_after = None
+        if max_age_days is not None:
+            created_after = datetime.now() - timedelta(days=max_age_days + 1)
+        
+        backups = (
+            backup for backup in self.store.iter_backups(created_after)
+            if (include_missing or backup.exists())
+            and (max_age_days is None or backup.age_days <= max_age_days)
+        )
+        stop = offset + limit if limit is not None else None
+        return list(islice(backups, offset, stop))
     
     async def get_database_version_by_job_id(self, job_id: str) -> Optional[DatabaseVersion]:
         """Get database version by job ID."""
-        return self.version_history.get_version_by_job_id(job_id)
+        return self.store.get_version_by_job_id(job_id)
+    
+    async def get_database_version(self, version_number: int) -> Optional[DatabaseVersion]:
+        """Get database version by number."""
+        return self.store.get_version(version_number)
     
     async def get_current_database_version(self) -> Optional[DatabaseVersion]:
         """Get the currently active database version."""
-        return self.version_history.get_active_version()
+        return self.store.get_active_version()
     
-    async def list_database_versions(self, limit: Optional[int] = None) -> List[DatabaseVersion]:
-        """List database versions."""
-        return self.version_history.list_versions(limit)
+    async def list_database_versions(self, limit: Optional[int] = None, offset: int = 0) -> List[DatabaseVersion]:
+        """List database versions, newest first, one page at a time."""
+        return self.store.list_versions(limit, offset)
     
     async def cleanup_missing_backups(self) -> List[str]:
         """Remove entries for backups that no longer exist."""
-        removed = self.backup_registry.cleanup_missing()
+        removed = [backup.job_id for backup in self.store.iter_backups() if not backup.exists()]
         if removed:
-            await self._save_backup_registry()
+            self.store.delete_backups(removed)
             logger.info(f"Cleaned up {len(removed)} missing backups: {removed}")
         return removed
     
@@ -145,15 +177,20 @@ class DatabaseTracker:
             if not backup:
                 return False
             
-            # Remove physical file
+            # Remove physical file, snapshot directory, or manifest and its unshared chunks,
+            # unless a skipped backup of another job still refers to it
             backup_file = Path(backup.backup_path)
-            if backup_file.exists():
+            if self.store.backup_path_shared(backup.backup_path, job_id):
+                logger.info(f"Keeping {backup.backup_path}, still referenced by other jobs")
+            elif backup_file.is_dir():
+                shutil.rmtree(backup_file)
+            elif backup_file.exists():
                 backup_file.unlink()
+                if backup_file.name.endswith(MANIFEST_SUFFIX):
+                    ChunkStore(backup_file.parent).collect_garbage()
             
             # Remove from registry
-            if job_id in self.backup_registry.backups:
-                del self.backup_registry.backups[job_id]
-                await self._save_backup_registry()
+            self.store.delete_backups([job_id])
             
             logger.info(f"Deleted backup for job {job_id}")
             return True
@@ -162,102 +199,47 @@ class DatabaseTracker:
             logger.error(f"Failed to delete backup for job {job_id}: {e}")
             return False
     
+    async def record_graph_fingerprint(self, fingerprint: Dict[str, Any]) -> None:
+        """
+        Record the current fingerprint of the graph or one namespace of it.
+        
+        Fingerprints of overlapping scopes are dropped: a namespace change
+        changes the whole graph, and a whole-graph change may touch every
+        namespace.
+        """
+        self.store.put_fingerprint(fingerprint.get("namespace") or "", fingerprint)
+    
+    async def invalidate_graph_fingerprint(self, namespace: Optional[str] = None) -> None:
+        """Forget the fingerprints of a scope that is about to change, and of overlapping scopes."""
+        self.store.drop_fingerprints(namespace or "")
+    
+    async def get_graph_fingerprint(self, namespace: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Last recorded fingerprint of the graph (None) or of a namespace."""
+        return self.store.get_fingerprint(namespace or "")
+    
+    async def find_backup_by_fingerprint(self, fingerprint: Dict[str, Any]) -> Optional[BackupMetadata]:
+        """Most recent existing backup taken of the graph the fingerprint describes."""
+        for backup in self.store.backups_with_graph(fingerprint):
+            if backup.exists():
+                return backup
+        return None
+    
     async def get_storage_statistics(self) -> Dict[str, Any]:
-        """Get storage statistics."""
+        """Get storage statistics, aggregated by the registry without listing backups."""
+        totals = self.store.backup_totals()
         stats = {
-            "total_backups": len(self.backup_registry.backups),
-            "total_size_mb": self.backup_registry.get_total_size_mb(),
-            "total_versions": len(self.version_history.versions),
-            "current_version": self.version_history.current_version,
+            "total_backups": totals["count"],
+            "total_size_mb": totals["size_bytes"] / (1024 * 1024),
+            "total_versions": self.store.count_versions(),
+            "current_version": self.store.current_version(),
             "storage_directory": str(self.storage_dir)
         }
         
         # Add age distribution
-        backups = await self.list_all_backups()
-        if backups:
-            ages = [backup.age_days for backup in backups]
-            stats["oldest_backup_days"] = max(ages)
-            stats["newest_backup_days"] = min(ages)
-            stats["average_backup_age_days"] = sum(ages) / len(ages)
+        if totals["count"]:
+            now = datetime.now()
+            stats["oldest_backup_days"] = (now - datetime.fromtimestamp(totals["oldest_ts"])).days
+            stats["newest_backup_days"] = (now - datetime.fromtimestamp(totals["newest_ts"])).days
+            stats["average_backup_age_days"] = (now.timestamp() - totals["average_ts"]) / 86400
         
         return stats
-    
-    def _load_backup_registry(self) -> BackupRegistry:
-        """Load backup registry from file."""
-        try:
-            if self.registry_file.exists():
-                with open(self.registry_file, 'r') as f:
-                    data = json.load(f)
-                
-                # Convert dictionary data back to BackupRegistry
-                registry = BackupRegistry()
-                for job_id, backup_data in data.get("backups", {}).items():
-                    backup_metadata = BackupMetadata(
-                        job_id=backup_data["job_id"],
-                        backup_path=backup_data["backup_path"],
-                        created_at=datetime.fromisoformat(backup_data["created_at"]),
-                        size_bytes=backup_data["size_bytes"],
-                        description=backup_data.get("description"),
-                        neo4j_version=backup_data.get("neo4j_version"),
-                        node_count=backup_data.get("node_count"),
-                        relationship_count=backup_data.get("relationship_count")
-                    )
-                    registry.register_backup(backup_metadata)
-                
-                return registry
-        except Exception as e:
-            logger.warning(f"Failed to load backup registry: {e}")
-        
-        return BackupRegistry()
-    
-    def _load_version_history(self) -> VersionHistory:
-        """Load version history from file."""
-        try:
-            if self.version_history_file.exists():
-                with open(self.version_history_file, 'r') as f:
-                    data = json.load(f)
-                
-                # Convert dictionary data back to VersionHistory
-                history = VersionHistory()
-                for version_data in data.get("versions", []):
-                    version = DatabaseVersion(
-                        job_id=version_data["job_id"],
-                        version_number=version_data["version_number"],
-                        created_at=datetime.fromisoformat(version_data["created_at"]),
-                        backup_path=version_data.get("backup_path"),
-                        is_active=version_data.get("is_active", False),
-                        node_count=version_data.get("node_count"),
-                        relationship_count=version_data.get("relationship_count"),
-                        property_count=version_data.get("property_count"),
-                        source_codebase=version_data.get("source_codebase"),
-                        extraction_job_id=version_data.get("extraction_job_id"),
-                        transformation_job_id=version_data.get("transformation_job_id"),
-                        description=version_data.get("description"),
-                        tags=version_data.get("tags", [])
-                    )
-                    history.versions.append(version)
-                
-                history.current_version = data.get("current_version")
-                return history
-        except Exception as e:
-            logger.warning(f"Failed to load version history: {e}")
-        
-        return VersionHistory()
-    
-    async def _save_backup_registry(self) -> None:
-        """Save backup registry to file."""
-        try:
-            with open(self.registry_file, 'w') as f:
-                json.dump(self.backup_registry.to_dict(), f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save backup registry: {e}")
-            raise
-    
-    async def _save_version_history(self) -> None:
-        """Save version history to file."""
-        try:
-            with open(self.version_history_file, 'w') as f:
-                json.dump(self.version_history.to_dict(), f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save version history: {e}")
-            raise
\ No newline at end of file
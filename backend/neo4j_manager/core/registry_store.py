@@ -0,0 +1,481 @@
+"""
+Registry Store - SQLite storage behind the DatabaseTracker
+
+Backups, database versions and recorded graph fingerprints live in one
+SQLite database in the backup directory instead of JSON files rewritten in
+full on every change.
+
+- Lookups go through the primary keys (job_id, version_number, scope) or
+  indexes on creation time, backup path and graph identity
+- Listings are read page by page in index order, never all at once
+- The database runs in WAL mode, so API handlers and CLI processes reading
+  the registry never block a writer; multi-statement writes are single
+  IMMEDIATE transactions, so concurrent writers serialize instead of losing
+  each other's changes
+- The active version is a single row of store_meta, so adding a version
+  never rewrites earlier ones
+- JSON registries written by earlier releases are imported on first open
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from ..models.backup_metadata import BackupMetadata
+from ..models.database_version import DatabaseVersion
+
+logger = logging.getLogger(__name__)
+
+# Bump when the table layout changes
+REGISTRY_SCHEMA_VERSION = "1"
+
+REGISTRY_DB_NAME = "registry.db"
+
+# Fingerprint fields that identify a graph (the rest, e.g. computed_at, is informational)
+FINGERPRINT_IDENTITY = ("namespace", "node_count", "relationship_count", "key_hash")
+
+# Legacy JSON files imported on first open, renamed with this suffix afterwards
+LEGACY_REGISTRY_FILE = "backup_registry.json"
+LEGACY_VERSION_HISTORY_FILE = "version_history.json"
+LEGACY_FINGERPRINTS_FILE = "graph_fingerprints.json"
+MIGRATED_SUFFIX = ".migrated"
+
+_BACKUP_COLUMNS = (
+    "job_id", "backup_path", "created_at", "size_bytes", "description", "neo4j_version",
+    "node_count", "relationship_count", "namespace", "fingerprint"
+)
+_VERSION_COLUMNS = (
+    "version_number", "job_id", "created_at", "backup_path", "node_count", "relationship_count",
+    "property_count", "source_codebase", "extraction_job_id", "transformation_job_id", "description", "tags"
+)
+# Completed with INSERT, INSERT OR REPLACE or INSERT OR IGNORE
+_BACKUP_INSERT = (
+    f"INTO backups ({', '.join(_BACKUP_COLUMNS)}, created_ts, graph_identity) "
+    f"VALUES ({', '.join('?' * (len(_BACKUP_COLUMNS) + 2))})"
+)
+_VERSION_INSERT = (
+    f"INTO versions ({', '.join(_VERSION_COLUMNS)}, created_ts) "
+    f"VALUES ({', '.join('?' * (len(_VERSION_COLUMNS) + 1))})"
+)
+
+
+def graph_identity(fingerprint: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Indexable key of the graph a fingerprint describes."""
+    if not fingerprint:
+        return None
+    return json.dumps([fingerprint.get(field) for field in FINGERPRINT_IDENTITY])
+
+
+class RegistryStore:
+    """SQLite-backed registry of backups, database versions and graph fingerprints."""
+
+    def __init__(self, db_path: Path, busy_timeout_seconds: float = 30.0):
+        """
+        Open (or create) the registry.
+
+        Args:
+            db_path: Path of the SQLite database file
+            busy_timeout_seconds: How long a writer waits for another process's transaction
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # Autocommit; multi-statement writes open their own transactions
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=busy_timeout_seconds, isolation_level=None, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+        self._import_legacy_json()
+
+    # Backups
+
+    def put_backup(self, backup: BackupMetadata) -> None:
+        """Insert or replace the backup registered for a job."""
+        with self._lock:
+            self._conn.execute(f"INSERT OR REPLACE {_BACKUP_INSERT}", self._backup_row(backup))
+
+    def get_backup(self, job_id: str) -> Optional[BackupMetadata]:
+        """Backup registered for a job."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM backups WHERE job_id = ?", (job_id,)).fetchone()
+        return self._backup(row) if row else None
+
+    def delete_backups(self, job_ids: Sequence[str]) -> None:
+        """Remove the registry entries of some jobs."""
+        with self._transaction() as conn:
+            conn.executemany("DELETE FROM backups WHERE job_id = ?", [(job_id,) for job_id in job_ids])
+
+    def iter_backups(self, created_after: Optional[datetime] = None, page_size: int = 256) -> Iterator[BackupMetadata]:
+        """
+        Backups newest first, optionally only those created after a time.
+
+        Rows are read a page at a time, each page continuing from the last
+        row of the previous one through the creation time index, so callers
+        that stop early never read the rest of the registry.
+        """
+        floor = created_after.timestamp() if created_after is not None else float("-inf")
+        after: Optional[tuple] = None
+        while True:
+            with self._lock:
+                if after is None:
+                    rows = self._conn.execute(
+                        "SELECT * FROM backups WHERE created_ts >= ? "
+                        "ORDER BY created_ts DESC, job_id LIMIT ?",
+                        (floor, page_size)
+                    ).fetchall()
+                else:
+                    rows = self._conn.execute(
+                        "SELECT * FROM backups WHERE created_ts >= ? "
+                        "AND (created_ts < ? OR (created_ts = ? AND job_id > ?)) "
+                        "ORDER BY created_ts DESC, job_id LIMIT ?",
+                        (floor, after[0], after[0], after[1], page_size)
+                    ).fetchall()
+            for row in rows:
+                yield self._backup(row)
+            if len(rows) < page_size:
+                return
+            after = (rows[-1]["created_ts"], rows[-1]["job_id"])
+
+    def backup_path_shared(self, backup_path: str, job_id: str) -> bool:
+        """Whether a job other than job_id is registered with the same backup path."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM backups WHERE backup_path = ? AND job_id != ? LIMIT 1", (backup_path, job_id)
+            ).fetchone() is not None
+
+    def backups_with_graph(self, fingerprint: Dict[str, Any]) -> List[BackupMetadata]:
+        """Backups taken of the graph the fingerprint describes, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM backups WHERE graph_identity = ? ORDER BY created_ts DESC",
+                (graph_identity(fingerprint),)
+            ).fetchall()
+        return [self._backup(row) for row in rows]
+
+    def count_backups(self) -> int:
+        """Number of registered backups."""
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM backups").fetchone()[0]
+
+    def backup_totals(self) -> Dict[str, Any]:
+        """
+        Count, total size and creation time range of the registered backups.
+
+        Aggregated in SQL, so statistics never load the backups themselves.
+        Timestamps are None when the registry is empty.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT count(*), coalesce(sum(size_bytes), 0), min(created_ts), max(created_ts), avg(created_ts) "
+                "FROM backups"
+            ).fetchone()
+        return {
+            "count": row[0],
+            "size_bytes": row[1],
+            "oldest_ts": row[2],
+            "newest_ts": row[3],
+            "average_ts": row[4]
+        }
+
+    # Versions
+
+    def add_version(self, version: DatabaseVersion) -> DatabaseVersion:
+        """
+        Append a version, numbered after the newest one, and make it the active version.
+
+        Numbering and activation happen in one transaction, so concurrent
+        writers never hand out the same number.
+        """
+        with self._transaction() as conn:
+            latest = conn.execute("SELECT max(version_number) FROM versions").fetchone()[0]
+            version.version_number = (latest or 0) + 1
+            version.is_active = True
+            conn.execute(f"INSERT {_VERSION_INSERT}", self._version_row(version))
+            self._set_meta(conn, "current_version", str(version.version_number))
+        return version
+
+    def get_version(self, version_number: int) -> Optional[DatabaseVersion]:
+        """Version by number."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM versions WHERE version_number = ?", (version_number,)).fetchone()
+            current = self._current_version()
+        return self._version(row, current) if row else None
+
+    def get_version_by_job_id(self, job_id: str) -> Optional[DatabaseVersion]:
+        """Earliest version created by a job."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM versions WHERE job_id = ? ORDER BY version_number LIMIT 1", (job_id,)
+            ).fetchone()
+            current = self._current_version()
+        return self._version(row, current) if row else None
+
+    def get_active_version(self) -> Optional[DatabaseVersion]:
+        """The active version."""
+        with self._lock:
+            current = self._current_version()
+        return self.get_version(current) if current is not None else None
+
+    def list_versions(self, limit: Optional[int] = None, offset: int = 0) -> List[DatabaseVersion]:
+        """One page of versions, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM versions ORDER BY created_ts DESC, version_number DESC LIMIT ? OFFSET ?",
+                (limit if limit is not None else -1, offset)
+            ).fetchall()
+            current = self._current_version()
+        return [self._version(row, current) for row in rows]
+
+    def count_versions(self) -> int:
+        """Number of versions."""
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM versions").fetchone()[0]
+
+    def current_version(self) -> Optional[int]:
+        """Number of the active version."""
+        with self._lock:
+            return self._current_version()
+
+    # Graph fingerprints
+
+    def put_fingerprint(self, scope: str, fingerprint: Dict[str, Any], drop_overlapping: bool = True) -> None:
+        """Record the fingerprint of a scope ("" is the whole graph)."""
+        with self._transaction() as conn:
+            if drop_overlapping:
+                self._drop_overlapping(conn, scope)
+            conn.execute(
+                "INSERT OR REPLACE INTO fingerprints (scope, fingerprint) VALUES (?, ?)",
+                (scope, json.dumps(fingerprint))
+            )
+
+    def drop_fingerprints(self, scope: str) -> None:
+        """Drop the fingerprint of a scope and of every scope overlapping it."""
+        with self._transaction() as conn:
+            self._drop_overlapping(conn, scope)
+            conn.execute("DELETE FROM fingerprints WHERE scope = ?", (scope,))
+
+    def get_fingerprint(self, scope: str) -> Optional[Dict[str, Any]]:
+        """Recorded fingerprint of a scope."""
+        with self._lock:
+            row = self._conn.execute("SELECT fingerprint FROM fingerprints WHERE scope = ?", (scope,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+    # Internals
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction that takes the database write lock up front."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _create_schema(self) -> None:
+        """Create tables, refusing databases written with another schema version."""
+        with self._transaction() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            row = conn.execute("SELECT value FROM store_meta WHERE key = 'schema_version'").fetchone()
+            if row and row[0] != REGISTRY_SCHEMA_VERSION:
+                # Unlike a cache, the registry cannot be rebuilt, so never discard it
+                raise RuntimeError(
+                    f"Backup registry {self.db_path} has schema version {row[0]}, "
+                    f"expected {REGISTRY_SCHEMA_VERSION}"
+                )
+
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS backups (
+                    job_id TEXT PRIMARY KEY,
+                    backup_path TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    created_ts REAL NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    description TEXT,
+                    neo4j_version TEXT,
+                    node_count INTEGER,
+                    relationship_count INTEGER,
+                    namespace TEXT,
+                    fingerprint TEXT,
+                    graph_identity TEXT
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS backups_created ON backups (created_ts)")
+            conn.execute("CREATE INDEX IF NOT EXISTS backups_path ON backups (backup_path)")
+            conn.execute("CREATE INDEX IF NOT EXISTS backups_graph ON backups (graph_identity, created_ts)")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS versions (
+                    version_number INTEGER PRIMARY KEY,
+                    job_id TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    created_ts REAL NOT NULL,
+                    backup_path TEXT,
+                    node_count INTEGER,
+                    relationship_count INTEGER,
+                    property_count INTEGER,
+                    source_codebase TEXT,
+                    extraction_job_id TEXT,
+                    transformation_job_id TEXT,
+                    description TEXT,
+                    tags TEXT NOT NULL DEFAULT '[]'
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS versions_job ON versions (job_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS versions_created ON versions (created_ts)")
+            conn.execute("CREATE TABLE IF NOT EXISTS fingerprints (scope TEXT PRIMARY KEY, fingerprint TEXT NOT NULL)")
+            self._set_meta(conn, "schema_version", REGISTRY_SCHEMA_VERSION)
+
+    def _import_legacy_json(self) -> None:
+        """Import the JSON registry, version history and fingerprints written by earlier releases."""
+        directory = self.db_path.parent
+        legacy = [
+            directory / name
+            for name in (LEGACY_REGISTRY_FILE, LEGACY_VERSION_HISTORY_FILE, LEGACY_FINGERPRINTS_FILE)
+            if (directory / name).exists()
+        ]
+        if not legacy:
+            return
+
+        backups: List[BackupMetadata] = []
+        versions: List[DatabaseVersion] = []
+        current: Optional[int] = None
+        fingerprints: Dict[str, Dict[str, Any]] = {}
+        try:
+            registry_file = directory / LEGACY_REGISTRY_FILE
+            if registry_file.exists():
+                for backup_data in json.loads(registry_file.read_text()).get("backups", {}).values():
+                    backup_data = dict(backup_data, created_at=datetime.fromisoformat(backup_data["created_at"]))
+                    backups.append(BackupMetadata(**{
+                        column: backup_data.get(column) for column in _BACKUP_COLUMNS if column in backup_data
+                    }))
+
+            history_file = directory / LEGACY_VERSION_HISTORY_FILE
+            if history_file.exists():
+                history = json.loads(history_file.read_text())
+                for version_data in history.get("versions", []):
+                    version_data = dict(version_data, created_at=datetime.fromisoformat(version_data["created_at"]))
+                    versions.append(DatabaseVersion(**{
+                        column: version_data.get(column) for column in _VERSION_COLUMNS if column in version_data
+                    }))
+                current = history.get("current_version")
+
+            fingerprints_file = directory / LEGACY_FINGERPRINTS_FILE
+            if fingerprints_file.exists():
+                fingerprints = json.loads(fingerprints_file.read_text())
+        except Exception as e:
+            logger.warning(f"Failed to read legacy backup registry files, leaving them in place: {e}")
+            return
+
+        with self._transaction() as conn:
+            conn.executemany(
+                f"INSERT OR IGNORE {_BACKUP_INSERT}",
+                [self._backup_row(backup) for backup in backups]
+            )
+            conn.executemany(
+                f"INSERT OR IGNORE {_VERSION_INSERT}",
+                [self._version_row(version) for version in versions]
+            )
+            if current is not None and self._current_version_in(conn) is None:
+                self._set_meta(conn, "current_version", str(current))
+            conn.executemany(
+                "INSERT OR IGNORE INTO fingerprints (scope, fingerprint) VALUES (?, ?)",
+                [(scope, json.dumps(fingerprint)) for scope, fingerprint in fingerprints.items()]
+            )
+
+        # Keep the old files for reference, but never import them twice
+        for path in legacy:
+            path.replace(path.with_name(path.name + MIGRATED_SUFFIX))
+        logger.info(f"Imported {len(backups)} backups, {len(versions)} versions and "
+                    f"{len(fingerprints)} graph fingerprints into {self.db_path}")
+
+    def _current_version(self) -> Optional[int]:
+        """Active version number; caller holds the lock."""
+        return self._current_version_in(self._conn)
+
+    @staticmethod
+    def _current_version_in(conn: sqlite3.Connection) -> Optional[int]:
+        row = conn.execute("SELECT value FROM store_meta WHERE key = 'current_version'").fetchone()
+        return int(row[0]) if row else None
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, key: str, value: str) -> None:
+        conn.execute("INSERT OR REPLACE INTO store_meta (key, value) VALUES (?, ?)", (key, value))
+
+    @staticmethod
+    def _drop_overlapping(conn: sqlite3.Connection, scope: str) -> None:
+        """Drop the fingerprints of scopes overlapping scope: the whole graph overlaps every namespace."""
+        if scope:
+            conn.execute("DELETE FROM fingerprints WHERE scope = ''")
+        else:
+            conn.execute("DELETE FROM fingerprints WHERE scope != ''")
+
+    @staticmethod
+    def _backup_row(backup: BackupMetadata) -> tuple:
+        return (
+            backup.job_id, backup.backup_path, backup.created_at.isoformat(), backup.size_bytes,
+            backup.description, backup.neo4j_version, backup.node_count, backup.relationship_count,
+            backup.namespace, json.dumps(backup.fingerprint) if backup.fingerprint else None,
+            backup.created_at.timestamp(), graph_identity(backup.fingerprint)
+        )
+
+    @staticmethod
+    def _version_row(version: DatabaseVersion) -> tuple:
+        return (
+            version.version_number, version.job_id, version.created_at.isoformat(), version.backup_path,
+            version.node_count, version.relationship_count, version.property_count, version.source_codebase,
+            version.extraction_job_id, version.transformation_job_id, version.description,
+            json.dumps(version.tags), version.created_at.timestamp()
+        )
+
+    @staticmethod
+    def _backup(row: sqlite3.Row) -> BackupMetadata:
+        return BackupMetadata(
+            job_id=row["job_id"],
+            backup_path=row["backup_path"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            size_bytes=row["size_bytes"],
+            description=row["description"],
+            neo4j_version=row["neo4j_version"],
+            node_count=row["node_count"],
+            relationship_count=row["relationship_count"],
+            namespace=row["namespace"],
+            fingerprint=json.loads(row["fingerprint"]) if row["fingerprint"] else None
+        )
+
+    @staticmethod
+    def _version(row: sqlite3.Row, current: Optional[int]) -> DatabaseVersion:
+        return DatabaseVersion(
+            job_id=row["job_id"],
+            version_number=row["version_number"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            backup_path=row["backup_path"],
+            is_active=row["version_number"] == current,
+            node_count=row["node_count"],
+            relationship_count=row["relationship_count"],
+            property_count=row["property_count"],
+            source_codebase=row["source_codebase"],
+            extraction_job_id=row["extraction_job_id"],
+            transformation_job_id=row["transformation_job_id"],
+            description=row["description"],
+            tags=json.loads(row["tags"])
+        )
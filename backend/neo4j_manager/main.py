@@ -29,6 +29,14 @@ async def main():
                        help="Action to perform")
     parser.add_argument("--job-id", help="Job ID for backup/restore operations")
     parser.add_argument("--backup-location", help="Custom backup location")
+    parser.add_argument("--namespace", help="Only back up (snapshot mode) or clear this graph namespace")
+    parser.add_argument("--mode", choices=["snapshot", "chunked", "tarball"],
+                       help="Backup mode: online graph snapshot, or stop-the-world deduplicated chunk "
+                            "store or tarball (default: NEO4J_BACKUP_MODE)")
+    parser.add_argument("--batch-size", type=int,
+                       help="Nodes or relationships deleted per transaction when clearing")
+    parser.add_argument("--force", action="store_true",
+                       help="Back up even if the graph still matches an existing backup")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
     
     args = parser.parse_args()
@@ -44,10 +52,21 @@ async def main():
                 print("Job ID required for backup operation")
                 sys.exit(1)
             
-            backup_result = await backup_service.create_backup(args.job_id)
-            if backup_result.success:
+            backup_result = await backup_service.create_backup(
+                args.job_id, mode=args.mode, namespace=args.namespace, skip_if_unchanged=not args.force
+            )
+            if backup_result.success and backup_result.skipped:
+                print(f"Graph unchanged, reusing backup of job {backup_result.reused_backup_job_id}: "
+                      f"{backup_result.backup_path}")
+                print(f"Job ID: {args.job_id}")
+                sys.exit(0)
+            elif backup_result.success:
                 print(f"Backup created: {backup_result.backup_path}")
                 print(f"Job ID: {args.job_id}")
+                if backup_result.backup_mode == "snapshot":
+                    print(f"Snapshot: {backup_result.node_count} nodes ({backup_result.nodes_per_second:.0f}/s), "
+                          f"{backup_result.relationship_count} relationships "
+                          f"({backup_result.relationships_per_second:.0f}/s)")
                 sys.exit(0)
             else:
                 print(f"Backup failed: {backup_result.error}")
@@ -61,15 +80,24 @@ async def main():
             restore_result = await backup_service.restore_backup(args.job_id)
             if restore_result.success:
                 print(f"Database restored from: {restore_result.backup_path}")
+                if restore_result.nodes_restored is not None:
+                    print(f"Restored: {restore_result.nodes_restored} nodes ({restore_result.nodes_per_second:.0f}/s), "
+                          f"{restore_result.relationships_restored} relationships "
+                          f"({restore_result.relationships_per_second:.0f}/s)")
                 sys.exit(0)
             else:
                 print(f"Restore failed: {restore_result.error}")
                 sys.exit(1)
         
         elif args.action == "clear":
-            clear_result = await backup_service.clear_database()
+            def report(progress) -> None:
+                print(f"Clear progress: {progress.progress_percentage:.1f}% "
+                      f"({progress.nodes_deleted} nodes, {progress.relationships_deleted} relationships)")
+            
+            clear_result = await backup_service.clear_database(args.namespace, args.batch_size, report)
             if clear_result.success:
-                print("Database cleared successfully")
+                print(f"Database cleared successfully: {clear_result.nodes_deleted} nodes, "
+                      f"{clear_result.relationships_deleted} relationships")
                 sys.exit(0)
             else:
                 print(f"Clear failed: {clear_result.error}")
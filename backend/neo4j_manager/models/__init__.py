@@ -9,7 +9,8 @@ from .backup_metadata import (
     RestoreResult,
     BackupMetadata,
     ServiceOperationResult,
-    TarballResult
+    TarballResult,
+    ChunkStoreResult
 )
 
 from .database_version import (
@@ -25,6 +26,7 @@ __all__ = [
     "BackupMetadata",
     "ServiceOperationResult",
     "TarballResult",
+    "ChunkStoreResult",
     
     # Database version models
     "DatabaseVersion",
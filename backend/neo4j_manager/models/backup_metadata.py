@@ -16,8 +16,19 @@ class BackupResult(BaseModel):
     job_id: str = Field(..., description="Job ID associated with this backup")
     success: bool = Field(default=False, description="Whether the backup was successful")
     backup_path: Optional[str] = Field(None, description="Path to the backup file")
-    backup_size_bytes: Optional[int] = Field(None, description="Size of backup in bytes")
+    backup_size_bytes: Optional[int] = Field(None, description="Size of backup in bytes (bytes added to the store for chunked backups)")
     backup_duration_seconds: Optional[float] = Field(None, description="Time taken to create backup")
+    backup_mode: Optional[str] = Field(None, description="How the backup was taken (snapshot, chunked, tarball)")
+    source_size_bytes: Optional[int] = Field(None, description="Uncompressed size of a chunked backup's files")
+    deduplication_ratio: Optional[float] = Field(None, description="Share of a chunked backup's chunks already stored")
+    skipped: bool = Field(default=False, description="Whether an existing backup of the unchanged graph was reused")
+    reused_backup_job_id: Optional[str] = Field(None, description="Job ID of the backup reused when skipped")
+    node_count: Optional[int] = Field(None, description="Nodes written to a snapshot backup")
+    relationship_count: Optional[int] = Field(None, description="Relationships written to a snapshot backup")
+    nodes_per_second: Optional[float] = Field(None, description="Node throughput of a snapshot backup")
+    relationships_per_second: Optional[float] = Field(None, description="Relationship throughput of a snapshot backup")
+    nodes_deleted: Optional[int] = Field(None, description="Nodes deleted by a clear operation")
+    relationships_deleted: Optional[int] = Field(None, description="Relationships deleted by a clear operation")
     errors: List[str] = Field(default_factory=list, description="List of errors encountered")
     created_at: datetime = Field(default_factory=datetime.now, description="Timestamp of backup creation")
     
@@ -47,6 +58,17 @@ class BackupResult(BaseModel):
             "backup_size_bytes": self.backup_size_bytes,
             "backup_size_mb": self.size_mb,
             "backup_duration_seconds": self.backup_duration_seconds,
+            "backup_mode": self.backup_mode,
+            "source_size_bytes": self.source_size_bytes,
+            "deduplication_ratio": self.deduplication_ratio,
+            "skipped": self.skipped,
+            "reused_backup_job_id": self.reused_backup_job_id,
+            "node_count": self.node_count,
+            "relationship_count": self.relationship_count,
+            "nodes_per_second": self.nodes_per_second,
+            "relationships_per_second": self.relationships_per_second,
+            "nodes_deleted": self.nodes_deleted,
+            "relationships_deleted": self.relationships_deleted,
             "errors": self.errors,
             "created_at": self.created_at.isoformat(),
             "has_errors": self.has_errors
@@ -60,6 +82,10 @@ class RestoreResult(BaseModel):
     success: bool = Field(default=False, description="Whether the restore was successful")
     backup_path: Optional[str] = Field(None, description="Path to the backup file restored from")
     restore_duration_seconds: Optional[float] = Field(None, description="Time taken to restore")
+    nodes_restored: Optional[int] = Field(None, description="Nodes loaded from a snapshot backup")
+    relationships_restored: Optional[int] = Field(None, description="Relationships loaded from a snapshot backup")
+    nodes_per_second: Optional[float] = Field(None, description="Node throughput of a snapshot restore")
+    relationships_per_second: Optional[float] = Field(None, description="Relationship throughput of a snapshot restore")
     errors: List[str] = Field(default_factory=list, description="List of errors encountered")
     restored_at: datetime = Field(default_factory=datetime.now, description="Timestamp of restore")
     
@@ -80,6 +106,10 @@ class RestoreResult(BaseModel):
             "success": self.success,
             "backup_path": self.backup_path,
             "restore_duration_seconds": self.restore_duration_seconds,
+            "nodes_restored": self.nodes_restored,
+            "relationships_restored": self.relationships_restored,
+            "nodes_per_second": self.nodes_per_second,
+            "relationships_per_second": self.relationships_per_second,
             "errors": self.errors,
             "restored_at": self.restored_at.isoformat(),
             "has_errors": self.has_errors
@@ -97,6 +127,8 @@ class BackupMetadata(BaseModel):
     neo4j_version: Optional[str] = Field(None, description="Neo4j version at backup time")
     node_count: Optional[int] = Field(None, description="Number of nodes in the backup")
     relationship_count: Optional[int] = Field(None, description="Number of relationships in the backup")
+    namespace: Optional[str] = Field(None, description="Graph namespace backed up, or None for the whole graph")
+    fingerprint: Optional[Dict[str, Any]] = Field(None, description="Graph fingerprint at backup time")
     
     @property
     def size_mb(self) -> float:
@@ -124,6 +156,8 @@ class BackupMetadata(BaseModel):
             "neo4j_version": self.neo4j_version,
             "node_count": self.node_count,
             "relationship_count": self.relationship_count,
+            "namespace": self.namespace,
+            "fingerprint": self.fingerprint,
             "age_days": self.age_days,
             "exists": self.exists()
         }
@@ -166,4 +200,43 @@ class TarballResult(BaseModel):
             "target_path": self.target_path,
             "size_bytes": self.size_bytes,
             "error": self.error
-        }
\ No newline at end of file
+        }
+
+class ChunkStoreResult(BaseModel):
+    """Result model for storing a directory in, or restoring it from, the chunk store."""
+    
+    operation: str = Field(..., description="Operation performed (store, restore)")
+    success: bool = Field(default=False, description="Whether the operation was successful")
+    manifest_path: Optional[str] = Field(None, description="Manifest written or read")
+    files: int = Field(default=0, description="Files stored or restored")
+    files_unchanged: int = Field(default=0, description="Files reused from the previous manifest without reading")
+    chunks: int = Field(default=0, description="Chunks referenced by the manifest")
+    new_chunks: int = Field(default=0, description="Chunks not already in the store")
+    source_bytes: int = Field(default=0, description="Uncompressed size of the files")
+    stored_bytes: int = Field(default=0, description="Compressed bytes added to the store")
+    duration_seconds: Optional[float] = Field(None, description="Time taken for the operation")
+    error: Optional[str] = Field(None, description="Error message if operation failed")
+    
+    @property
+    def deduplication_ratio(self) -> float:
+        """Share of the chunks that were already stored."""
+        if self.chunks == 0:
+            return 0.0
+        return 1 - self.new_chunks / self.chunks
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "operation": self.operation,
+            "success": self.success,
+            "manifest_path": self.manifest_path,
+            "files": self.files,
+            "files_unchanged": self.files_unchanged,
+            "chunks": self.chunks,
+            "new_chunks": self.new_chunks,
+            "deduplication_ratio": self.deduplication_ratio,
+            "source_bytes": self.source_bytes,
+            "stored_bytes": self.stored_bytes,
+            "duration_seconds": self.duration_seconds,
+            "error": self.error
+        }
@@ -6,11 +6,12 @@ registration, and version tracking.
 """
 
 import logging
-from typing import Optional, Dict, Any
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
 
 from ..core.backup_manager import BackupManager
 from ..core.database_tracker import DatabaseTracker
-from ..models.backup_metadata import BackupResult, RestoreResult
+from ..models.backup_metadata import BackupMetadata, BackupResult, RestoreResult
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,9 @@ class BackupService:
         self, 
         job_id: str,
         description: Optional[str] = None,
+        mode: Optional[str] = None,
+        namespace: Optional[str] = None,
+        skip_if_unchanged: bool = True,
         **metadata
     ) -> BackupResult:
         """
@@ -38,6 +42,10 @@ class BackupService:
         Args:
             job_id: Job identifier for this backup
             description: Optional description for the backup
+            mode: Backup mode ("snapshot" or "tarball"); defaults to the manager's
+            namespace: Only snapshot this graph namespace
+            skip_if_unchanged: Reuse an existing backup when the graph still
+                matches its fingerprint instead of taking a new one
             **metadata: Additional metadata (neo4j_version, node_count, etc.)
         
         Returns:
@@ -45,16 +53,38 @@ class BackupService:
         """
         try:
             logger.info(f"Starting backup workflow for job {job_id}")
+            start_time = datetime.now()
+            
+            # Data directory backups always cover the whole graph
+            mode = mode or self.backup_manager.backup_mode
+            scope = namespace if mode == "snapshot" else None
+            
+            recorded = await self.database_tracker.get_graph_fingerprint(scope)
+            fingerprint = await self.backup_manager.graph_fingerprint(scope, recorded)
+            if fingerprint and fingerprint is not recorded:
+                await self.database_tracker.record_graph_fingerprint(fingerprint)
+            
+            if skip_if_unchanged and fingerprint:
+                existing = await self.database_tracker.find_backup_by_fingerprint(fingerprint)
+                if existing:
+                    return await self._reuse_backup(job_id, existing, description, start_time, **metadata)
             
             # Create the backup
-            backup_result = await self.backup_manager.create_backup(job_id)
+            backup_result = await self.backup_manager.create_backup(job_id, mode=mode, namespace=namespace)
             
             if backup_result.success and backup_result.backup_path:
+                # Snapshots count what they wrote
+                if backup_result.node_count is not None:
+                    metadata.setdefault("node_count", backup_result.node_count)
+                    metadata.setdefault("relationship_count", backup_result.relationship_count)
+                
                 # Register the backup
                 await self.database_tracker.register_backup(
                     job_id=job_id,
                     backup_path=backup_result.backup_path,
                     description=description or f"Backup for job {job_id}",
+                    namespace=scope,
+                    fingerprint=fingerprint,
                     **metadata
                 )
                 
@@ -79,6 +109,46 @@ class BackupService:
             result.add_error(str(e))
             return result
     
+    async def _reuse_backup(
+        self,
+        job_id: str,
+        existing: BackupMetadata,
+        description: Optional[str],
+        start_time: datetime,
+        **metadata
+    ) -> BackupResult:
+        """Register an existing backup of the unchanged graph for job_id instead of taking a new one."""
+        logger.info(f"Graph unchanged since the backup of job {existing.job_id}, reusing {existing.backup_path}")
+        
+        await self.database_tracker.register_backup(
+            job_id=job_id,
+            backup_path=existing.backup_path,
+            description=description or f"Backup for job {job_id} (reuses {existing.job_id})",
+            neo4j_version=existing.neo4j_version,
+            node_count=existing.node_count,
+            relationship_count=existing.relationship_count,
+            namespace=existing.namespace,
+            fingerprint=existing.fingerprint
+        )
+        await self.database_tracker.add_database_version(
+            job_id=job_id,
+            backup_path=existing.backup_path,
+            description=description,
+            **metadata
+        )
+        
+        return BackupResult(
+            job_id=job_id,
+            success=True,
+            backup_path=existing.backup_path,
+            backup_size_bytes=0,
+            backup_duration_seconds=(datetime.now() - start_time).total_seconds(),
+            node_count=existing.node_count,
+            relationship_count=existing.relationship_count,
+            skipped=True,
+            reused_backup_job_id=existing.job_id
+        )
+    
     async def restore_backup(self, job_id: str) -> RestoreResult:
         """
         Restore a backup with automatic version tracking.
@@ -107,6 +177,12 @@ class BackupService:
             # Perform the restore
             restore_result = await self.backup_manager.restore_backup(job_id, backup_metadata.backup_path)
             
+            # The graph now matches the backup, or is in an unknown state
+            if restore_result.success and backup_metadata.fingerprint:
+                await self.database_tracker.record_graph_fingerprint(backup_metadata.fingerprint)
+            else:
+                await self.database_tracker.invalidate_graph_fingerprint(backup_metadata.namespace)
+            
             if restore_result.success:
                 # Update version tracking to mark this version as active
                 version = await self.database_tracker.get_database_version_by_job_id(job_id)
@@ -138,12 +214,24 @@ class BackupService:
             result.add_error(str(e))
             return result
     
-    async def clear_database(self) -> BackupResult:
+    async def clear_database(
+        self,
+        namespace: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        progress_callback: Optional[Callable[[Any], None]] = None
+    ) -> BackupResult:
         """
-        Clear the database with automatic backup before clearing.
+        Clear the database, or one namespace, with automatic backup before clearing.
+        
+        The clear deletes in bounded batches while the database stays online.
+        
+        Args:
+            namespace: Only clear this namespace; None clears the whole graph
+            batch_size: Nodes or relationships deleted per transaction
+            progress_callback: Called with the running ClearResult after every batch
         
         Returns:
-            BackupResult with operation status
+            BackupResult with operation status and deleted counts
         """
         try:
             logger.info("Starting database clear workflow")
@@ -152,14 +240,16 @@ class BackupService:
             clear_job_id = f"pre_clear_backup_{int(datetime.now().timestamp())}"
             backup_result = await self.create_backup(
                 job_id=clear_job_id,
-                description="Automatic backup before database clear"
+                description="Automatic backup before database clear",
+                namespace=namespace
             )
             
             if not backup_result.success:
                 logger.warning("Pre-clear backup failed, proceeding with clear anyway")
             
             # Clear the database
-            clear_result = await self.backup_manager.clear_database()
+            clear_result = await self.backup_manager.clear_database(namespace, batch_size, progress_callback)
+            await self.database_tracker.invalidate_graph_fingerprint(namespace)
             
             if clear_result.success:
                 logger.info("Database clear workflow completed successfully")
@@ -175,19 +265,26 @@ class BackupService:
             result.add_error(str(e))
             return result
     
-    async def list_backups(self, include_missing: bool = False) -> Dict[str, Any]:
+    async def list_backups(
+        self,
+        include_missing: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Dict[str, Any]:
         """
-        List all backups with metadata.
+        List backups and versions with metadata, newest first.
         
         Args:
             include_missing: Whether to include backups whose files no longer exist
+            limit: Page size for backups and versions, or None for all of them
+            offset: Entries to skip in each list
         
         Returns:
             Dictionary with backup information
         """
         try:
-            backups = await self.database_tracker.list_all_backups(include_missing)
-            versions = await self.database_tracker.list_database_versions()
+            backups = await self.database_tracker.list_all_backups(include_missing, limit=limit, offset=offset)
+            versions = await self.database_tracker.list_database_versions(limit, offset)
             stats = await self.database_tracker.get_storage_statistics()
             
             return {
@@ -279,6 +376,3 @@ class BackupService:
                 "missing_job_ids": [],
                 "error": str(e)
             }
-
-
-from datetime import datetime  # Import needed for clear_database method
\ No newline at end of file
@@ -9,11 +9,12 @@ Key improvements:
 - Uses shared ast_utils to eliminate duplicate code
 - Properly links methods to their parent classes
 - Integrated with status reporting
+- CombinedVisitor extracts every element in a single traversal
 """
 
 import ast
 import logging
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from models import ParsedClass, ParsedFunction, ParsedImport, ParsedVariable
 from ast_utils import (
@@ -46,6 +47,25 @@ class ClassVisitor(ast.NodeVisitor):
         
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """Visit a class definition node."""
+        class_info = self.create_class_info(node)
+        
+        # Handle nested class vs. top-level class
+        parent_class = self.current_class
+        self.current_class = class_info
+        
+        # Visit children - this will populate methods and inner classes
+        self.generic_visit(node)
+        
+        # Restore parent context and add to appropriate list
+        self.current_class = parent_class
+        
+        if parent_class:
+            parent_class.inner_classes.append(class_info)
+        else:
+            self.classes.append(class_info)
+            
+    def create_class_info(self, node: ast.ClassDef) -> ParsedClass:
+        """Build an empty ParsedClass for a class node and report it."""
         # Report progress
         if self.status_reporter:
             self.status_reporter.report_status(
@@ -55,7 +75,7 @@ class ClassVisitor(ast.NodeVisitor):
             )
             
         # Extract class information using shared utilities
-        class_info = ParsedClass(
+        return ParsedClass(
             name=node.name,
             bases=get_base_classes(node),
             docstring=get_docstring(node),
@@ -66,21 +86,6 @@ class ClassVisitor(ast.NodeVisitor):
             decorators=get_decorators(node),
             inner_classes=[],
         )
-        
-        # Handle nested class vs. top-level class
-        parent_class = self.current_class
-        self.current_class = class_info
-        
-        # Visit children - this will populate methods and inner classes
-        self.generic_visit(node)
-        
-        # Restore parent context and add to appropriate list
-        self.current_class = parent_class
-        
-        if parent_class:
-            parent_class.inner_classes.append(class_info)
-        else:
-            self.classes.append(class_info)
             
             
 class FunctionVisitor(ast.NodeVisitor):
@@ -103,6 +108,31 @@ class FunctionVisitor(ast.NodeVisitor):
         
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Visit a function definition node."""
+        function_info = self.create_function_info(node, is_method=self.current_class is not None)
+        
+        # Handle nested function vs. top-level function/method
+        parent_function = self.current_function
+        self.current_function = function_info
+        
+        # Visit children to extract nested functions and variables
+        self.generic_visit(node)
+        
+        # Restore parent context
+        self.current_function = parent_function
+        
+        # Add to appropriate container
+        if parent_function:
+            # This is a nested function
+            parent_function.nested_functions.append(function_info)
+        elif self.current_class:
+            # This is a method - add it to the current class
+            self.current_class.methods.append(function_info)
+        else:
+            # This is a top-level function
+            self.functions.append(function_info)
+            
+    def create_function_info(self, node: ast.AST, is_method: bool) -> ParsedFunction:
+        """Build an empty ParsedFunction for a (async) function node and report it."""
         # Report progress
         if self.status_reporter:
             self.status_reporter.report_status(
@@ -124,7 +154,7 @@ class FunctionVisitor(ast.NodeVisitor):
         signature = self._build_signature(node.name, parameters, return_type)
         
         # Create parsed function
-        function_info = ParsedFunction(
+        return ParsedFunction(
             name=node.name,
             signature=signature,
             docstring=get_docstring(node),
@@ -135,31 +165,10 @@ class FunctionVisitor(ast.NodeVisitor):
             line_start=node.lineno,
             line_end=getattr(node, "end_lineno", node.lineno),
             decorators=decorators,
-            is_method=self.current_class is not None,
+            is_method=is_method,
             is_static=is_static,
             is_class_method=is_class_method,
         )
-        
-        # Handle nested function vs. top-level function/method
-        parent_function = self.current_function
-        self.current_function = function_info
-        
-        # Visit children to extract nested functions and variables
-        self.generic_visit(node)
-        
-        # Restore parent context
-        self.current_function = parent_function
-        
-        # Add to appropriate container
-        if parent_function:
-            # This is a nested function
-            parent_function.nested_functions.append(function_info)
-        elif self.current_class:
-            # This is a method - add it to the current class
-            self.current_class.methods.append(function_info)
-        else:
-            # This is a top-level function
-            self.functions.append(function_info)
             
     def _build_signature(
         self, 
@@ -244,6 +253,20 @@ class VariableVisitor(ast.NodeVisitor):
 
     def visit_Assign(self, node: ast.Assign) -> None:
         """Visit an assignment node."""
+        self.add_assignment(node)
+
+        # Continue visiting children
+        self.generic_visit(node)
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        """Visit an annotated assignment (x: int = 1)."""
+        self.add_annotated_assignment(node)
+
+        # Continue visiting children
+        self.generic_visit(node)
+
+    def add_assignment(self, node: ast.Assign) -> None:
+        """Record the variables bound by an assignment in the current scope."""
         # Extract the assigned value
         value_repr = extract_value(node.value)
 
@@ -286,11 +309,8 @@ class VariableVisitor(ast.NodeVisitor):
                         is_class_var=True,  # Class variable
                     )
 
-        # Continue visiting children
-        self.generic_visit(node)
-
-    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
-        """Visit an annotated assignment (x: int = 1)."""
+    def add_annotated_assignment(self, node: ast.AnnAssign) -> None:
+        """Record the variable bound by an annotated assignment in the current scope."""
         if isinstance(node.target, ast.Name):
             # Extract type annotation
             type_annotation = extract_annotation(node)
@@ -306,9 +326,6 @@ class VariableVisitor(ast.NodeVisitor):
                 inferred_type=type_annotation,
             )
 
-        # Continue visiting children
-        self.generic_visit(node)
-
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """Update scope when entering a class definition."""
         old_scope = self.current_scope
@@ -352,8 +369,13 @@ class VariableVisitor(ast.NodeVisitor):
 
 class CombinedVisitor(ast.NodeVisitor):
     """
-    A combined visitor that properly handles the interaction between
-    class and function visitors to ensure methods are linked to classes.
+    A combined visitor that extracts classes, methods, nested functions,
+    imports and variables in a single traversal.
+    
+    A scope stack of the enclosing class/function definitions lets each
+    definition be attached to its parent as soon as it is reached, so the
+    cost is linear in the size of the module. Expression subtrees are never
+    entered because they cannot contain definitions or assignments.
     """
     
     def __init__(self, status_reporter=None):
@@ -363,6 +385,11 @@ class CombinedVisitor(ast.NodeVisitor):
         self.variable_visitor = VariableVisitor(status_reporter)
         self.status_reporter = status_reporter
         
+        # (scope kind, parsed element) for each enclosing class or function
+        self._scope_stack: List[Tuple[str, Any]] = []
+        # Innermost enclosing class, looking through function scopes
+        self._current_class: Optional[ParsedClass] = None
+        
     def visit(self, node: ast.AST) -> Dict[str, List]:
         """
         Visit the AST and extract all structural elements.
@@ -370,15 +397,7 @@ class CombinedVisitor(ast.NodeVisitor):
         Returns:
             Dictionary containing classes, functions, imports, and variables
         """
-        # First pass: Extract classes and imports
-        self.class_visitor.visit(node)
-        self.import_visitor.visit(node)
-        
-        # Second pass: Extract functions with class context
-        self._extract_functions_with_context(node)
-        
-        # Third pass: Extract variables
-        self.variable_visitor.visit(node)
+        self._visit_node(node)
         
         return {
             "classes": self.class_visitor.classes,
@@ -387,48 +406,86 @@ class CombinedVisitor(ast.NodeVisitor):
             "variables": self.variable_visitor.variables
         }
         
-    def _extract_functions_with_context(self, node: ast.AST) -> None:
-        """Extract functions while maintaining class context."""
-        for child in ast.walk(node):
-            if isinstance(child, ast.ClassDef):
-                # Find the corresponding ParsedClass
-                parsed_class = self._find_parsed_class(child.name)
-                if parsed_class:
-                    # Set class context and visit methods
-                    self.function_visitor.set_current_class(parsed_class)
-                    for item in child.body:
-                        if isinstance(item, ast.FunctionDef):
-                            self.function_visitor.visit(item)
-                    self.function_visitor.set_current_class(None)
-            elif isinstance(child, ast.FunctionDef):
-                # Top-level function (not in a class)
-                if not self._is_method(child):
-                    self.function_visitor.visit(child)
-                    
-    def _find_parsed_class(self, name: str) -> Optional[ParsedClass]:
-        """Find a parsed class by name."""
-        for cls in self.class_visitor.classes:
-            if cls.name == name:
-                return cls
-            # Check inner classes
-            found = self._find_inner_class(cls, name)
-            if found:
-                return found
-        return None
+    def _visit_node(self, node: ast.AST) -> None:
+        """Dispatch a node to its handler, or descend into its statements."""
+        handler = self._HANDLERS.get(type(node))
+        if handler is not None:
+            handler(self, node)
+        else:
+            self._visit_children(node)
+            
+    def _visit_children(self, node: ast.AST) -> None:
+        """Visit the child nodes that can hold statements."""
+        for child in ast.iter_child_nodes(node):
+            if not isinstance(child, ast.expr):
+                self._visit_node(child)
+                
+    def _visit_body(self, node: ast.AST, scope: str, element: Any) -> None:
+        """Visit the statements of a class or function inside its scope."""
+        self._scope_stack.append((scope, element))
+        previous_scope = self.variable_visitor.current_scope
+        self.variable_visitor.current_scope = scope
+        try:
+            for statement in node.body:
+                self._visit_node(statement)
+        finally:
+            self.variable_visitor.current_scope = previous_scope
+            self._scope_stack.pop()
+            
+    def _handle_class(self, node: ast.ClassDef) -> None:
+        """Extract a class and attach it to its enclosing class, if any."""
+        class_info = self.class_visitor.create_class_info(node)
+        
+        parent_class = self._current_class
+        if parent_class:
+            parent_class.inner_classes.append(class_info)
+        else:
+            self.class_visitor.classes.append(class_info)
+            
+        self._current_class = class_info
+        try:
+            self._visit_body(node, "class", class_info)
+        finally:
+            self._current_class = parent_class
+            
+    def _handle_function(self, node: ast.AST) -> None:
+        """Extract a function as a method, nested function or top-level function."""
+        parent_scope, parent = self._scope_stack[-1] if self._scope_stack else ("module", None)
+        function_info = self.function_visitor.create_function_info(
+            node, is_method=parent_scope == "class"
+        )
+        
+        if parent_scope == "function":
+            parent.nested_functions.append(function_info)
+        elif parent_scope == "class":
+            parent.methods.append(function_info)
+        else:
+            self.function_visitor.functions.append(function_info)
+            
+        self._visit_body(node, "function", function_info)
+        
+    def _handle_import(self, node: ast.Import) -> None:
+        """Extract an import statement."""
+        self.import_visitor.visit_Import(node)
+        
+    def _handle_import_from(self, node: ast.ImportFrom) -> None:
+        """Extract an import-from statement."""
+        self.import_visitor.visit_ImportFrom(node)
+        
+    def _handle_assign(self, node: ast.Assign) -> None:
+        """Extract the variables bound by an assignment."""
+        self.variable_visitor.add_assignment(node)
         
-    def _find_inner_class(self, parent: ParsedClass, name: str) -> Optional[ParsedClass]:
-        """Recursively find an inner class by name."""
-        for inner in parent.inner_classes:
-            if inner.name == name:
-                return inner
-            found = self._find_inner_class(inner, name)
-            if found:
-                return found
-        return None
+    def _handle_ann_assign(self, node: ast.AnnAssign) -> None:
+        """Extract the variable bound by an annotated assignment."""
+        self.variable_visitor.add_annotated_assignment(node)
         
-    def _is_method(self, node: ast.FunctionDef) -> bool:
-        """Check if a function node is inside a class."""
-        for parent in ast.walk(node):
-            if isinstance(parent, ast.ClassDef):
-                return True
-        return False
\ No newline at end of file
+    _HANDLERS: Dict[type, Callable[["CombinedVisitor", Any], None]] = {
+        ast.ClassDef: _handle_class,
+        ast.FunctionDef: _handle_function,
+        ast.AsyncFunctionDef: _handle_function,
+        ast.Import: _handle_import,
+        ast.ImportFrom: _handle_import_from,
+        ast.Assign: _handle_assign,
+        ast.AnnAssign: _handle_ann_assign,
+    }
@@ -0,0 +1,407 @@
+"""
+Parse cache storage backends.
+
+This module implements the on-disk storage behind HashBasedCache. Parse
+results are content-addressed: they are stored under a key built from the
+file's content hash and the parser config hash, so identical files in other
+checkouts, branches, analysis sessions or CI nodes resolve to the same entry.
+
+- ParseCacheStore: local SQLite database holding the path index (file path ->
+  content hash and stat data) plus the parse results. Lookups go through
+  primary keys, writes are upserts batched into short transactions, and the
+  database runs in WAL mode so appends never rewrite existing data.
+- SharedDirectoryBackend: parse results as one file per key on a shared
+  filesystem, written atomically so concurrent writers never expose partial
+  entries.
+
+# AI-Intent: Infrastructure:Performance
+# Intent: Durable, append-friendly storage for incremental parsing results
+# Confidence: High
+# @layer: infrastructure
+# @component: caching
+# @performance: incremental-parsing
+"""
+
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when the table layout or payload encoding changes
+STORE_SCHEMA_VERSION = "4"
+
+# SQLite limits the number of host parameters per statement
+_MAX_QUERY_PARAMS = 500
+
+# Seconds a connection waits for another process's write transaction to end
+DEFAULT_BUSY_TIMEOUT = 30.0
+
+
+# Row layout of the file index:
+# (file_path, content_hash, last_modified, last_modified_ns, size, parsed_at,
+#  parse_duration, relationship_count)
+FileIndexRow = Tuple[str, str, float, int, int, str, float, int]
+
+
+class CacheBackend(ABC):
+    """
+    Storage for serialized parse results keyed by content and config hash.
+
+    Backends only deal in keys and opaque payload bytes; HashBasedCache owns
+    the conversion to CacheEntry objects. Implementations must be safe to
+    call from multiple threads.
+    """
+
+    # Shared backends are used by other checkouts and machines, so entries
+    # are never deleted just because no local path refers to them anymore
+    shared = False
+
+    @abstractmethod
+    def has_module(self, key: str) -> bool:
+        """Return True if a parse result is stored for the key."""
+
+    @abstractmethod
+    def get_module(self, key: str) -> Optional[bytes]:
+        """Return the serialized parse result for a key, if stored."""
+
+    @abstractmethod
+    def get_modules(self, keys: Iterable[str]) -> Dict[str, bytes]:
+        """Return the serialized parse results for many keys at once."""
+
+    @abstractmethod
+    def put_module(self, key: str, payload: bytes):
+        """Store the serialized parse result for a key."""
+
+    @abstractmethod
+    def delete_module(self, key: str):
+        """Remove the parse result for a key."""
+
+    def commit(self):
+        """Make pending writes durable."""
+
+    @abstractmethod
+    def clear(self):
+        """Remove all parse results held by this backend."""
+
+    @abstractmethod
+    def size_bytes(self) -> int:
+        """Size of the stored data on disk."""
+
+    def close(self):
+        """Release resources held by the backend."""
+
+
+class ParseCacheStore(CacheBackend):
+    """
+    SQLite-backed store for file hashes and serialized parse results.
+
+    This is the local-directory backend. Besides the parse results it holds
+    the path index, which always stays local to the checkout even when parse
+    results come from a shared backend. The store only deals in rows and
+    opaque payload bytes; HashBasedCache owns the conversion to FileHash and
+    CacheEntry objects. All methods are safe to call from multiple threads.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        commit_interval: int = 64,
+        max_transaction_seconds: float = 0.5,
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT
+    ):
+        """
+        Open (or create) the store.
+
+        Writes are batched into short transactions: an open transaction holds
+        the database's write lock, which other processes sharing the cache
+        directory (concurrent jobs, warm extractor workers) wait for.
+
+        Args:
+            db_path: Path of the SQLite database file
+            commit_interval: Number of writes after which a transaction is committed
+            max_transaction_seconds: Age after which a transaction is committed on the next write
+            busy_timeout: Seconds to wait for another connection's write lock
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.commit_interval = commit_interval
+        self.max_transaction_seconds = max_transaction_seconds
+
+        self._lock = threading.Lock()
+        self._pending_writes = 0
+        self._transaction_started = 0.0
+        self._conn = sqlite3.connect(str(self.db_path), timeout=busy_timeout, check_same_thread=False)
+        self._conn.execute(f"PRAGMA busy_timeout={int(busy_timeout * 1000)}")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        """Create tables, discarding data written with another schema version."""
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            row = self._conn.execute(
+                "SELECT value FROM store_meta WHERE key = 'schema_version'"
+            ).fetchone()
+
+            if row and row[0] != STORE_SCHEMA_VERSION:
+                logger.info(f"Parse cache schema changed ({row[0]} -> {STORE_SCHEMA_VERSION}), resetting cache")
+                self._conn.execute("DROP TABLE IF EXISTS file_index")
+                self._conn.execute("DROP TABLE IF EXISTS modules")
+
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS file_index (
+                    file_path TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    last_modified REAL NOT NULL,
+                    last_modified_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    parsed_at TEXT NOT NULL,
+                    parse_duration REAL NOT NULL DEFAULT 0,
+                    relationship_count INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS modules (
+                    cache_key TEXT PRIMARY KEY,
+                    payload BLOB NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO store_meta (key, value) VALUES ('schema_version', ?)",
+                (STORE_SCHEMA_VERSION,)
+            )
+            self._conn.commit()
+
+    def load_file_index(self) -> List[FileIndexRow]:
+        """Return every row of the path index."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT file_path, content_hash, last_modified, last_modified_ns, size, "
+                "parsed_at, parse_duration, relationship_count FROM file_index"
+            ).fetchall()
+
+    def put_file_entry(self, row: FileIndexRow):
+        """Insert or replace a path index row."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO file_index (file_path, content_hash, last_modified, "
+                "last_modified_ns, size, parsed_at, parse_duration, relationship_count) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                row
+            )
+            self._after_write()
+
+    def delete_file_entry(self, file_path: str):
+        """Remove a path from the index."""
+        with self._lock:
+            self._conn.execute("DELETE FROM file_index WHERE file_path = ?", (file_path,))
+            self._after_write()
+
+    def has_module(self, key: str) -> bool:
+        """Return True if a parse result is stored for the key."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM modules WHERE cache_key = ?", (key,)
+            ).fetchone() is not None
+
+    def put_module(self, key: str, payload: bytes):
+        """Store the serialized parse result for a key."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO modules (cache_key, payload) VALUES (?, ?)",
+                (key, sqlite3.Binary(payload))
+            )
+            self._after_write()
+
+    def get_module(self, key: str) -> Optional[bytes]:
+        """Return the serialized parse result for a key, if stored."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM modules WHERE cache_key = ?", (key,)
+            ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def get_modules(self, keys: Iterable[str]) -> Dict[str, bytes]:
+        """Return the serialized parse results for many keys at once."""
+        keys = list(set(keys))
+        results: Dict[str, bytes] = {}
+
+        with self._lock:
+            for start in range(0, len(keys), _MAX_QUERY_PARAMS):
+                chunk = keys[start:start + _MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                for key, payload in self._conn.execute(
+                    f"SELECT cache_key, payload FROM modules WHERE cache_key IN ({placeholders})",
+                    chunk
+                ):
+                    results[key] = bytes(payload)
+
+        return results
+
+    def delete_module(self, key: str):
+        """Remove the parse result for a key."""
+        with self._lock:
+            self._conn.execute("DELETE FROM modules WHERE cache_key = ?", (key,))
+            self._after_write()
+
+    def commit(self):
+        """Commit pending writes."""
+        with self._lock:
+            self._conn.commit()
+            self._pending_writes = 0
+
+    def clear(self):
+        """Remove all cached data."""
+        with self._lock:
+            self._conn.execute("DELETE FROM file_index")
+            self._conn.execute("DELETE FROM modules")
+            self._conn.commit()
+            self._pending_writes = 0
+            self._conn.execute("VACUUM")
+
+    def size_bytes(self) -> int:
+        """Size of the database and its write-ahead log on disk."""
+        total = 0
+        for path in (self.db_path, Path(f"{self.db_path}-wal")):
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def close(self):
+        """Commit pending writes and close the database."""
+        with self._lock:
+            try:
+                self._conn.commit()
+            finally:
+                self._conn.close()
+
+    def _after_write(self):
+        """Commit once enough writes are pending or the transaction is old; caller holds the lock."""
+        now = time.monotonic()
+        if not self._pending_writes:
+            self._transaction_started = now
+        self._pending_writes += 1
+        if (self._pending_writes >= self.commit_interval
+                or now - self._transaction_started >= self.max_transaction_seconds):
+            self._conn.commit()
+            self._pending_writes = 0
+
+
+class SharedDirectoryBackend(CacheBackend):
+    """
+    Parse results stored as one file per key in a shared directory.
+
+    Intended for a directory on a network or shared filesystem that every
+    analysis session and CI node mounts. Entries are immutable (the key
+    covers content and parser config), so writers never coordinate: each
+    entry is written to a temporary file and moved into place with
+    os.replace, which is atomic, and existing entries are never rewritten.
+    Anyone with access can write here, so entries are plain JSON data.
+    """
+
+    shared = True
+
+    SUFFIX = ".json"
+
+    def __init__(self, root: Path, max_workers: int = 16):
+        """
+        Open (or create) the shared directory.
+
+        Args:
+            root: Directory holding the entries
+            max_workers: Threads used to read many entries at once
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
+
+    def has_module(self, key: str) -> bool:
+        """Return True if a parse result is stored for the key."""
+        return self._path(key).exists()
+
+    def get_module(self, key: str) -> Optional[bytes]:
+        """Return the serialized parse result for a key, if stored."""
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def get_modules(self, keys: Iterable[str]) -> Dict[str, bytes]:
+        """Return the serialized parse results for many keys at once."""
+        keys = list(set(keys))
+        if len(keys) <= 1:
+            payloads = [self.get_module(key) for key in keys]
+        else:
+            # Network filesystems have high per-file latency; overlap the reads
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(keys))) as executor:
+                payloads = list(executor.map(self.get_module, keys))
+
+        return {key: payload for key, payload in zip(keys, payloads) if payload is not None}
+
+    def put_module(self, key: str, payload: bytes):
+        """Store the serialized parse result for a key."""
+        path = self._path(key)
+        if path.exists():
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=self.SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            # mkstemp creates owner-only files; other users share the directory
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def delete_module(self, key: str):
+        """Remove the parse result for a key."""
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        """Remove all parse results from the shared directory."""
+        for path in self.root.glob(f"*/*{self.SUFFIX}"):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def size_bytes(self) -> int:
+        """Size of all entries in the shared directory."""
+        total = 0
+        for path in self.root.glob(f"*/*{self.SUFFIX}"):
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _path(self, key: str) -> Path:
+        """Entry path; a two-character fan-out keeps directories small."""
+        return self.root / key[:2] / f"{key}{self.SUFFIX}"
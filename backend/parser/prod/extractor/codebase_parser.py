@@ -14,12 +14,13 @@ Key improvements:
 import logging
 import os
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from config import ParserConfig, get_parser_config
 from models import ParsedModule
 from module_parser import ModuleParser
-from parallel_processor import ParallelProcessor
+from parallel_processor import ModuleSink, ParallelProcessor
+from processing_types import ModuleDelta
 from communication import StatusReporter
 
 logger = logging.getLogger(__name__)
@@ -50,7 +51,8 @@ class CodebaseParser:
     def parse_codebase(
         self, 
         root_path: str,
-        status_reporter: Optional[StatusReporter] = None
+        status_reporter: Optional[StatusReporter] = None,
+        module_sink: Optional[ModuleSink] = None
     ) -> Dict[str, ParsedModule]:
         """
         Parse an entire Python codebase starting from a root directory.
@@ -58,9 +60,12 @@ class CodebaseParser:
         Args:
             root_path: Path to the root directory of the codebase
             status_reporter: Optional status reporter for progress updates
+            module_sink: Optional callback receiving (file_path, module) as soon
+                as each module is parsed; modules are then not collected
 
         Returns:
-            Dictionary mapping file paths to parsed modules
+            Dictionary mapping file paths to parsed modules (empty when a
+            module_sink is given)
         """
         root_path = os.path.abspath(root_path)
         logger.info(f"Parsing codebase at {root_path}")
@@ -96,7 +101,8 @@ class CodebaseParser:
             
             parsed_modules = self.parallel_processor.process_files(
                 python_files, 
-                parse_with_status
+                parse_with_status,
+                module_sink=module_sink
             )
             
             # Report progress updates from parallel processor
@@ -121,7 +127,12 @@ class CodebaseParser:
                 try:
                     parsed_module = self.parse_file(file_path, status_reporter)
                     if parsed_module:
-                        parsed_modules[file_path] = parsed_module
+                        # Keep the path index complete for later incremental runs
+                        self.parallel_processor.cache.store_result(file_path, parsed_module, [])
+                        if module_sink:
+                            module_sink(file_path, parsed_module)
+                        else:
+                            parsed_modules[file_path] = parsed_module
                 except Exception as e:
                     logger.error(f"Error parsing {file_path}: {e}")
                     if status_reporter:
@@ -131,7 +142,10 @@ class CodebaseParser:
                             error=str(e)
                         )
 
-        logger.info(f"Successfully parsed {len(parsed_modules)} modules")
+            self.parallel_processor.cache.save_hash_cache()
+
+        if not module_sink:
+            logger.info(f"Successfully parsed {len(parsed_modules)} modules")
         
         # Log processing metrics if parallel processing was used
         if self.config.parallel_processing and len(python_files) > 1:
@@ -159,6 +173,111 @@ class CodebaseParser:
                 
         return parsed_modules
 
+    def parse_codebase_incremental(
+        self,
+        root_path: str,
+        status_reporter: Optional[StatusReporter] = None,
+        module_sink: Optional[ModuleSink] = None,
+        delta_callback: Optional[Callable[[ModuleDelta], None]] = None
+    ) -> Tuple[Dict[str, ParsedModule], ModuleDelta]:
+        """
+        Parse only the modules that changed since the previous run.
+        
+        The previous run's state is the hash cache's path index for files
+        under root_path. Added and changed files are parsed (or loaded from
+        the cache when identical content was parsed elsewhere), deleted
+        files are dropped from the index, and unchanged files are skipped
+        entirely.
+        
+        Args:
+            root_path: Path to the root directory of the codebase
+            status_reporter: Optional status reporter for progress updates
+            module_sink: Optional callback receiving (file_path, module) as soon
+                as each added or changed module is available; modules are
+                then not collected
+            delta_callback: Optional callback receiving the delta once it is
+                known, before any module is parsed
+            
+        Returns:
+            Tuple of (parsed added and changed modules, module delta)
+            
+        Raises:
+            ValueError: If result caching is disabled
+        """
+        cache = self.parallel_processor.cache
+        if not cache.cache_enabled:
+            raise ValueError("Incremental parsing requires cache_results to be enabled")
+        
+        root_path = os.path.abspath(root_path)
+        logger.info(f"Incrementally parsing codebase at {root_path}")
+        
+        if status_reporter:
+            status_reporter.report_status(
+                phase="extraction",
+                status="discovering",
+                message=f"Discovering Python files in {root_path}"
+            )
+        
+        python_files = self._discover_python_files(root_path)
+        
+        # Snapshot the previous state before change detection updates the index
+        known_paths = cache.get_indexed_paths(root_path)
+        changed_files, cached_files = cache.get_changed_files(python_files)
+        
+        delta = ModuleDelta(root_path=root_path)
+        delta.added = [path for path in python_files if path not in known_paths]
+        delta.changed = [path for path in changed_files if path in known_paths]
+        delta.deleted = sorted(known_paths.difference(python_files))
+        delta.unchanged_count = len(python_files) - len(delta.added) - len(delta.changed)
+        
+        for file_path in delta.deleted:
+            cache.invalidate_file(file_path)
+        
+        if delta_callback:
+            delta_callback(delta)
+        
+        if status_reporter:
+            status_reporter.report_status(
+                phase="extraction",
+                status="discovered",
+                message=(
+                    f"Found {len(delta.added)} added, {len(delta.changed)} changed and "
+                    f"{len(delta.deleted)} deleted Python files"
+                ),
+                metadata={
+                    "file_count": len(python_files),
+                    "added": len(delta.added),
+                    "changed": len(delta.changed),
+                    "deleted": len(delta.deleted)
+                }
+            )
+        
+        def parse_with_status(file_path: str) -> Optional[ParsedModule]:
+            return self.parse_file(file_path, status_reporter)
+        
+        parsed_modules: Dict[str, ParsedModule] = {}
+        if changed_files:
+            parsed_modules = self.parallel_processor.process_files(
+                changed_files, parse_with_status, module_sink=module_sink
+            )
+        
+        # New paths whose content was already parsed elsewhere come from the cache
+        known_content = [path for path in cached_files if path not in known_paths]
+        for file_path, cache_entry in cache.bulk_load_cached_results(known_content).items():
+            if not cache_entry.parsed_module:
+                continue
+            if module_sink:
+                module_sink(file_path, cache_entry.parsed_module)
+            else:
+                parsed_modules[file_path] = cache_entry.parsed_module
+        cache.save_hash_cache()
+        
+        logger.info(
+            f"Incremental parse: {len(delta.added)} added, {len(delta.changed)} changed, "
+            f"{len(delta.deleted)} deleted, {delta.unchanged_count} unchanged"
+        )
+        return parsed_modules, delta
+
     def parse_file(
         self, 
         file_path: str,
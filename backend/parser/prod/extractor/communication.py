@@ -8,8 +8,11 @@ real-time updates about their progress to the central orchestrator.
 import json
 import logging
 import os
+import threading
+import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, List, Optional
 import requests
 from urllib.parse import urljoin
 
@@ -17,16 +20,53 @@ from urllib.parse import urljoin
 logger = logging.getLogger(__name__)
 
 
+# High-volume per-file/per-element events that may be downsampled or dropped
+# under backpressure. Lifecycle events (started, completed, error, ...) are
+# always delivered.
+DROPPABLE_STATUSES = frozenset({
+    "processing_file",
+    "parsing_module",
+    "extracting_elements",
+    "module_parsed",
+    "parsing_class",
+    "parsing_function",
+    "syntax_error",
+})
+
+
 class StatusReporter:
-    """Reports parser status updates to the orchestrator."""
+    """
+    Reports parser status updates to the orchestrator.
+    
+    Updates are queued and sent in batches by a background thread to
+    ``/v1/jobs/{job_id}/status/batch`` so that parsing threads never wait on
+    network I/O. Progress updates are coalesced (only the latest is sent),
+    and high-volume file events are downsampled once the queue passes its
+    high-water mark and dropped once it is full. Call ``close()`` when done
+    to flush what is left.
+    """
     
-    def __init__(self, job_id: str, orchestrator_url: Optional[str] = None):
+    def __init__(
+        self,
+        job_id: str,
+        orchestrator_url: Optional[str] = None,
+        max_queue_size: int = 1000,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        sample_rate: int = 10,
+        retry_cooldown: float = 30.0
+    ):
         """
         Initialize the status reporter.
         
         Args:
             job_id: Unique identifier for this parsing job
             orchestrator_url: Base URL of the orchestrator API
+            max_queue_size: Maximum number of queued droppable events
+            batch_size: Maximum number of events per request
+            flush_interval: Seconds between flushes of a partial batch
+            sample_rate: Keep 1 in N droppable events above the high-water mark
+            retry_cooldown: Seconds to skip the orchestrator after a failed request
         """
         self.job_id = job_id
         self.orchestrator_url = orchestrator_url or os.getenv(
@@ -35,6 +75,32 @@ class StatusReporter:
         )
         self.session = requests.Session()
         
+        self.max_queue_size = max_queue_size
+        self.high_water_mark = max_queue_size // 2
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.sample_rate = max(1, sample_rate)
+        self.retry_cooldown = retry_cooldown
+        
+        self._events: Deque[Dict[str, Any]] = deque()
+        self._latest_progress: Optional[Dict[str, Any]] = None
+        self._condition = threading.Condition()
+        self._sender: Optional[threading.Thread] = None
+        self._closed = False
+        self._flush_requested = False
+        self._in_flight = 0
+        self._sampled = 0
+        self._offline_until = 0.0
+        
+        self.stats = {
+            "queued": 0,
+            "sent": 0,
+            "coalesced": 0,
+            "dropped": 0,
+            "written_locally": 0,
+            "batches": 0
+        }
+        
     def report_status(
         self,
         phase: str,
@@ -44,7 +110,7 @@ class StatusReporter:
         metadata: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
-        Report a status update to the orchestrator.
+        Queue a status update for the orchestrator.
         
         Args:
             phase: Current phase (extraction, transformation, loading)
@@ -54,7 +120,7 @@ class StatusReporter:
             metadata: Optional additional metadata
             
         Returns:
-            True if status was reported successfully, False otherwise
+            True if the update was queued, False if it was dropped
         """
         update = {
             "job_id": self.job_id,
@@ -66,24 +132,37 @@ class StatusReporter:
             "metadata": metadata or {}
         }
         
-        try:
-            # Try to send to orchestrator
-            endpoint = urljoin(self.orchestrator_url, f"/v1/jobs/{self.job_id}/status")
-            response = self.session.post(
-                endpoint,
-                json=update,
-                timeout=5  # Don't block parsing on network issues
-            )
-            response.raise_for_status()
-            return True
+        with self._condition:
+            if self._closed:
+                return False
+            self._ensure_sender()
             
-        except requests.exceptions.RequestException as e:
-            # Log but don't fail - parsing should continue even if reporting fails
-            logger.warning(f"Failed to report status to orchestrator: {e}")
-            
-            # Fallback: write to local status file
-            self._write_local_status(update)
+            if progress is not None:
+                # Only the most recent progress value is worth sending
+                if self._latest_progress is not None:
+                    self.stats["coalesced"] += 1
+                self._latest_progress = update
+            elif status in DROPPABLE_STATUSES and not self._accept_droppable():
+                self.stats["dropped"] += 1
+                return False
+            else:
+                self._events.append(update)
+                
+            self.stats["queued"] += 1
+            if len(self._events) >= self.batch_size:
+                self._condition.notify()
+                
+        return True
+        
+    def _accept_droppable(self) -> bool:
+        """Apply backpressure to a droppable event; caller holds the lock."""
+        queued = len(self._events)
+        if queued >= self.max_queue_size:
             return False
+        if queued >= self.high_water_mark:
+            self._sampled += 1
+            return self._sampled % self.sample_rate == 0
+        return True
             
     def report_file_processing(
         self,
@@ -100,7 +179,7 @@ class StatusReporter:
             error: Optional error message if status is error
             
         Returns:
-            True if status was reported successfully, False otherwise
+            True if the update was queued, False if it was dropped
         """
         metadata = {
             "file_path": file_path,
@@ -131,7 +210,7 @@ class StatusReporter:
             message: Optional progress message
             
         Returns:
-            True if status was reported successfully, False otherwise
+            True if the update was queued, False if it was dropped
         """
         progress = (current / total * 100) if total > 0 else 0
         msg = message or f"Processing {current}/{total} items"
@@ -147,27 +226,139 @@ class StatusReporter:
             }
         )
         
-    def _write_local_status(self, update: Dict[str, Any]) -> None:
-        """Write status update to local file as fallback."""
-        status_file = f"extraction_status_{self.job_id}.json"
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Wait until every queued update has been sent or written locally.
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if the queue was drained within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self._events or self._latest_progress is not None or self._in_flight:
+                if self._sender is None or not self._sender.is_alive():
+                    # Nothing will drain the queue; send from this thread
+                    batch = self._take_batch()
+                    self._condition.release()
+                    try:
+                        self._send_batch(batch)
+                    finally:
+                        self._condition.acquire()
+                        self._in_flight -= len(batch)
+                    continue
+                    
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._flush_requested = True
+                self._condition.notify_all()
+                self._condition.wait(min(remaining, self.flush_interval))
+        return True
+        
+    def close(self, timeout: float = 10.0) -> None:
+        """Flush remaining updates and stop the background sender."""
         try:
-            # Read existing status if available
-            existing = []
-            if os.path.exists(status_file):
-                with open(status_file, 'r') as f:
-                    existing = json.load(f)
+            self.flush(timeout)
+        finally:
+            # The sender drains whatever is still queued before it exits
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            if self._sender is not None:
+                self._sender.join(timeout)
+            
+    def _ensure_sender(self) -> None:
+        """Start the background sender thread; caller holds the lock."""
+        if self._sender is None or not self._sender.is_alive():
+            self._sender = threading.Thread(
+                target=self._run_sender,
+                name=f"status-reporter-{self.job_id}",
+                daemon=True
+            )
+            self._sender.start()
+            
+    def _run_sender(self) -> None:
+        """Background loop that sends queued updates in batches."""
+        while True:
+            with self._condition:
+                # Wait up to one interval for a full batch, unless asked to flush
+                deadline = time.monotonic() + self.flush_interval
+                while (not self._closed and not self._flush_requested
+                       and len(self._events) < self.batch_size):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
                     
-            # Append new update
-            existing.append(update)
+                batch = self._take_batch()
+                if not self._events:
+                    self._flush_requested = False
+                if not batch and self._closed:
+                    return
+                
+            try:
+                self._send_batch(batch)
+            finally:
+                with self._condition:
+                    self._in_flight -= len(batch)
+                    self._condition.notify_all()
+                
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        """Remove up to batch_size updates from the queue; caller holds the lock."""
+        batch = []
+        while self._events and len(batch) < self.batch_size:
+            batch.append(self._events.popleft())
+        if self._latest_progress is not None:
+            batch.append(self._latest_progress)
+            self._latest_progress = None
+        self._in_flight += len(batch)
+        return batch
+        
+    def _send_batch(self, batch: List[Dict[str, Any]]) -> bool:
+        """Send a batch to the orchestrator, falling back to the local status file."""
+        if not batch:
+            return True
             
-            # Write back
-            with open(status_file, 'w') as f:
-                json.dump(existing, f, indent=2)
+        dropped = self.stats["dropped"]
+        if time.monotonic() >= self._offline_until:
+            try:
+                endpoint = urljoin(self.orchestrator_url, f"/v1/jobs/{self.job_id}/status/batch")
+                response = self.session.post(
+                    endpoint,
+                    json={"updates": batch, "dropped": dropped},
+                    timeout=5
+                )
+                response.raise_for_status()
+                self.stats["sent"] += len(batch)
+                self.stats["batches"] += 1
+                return True
+                
+            except Exception as e:
+                # Log but don't fail - parsing should continue even if reporting fails
+                logger.warning(f"Failed to report status to orchestrator: {e}")
+                self._offline_until = time.monotonic() + self.retry_cooldown
+                
+        # Fallback: write to local status file
+        self._write_local_status(batch)
+        return False
+        
+    def _write_local_status(self, updates: List[Dict[str, Any]]) -> None:
+        """Append status updates to a local JSON-lines file as fallback."""
+        status_file = f"extraction_status_{self.job_id}.jsonl"
+        try:
+            with open(status_file, 'a') as f:
+                for update in updates:
+                    f.write(json.dumps(update) + "\n")
+            self.stats["written_locally"] += len(updates)
                 
         except Exception as e:
             logger.error(f"Failed to write local status file: {e}")
 
 
+
 class NullStatusReporter(StatusReporter):
     """A no-op status reporter for when orchestrator communication is disabled."""
     
@@ -185,4 +376,11 @@ class NullStatusReporter(StatusReporter):
         
     def report_progress(self, *args, **kwargs) -> bool:
         """No-op progress report."""
-        return True
\ No newline at end of file
+        return True
+        
+    def flush(self, *args, **kwargs) -> bool:
+        """No-op flush."""
+        return True
+        
+    def close(self, *args, **kwargs) -> None:
+        """No-op close."""
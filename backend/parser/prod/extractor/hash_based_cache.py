@@ -17,14 +17,20 @@ import hashlib
 import json
 import logging
 import gc
+import os
+import sqlite3
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 from config import ParserConfig
 from models import ParsedModule
+from cache_store import CacheBackend, ParseCacheStore, SharedDirectoryBackend
 
 # Import CodeRelationship - handle import gracefully if not available
 try:
@@ -55,7 +61,10 @@ def _serialize_with_enum_support(obj: Any) -> Any:
         return obj.value
     elif isinstance(obj, dict):
         return {key: _serialize_with_enum_support(value) for key, value in obj.items()}
-    elif isinstance(obj, (list, tuple, set)):
+    elif isinstance(obj, (set, frozenset)):
+        # Sort so the result does not depend on hash randomization
+        return sorted((_serialize_with_enum_support(item) for item in obj), key=repr)
+    elif isinstance(obj, (list, tuple)):
         return [_serialize_with_enum_support(item) for item in obj]
     elif hasattr(obj, '__dict__'):
         # Handle dataclass-like objects
@@ -74,6 +83,7 @@ class FileHash:
     parsed_at: datetime
     parse_duration: float = 0.0
     relationship_count: int = 0
+    last_modified_ns: int = 0  # Exact mtime for stat-first change detection
 
 
 @dataclass
@@ -91,57 +101,108 @@ class HashBasedCache:
     
     This cache tracks file content hashes to determine if files have changed
     since the last parsing run, enabling efficient incremental processing
-    of large codebases.
+    of large codebases. The path index (path -> content hash) lives in a
+    local SQLite store; parse results are keyed by content hash plus parser
+    config hash and kept in a pluggable backend (see cache_store.py), so
+    identical files at other paths, branches, analysis sessions or CI nodes
+    reuse the same result. Payloads are JSON-encoded ParsedModule.to_tuple()
+    data, so reading an entry another user wrote never runs code.
+    
+    Backends are selected with tool_options['cache']['backend']:
+    "local" (default) keeps results in the local store, "shared" keeps them
+    in tool_options['cache']['shared_dir'].
+    
+    Other processes may share the cache directory. When the store stays
+    locked by one of them, lookups degrade to cache misses and index
+    updates are skipped; the parse itself never fails on the cache.
     """
     
+    STORE_FILENAME = "parse_cache.db"
+    
+    BACKENDS = ("local", "shared")
+    
+    # Settings that do not change parse output and are left out of the config hash
+    RUNTIME_CONFIG_FIELDS = ("cache_results", "parallel_processing")
+    RUNTIME_TOOL_OPTIONS = ("cache", "parallel", "memory")
+    
+    # Below this many files change detection runs inline instead of on a pool
+    PARALLEL_CHECK_THRESHOLD = 64
+    
     def __init__(self, config: ParserConfig, cache_dir: Optional[str] = None):
         self.config = config
         
         # Cache configuration
+        self.cache_options = config.tool_options.get('cache', {})
         self.cache_enabled = config.cache_results
-        self.cache_dir = Path(cache_dir or ".parser_cache")
+        self.cache_dir = Path(cache_dir or self.cache_options.get('cache_dir') or ".parser_cache")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
-        # Cache files
-        self.hash_cache_file = self.cache_dir / "file_hashes.json"
-        self.parsed_cache_dir = self.cache_dir / "parsed_modules"
-        self.parsed_cache_dir.mkdir(parents=True, exist_ok=True)
+        # Local store for the path index; parse results go to the backend
+        try:
+            self.store = ParseCacheStore(self.cache_dir / self.STORE_FILENAME)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Parse cache store unavailable ({e}), caching in memory for this session")
+            self.store = ParseCacheStore(Path(":memory:"))
+        self.backend = self._create_backend()
+        self._config_hash = self._get_config_hash()
         
         # In-memory caches
         self.file_hashes: Dict[str, FileHash] = {}
         self.cached_results: Dict[str, CacheEntry] = {}
         
+        # Indexed paths per content hash, kept in step with file_hashes, so
+        # invalidation knows whether a parse result is still shared. Parser
+        # threads store results concurrently, so both change under the lock.
+        self._content_refs: Counter = Counter()
+        self._index_lock = threading.RLock()
+        
+        # Hashes computed during the current run, so each file is read at most once
+        self._run_hashes: Dict[str, FileHash] = {}
+        
         # Statistics
         self.stats = {
             'cache_hits': 0,
             'cache_misses': 0,
             'files_parsed': 0,
             'files_skipped': 0,
+            'files_hashed': 0,
+            'content_hits': 0,
             'total_time_saved': 0.0
         }
         
         # Load existing cache
         self._load_hash_cache()
     
-    def calculate_file_hash(self, file_path: str) -> Optional[FileHash]:
+    def calculate_file_hash(self, file_path: str, stat: Optional[os.stat_result] = None) -> Optional[FileHash]:
         """
         Calculate content hash for a file.
         
         Args:
             file_path: Path to the file
+            stat: Optional stat result already taken for the file
             
         Returns:
             FileHash object or None if file doesn't exist
         """
+        file_hash = self._hash_file(file_path, stat)
+        if file_hash:
+            self.stats['files_hashed'] += 1
+        return file_hash
+    
+    def _hash_file(self, file_path: str, stat: Optional[os.stat_result] = None) -> Optional[FileHash]:
+        """Hash a file without touching the cache's state, so it can run on any thread."""
         path = Path(file_path)
         
-        if not path.exists():
+        try:
+            stat = stat or path.stat()
+        except FileNotFoundError:
             logger.warning(f"File not found for hashing: {file_path}")
             return None
+        except OSError as e:
+            logger.error(f"Error calculating hash for {file_path}: {e}")
+            return None
         
         try:
-            stat = path.stat()
-            
             # Read and hash file content
             with open(path, 'rb') as f:
                 content = f.read()
@@ -152,7 +213,8 @@ class HashBasedCache:
                 content_hash=content_hash,
                 last_modified=stat.st_mtime,
                 size=stat.st_size,
-                parsed_at=datetime.now()
+                parsed_at=datetime.now(),
+                last_modified_ns=stat.st_mtime_ns
             )
             
         except Exception as e:
@@ -163,6 +225,13 @@ class HashBasedCache:
         """
         Check if a file has changed since last parsing.
         
+        Size and mtime_ns are compared first; the file is only read and
+        hashed when they differ from the cached values. A file whose content
+        turns out to be unchanged (e.g. touched or checked out again) gets its
+        stat data refreshed so the next run is stat-only again. A file whose
+        content was already parsed elsewhere (another path, branch or
+        machine sharing the backend) is adopted into the path index.
+        
         Args:
             file_path: Path to the file
             
@@ -173,21 +242,100 @@ class HashBasedCache:
             return True
         
         abs_path = str(Path(file_path).absolute())
+        return self._apply_check(abs_path, *self._check_file(abs_path))
+    
+    def _check_file(self, abs_path: str) -> Tuple[Optional[os.stat_result], Optional[FileHash]]:
+        """
+        Stat a file, and hash it if its stat data differs from the index.
         
-        # Check if we have a cached hash
-        if abs_path not in self.file_hashes:
+        Only reads the cache's state, so get_changed_files runs it on worker
+        threads; _apply_check applies the outcome on the calling thread.
+        
+        Returns:
+            (stat, hash): stat is None if the file cannot be stat'ed; hash is
+            None if the index entry still matches or hashing failed
+        """
+        try:
+            stat = os.stat(abs_path)
+        except OSError:
+            return None, None
+        
+        cached_hash = self.file_hashes.get(abs_path)
+        if cached_hash and self._stat_matches(cached_hash, stat):
+            return stat, None
+        
+        # Unknown path or stat data differs - content has to be compared
+        known = self._run_hashes.get(abs_path)
+        if known and self._stat_matches(known, stat):
+            return stat, known
+        return stat, self._hash_file(abs_path, stat)
+    
+    def _apply_check(self, abs_path: str, stat: Optional[os.stat_result],
+                     current_hash: Optional[FileHash]) -> bool:
+        """Update the index and statistics for a _check_file result; True if the file changed."""
+        if stat is None:
             return True
         
-        # Calculate current hash
-        current_hash = self.calculate_file_hash(file_path)
+        cached_hash = self.file_hashes.get(abs_path)
+        if cached_hash and self._stat_matches(cached_hash, stat):
+            return False
         if not current_hash:
             return True
+        self._remember_run_hash(abs_path, current_hash)
         
-        cached_hash = self.file_hashes[abs_path]
+        if cached_hash and current_hash.content_hash == cached_hash.content_hash:
+            cached_hash.last_modified = current_hash.last_modified
+            cached_hash.last_modified_ns = current_hash.last_modified_ns
+            cached_hash.size = current_hash.size
+            self._put_file_entry(cached_hash)
+            return False
         
-        # Compare hashes and modification times
-        return (current_hash.content_hash != cached_hash.content_hash or
-                current_hash.last_modified != cached_hash.last_modified)
+        # Content not seen at this path; it may have been parsed elsewhere
+        try:
+            if not self.backend.has_module(self._module_key(current_hash.content_hash)):
+                return True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Parse cache store busy, treating {abs_path} as changed: {e}")
+            return True
+        
+        file_hash = FileHash(**asdict(current_hash))
+        self._index_file_hash(abs_path, file_hash)
+        self._put_file_entry(file_hash)
+        self.stats['content_hits'] += 1
+        return False
+    
+    def _get_run_hash(self, abs_path: str, stat: Optional[os.stat_result] = None) -> Optional[FileHash]:
+        """
+        Hash a file at most once per run.
+        
+        A hash computed earlier in the run is reused as long as the file's
+        size and mtime_ns still match.
+        """
+        if stat is None:
+            try:
+                stat = os.stat(abs_path)
+            except OSError:
+                return self.calculate_file_hash(abs_path)
+        
+        known = self._run_hashes.get(abs_path)
+        if known and self._stat_matches(known, stat):
+            return known
+        
+        file_hash = self.calculate_file_hash(abs_path, stat)
+        if file_hash:
+            self._run_hashes[abs_path] = file_hash
+        return file_hash
+    
+    def _remember_run_hash(self, abs_path: str, file_hash: FileHash):
+        """Keep a hash computed by _check_file for the rest of the run."""
+        if self._run_hashes.get(abs_path) is not file_hash:
+            self._run_hashes[abs_path] = file_hash
+            self.stats['files_hashed'] += 1
+    
+    @staticmethod
+    def _stat_matches(file_hash: FileHash, stat: os.stat_result) -> bool:
+        """Whether a file's size and mtime_ns still match a FileHash."""
+        return stat.st_size == file_hash.size and stat.st_mtime_ns == file_hash.last_modified_ns
     
     def get_cached_result(self, file_path: str) -> Optional[CacheEntry]:
         """
@@ -204,22 +352,23 @@ class HashBasedCache:
         
         abs_path = str(Path(file_path).absolute())
         
-        # Check if file has changed
+        # Stat-only when get_changed_files already ran; never hashes twice per run
         if self.has_file_changed(file_path):
             return None
         
-        # Try to load cached result
-        cached_file = self.parsed_cache_dir / f"{hashlib.md5(abs_path.encode()).hexdigest()}.json"
-        
-        if not cached_file.exists():
+        file_hash = self.file_hashes[abs_path]
+        module_key = self._module_key(file_hash.content_hash)
+        try:
+            payload = self.backend.get_module(module_key)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Parse cache store busy, not loading {file_path}: {e}")
+            payload = None
+        if payload is None:
+            self.stats['cache_misses'] += 1
             return None
         
         try:
-            with open(cached_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Deserialize the cached entry
-            cache_entry = self._deserialize_cache_entry(data)
+            cache_entry = self._deserialize_cache_entry(payload, file_hash)
             self.cached_results[abs_path] = cache_entry
             
             self.stats['cache_hits'] += 1
@@ -228,11 +377,13 @@ class HashBasedCache:
             
         except Exception as e:
             logger.warning(f"Error loading cached result for {file_path}: {e}")
-            # Remove corrupt cache file
-            try:
-                cached_file.unlink()
-            except:
-                pass
+            # Remove corrupt cache entry; shared entries belong to other sessions
+            if not self.backend.shared:
+                try:
+                    self.backend.delete_module(module_key)
+                except sqlite3.OperationalError as delete_error:
+                    logger.warning(f"Parse cache store busy, corrupt entry for {file_path} kept: {delete_error}")
+            self.stats['cache_misses'] += 1
             return None
     
     def store_result(self, file_path: str, parsed_module: Optional[ParsedModule], 
@@ -255,11 +406,12 @@ class HashBasedCache:
         abs_path = str(Path(file_path).absolute())
         
         try:
-            # Calculate file hash
-            file_hash = self.calculate_file_hash(file_path)
-            if not file_hash:
+            # Reuse the hash from change detection when the file is unchanged since
+            run_hash = self._get_run_hash(abs_path)
+            if not run_hash:
                 return False
             
+            file_hash = FileHash(**{**asdict(run_hash), 'parsed_at': datetime.now()})
             file_hash.parse_duration = parse_duration
             file_hash.relationship_count = len(relationships)
             
@@ -271,20 +423,21 @@ class HashBasedCache:
                 metadata={
                     'cached_at': datetime.now().isoformat(),
                     'parser_version': '2.3',
-                    'config_hash': self._get_config_hash()
+                    'config_hash': self._config_hash
                 }
             )
             
+            # Persist to the store
+            self.backend.put_module(self._module_key(file_hash.content_hash),
+                                    self._serialize_cache_entry(cache_entry))
+            self.store.put_file_entry(self._file_hash_to_row(file_hash))
+            # Parsing the next file may take a while; don't hold the write lock meanwhile
+            self.store.commit()
+            
             # Store in memory
-            self.file_hashes[abs_path] = file_hash
+            self._index_file_hash(abs_path, file_hash)
             self.cached_results[abs_path] = cache_entry
             
-            # Persist to disk
-            cached_file = self.parsed_cache_dir / f"{hashlib.md5(abs_path.encode()).hexdigest()}.json"
-            
-            with open(cached_file, 'w', encoding='utf-8') as f:
-                json.dump(self._serialize_cache_entry(cache_entry), f, indent=2)
-            
             self.stats['files_parsed'] += 1
             logger.debug(f"Cached result for {file_path}")
             return True
@@ -306,16 +459,48 @@ class HashBasedCache:
         changed_files = []
         cached_files = []
         
-        for file_path in file_paths:
-            if self.has_file_changed(file_path):
+        if not self.cache_enabled or len(file_paths) < self.PARALLEL_CHECK_THRESHOLD:
+            changed_flags = [self.has_file_changed(file_path) for file_path in file_paths]
+        else:
+            # Stat calls and the occasional hash release the GIL. Workers only
+            # stat and hash; the index, refcounts and stats are updated here.
+            abs_paths = [str(Path(file_path).absolute()) for file_path in file_paths]
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                checks = list(executor.map(self._check_file, abs_paths, chunksize=64))
+            changed_flags = [self._apply_check(abs_path, *check) for abs_path, check in zip(abs_paths, checks)]
+        
+        for file_path, changed in zip(file_paths, changed_flags):
+            if changed:
                 changed_files.append(file_path)
             else:
                 cached_files.append(file_path)
                 self.stats['files_skipped'] += 1
         
+        # Index refreshes are committed now rather than held for the whole run
+        self.save_hash_cache()
+        
         logger.info(f"Cache analysis: {len(changed_files)} changed, {len(cached_files)} cached")
         return changed_files, cached_files
     
+    def get_indexed_paths(self, root_path: str) -> Set[str]:
+        """
+        Return the indexed file paths under a directory.
+        
+        Args:
+            root_path: Directory to look under
+            
+        Returns:
+            Absolute paths of all indexed files below root_path
+        """
+        prefix = os.path.join(str(Path(root_path).absolute()), "")
+        return {file_path for file_path in self.file_hashes if file_path.startswith(prefix)}
+    
+    def end_run(self):
+        """Commit the run's writes and forget hashes computed during it."""
+        self.save_hash_cache()
+        self._run_hashes.clear()
+    
     def bulk_load_cached_results(self, file_paths: List[str]) -> Dict[str, CacheEntry]:
         """
         Load multiple cached results efficiently.
@@ -327,18 +512,58 @@ class HashBasedCache:
             Dictionary mapping file paths to cache entries
         """
         results = {}
+        if not self.cache_enabled:
+            return results
         
+        # Resolve every path to its content hash, then fetch all payloads at once
+        file_hashes = {}
         for file_path in file_paths:
-            cache_entry = self.get_cached_result(file_path)
-            if cache_entry:
-                results[file_path] = cache_entry
-                
-                # Add to statistics - estimate time saved
-                if cache_entry.file_hash.parse_duration > 0:
-                    self.stats['total_time_saved'] += cache_entry.file_hash.parse_duration
+            if self.has_file_changed(file_path):
+                continue
+            file_hashes[file_path] = self.file_hashes[str(Path(file_path).absolute())]
+        
+        try:
+            payloads = self.backend.get_modules(self._module_key(fh.content_hash) for fh in file_hashes.values())
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Parse cache store busy, loading no cached results: {e}")
+            payloads = {}
+        
+        # Rebuilding modules allocates millions of small objects; without this
+        # the cyclic GC rescans the growing heap over and over
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self._deserialize_payloads(file_hashes, payloads, results)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
         
         return results
     
+    def _deserialize_payloads(self, file_hashes: Dict[str, FileHash], payloads: Dict[str, bytes],
+                              results: Dict[str, CacheEntry]):
+        """Rebuild cache entries for bulk_load_cached_results."""
+        for file_path, file_hash in file_hashes.items():
+            payload = payloads.get(self._module_key(file_hash.content_hash))
+            if payload is None:
+                self.stats['cache_misses'] += 1
+                continue
+            
+            try:
+                cache_entry = self._deserialize_cache_entry(payload, file_hash)
+            except Exception as e:
+                logger.warning(f"Error loading cached result for {file_path}: {e}")
+                self.stats['cache_misses'] += 1
+                continue
+            
+            self.cached_results[str(Path(file_path).absolute())] = cache_entry
+            results[file_path] = cache_entry
+            self.stats['cache_hits'] += 1
+            
+            # Add to statistics - estimate time saved
+            if cache_entry.file_hash.parse_duration > 0:
+                self.stats['total_time_saved'] += cache_entry.file_hash.parse_duration
+    
     def invalidate_file(self, file_path: str) -> bool:
         """
         Invalidate cache for a specific file.
@@ -353,15 +578,14 @@ class HashBasedCache:
         
         try:
             # Remove from memory caches
-            if abs_path in self.file_hashes:
-                del self.file_hashes[abs_path]
-            if abs_path in self.cached_results:
-                del self.cached_results[abs_path]
+            self.cached_results.pop(abs_path, None)
             
-            # Remove cached file
-            cached_file = self.parsed_cache_dir / f"{hashlib.md5(abs_path.encode()).hexdigest()}.json"
-            if cached_file.exists():
-                cached_file.unlink()
+            # Remove from the store; the parse result may be shared by identical files
+            with self._index_lock:
+                file_hash = self._unindex_file_hash(abs_path)
+                self.store.delete_file_entry(abs_path)
+                if file_hash and not self.backend.shared and not self._content_refs[file_hash.content_hash]:
+                    self.backend.delete_module(self._module_key(file_hash.content_hash))
             
             logger.debug(f"Invalidated cache for {file_path}")
             return True
@@ -374,20 +598,21 @@ class HashBasedCache:
         """
         Clear all cached data.
         
+        Only the local store is cleared; a shared backend is left intact
+        because other checkouts and machines rely on it.
+        
         Returns:
             True if cleared successfully
         """
         try:
             # Clear memory caches
-            self.file_hashes.clear()
+            with self._index_lock:
+                self.file_hashes.clear()
+                self._content_refs.clear()
             self.cached_results.clear()
             
-            # Remove cache files
-            if self.hash_cache_file.exists():
-                self.hash_cache_file.unlink()
-            
-            for cache_file in self.parsed_cache_dir.glob("*.json"):
-                cache_file.unlink()
+            # Remove stored data
+            self.store.clear()
             
             # Reset statistics
             self.stats = {
@@ -395,6 +620,8 @@ class HashBasedCache:
                 'cache_misses': 0,
                 'files_parsed': 0,
                 'files_skipped': 0,
+                'files_hashed': 0,
+                'content_hits': 0,
                 'total_time_saved': 0.0
             }
             
@@ -445,112 +672,174 @@ class HashBasedCache:
         return removed_count
     
     def _load_hash_cache(self):
-        """Load hash cache from disk."""
-        if not self.hash_cache_file.exists():
-            return
-        
+        """Load the path index from the store."""
         try:
-            with open(self.hash_cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            for file_path, hash_data in data.get('file_hashes', {}).items():
-                self.file_hashes[file_path] = FileHash(
-                    file_path=hash_data['file_path'],
-                    content_hash=hash_data['content_hash'],
-                    last_modified=hash_data['last_modified'],
-                    size=hash_data['size'],
-                    parsed_at=datetime.fromisoformat(hash_data['parsed_at']),
-                    parse_duration=hash_data.get('parse_duration', 0.0),
-                    relationship_count=hash_data.get('relationship_count', 0)
-                )
+            for row in self.store.load_file_index():
+                file_hash = self._row_to_file_hash(row)
+                self._index_file_hash(file_hash.file_path, file_hash)
             
             logger.debug(f"Loaded {len(self.file_hashes)} cached file hashes")
             
         except Exception as e:
             logger.warning(f"Error loading hash cache: {e}")
             self.file_hashes.clear()
+            self._content_refs.clear()
     
     def save_hash_cache(self):
-        """Save hash cache to disk."""
+        """
+        Persist pending cache writes.
+        
+        Index rows and parse results are upserted as they are stored, so
+        saving only commits the open transaction.
+        """
         if not self.cache_enabled:
             return
         
         try:
-            cache_data = {
-                'version': '2.3',
-                'saved_at': datetime.now().isoformat(),
-                'file_hashes': {}
-            }
-            
-            for file_path, file_hash in self.file_hashes.items():
-                cache_data['file_hashes'][file_path] = asdict(file_hash)
-                # Convert datetime to string
-                cache_data['file_hashes'][file_path]['parsed_at'] = file_hash.parsed_at.isoformat()
-            
-            with open(self.hash_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
-            
+            self.store.commit()
+            if self.backend is not self.store:
+                self.backend.commit()
             logger.debug(f"Saved hash cache with {len(self.file_hashes)} entries")
             
         except Exception as e:
             logger.error(f"Error saving hash cache: {e}")
     
+    def _index_file_hash(self, abs_path: str, file_hash: FileHash):
+        """Set a path's FileHash, keeping the content hash reference counts in step."""
+        with self._index_lock:
+            previous = self.file_hashes.get(abs_path)
+            if previous is not None:
+                self._release_content(previous.content_hash)
+            self.file_hashes[abs_path] = file_hash
+            self._content_refs[file_hash.content_hash] += 1
+    
+    def _unindex_file_hash(self, abs_path: str) -> Optional[FileHash]:
+        """Remove a path's FileHash, keeping the content hash reference counts in step."""
+        with self._index_lock:
+            file_hash = self.file_hashes.pop(abs_path, None)
+            if file_hash is not None:
+                self._release_content(file_hash.content_hash)
+        return file_hash
+    
+    def _release_content(self, content_hash: str):
+        """Drop one reference to a content hash; the caller holds the index lock."""
+        self._content_refs[content_hash] -= 1
+        if self._content_refs[content_hash] <= 0:
+            del self._content_refs[content_hash]
+    
+    def _put_file_entry(self, file_hash: FileHash):
+        """Index a file; if the store stays locked, only the index update is lost."""
+        try:
+            self.store.put_file_entry(self._file_hash_to_row(file_hash))
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Parse cache store busy, not indexing {file_hash.file_path}: {e}")
+    
+    @staticmethod
+    def _file_hash_to_row(file_hash: FileHash) -> tuple:
+        """Convert a FileHash to a store index row."""
+        return (
+            file_hash.file_path,
+            file_hash.content_hash,
+            file_hash.last_modified,
+            file_hash.last_modified_ns,
+            file_hash.size,
+            file_hash.parsed_at.isoformat(),
+            file_hash.parse_duration,
+            file_hash.relationship_count,
+        )
+    
+    @staticmethod
+    def _row_to_file_hash(row: tuple) -> FileHash:
+        """Convert a store index row to a FileHash."""
+        (file_path, content_hash, last_modified, last_modified_ns, size,
+         parsed_at, parse_duration, relationship_count) = row
+        return FileHash(
+            file_path=file_path,
+            content_hash=content_hash,
+            last_modified=last_modified,
+            size=size,
+            parsed_at=datetime.fromisoformat(parsed_at),
+            parse_duration=parse_duration,
+            relationship_count=relationship_count,
+            last_modified_ns=last_modified_ns
+        )
+    
+    def _create_backend(self) -> CacheBackend:
+        """Create the parse result backend selected in the cache options."""
+        backend = self.cache_options.get('backend', 'local')
+        
+        if backend == 'shared':
+            shared_dir = self.cache_options.get('shared_dir')
+            if shared_dir:
+                return SharedDirectoryBackend(Path(shared_dir))
+            logger.warning("Shared cache backend requires 'shared_dir', using local backend")
+        elif backend != 'local':
+            logger.warning(f"Unknown cache backend '{backend}', expected one of {self.BACKENDS}; using local backend")
+        
+        return self.store
+    
+    def _module_key(self, content_hash: str) -> str:
+        """Backend key of a parse result: same content and parser config, same result."""
+        return f"{content_hash}-{self._config_hash}"
+    
     def _get_config_hash(self) -> str:
-        """Generate hash of parser configuration for cache validation."""
-        config_str = json.dumps(asdict(self.config), sort_keys=True)
+        """
+        Generate hash of parser configuration for cache validation.
+        
+        Only settings that affect parse output are hashed, so sessions that
+        differ in cache location, worker counts or memory limits still share
+        parse results.
+        """
+        config_data = asdict(self.config)
+        for field_name in self.RUNTIME_CONFIG_FIELDS:
+            config_data.pop(field_name, None)
+        config_data['tool_options'] = {
+            tool: options for tool, options in config_data['tool_options'].items()
+            if tool not in self.RUNTIME_TOOL_OPTIONS
+        }
+        config_str = json.dumps(_serialize_with_enum_support(config_data), sort_keys=True, default=str)
         return hashlib.md5(config_str.encode()).hexdigest()[:8]
     
     def _get_cache_size_mb(self) -> float:
         """Calculate total cache size in MB."""
-        total_size = 0
-        
-        try:
-            if self.hash_cache_file.exists():
-                total_size += self.hash_cache_file.stat().st_size
-            
-            for cache_file in self.parsed_cache_dir.glob("*.json"):
-                total_size += cache_file.stat().st_size
-        except:
-            pass
-        
-        return total_size / (1024 * 1024)
+        return self.store.size_bytes() / (1024 * 1024)
     
-    def _serialize_cache_entry(self, entry: CacheEntry) -> Dict[str, Any]:
-        """Serialize cache entry for JSON storage."""
-        return {
-            'file_hash': {
-                **_serialize_with_enum_support(asdict(entry.file_hash)),
-                'parsed_at': entry.file_hash.parsed_at.isoformat()
+    def _serialize_cache_entry(self, entry: CacheEntry) -> bytes:
+        """Serialize the shareable part of a cache entry for the store."""
+        return json.dumps(
+            {
+                'parsed_module': entry.parsed_module.to_tuple() if entry.parsed_module else None,
+                'relationships': [_serialize_with_enum_support(asdict(rel)) for rel in entry.relationships],
+                'metadata': _serialize_with_enum_support(entry.metadata)
             },
-            'parsed_module': _serialize_with_enum_support(asdict(entry.parsed_module)) if entry.parsed_module else None,
-            'relationships': [_serialize_with_enum_support(asdict(rel)) for rel in entry.relationships],
-            'metadata': _serialize_with_enum_support(entry.metadata)
-        }
+            separators=(',', ':'),
+            default=str
+        ).encode('utf-8')
     
-    def _deserialize_cache_entry(self, data: Dict[str, Any]) -> CacheEntry:
-        """Deserialize cache entry from JSON data."""
-        file_hash_data = data['file_hash']
-        file_hash = FileHash(
-            file_path=file_hash_data['file_path'],
-            content_hash=file_hash_data['content_hash'],
-            last_modified=file_hash_data['last_modified'],
-            size=file_hash_data['size'],
-            parsed_at=datetime.fromisoformat(file_hash_data['parsed_at']),
-            parse_duration=file_hash_data.get('parse_duration', 0.0),
-            relationship_count=file_hash_data.get('relationship_count', 0)
-        )
+    def _deserialize_cache_entry(self, payload: bytes, file_hash: FileHash) -> CacheEntry:
+        """
+        Rebuild a cache entry from a stored payload.
+        
+        Parse results are keyed by content, so a payload may have been stored
+        for an identical file at another path (or before the file was touched);
+        the module is rebased onto the path and mtime being looked up.
+        Payloads are plain JSON (tuples come back as lists, which from_tuple
+        unpacks the same way), never pickles, since a shared backend's
+        entries may have been written by anyone with access to it.
+        """
+        data = json.loads(payload)
         
-        # Deserialize parsed module
         parsed_module = None
         if data['parsed_module']:
-            # This would need proper deserialization of ParsedModule
-            # For now, storing as dict - full implementation would recreate object
-            parsed_module = data['parsed_module']
+            parsed_module = ParsedModule.from_tuple(data['parsed_module'])
+            rebased = parsed_module.path != file_hash.file_path
+            if rebased:
+                parsed_module.path = file_hash.file_path
+                parsed_module.name = Path(file_hash.file_path).stem
+            if rebased or parsed_module.last_modified is not None:
+                parsed_module.last_modified = datetime.fromtimestamp(file_hash.last_modified).isoformat()
         
-        # Deserialize relationships
-        relationships = []
-        for rel_data in data['relationships']:
-            relationships.append(CodeRelationship(**rel_data))
+        relationships = [CodeRelationship(**rel_data) for rel_data in data['relationships']]
         
         return CacheEntry(
             file_hash=file_hash,
@@ -563,7 +852,7 @@ class HashBasedCache:
         """Ensure hash cache is saved on cleanup."""
         try:
             # Only try to save if we have the necessary attributes and builtins are still available
-            if hasattr(self, 'cache_enabled') and hasattr(self, 'file_hashes') and hasattr(self, 'hash_cache_file'):
+            if hasattr(self, 'cache_enabled') and hasattr(self, 'store'):
                 self.save_hash_cache()
         except:
             # Silently ignore all errors during cleanup
@@ -3,8 +3,9 @@
 Main entry point for the Extractor Domain.
 
 This module orchestrates the entire extraction phase, parsing a codebase
-and producing a structured JSON output file containing all code elements
-and their relationships.
+and producing a structured output file containing all code elements
+and their relationships: newline-delimited JSON written while parsing runs
+(the default), or a single JSON document.
 """
 
 import argparse
@@ -16,7 +17,7 @@ from typing import Dict, Optional
 import uuid
 
 from codebase_parser import CodebaseParser
-from serialization import Serializer
+from serialization import ExtractionStreamWriter, Serializer
 from models import ParsedModule
 from communication import StatusReporter
 
@@ -27,28 +28,63 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+OUTPUT_FORMATS = ("ndjson", "json")
+
+# Parser reused by every run of main() in this process, so a warm worker
+# keeps its parse cache loaded between jobs
+_shared_codebase_parser: Optional[CodebaseParser] = None
+
+
+def get_shared_codebase_parser() -> CodebaseParser:
+    """Return the process-wide CodebaseParser, creating it on first use."""
+    global _shared_codebase_parser
+    if _shared_codebase_parser is None:
+        _shared_codebase_parser = CodebaseParser()
+    return _shared_codebase_parser
+
 
 class ExtractorMain:
     """Main orchestrator for the extraction phase."""
     
-    def __init__(self, job_id: Optional[str] = None):
-        """Initialize the extractor with optional job ID."""
+    def __init__(self, job_id: Optional[str] = None, codebase_parser: Optional[CodebaseParser] = None):
+        """Initialize the extractor with optional job ID and parser to reuse."""
         self.job_id = job_id or str(uuid.uuid4())
         self.status_reporter = StatusReporter(job_id=self.job_id)
-        self.codebase_parser = CodebaseParser()
+        self.codebase_parser = codebase_parser or CodebaseParser()
         self.serializer = Serializer()
         
-    def extract(self, codebase_path: str, output_path: Optional[str] = None) -> str:
+    def extract(
+        self,
+        codebase_path: str,
+        output_path: Optional[str] = None,
+        incremental: bool = False,
+        output_format: str = "ndjson",
+        write_index: bool = False
+    ) -> str:
         """
         Extract code structure from the given codebase.
         
+        In incremental mode only added and changed modules are written, and
+        the output gains a "delta" section listing added, changed and deleted
+        module paths relative to the previous run.
+        
+        With the ndjson format every module is written as soon as it is
+        parsed and then dropped, so memory does not grow with the codebase;
+        the json format keeps every module in memory for a single document.
+        
         Args:
             codebase_path: Path to the codebase to analyze
             output_path: Optional custom output path
+            incremental: Extract only modules changed since the previous run
+            output_format: "ndjson" (streamed) or "json" (single document)
+            write_index: Write a byte-offset index next to ndjson output
             
         Returns:
             Path to the generated output file
         """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format: {output_format}")
+        
         try:
             # Report extraction started
             self.status_reporter.report_status(
@@ -72,28 +108,14 @@ class ExtractorMain:
                 message="Discovering and parsing Python files"
             )
             
-            parsed_modules: Dict[str, ParsedModule] = self.codebase_parser.parse_codebase(
-                str(path),
-                status_reporter=self.status_reporter
-            )
-            
             # Generate output filename
             if output_path is None:
-                output_path = f"extraction_output_{self.job_id}.json"
-            
-            # Serialize the results
-            logger.info(f"Serializing {len(parsed_modules)} modules to {output_path}")
-            self.status_reporter.report_status(
-                phase="extraction",
-                status="serializing",
-                message=f"Serializing {len(parsed_modules)} parsed modules"
-            )
+                output_path = f"extraction_output_{self.job_id}.{output_format}"
             
-            serialized_data = self.serializer.serialize_modules(parsed_modules)
-            
-            # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(serialized_data, f, indent=2)
+            if output_format == "ndjson":
+                module_count = self._extract_streaming(path, output_path, incremental, write_index)
+            else:
+                module_count = self._extract_document(path, output_path, incremental)
             
             # Report completion
             self.status_reporter.report_status(
@@ -101,8 +123,9 @@ class ExtractorMain:
                 status="completed",
                 message=f"Extraction completed. Output saved to: {output_path}",
                 metadata={
-                    "modules_parsed": len(parsed_modules),
-                    "output_file": output_path
+                    "modules_parsed": module_count,
+                    "output_file": output_path,
+                    "incremental": incremental
                 }
             )
             
@@ -118,6 +141,71 @@ class ExtractorMain:
             )
             logger.error(f"Extraction failed: {e}")
             raise
+            
+        finally:
+            # Status updates are sent in the background; deliver what is queued
+            self.status_reporter.flush()
+            
+    def _extract_streaming(self, path: Path, output_path: str, incremental: bool, write_index: bool) -> int:
+        """Parse into an NDJSON stream, writing each module as it is parsed."""
+        with ExtractionStreamWriter(output_path, write_index=write_index, serializer=self.serializer) as writer:
+            if incremental:
+                self.codebase_parser.parse_codebase_incremental(
+                    str(path),
+                    status_reporter=self.status_reporter,
+                    module_sink=writer.write_module,
+                    # The delta goes in the header so stale modules are known up front
+                    delta_callback=lambda delta: writer.write_header(delta.to_dict())
+                )
+            else:
+                writer.write_header()
+                self.codebase_parser.parse_codebase(
+                    str(path),
+                    status_reporter=self.status_reporter,
+                    module_sink=writer.write_module
+                )
+        
+        logger.info(f"Streamed {writer.module_count} modules to {output_path}")
+        return writer.module_count
+        
+    def _extract_document(self, path: Path, output_path: str, incremental: bool) -> int:
+        """Parse everything, then serialize it as a single JSON document."""
+        delta = None
+        if incremental:
+            parsed_modules, delta = self.codebase_parser.parse_codebase_incremental(
+                str(path),
+                status_reporter=self.status_reporter
+            )
+        else:
+            parsed_modules: Dict[str, ParsedModule] = self.codebase_parser.parse_codebase(
+                str(path),
+                status_reporter=self.status_reporter
+            )
+        
+        # Serialize the results
+        logger.info(f"Serializing {len(parsed_modules)} modules to {output_path}")
+        self.status_reporter.report_status(
+            phase="extraction",
+            status="serializing",
+            message=f"Serializing {len(parsed_modules)} parsed modules"
+        )
+        
+        serialized_data = self.serializer.serialize_modules(parsed_modules)
+        if delta is not None:
+            # Ahead of the modules, so incremental readers know the stale
+            # modules before they reach the replacements
+            metadata = serialized_data.pop("metadata")
+            serialized_data = {"metadata": metadata, "delta": delta.to_dict(), **serialized_data}
+        
+        # Write to file
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(serialized_data, f, indent=2)
+        
+        return len(parsed_modules)
+        
+    def close(self) -> None:
+        """Stop the background status reporter."""
+        self.status_reporter.close()
 
 
 def main():
@@ -136,7 +224,23 @@ def main():
     )
     parser.add_argument(
         "--output",
-        help="Custom output file path (default: extraction_output_<job_id>.json)"
+        help="Custom output file path (default: extraction_output_<job_id>.<format>)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="ndjson",
+        help="Output format: streamed newline-delimited JSON or a single JSON document"
+    )
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        help="Write a byte-offset index (<output>.idx) for ndjson output"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only extract modules added or changed since the previous run"
     )
     parser.add_argument(
         "--verbose",
@@ -149,17 +253,24 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    extractor = None
     try:
-        extractor = ExtractorMain(job_id=args.job_id)
+        extractor = ExtractorMain(job_id=args.job_id, codebase_parser=get_shared_codebase_parser())
         output_file = extractor.extract(
             codebase_path=args.path,
-            output_path=args.output
+            output_path=args.output,
+            incremental=args.incremental,
+            output_format=args.format,
+            write_index=args.index
         )
         print(f"Extraction successful. Output: {output_file}")
         sys.exit(0)
     except Exception as e:
         print(f"Extraction failed: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        if extractor:
+            extractor.close()
 
 
 if __name__ == "__main__":
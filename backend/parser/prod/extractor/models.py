@@ -41,6 +41,23 @@ class ParsedImport:
             "symbols": self.symbols,
         }
 
+    def to_tuple(self) -> tuple:
+        """Convert the import to a positional tuple for compact transport."""
+        return (
+            self.name,
+            self.asname,
+            self.fromname,
+            self.line_start,
+            self.line_end,
+            self.is_star,
+            self.symbols,
+        )
+
+    @classmethod
+    def from_tuple(cls, data: tuple) -> "ParsedImport":
+        """Rebuild an import from the output of ``to_tuple``."""
+        return cls(*data)
+
 
 @dataclass
 class ParsedVariable:
@@ -68,6 +85,24 @@ class ParsedVariable:
             "scope": self.scope,
         }
 
+    def to_tuple(self) -> tuple:
+        """Convert the variable to a positional tuple for compact transport."""
+        return (
+            self.name,
+            self.inferred_type,
+            self.value_repr,
+            self.line_start,
+            self.line_end,
+            self.is_class_var,
+            self.is_constant,
+            self.scope,
+        )
+
+    @classmethod
+    def from_tuple(cls, data: tuple) -> "ParsedVariable":
+        """Rebuild a variable from the output of ``to_tuple``."""
+        return cls(*data)
+
 
 @dataclass
 class ParsedFunction:
@@ -109,6 +144,50 @@ class ParsedFunction:
             "imports": [imp.to_dict() for imp in self.imports],
         }
 
+    def to_tuple(self) -> tuple:
+        """Convert the function to a positional tuple for compact transport."""
+        return (
+            self.name,
+            self.signature,
+            self.docstring,
+            self.parameters,
+            self.return_type,
+            [var.to_tuple() for var in self.variables],
+            [func.to_tuple() for func in self.nested_functions],
+            self.line_start,
+            self.line_end,
+            self.decorators,
+            self.is_method,
+            self.is_static,
+            self.is_class_method,
+            self.complexity,
+            [imp.to_tuple() for imp in self.imports],
+        )
+
+    @classmethod
+    def from_tuple(cls, data: tuple) -> "ParsedFunction":
+        """Rebuild a function from the output of ``to_tuple``."""
+        (name, signature, docstring, parameters, return_type, variables,
+         nested_functions, line_start, line_end, decorators, is_method,
+         is_static, is_class_method, complexity, imports) = data
+        return cls(
+            name=name,
+            signature=signature,
+            docstring=docstring,
+            parameters=parameters,
+            return_type=return_type,
+            variables=[ParsedVariable.from_tuple(var) for var in variables],
+            nested_functions=[cls.from_tuple(func) for func in nested_functions],
+            line_start=line_start,
+            line_end=line_end,
+            decorators=decorators,
+            is_method=is_method,
+            is_static=is_static,
+            is_class_method=is_class_method,
+            complexity=complexity,
+            imports=[ParsedImport.from_tuple(imp) for imp in imports],
+        )
+
 
 @dataclass
 class ParsedClass:
@@ -142,6 +221,41 @@ class ParsedClass:
             "metaclass": self.metaclass,
         }
 
+    def to_tuple(self) -> tuple:
+        """Convert the class to a positional tuple for compact transport."""
+        return (
+            self.name,
+            self.bases,
+            self.docstring,
+            [method.to_tuple() for method in self.methods],
+            [attr.to_tuple() for attr in self.attributes],
+            self.line_start,
+            self.line_end,
+            self.decorators,
+            [cls.to_tuple() for cls in self.inner_classes],
+            self.imported_types,
+            self.metaclass,
+        )
+
+    @classmethod
+    def from_tuple(cls, data: tuple) -> "ParsedClass":
+        """Rebuild a class from the output of ``to_tuple``."""
+        (name, bases, docstring, methods, attributes, line_start, line_end,
+         decorators, inner_classes, imported_types, metaclass) = data
+        return cls(
+            name=name,
+            bases=bases,
+            docstring=docstring,
+            methods=[ParsedFunction.from_tuple(method) for method in methods],
+            attributes=[ParsedVariable.from_tuple(attr) for attr in attributes],
+            line_start=line_start,
+            line_end=line_end,
+            decorators=decorators,
+            inner_classes=[cls.from_tuple(inner) for inner in inner_classes],
+            imported_types=imported_types,
+            metaclass=metaclass,
+        )
+
 
 @dataclass
 class ParsedModule:
@@ -177,3 +291,46 @@ class ParsedModule:
             "last_modified": self.last_modified,
             "md5_hash": self.md5_hash,
         }
+
+    def to_tuple(self) -> tuple:
+        """
+        Convert the parsed module to nested positional tuples.
+
+        The tuple form drops the field names that ``to_dict`` repeats for
+        every element, which keeps the payload small when modules are
+        shipped between worker processes or written to a binary cache.
+        """
+        return (
+            self.name,
+            self.path,
+            self.docstring,
+            [imp.to_tuple() for imp in self.imports],
+            [cls.to_tuple() for cls in self.classes],
+            [func.to_tuple() for func in self.functions],
+            [var.to_tuple() for var in self.variables],
+            self.line_count,
+            self.size_bytes,
+            self.ast_errors,
+            self.last_modified,
+            self.md5_hash,
+        )
+
+    @classmethod
+    def from_tuple(cls, data: tuple) -> "ParsedModule":
+        """Rebuild a parsed module from the output of ``to_tuple``."""
+        (name, path, docstring, imports, classes, functions, variables,
+         line_count, size_bytes, ast_errors, last_modified, md5_hash) = data
+        return cls(
+            name=name,
+            path=path,
+            docstring=docstring,
+            imports=[ParsedImport.from_tuple(imp) for imp in imports],
+            classes=[ParsedClass.from_tuple(c) for c in classes],
+            functions=[ParsedFunction.from_tuple(func) for func in functions],
+            variables=[ParsedVariable.from_tuple(var) for var in variables],
+            line_count=line_count,
+            size_bytes=size_bytes,
+            ast_errors=ast_errors,
+            last_modified=last_modified,
+            md5_hash=md5_hash,
+        )
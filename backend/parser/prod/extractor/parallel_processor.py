@@ -17,10 +17,18 @@ import asyncio
 import logging
 import multiprocessing
 import os
+import pickle
 import psutil
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from queue import Queue
 from typing import Dict, List, Optional, Callable, Any, Tuple
@@ -32,10 +40,65 @@ from errors import ParserError, ParserErrorCode
 from processing_types import ProcessingStrategy, ProcessingMetrics, ParsingTask, ProgressTracker
 from memory_efficient_parser import MemoryEfficientParser
 from hash_based_cache import HashBasedCache
+from module_parser import ModuleParser
 
 
 logger = logging.getLogger(__name__)
 
+# Default size above which HYBRID mode sends a file to the process pool
+DEFAULT_PROCESS_THRESHOLD_KB = 32
+
+# Start method for worker processes; "spawn" avoids forking a parent that
+# is already running the thread pool in HYBRID mode
+DEFAULT_START_METHOD = "spawn"
+
+# Receives each module as soon as it is available, instead of collecting it
+ModuleSink = Callable[[str, ParsedModule], None]
+
+# Per-process parser state, populated by _init_process_worker
+_worker_config: Optional[ParserConfig] = None
+_worker_parser: Optional[ModuleParser] = None
+
+
+def _init_process_worker(config: ParserConfig) -> None:
+    """Create the ModuleParser owned by a single worker process."""
+    global _worker_config, _worker_parser
+    _worker_config = config
+    _worker_parser = ModuleParser(config)
+
+
+def _parse_task_in_process(task: ParsingTask) -> Tuple[Optional[bytes], float]:
+    """
+    Parse one task inside a worker process.
+
+    Mirrors CodebaseParser.parse_file: oversized files are skipped and parse
+    errors are logged rather than raised, so only pool-level failures reach
+    the parent's error recovery.
+
+    Args:
+        task: Picklable parsing task shipped from the parent process
+
+    Returns:
+        Tuple of (pickled ParsedModule.to_tuple() payload or None, parse duration)
+    """
+    if _worker_parser is None:
+        raise RuntimeError("Worker process was started without _init_process_worker")
+
+    start_time = time.time()
+    try:
+        max_file_size = _worker_config.max_file_size
+        if max_file_size > 0 and os.path.getsize(task.file_path) > max_file_size:
+            logger.warning(f"Skipping {task.file_path}: exceeds size limit ({max_file_size} bytes)")
+            return None, time.time() - start_time
+
+        parsed_module = _worker_parser.parse(task.file_path)
+    except Exception as e:
+        logger.error(f"Error parsing {task.file_path}: {e}")
+        return None, time.time() - start_time
+
+    payload = pickle.dumps(parsed_module.to_tuple(), protocol=pickle.HIGHEST_PROTOCOL)
+    return payload, time.time() - start_time
+
 
 class MemoryManager:
     """Manages memory usage during parallel processing."""
@@ -146,10 +209,17 @@ class ParallelProcessor:
     - Integration with relationship extraction
     """
     
+    # Short strategy names used by the presets in config.py
+    STRATEGY_ALIASES = {
+        "thread": ProcessingStrategy.THREAD_BASED,
+        "process": ProcessingStrategy.PROCESS_BASED,
+    }
+    
     def __init__(self, config: ParserConfig):
         self.config = config
-        self.strategy = ProcessingStrategy.ADAPTIVE
-        self.memory_manager = MemoryManager(max_memory_mb=config.tool_options.get('parallel', {}).get('max_memory_mb', 1024))
+        self.parallel_options = config.tool_options.get('parallel', {})
+        self.strategy = self._resolve_configured_strategy()
+        self.memory_manager = MemoryManager(max_memory_mb=self.parallel_options.get('max_memory_mb', 1024))
         self.error_recovery = ErrorRecoveryManager()
         self.metrics = ProcessingMetrics()
         
@@ -161,6 +231,10 @@ class ParallelProcessor:
         self.task_queue: Queue = Queue()
         self.completed_tasks: Dict[str, Any] = {}
         self.failed_tasks: Dict[str, Exception] = {}
+        # HYBRID records results from the thread pool and the process feeder at once
+        self._results_lock = threading.Lock()
+        self._module_sink: Optional[ModuleSink] = None
+        self._sink_lock = threading.Lock()
         
         # Progress tracking
         self.progress_tracker: Optional[ProgressTracker] = None
@@ -171,17 +245,40 @@ class ParallelProcessor:
         # Hash-based cache for incremental parsing
         self.cache = HashBasedCache(config)
         
-    def process_files(self, file_paths: List[str], parse_func: Callable[[str], ParsedModule]) -> Dict[str, ParsedModule]:
+    def process_files(
+        self,
+        file_paths: List[str],
+        parse_func: Callable[[str], ParsedModule],
+        module_sink: Optional[ModuleSink] = None
+    ) -> Dict[str, ParsedModule]:
         """
         Process multiple files in parallel with comprehensive management and caching.
         
         Args:
             file_paths: List of file paths to process
             parse_func: Function to parse individual files
+            module_sink: Optional callback receiving (file_path, module) for each
+                cached or parsed module as soon as it is available. Calls are
+                serialized. Modules handed to the sink are not retained, so
+                memory stays bounded by the modules in flight.
             
         Returns:
-            Dictionary mapping file paths to parsed modules
+            Dictionary mapping file paths to parsed modules (empty when a
+            module_sink is given)
         """
+        self._module_sink = module_sink
+        try:
+            return self._process_files(file_paths, parse_func)
+        finally:
+            self._module_sink = None
+    
+    def _process_files(self, file_paths: List[str], parse_func: Callable[[str], ParsedModule]) -> Dict[str, ParsedModule]:
+        """Body of process_files; results go through _collect_result."""
+        # Per-run bookkeeping; the processor may be reused across runs
+        self.completed_tasks.clear()
+        self.failed_tasks.clear()
+        self.error_recovery.failed_tasks.clear()
+        
         # Initialize metrics and progress tracking
         self.metrics = ProcessingMetrics(total_files=len(file_paths))
         self.progress_tracker = ProgressTracker(len(file_paths))
@@ -198,7 +295,7 @@ class ParallelProcessor:
         # Add cached results to final output
         for file_path, cache_entry in cached_results.items():
             if cache_entry.parsed_module:
-                parsed_modules[file_path] = cache_entry.parsed_module
+                self._collect_result(parsed_modules, file_path, cache_entry.parsed_module)
                 self.progress_tracker.update_progress(completed=1)
         
         # Update metrics to reflect actual work needed
@@ -216,6 +313,7 @@ class ParallelProcessor:
         if not tasks:
             logger.info("All files are cached, no parsing needed")
             self.metrics.end_time = time.time()
+            self.cache.end_run()
             return parsed_modules
         
         # Select processing strategy for changed files
@@ -246,6 +344,18 @@ class ParallelProcessor:
             
             # Save cache after processing
             self.cache.save_hash_cache()
+            self.cache.end_run()
+    
+    def _resolve_configured_strategy(self) -> ProcessingStrategy:
+        """Map tool_options['parallel']['strategy'] to a ProcessingStrategy."""
+        name = str(self.parallel_options.get('strategy', ProcessingStrategy.ADAPTIVE.value)).lower()
+        if name in self.STRATEGY_ALIASES:
+            return self.STRATEGY_ALIASES[name]
+        try:
+            return ProcessingStrategy(name)
+        except ValueError:
+            logger.warning(f"Unknown parallel strategy '{name}', using adaptive")
+            return ProcessingStrategy.ADAPTIVE
     
     def _calculate_priority(self, file_path: str) -> int:
         """Calculate task priority based on file characteristics."""
@@ -340,25 +450,21 @@ class ParallelProcessor:
                     
                     try:
                         result = future.result()
-                        if result:
-                            results[task.file_path] = result
-                            self.completed_tasks[task.task_id] = result
-                            
-                            # Cache the result
-                            parse_duration = time.time() - (task.start_time if hasattr(task, 'start_time') else time.time())
-                            self.cache.store_result(task.file_path, result, [], parse_duration)
-                            
-                            self.progress_tracker.update_progress(completed=1)
-                        else:
-                            self.progress_tracker.update_progress(failed=1)
                     except Exception as e:
                         if self.error_recovery.handle_error(task, e):
                             # Retry task
                             retry_future = executor.submit(self._safe_parse_task, task, parse_func)
                             future_to_task[retry_future] = task
                         else:
-                            self.failed_tasks[task.file_path] = e
-                            self.progress_tracker.update_progress(failed=1)
+                            self._record_failure(task, e)
+                    else:
+                        if result:
+                            parse_duration = time.time() - (task.start_time if hasattr(task, 'start_time') else time.time())
+                            self._record_success(task, result, parse_duration)
+                            # Sink errors are not parse errors and must not trigger a retry
+                            self._collect_result(results, task.file_path, result)
+                        else:
+                            self._record_failure(task)
                     
                     # Remove completed future
                     del future_to_task[future]
@@ -377,25 +483,159 @@ class ParallelProcessor:
         return results
     
     def _process_with_processes(self, tasks: List[ParsingTask], parse_func: Callable) -> Dict[str, ParsedModule]:
-        """Process tasks using process-based parallelism."""
-        max_workers = min(os.cpu_count() or 1, len(tasks), 4)  # Cap at 4 processes
+        """
+        Process tasks using process-based parallelism.
+        
+        Each worker process owns its own ModuleParser (see _init_process_worker),
+        so parse_func is only used if the pool breaks and the remaining tasks
+        have to be finished on threads. Workers return pickled
+        ParsedModule.to_tuple() payloads, which are rebuilt here.
+        """
+        if not tasks:
+            return {}
+        
+        max_workers = self._get_process_worker_count(len(tasks))
+        # Keep a few tasks queued per worker without materialising every future
+        max_in_flight = max_workers * 4
         results = {}
+        completed_paths = set()
+        
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=self._get_mp_context(),
+                initializer=_init_process_worker,
+                initargs=(self.config,)
+            ) as executor:
+                self._process_pool = executor
+                future_to_task = {}
+                task_iter = iter(tasks)
+                
+                for task in task_iter:
+                    future_to_task[executor.submit(_parse_task_in_process, task)] = task
+                    if len(future_to_task) >= max_in_flight:
+                        break
+                
+                while future_to_task:
+                    done, _ = wait(future_to_task, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        task = future_to_task.pop(future)
+                        
+                        try:
+                            payload, parse_duration = future.result()
+                        except BrokenProcessPool:
+                            raise
+                        except Exception as e:
+                            if self.error_recovery.handle_error(task, e):
+                                future_to_task[executor.submit(_parse_task_in_process, task)] = task
+                            else:
+                                self._record_failure(task, e)
+                        else:
+                            if payload is None:
+                                self._record_failure(task)
+                            else:
+                                result = ParsedModule.from_tuple(pickle.loads(payload))
+                                completed_paths.add(task.file_path)
+                                self._record_success(task, result, parse_duration)
+                                self._collect_result(results, task.file_path, result)
+                        
+                        next_task = next(task_iter, None)
+                        if next_task is not None:
+                            future_to_task[executor.submit(_parse_task_in_process, next_task)] = next_task
+                            
+        except BrokenProcessPool as e:
+            remaining = [
+                task for task in tasks
+                if task.file_path not in completed_paths and task.file_path not in self.failed_tasks
+            ]
+            logger.warning(f"Process pool terminated unexpectedly ({e}); finishing {len(remaining)} files with threads")
+            results.update(self._process_with_threads(remaining, parse_func))
         
-        # Note: This is a simplified implementation
-        # Full implementation would require serializable task objects and parse functions
-        logger.warning("Process-based parallelism not fully implemented - falling back to threads")
-        return self._process_with_threads(tasks, parse_func)
+        return results
     
     def _process_hybrid(self, tasks: List[ParsingTask], parse_func: Callable) -> Dict[str, ParsedModule]:
-        """Process tasks using hybrid thread/process approach."""
-        # Simplified: use threads for now
-        # Full implementation would categorize tasks and use appropriate pools
-        return self._process_with_threads(tasks, parse_func)
+        """
+        Process tasks using hybrid thread/process approach.
+        
+        Files above tool_options['parallel']['process_threshold_kb'] go to the
+        process pool, where parsing is not bound by the GIL; the rest are parsed
+        on threads in this process at the same time, which avoids paying the
+        pickling round trip for small modules.
+        """
+        large_tasks, small_tasks = self._partition_by_size(tasks)
+        
+        if not large_tasks:
+            return self._process_with_threads(small_tasks, parse_func)
+        if not small_tasks:
+            return self._process_with_processes(large_tasks, parse_func)
+        
+        logger.info(f"Hybrid processing: {len(large_tasks)} files on processes, {len(small_tasks)} files on threads")
+        
+        # Drive the process pool from a helper thread while the thread pool runs here
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="hybrid-process-feeder") as feeder:
+            process_future = feeder.submit(self._process_with_processes, large_tasks, parse_func)
+            results = self._process_with_threads(small_tasks, parse_func)
+            results.update(process_future.result())
+        
+        return results
     
     def _process_adaptive(self, tasks: List[ParsingTask], parse_func: Callable) -> Dict[str, ParsedModule]:
-        """Process tasks using adaptive strategy selection."""
-        # Monitor performance and switch strategies if needed
-        return self._process_with_threads(tasks, parse_func)
+        """
+        Process tasks using adaptive strategy selection.
+        
+        Hybrid processing already degrades to a single pool when every file
+        falls on one side of the size threshold, so it is the adaptive choice.
+        """
+        return self._process_hybrid(tasks, parse_func)
+    
+    def _partition_by_size(self, tasks: List[ParsingTask]) -> Tuple[List[ParsingTask], List[ParsingTask]]:
+        """Split tasks into (large, small) using the configured process threshold."""
+        threshold_bytes = self.parallel_options.get('process_threshold_kb', DEFAULT_PROCESS_THRESHOLD_KB) * 1024
+        large_tasks, small_tasks = [], []
+        
+        for task in tasks:
+            try:
+                size = Path(task.file_path).stat().st_size
+            except OSError:
+                size = 0
+            (large_tasks if size >= threshold_bytes else small_tasks).append(task)
+        
+        return large_tasks, small_tasks
+    
+    def _get_process_worker_count(self, task_count: int) -> int:
+        """Number of worker processes; max_workers of 0 means one per CPU."""
+        configured = self.parallel_options.get('max_workers') or 0
+        max_workers = configured if configured > 0 else (os.cpu_count() or 1)
+        return max(1, min(max_workers, task_count))
+    
+    def _get_mp_context(self):
+        """Multiprocessing context for the process pool."""
+        return multiprocessing.get_context(self.parallel_options.get('start_method', DEFAULT_START_METHOD))
+    
+    def _collect_result(self, results: Dict[str, ParsedModule], file_path: str, module: ParsedModule):
+        """Hand a module to the module sink, or add it to the results."""
+        if self._module_sink is None:
+            results[file_path] = module
+            return
+        with self._sink_lock:
+            self._module_sink(file_path, module)
+    
+    def _record_success(self, task: ParsingTask, result: ParsedModule, parse_duration: float):
+        """Record a parsed module in the task table, cache, metrics and progress."""
+        with self._results_lock:
+            # Streaming runs do not keep modules that already went to the sink
+            self.completed_tasks[task.task_id] = result if self._module_sink is None else task.file_path
+            self.metrics.processed_files += 1
+        self.cache.store_result(task.file_path, result, [], parse_duration)
+        self.progress_tracker.update_progress(completed=1)
+    
+    def _record_failure(self, task: ParsingTask, error: Optional[Exception] = None):
+        """Record a task that produced no parsed module."""
+        with self._results_lock:
+            if error is not None:
+                self.failed_tasks[task.file_path] = error
+            self.metrics.failed_files += 1
+        self.progress_tracker.update_progress(failed=1)
     
     def _can_process_task(self, task: ParsingTask) -> bool:
         """Check if task can be processed given current resource constraints."""
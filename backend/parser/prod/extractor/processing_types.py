@@ -56,6 +56,36 @@ class ProcessingMetrics:
         return self.processed_files / duration
 
 
+@dataclass
+class ModuleDelta:
+    """
+    Modules added, changed and deleted under a root since the previous run.
+    
+    Paths are absolute. Changed and deleted modules are the ones whose
+    previously loaded graph data is stale.
+    """
+    root_path: str
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    unchanged_count: int = 0
+    
+    @property
+    def is_empty(self) -> bool:
+        """True if nothing was added, changed or deleted."""
+        return not (self.added or self.changed or self.deleted)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the extraction output format."""
+        return {
+            "root_path": self.root_path,
+            "added": self.added,
+            "changed": self.changed,
+            "deleted": self.deleted,
+            "unchanged_count": self.unchanged_count
+        }
+
+
 @dataclass
 class ParsingTask:
     """Individual parsing task with metadata."""
@@ -65,6 +95,8 @@ class ParsingTask:
     dependencies: List[str] = field(default_factory=list)
     estimated_memory: int = 0  # MB
     start_time: Optional[float] = None
+    retries: int = 0
+    max_retries: int = 3
     
     def __post_init__(self):
         if self.start_time is None:
@@ -3,11 +3,19 @@ Serialization module for converting parsed Python objects to JSON.
 
 This module handles the conversion of ParsedModule and related objects
 into a JSON-serializable format for the extraction output.
+
+Two output layouts are supported:
+- A single JSON document (Serializer.serialize_modules), which needs every
+  module in memory at once
+- Newline-delimited JSON (ExtractionStreamWriter): a header record, one
+  record per module written as soon as the module is parsed, and a trailer
+  with the summary statistics, plus an optional byte-offset index
 """
 
 import json
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 from dataclasses import asdict, is_dataclass
 
 from models import (
@@ -51,10 +59,8 @@ class Serializer:
         # Create the output structure
         output = {
             "metadata": {
-                "version": "1.0",
-                "generated_at": datetime.utcnow().isoformat(),
-                "module_count": len(modules),
-                "parser": "python_debug_tool_ast_parser"
+                **self.build_metadata(),
+                "module_count": len(modules)
             },
             "modules": {}
         }
@@ -74,6 +80,18 @@ class Serializer:
         
         return output
         
+    def build_metadata(self) -> Dict[str, Any]:
+        """Build the metadata section describing this extraction output."""
+        return {
+            "version": "1.0",
+            "generated_at": datetime.utcnow().isoformat(),
+            "parser": "python_debug_tool_ast_parser"
+        }
+        
+    def serialize_module(self, module: ParsedModule) -> Dict[str, Any]:
+        """Serialize a single ParsedModule object."""
+        return self._serialize_module(module)
+        
     def _serialize_module(self, module: ParsedModule) -> Dict[str, Any]:
         """Serialize a single ParsedModule object."""
         return {
@@ -151,33 +169,130 @@ class Serializer:
         
     def _calculate_summary(self, modules: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate summary statistics for the serialized modules."""
-        total_classes = 0
-        total_functions = 0
-        total_methods = 0
-        total_imports = 0
-        total_variables = 0
-        total_lines = 0
-        
+        summary = self._empty_summary()
         for module_data in modules.values():
-            total_imports += len(module_data.get("imports", []))
-            total_classes += len(module_data.get("classes", []))
-            total_functions += len(module_data.get("functions", []))
-            total_variables += len(module_data.get("variables", []))
-            total_lines += module_data.get("line_count", 0)
-            
-            # Count methods in classes
-            for class_data in module_data.get("classes", []):
-                total_methods += len(class_data.get("methods", []))
-                
+            self._add_to_summary(summary, module_data)
+        return summary
+        
+    def _empty_summary(self) -> Dict[str, Any]:
+        """Summary statistics of an empty module set."""
         return {
-            "total_modules": len(modules),
-            "total_classes": total_classes,
-            "total_functions": total_functions,
-            "total_methods": total_methods,
-            "total_imports": total_imports,
-            "total_variables": total_variables,
-            "total_lines": total_lines
+            "total_modules": 0,
+            "total_classes": 0,
+            "total_functions": 0,
+            "total_methods": 0,
+            "total_imports": 0,
+            "total_variables": 0,
+            "total_lines": 0
+        }
+        
+    def _add_to_summary(self, summary: Dict[str, Any], module_data: Dict[str, Any]) -> None:
+        """Add one serialized module to running summary statistics."""
+        summary["total_modules"] += 1
+        summary["total_imports"] += len(module_data.get("imports", []))
+        summary["total_classes"] += len(module_data.get("classes", []))
+        summary["total_functions"] += len(module_data.get("functions", []))
+        summary["total_variables"] += len(module_data.get("variables", []))
+        summary["total_lines"] += module_data.get("line_count", 0)
+        
+        # Count methods in classes
+        for class_data in module_data.get("classes", []):
+            summary["total_methods"] += len(class_data.get("methods", []))
+
+
+class ExtractionStreamWriter:
+    """
+    Writes extraction output as newline-delimited JSON while parsing runs.
+    
+    Records, one per line:
+        {"type": "header", "metadata": {...}, "delta": {...}}  (delta only for incremental runs)
+        {"type": "module", "path": "...", "module": {...}}     (one per module)
+        {"type": "trailer", "module_count": N, "summary": {...}}
+    
+    With an index, a "<output>.idx" JSON file maps each module path to the
+    [offset, length] of its record, so single modules can be read with a seek.
+    
+    write_module is not thread-safe; ParallelProcessor serializes sink calls.
+    """
+    
+    FORMAT = "ndjson"
+    INDEX_SUFFIX = ".idx"
+    
+    def __init__(self, output_path: str, write_index: bool = False, serializer: Optional[Serializer] = None):
+        """
+        Open the output file.
+        
+        Args:
+            output_path: Path of the NDJSON output file
+            write_index: Also write a byte-offset index next to the output
+            serializer: Serializer used for module records
+        """
+        self.output_path = Path(output_path)
+        self.index_path = Path(f"{output_path}{self.INDEX_SUFFIX}") if write_index else None
+        self.serializer = serializer or Serializer()
+        self.module_count = 0
+        
+        self._summary = self.serializer._empty_summary()
+        self._offsets: Dict[str, List[int]] = {}
+        self._header_written = False
+        self._file = open(self.output_path, "wb")
+        
+    def __enter__(self) -> "ExtractionStreamWriter":
+        return self
+        
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # Leave the stream without a trailer so readers reject it
+            self._file.close()
+        
+    def write_header(self, delta: Optional[Dict[str, Any]] = None) -> None:
+        """Write the header record; must come before any module record."""
+        if self._header_written:
+            raise RuntimeError("Extraction stream header already written")
+        header = {
+            "type": "header",
+            "metadata": {**self.serializer.build_metadata(), "format": self.FORMAT}
         }
+        if delta is not None:
+            header["delta"] = delta
+        self._write_record(header)
+        self._header_written = True
+        
+    def write_module(self, path: str, module: ParsedModule) -> None:
+        """Serialize a parsed module and append it as one record."""
+        if not self._header_written:
+            self.write_header()
+        module_data = self.serializer.serialize_module(module)
+        offset, length = self._write_record({"type": "module", "path": path, "module": module_data})
+        
+        self.serializer._add_to_summary(self._summary, module_data)
+        self.module_count += 1
+        if self.index_path:
+            self._offsets[path] = [offset, length]
+            
+    def close(self) -> Dict[str, Any]:
+        """Write the trailer (and index) and close the file; returns the summary."""
+        if self._file.closed:
+            return self._summary
+        if not self._header_written:
+            self.write_header()
+        self._write_record({"type": "trailer", "module_count": self.module_count, "summary": self._summary})
+        self._file.close()
+        
+        if self.index_path:
+            with open(self.index_path, "w", encoding="utf-8") as f:
+                json.dump({"output": self.output_path.name, "modules": self._offsets}, f)
+                
+        return self._summary
+        
+    def _write_record(self, record: Dict[str, Any]) -> Tuple[int, int]:
+        """Append a record as one line; returns its (offset, length) in bytes."""
+        line = (json.dumps(record, separators=(",", ":"), cls=EnhancedJSONEncoder) + "\n").encode("utf-8")
+        offset = self._file.tell()
+        self._file.write(line)
+        return offset, len(line)
 
 
 class EnhancedJSONEncoder(json.JSONEncoder):
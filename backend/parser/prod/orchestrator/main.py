@@ -8,11 +8,13 @@ and exposes a RESTful API for control and monitoring.
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
 import subprocess
 import sys
+import time
 import uuid
 from datetime import datetime
 from enum import Enum
@@ -20,10 +22,17 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 from concurrent.futures import ThreadPoolExecutor
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException
 from fastapi.responses import FileResponse, JSONResponse
 from pydantic import BaseModel, Field
 
+try:
+    from .phase_workers import PhaseEntryPoint, PhaseRunResult, PhaseWorkerPool
+    from .scheduler import DEFAULT_MAX_QUEUED_JOBS, DEFAULT_MAX_RUNNING_JOBS, JobScheduler, QueueFullError
+except ImportError:  # run as a script from the orchestrator directory
+    from phase_workers import PhaseEntryPoint, PhaseRunResult, PhaseWorkerPool
+    from scheduler import DEFAULT_MAX_QUEUED_JOBS, DEFAULT_MAX_RUNNING_JOBS, JobScheduler, QueueFullError
+
 
 logging.basicConfig(
     level=logging.INFO,
@@ -31,6 +40,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# How phases are executed: a fresh interpreter per phase and job, or warm
+# long-lived worker processes (see phase_workers)
+EXECUTION_MODES = ("subprocess", "warm")
+
 
 class JobStatus(str, Enum):
     """Enumeration of job statuses."""
@@ -48,6 +61,15 @@ class AnalyzeRequest(BaseModel):
     neo4j_uri: Optional[str] = Field(None, description="Neo4j connection URI")
     neo4j_user: Optional[str] = Field(None, description="Neo4j username")
     neo4j_password: Optional[str] = Field(None, description="Neo4j password")
+    incremental: bool = Field(
+        False,
+        description="Only re-extract, re-transform and re-upload modules changed since the last successful run"
+    )
+    namespace: Optional[str] = Field(
+        None,
+        description="Graph namespace to write into (defaults to the namespace of the codebase's "
+                    "previous run, or to the job ID for a codebase's first run)"
+    )
 
 
 class JobStatusResponse(BaseModel):
@@ -76,15 +98,42 @@ class JobResultsResponse(BaseModel):
     backup_result: Optional[str] = None
     upload_result: Optional[str] = None
     neo4j_stats: Optional[str] = None
+    namespace: Optional[str] = None
     metrics: Dict[str, Any] = {}
 
 
+class StatusUpdate(BaseModel):
+    """A single status update reported by a pipeline phase."""
+    job_id: Optional[str] = None
+    phase: str
+    status: str
+    message: str
+    timestamp: Optional[str] = None
+    progress: Optional[float] = None
+    metadata: Dict[str, Any] = {}
+
+
+class StatusBatchRequest(BaseModel):
+    """Request model for bulk status updates."""
+    updates: List[StatusUpdate] = Field(..., description="Status updates in the order they were reported")
+    dropped: int = Field(0, description="Updates dropped by the reporter under backpressure so far")
+
+
 class Job:
     """Represents a pipeline job."""
     
-    def __init__(self, job_id: str, codebase_path: str):
+    def __init__(
+        self,
+        job_id: str,
+        codebase_path: str,
+        incremental: bool = False,
+        namespace: Optional[str] = None
+    ):
         self.job_id = job_id
         self.codebase_path = codebase_path
+        self.incremental = incremental
+        # Graph namespace the job writes into; resolved when the job starts
+        self.namespace = namespace
         self.status = JobStatus.PENDING
         self.phase = "initialization"
         self.progress = 0.0
@@ -115,13 +164,60 @@ class OrchestrationService:
     Central service that manages the multi-phase pipeline.
     
     This service coordinates the execution of extractor, transformer,
-    and loader domains in sequence.
+    and loader domains in sequence. Jobs go through a JobScheduler, so
+    several jobs can run at once, each codebase writing into its own graph
+    namespace.
     """
     
-    def __init__(self):
-        """Initialize the orchestration service."""
+    def __init__(
+        self,
+        execution_mode: Optional[str] = None,
+        workers_per_phase: Optional[int] = None,
+        max_concurrent_jobs: Optional[int] = None,
+        max_queued_jobs: int = DEFAULT_MAX_QUEUED_JOBS,
+        phase_limits: Optional[Dict[str, int]] = None,
+        transform_workers: Optional[int] = None
+    ):
+        """
+        Initialize the orchestration service.
+        
+        Args:
+            execution_mode: "subprocess" (default) or "warm"; falls back to
+                the PIPELINE_EXECUTION_MODE environment variable
+            workers_per_phase: Worker processes per phase in warm mode;
+                by default each phase gets one per scheduler slot, so a run
+                holding a slot never waits for a worker
+            max_concurrent_jobs: Jobs running at once; falls back to the
+                PIPELINE_MAX_CONCURRENT_JOBS environment variable
+            max_queued_jobs: Jobs waiting to run before new ones are refused
+            phase_limits: Concurrent runs per phase (see scheduler.default_phase_limits)
+            transform_workers: Worker processes for tuple generation in the
+                transformer (0: one per CPU); falls back to the
+                PIPELINE_TRANSFORM_WORKERS environment variable, unset
+                generates tuples in the transformer's own process
+        """
         self.jobs: Dict[str, Job] = {}
-        self.executor = ThreadPoolExecutor(max_workers=4)
+        
+        if max_concurrent_jobs is None:
+            max_concurrent_jobs = int(os.getenv("PIPELINE_MAX_CONCURRENT_JOBS", DEFAULT_MAX_RUNNING_JOBS))
+        self.scheduler = JobScheduler(
+            self.run_pipeline,
+            max_running_jobs=max_concurrent_jobs,
+            max_queued_jobs=max_queued_jobs,
+            phase_limits=phase_limits
+        )
+        
+        # Every phase run in progress blocks one thread
+        self.executor = ThreadPoolExecutor(max_workers=max(4, sum(self.scheduler.phase_limits.values())))
+        
+        # Codebases whose graph matches the extractor's cache state, by path.
+        # Incremental runs are only safe on top of a completed run.
+        self.synced_codebases: Dict[str, str] = {}
+        
+        # Namespace holding each codebase's graph, by path. Re-runs write
+        # into it, so a full run clears and snapshots the previous graph
+        # instead of leaving it behind next to a fresh copy.
+        self.codebase_namespaces: Dict[str, str] = {}
         
         # Get base directory
         self.base_dir = Path(__file__).parent.parent
@@ -134,23 +230,82 @@ class OrchestrationService:
         self.neo4j_manager_dir = self.backend_dir / "neo4j_manager"
         self.uploader_dir = self.backend_dir / "uploader"
         
-    def create_job(self, codebase_path: str) -> str:
+        if transform_workers is None and os.getenv("PIPELINE_TRANSFORM_WORKERS"):
+            transform_workers = int(os.getenv("PIPELINE_TRANSFORM_WORKERS"))
+        self.transform_workers = transform_workers
+        
+        self.execution_mode = execution_mode or os.getenv("PIPELINE_EXECUTION_MODE", "subprocess")
+        if self.execution_mode not in EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode: {self.execution_mode}")
+        
+        self.phase_workers: Optional[PhaseWorkerPool] = None
+        if self.execution_mode == "warm":
+            entry_points = self._phase_entry_points()
+            if workers_per_phase is None:
+                # Phases without a scheduler limit run at most one per running job
+                workers_per_phase = {
+                    phase: self.scheduler.phase_limits.get(phase, self.scheduler.max_running_jobs)
+                    for phase in entry_points
+                }
+            self.phase_workers = PhaseWorkerPool(entry_points, workers_per_phase)
+        
+    def _phase_entry_points(self) -> Dict[str, PhaseEntryPoint]:
+        """Entry points hosted by warm workers, by phase."""
+        backend_dir = str(self.backend_dir)
+        return {
+            "extraction": PhaseEntryPoint(
+                name="extraction",
+                sys_path=[str(self.extractor_dir)],
+                script=str(self.extractor_dir / "main.py")
+            ),
+            "transformation": PhaseEntryPoint(
+                name="transformation",
+                script=str(self.transformer_dir / "main.py")
+            ),
+            "backup": PhaseEntryPoint(name="backup", sys_path=[backend_dir], module="neo4j_manager.main"),
+            "upload": PhaseEntryPoint(name="upload", sys_path=[backend_dir], module="uploader.main")
+        }
+        
+    def shutdown(self) -> None:
+        """Stop warm workers and the thread pool."""
+        if self.phase_workers:
+            self.phase_workers.close()
+        self.executor.shutdown(wait=False)
+        
+    def create_job(self, codebase_path: str, incremental: bool = False, namespace: Optional[str] = None) -> str:
         """
         Create a new analysis job.
         
         Args:
             codebase_path: Path to the codebase to analyze
+            incremental: Request a diff-driven run
+            namespace: Graph namespace to write into, if not the default
             
         Returns:
             Job ID
         """
         job_id = str(uuid.uuid4())
-        job = Job(job_id, codebase_path)
+        job = Job(job_id, codebase_path, incremental, namespace)
         self.jobs[job_id] = job
         
         logger.info(f"Created job {job_id} for codebase: {codebase_path}")
         return job_id
         
+    def submit_job(self, job_id: str) -> None:
+        """
+        Queue a job's pipeline run on the scheduler.
+        
+        Jobs of the same codebase run one after another; jobs of different
+        codebases run concurrently up to the scheduler's limits.
+        
+        Raises:
+            QueueFullError: If the run queue is full
+        """
+        job = self.jobs[job_id]
+        self.scheduler.submit(job_id, job.codebase_path)
+        job.message = "Queued"
+        job.updated_at = datetime.utcnow()
+        
     def get_job(self, job_id: str) -> Optional[Job]:
         """Get a job by ID."""
         return self.jobs.get(job_id)
@@ -188,6 +343,44 @@ class OrchestrationService:
             
         logger.info(f"Job {job_id} status updated: {phase} - {status} - {message}")
         
+    def record_status_updates(
+        self,
+        job_id: str,
+        updates: List[StatusUpdate],
+        dropped: int = 0
+    ) -> int:
+        """
+        Apply a batch of status updates reported by a running phase.
+        
+        The pipeline itself owns the job status and phase; reported updates
+        only refresh the message, progress and last reported event.
+        
+        Returns:
+            Number of updates applied
+        """
+        job = self.get_job(job_id)
+        if not job or not updates:
+            return 0
+            
+        for update in updates:
+            job.message = update.message
+            if update.progress is not None:
+                job.progress = update.progress
+                
+        latest = updates[-1]
+        job.updated_at = datetime.utcnow()
+        job.metadata["last_reported_status"] = {
+            "phase": latest.phase,
+            "status": latest.status,
+            "message": latest.message,
+            "timestamp": latest.timestamp
+        }
+        job.metrics["status_updates_received"] = job.metrics.get("status_updates_received", 0) + len(updates)
+        job.metrics["status_updates_dropped"] = dropped
+        
+        logger.debug(f"Job {job_id} received {len(updates)} status updates ({dropped} dropped by reporter)")
+        return len(updates)
+        
     async def run_pipeline(self, job_id: str) -> None:
         """
         Run the complete pipeline for a job.
@@ -196,12 +389,34 @@ class OrchestrationService:
         1. Extraction
         2. Transformation
         3. Loading
+        
+        Incremental jobs only extract modules added, changed or deleted
+        since the last successful run for the same codebase, delete their
+        stale subgraphs and merge the delta into the live graph. Without a
+        previous successful run in this service the job falls back to a
+        full reload.
         """
         job = self.get_job(job_id)
         if not job:
             logger.error(f"Job not found: {job_id}")
             return
+        job.metrics["queue_seconds"] = round((datetime.utcnow() - job.started_at).total_seconds(), 3)
             
+        # Incremental runs update the namespace of the run they build on
+        synced_job = self.get_job(self.synced_codebases.get(job.codebase_path, ""))
+        if job.incremental and synced_job is None:
+            logger.info(f"No synced graph for {job.codebase_path}, running full pipeline")
+            job.incremental = False
+        elif job.incremental and job.namespace and job.namespace != synced_job.namespace:
+            logger.info(f"Namespace {job.namespace} is not synced with {job.codebase_path}, running full pipeline")
+            job.incremental = False
+        if job.namespace is None:
+            job.namespace = self.codebase_namespaces.get(job.codebase_path, job.job_id)
+        # Recorded before any phase runs: a failed upload may already have written here
+        self.codebase_namespaces[job.codebase_path] = job.namespace
+        job.metadata["mode"] = "incremental" if job.incremental else "full"
+        job.metadata["namespace"] = job.namespace
+        
         try:
             # Phase 1: Extraction
             self.update_job_status(
@@ -214,16 +429,30 @@ class OrchestrationService:
             extraction_output = await self._run_extractor(job)
             job.extraction_output = extraction_output
             
+            if job.incremental:
+                delta = self._read_extraction_delta(extraction_output)
+                job.metrics["delta"] = {key: len(delta.get(key, [])) for key in ("added", "changed", "deleted")}
+                
+                if not any(job.metrics["delta"].values()):
+                    self.synced_codebases[job.codebase_path] = job_id
+                    self.update_job_status(
+                        job_id,
+                        JobStatus.COMPLETED,
+                        "completed",
+                        "No changes detected since the last run",
+                        progress=100.0
+                    )
+                    return
+            
             # Phase 2: Transformation
             self.update_job_status(
                 job_id,
                 JobStatus.TRANSFORMING,
                 "transformation",
-                "Transforming to Cypher commands"
+                "Transforming to Neo4j tuples"
             )
             
-            cypher_commands = await self._run_transformer(job)
-            job.cypher_commands = cypher_commands
+            job.tuples_output = await self._run_transformer(job)
             
             # Phase 3a: Backup current database
             self.update_job_status(
@@ -249,6 +478,7 @@ class OrchestrationService:
             job.loader_output = upload_result  # For backward compatibility
             
             # Mark as completed
+            self.synced_codebases[job.codebase_path] = job_id
             self.update_job_status(
                 job_id,
                 JobStatus.COMPLETED,
@@ -258,6 +488,8 @@ class OrchestrationService:
             )
             
         except Exception as e:
+            # The graph may no longer match the extractor's cache state
+            self.synced_codebases.pop(job.codebase_path, None)
             logger.error(f"Pipeline failed for job {job_id}: {e}")
             self.update_job_status(
                 job_id,
@@ -267,67 +499,122 @@ class OrchestrationService:
                 error=str(e)
             )
             
+    async def _run_phase(self, job: Job, phase: str, script: Path, args: List[str]) -> PhaseRunResult:
+        """
+        Run a phase entry point with args and record its timing.
+        
+        The run first waits for one of the phase's scheduler slots. In warm
+        mode it then goes to the phase's worker process and its output and
+        log lines update the job as they arrive; otherwise the script runs
+        in a fresh interpreter.
+        """
+        async with self.scheduler.phase_slot(phase) as slot_wait:
+            return await self._run_phase_now(job, phase, script, args, slot_wait)
+        
+    async def _run_phase_now(
+        self,
+        job: Job,
+        phase: str,
+        script: Path,
+        args: List[str],
+        slot_wait: float
+    ) -> PhaseRunResult:
+        """Run a phase entry point while holding its scheduler slot."""
+        loop = asyncio.get_event_loop()
+        start = time.perf_counter()
+        
+        if self.phase_workers is not None:
+            logger.info(f"Running {phase} on warm worker: {' '.join(args)}")
+            on_message = functools.partial(
+                loop.call_soon_threadsafe, self._record_worker_message, job.job_id, phase
+            )
+            result = await loop.run_in_executor(
+                self.executor,
+                self.phase_workers.run,
+                phase,
+                args,
+                on_message
+            )
+        else:
+            cmd = [sys.executable, str(script), *args]
+            logger.info(f"Running {phase}: {' '.join(cmd)}")
+            completed = await loop.run_in_executor(
+                self.executor,
+                functools.partial(subprocess.run, cmd, capture_output=True)
+            )
+            result = PhaseRunResult(
+                phase=phase,
+                returncode=completed.returncode,
+                seconds=time.perf_counter() - start,
+                output=completed.stderr.decode(errors="replace"),
+                cold_start=True
+            )
+        
+        job.metrics.setdefault("phase_timings", {})[phase] = {
+            "seconds": round(time.perf_counter() - start, 3),
+            "run_seconds": round(result.seconds, 3),
+            "slot_wait_seconds": round(slot_wait, 3),
+            "worker_wait_seconds": round(result.worker_wait, 3),
+            "mode": self.execution_mode,
+            "cold_start": result.cold_start,
+            "returncode": result.returncode
+        }
+        return result
+        
+    def _record_worker_message(self, job_id: str, phase: str, message: Dict[str, Any]) -> None:
+        """Apply an output or log line streamed by a warm worker to its job."""
+        job = self.get_job(job_id)
+        if not job or not message.get("message"):
+            return
+        job.message = message["message"]
+        job.updated_at = datetime.utcnow()
+        job.metadata["last_worker_message"] = {"phase": phase, **message}
+        job.metrics["worker_messages_received"] = job.metrics.get("worker_messages_received", 0) + 1
+        
     async def _run_extractor(self, job: Job) -> str:
         """Run the extractor phase."""
-        output_file = f"extraction_output_{job.job_id}.json"
+        output_file = f"extraction_output_{job.job_id}.ndjson"
         
-        cmd = [
-            sys.executable,
-            str(self.extractor_dir / "main.py"),
+        args = [
             "--path", job.codebase_path,
             "--job-id", job.job_id,
             "--output", output_file
         ]
+        if job.incremental:
+            args.append("--incremental")
         
-        logger.info(f"Running extractor: {' '.join(cmd)}")
+        result = await self._run_phase(job, "extraction", self.extractor_dir / "main.py", args)
         
-        # Run in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            self.executor,
-            subprocess.run,
-            cmd,
-            subprocess.PIPE,
-            subprocess.PIPE,
-            True  # capture_output
-        )
-        
-        if result.returncode != 0:
-            raise RuntimeError(f"Extractor failed: {result.stderr.decode()}")
+        if not result.success:
+            raise RuntimeError(f"Extractor failed: {result.output}")
             
         return output_file
         
+    def _read_extraction_delta(self, extraction_output: str) -> Dict[str, Any]:
+        """Read the module delta written by an incremental extraction."""
+        with open(extraction_output, 'r', encoding='utf-8') as f:
+            if extraction_output.endswith(".ndjson"):
+                # Streamed output carries the delta in its header record
+                return json.loads(f.readline()).get("delta", {})
+            return json.load(f).get("delta", {})
+        
     async def _run_transformer(self, job: Job) -> str:
-        """Run the transformer phase."""
-        output_file = f"cypher_commands_{job.job_id}.cypher"
+        """Run the transformer phase; returns the tuple stream for the uploader."""
+        output_file = f"tuples_{job.job_id}.tuplestream"
         
-        cmd = [
-            sys.executable,
-            str(self.transformer_dir / "main.py"),
+        args = [
             "--input", job.extraction_output,
             "--job-id", job.job_id,
             "--output", output_file
         ]
+        if self.transform_workers is not None:
+            args += ["--workers", str(self.transform_workers)]
         
-        logger.info(f"Running transformer: {' '.join(cmd)}")
-        
-        # Run in thread pool
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            self.executor,
-            subprocess.run,
-            cmd,
-            subprocess.PIPE,
-            subprocess.PIPE,
-            True  # capture_output
-        )
+        result = await self._run_phase(job, "transformation", self.transformer_dir / "main.py", args)
         
-        if result.returncode != 0:
-            raise RuntimeError(f"Transformer failed: {result.stderr.decode()}")
+        if not result.success:
+            raise RuntimeError(f"Transformer failed: {result.output}")
         
-        # Store additional Phase 2 output files
-        job.tuples_output = f"tuples_{job.job_id}.json"
-            
         return output_file
     
     async def _run_neo4j_backup(self, job: Job) -> str:
@@ -335,28 +622,18 @@ class OrchestrationService:
         
         backup_result_file = f"backup_result_{job.job_id}.json"
         
-        cmd = [
-            sys.executable,
-            str(self.neo4j_manager_dir / "main.py"),
+        # Online snapshot of the namespace the upload will write into
+        args = [
             "--action", "backup",
-            "--job-id", job.job_id
+            "--job-id", job.job_id,
+            "--mode", "snapshot",
+            "--namespace", job.namespace
         ]
         
-        logger.info(f"Running Neo4j backup: {' '.join(cmd)}")
-        
-        # Run in thread pool
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            self.executor,
-            subprocess.run,
-            cmd,
-            subprocess.PIPE,
-            subprocess.PIPE,
-            True  # capture_output
-        )
+        result = await self._run_phase(job, "backup", self.neo4j_manager_dir / "main.py", args)
         
-        if result.returncode != 0:
-            logger.warning(f"Backup failed: {result.stderr.decode()}")
+        if not result.success:
+            logger.warning(f"Backup failed: {result.output}")
             # Continue with upload even if backup fails
             # In production, you might want to make this configurable
         
@@ -365,43 +642,37 @@ class OrchestrationService:
     async def _run_uploader(self, job: Job) -> str:
         """Run the uploader phase with integrated backup management."""
         
-        # Ensure we have cypher commands from Phase 2
-        if not job.cypher_commands or not Path(job.cypher_commands).exists():
+        # Prefer the tuple stream (bulk UNWIND upload) over literal Cypher commands
+        if job.tuples_output and Path(job.tuples_output).exists():
+            upload_input = job.tuples_output
+        elif job.cypher_commands and Path(job.cypher_commands).exists():
+            upload_input = job.cypher_commands
+        else:
             raise RuntimeError("Phase 2 output not found - cannot proceed with upload")
         
         upload_result_file = f"upload_result_{job.job_id}.json"
         
-        cmd = [
-            sys.executable,
-            str(self.uploader_dir / "main.py"),
-            "--input", job.cypher_commands,
+        args = [
+            "--input", upload_input,
             "--job-id", job.job_id,
             "--output", upload_result_file,
-            "--clear-database", "true"  # Always clear before upload
+            # Other codebases' graphs live in other namespaces and are never cleared
+            "--namespace", job.namespace,
+            # Incremental uploads delete stale module subgraphs themselves
+            "--clear-database", "false" if job.incremental else "true"
         ]
         
-        logger.info(f"Running uploader: {' '.join(cmd)}")
+        result = await self._run_phase(job, "upload", self.uploader_dir / "main.py", args)
         
-        # Run in thread pool
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            self.executor,
-            subprocess.run,
-            cmd,
-            subprocess.PIPE,
-            subprocess.PIPE,
-            True  # capture_output
-        )
-        
-        if result.returncode != 0:
+        if not result.success:
             # If upload fails, offer to restore backup
-            logger.error(f"Upload failed: {result.stderr.decode()}")
+            logger.error(f"Upload failed: {result.output}")
             
             if job.backup_result:
                 logger.info("Upload failed - backup available for restoration")
                 # Could trigger automatic restore here or leave for manual operation
             
-            raise RuntimeError(f"Uploader failed: {result.stderr.decode()}")
+            raise RuntimeError(f"Uploader failed: {result.output}")
         
         return upload_result_file
 
@@ -417,15 +688,25 @@ app = FastAPI(
 orchestrator = OrchestrationService()
 
 
+@app.on_event("startup")
+async def start_phase_workers() -> None:
+    """Start warm phase workers so the first job does not pay their startup."""
+    if orchestrator.phase_workers:
+        orchestrator.phase_workers.start()
+
+
+@app.on_event("shutdown")
+async def stop_phase_workers() -> None:
+    """Stop warm phase workers."""
+    orchestrator.shutdown()
+
+
 @app.post("/v1/analyze", response_model=Dict[str, str])
-async def start_analysis(
-    request: AnalyzeRequest,
-    background_tasks: BackgroundTasks
-) -> Dict[str, str]:
+async def start_analysis(request: AnalyzeRequest) -> Dict[str, str]:
     """
     Start a new code analysis job.
     
-    This endpoint initiates the three-phase pipeline:
+    This endpoint queues the three-phase pipeline on the job scheduler:
     1. Extraction - Parse code and extract structure
     2. Transformation - Convert to Neo4j Cypher commands
     3. Loading - Load data into Neo4j database
@@ -444,14 +725,22 @@ async def start_analysis(
         )
         
     # Create job
-    job_id = orchestrator.create_job(str(codebase_path))
+    job_id = orchestrator.create_job(
+        str(codebase_path),
+        incremental=request.incremental,
+        namespace=request.namespace
+    )
     
-    # Start pipeline in background
-    background_tasks.add_task(orchestrator.run_pipeline, job_id)
+    # Queue pipeline; it starts as soon as the scheduler has a free slot
+    try:
+        orchestrator.submit_job(job_id)
+    except QueueFullError as e:
+        orchestrator.jobs.pop(job_id, None)
+        raise HTTPException(status_code=429, detail=str(e))
     
     return {
         "job_id": job_id,
-        "status": "Analysis started",
+        "status": "Analysis queued",
         "message": f"Processing codebase at: {codebase_path}"
     }
 
@@ -471,6 +760,11 @@ async def get_job_status(job_id: str) -> JobStatusResponse:
             detail=f"Job not found: {job_id}"
         )
         
+    metadata = dict(job.metadata)
+    queue_position = orchestrator.scheduler.queue_position(job_id)
+    if queue_position is not None:
+        metadata["queue_position"] = queue_position
+        
     return JobStatusResponse(
         job_id=job.job_id,
         status=job.status,
@@ -481,10 +775,32 @@ async def get_job_status(job_id: str) -> JobStatusResponse:
         updated_at=job.updated_at.isoformat(),
         completed_at=job.completed_at.isoformat() if job.completed_at else None,
         error=job.error,
-        metadata=job.metadata
+        metadata=metadata
     )
 
 
+@app.post("/v1/jobs/{job_id}/status/batch")
+async def report_job_status_batch(job_id: str, request: StatusBatchRequest) -> Dict[str, Any]:
+    """
+    Receive a batch of status updates from a pipeline phase.
+    
+    Phases queue their updates and post them here in bulk instead of making
+    one request per event.
+    """
+    job = orchestrator.get_job(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Job not found: {job_id}"
+        )
+        
+    accepted = orchestrator.record_status_updates(job_id, request.updates, request.dropped)
+    return {
+        "job_id": job_id,
+        "accepted": accepted
+    }
+
+
 @app.get("/v1/jobs/{job_id}/results", response_model=JobResultsResponse)
 async def get_job_results(job_id: str) -> JobResultsResponse:
     """
@@ -517,6 +833,7 @@ async def get_job_results(job_id: str) -> JobResultsResponse:
         backup_result=job.backup_result,
         upload_result=job.upload_result,
         neo4j_stats=job.neo4j_stats,
+        namespace=job.namespace,
         metrics=job.metrics
     )
 
@@ -527,9 +844,9 @@ async def download_job_file(job_id: str, file_type: str) -> FileResponse:
     Download a specific output file from a job.
     
     File types:
-    - extraction: The extraction_output.json file
-    - cypher: The cypher_commands.cypher file
-    - tuples: The tuples.json file (Phase 2 JSON output)
+    - extraction: The extraction output file (NDJSON)
+    - cypher: The cypher_commands.cypher file (optional export)
+    - tuples: The tuple stream file (Phase 2 output handed to the uploader)
     - loader: The loader output file
     - backup-result: The backup result file (Phase 3)
     - upload-result: The upload result file (Phase 3)
@@ -570,6 +887,12 @@ async def download_job_file(job_id: str, file_type: str) -> FileResponse:
     )
 
 
+@app.get("/v1/scheduler")
+async def get_scheduler_status() -> Dict[str, Any]:
+    """Running and queued jobs and the usage of each phase's concurrency slots."""
+    return orchestrator.scheduler.stats()
+
+
 @app.get("/health")
 async def health_check() -> Dict[str, str]:
     """Health check endpoint."""
@@ -0,0 +1,432 @@
+"""
+Warm worker processes for pipeline phases.
+
+Instead of starting a fresh interpreter per job and phase, each phase entry
+point (extractor, transformer, backup, uploader) can be hosted by a
+long-lived worker process. The entry point's module is imported once, so
+heavy imports, the extractor's parse cache and the uploader's Neo4j driver
+stay warm across jobs. Each run calls the entry point's main() with the
+job's command-line arguments; its output lines and log records are streamed
+back over a pipe as they happen instead of being buffered until exit.
+
+Protocol over the pipe (all messages are dictionaries):
+- parent -> worker: {"argv": [...]} to run the entry point, None to exit
+- worker -> parent: {"type": "output" | "log", ...} while running, then
+  {"type": "result", "returncode", "seconds", "output"}
+"""
+
+import asyncio
+import contextlib
+import importlib
+import importlib.util
+import inspect
+import io
+import logging
+import multiprocessing
+import multiprocessing.util
+import queue
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Workers must not inherit the orchestrator's event loop and threads
+DEFAULT_START_METHOD = "spawn"
+
+# Output lines kept for the error message of a failed run
+OUTPUT_TAIL_LINES = 50
+
+# Receives every output and log message of a run as it arrives
+MessageCallback = Callable[[Dict[str, Any]], None]
+
+# Running workers. Workers are not daemonic, because hosted phases start
+# process pools of their own (the extractor's hybrid strategy, the
+# transformer's worker pool). Non-daemonic processes are not terminated at
+# interpreter exit, so the ones still running are closed then; otherwise
+# multiprocessing's exit hook would wait for them forever.
+_live_workers: "weakref.WeakSet[PhaseWorker]" = weakref.WeakSet()
+
+
+def _close_live_workers() -> None:
+    """Stop workers that are still running when the interpreter exits."""
+    for worker in list(_live_workers):
+        worker.close(timeout=5.0)
+
+
+# Finalizers with an exit priority run before the exit hook joins child processes
+multiprocessing.util.Finalize(None, _close_live_workers, exitpriority=10)
+
+
+@dataclass(frozen=True)
+class PhaseEntryPoint:
+    """How a worker process loads a phase's command-line entry point."""
+
+    name: str
+    sys_path: List[str] = field(default_factory=list)
+    module: Optional[str] = None  # Importable module, e.g. "uploader.main"
+    script: Optional[str] = None  # Or the path of a script, loaded as a module
+    function: str = "main"
+
+    def load(self) -> Callable[[], Any]:
+        """Import the entry point; called once per worker process."""
+        for path in reversed(self.sys_path):
+            if path not in sys.path:
+                sys.path.insert(0, path)
+
+        if self.module:
+            module = importlib.import_module(self.module)
+        else:
+            spec = importlib.util.spec_from_file_location(f"phase_{self.name}", self.script)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[spec.name] = module
+            spec.loader.exec_module(module)
+        return getattr(module, self.function)
+
+
+@dataclass
+class PhaseRunResult:
+    """Outcome of running a phase entry point."""
+
+    phase: str
+    returncode: int
+    seconds: float
+    output: str = ""
+    cold_start: bool = False
+    worker_wait: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        """True if the entry point exited with status 0."""
+        return self.returncode == 0
+
+
+class _PipeSender:
+    """Sends messages over the worker's end of the pipe from any thread."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._lock = threading.Lock()
+
+    def send(self, message: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.send(message)
+
+
+class _PipeStream(io.TextIOBase):
+    """Text stream sending each written line over the pipe."""
+
+    def __init__(self, sender: _PipeSender, stream: str, tail: Deque[str]):
+        self._sender = sender
+        self._stream = stream
+        self._tail = tail
+        self._pending = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._pending += text
+        *lines, self._pending = self._pending.split("\n")
+        for line in lines:
+            self._send(line)
+        return len(text)
+
+    def flush(self) -> None:
+        if self._pending:
+            self._send(self._pending)
+            self._pending = ""
+
+    def _send(self, line: str) -> None:
+        self._tail.append(line)
+        self._sender.send({"type": "output", "stream": self._stream, "message": line})
+
+
+class _PipeLogHandler(logging.Handler):
+    """Logging handler sending records over the pipe as structured messages."""
+
+    def __init__(self, sender: _PipeSender):
+        super().__init__(level=logging.INFO)
+        self._sender = sender
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._sender.send({
+                "type": "log",
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+                "timestamp": record.created
+            })
+        except Exception:
+            self.handleError(record)
+
+
+def _exit_code(exit_request: SystemExit, tail: Deque[str]) -> int:
+    """Map a SystemExit to a process exit status, like the interpreter does."""
+    code = exit_request.code
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    tail.append(str(code))
+    return 1
+
+
+def _run_entry_point(
+    entry_point: Callable,
+    argv: List[str],
+    name: str,
+    sender: _PipeSender,
+    loop: asyncio.AbstractEventLoop
+) -> Dict[str, Any]:
+    """Run the entry point once with argv; returns the result message."""
+    tail: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    stdout = _PipeStream(sender, "stdout", tail)
+    stderr = _PipeStream(sender, "stderr", tail)
+    start = time.perf_counter()
+
+    sys.argv = [name, *argv]
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                result = entry_point()
+                if inspect.isawaitable(result):
+                    loop.run_until_complete(result)
+                returncode = 0
+            except SystemExit as e:
+                returncode = _exit_code(e, tail)
+            except Exception:
+                print(traceback.format_exc(), file=sys.stderr)
+                returncode = 1
+    finally:
+        stdout.flush()
+        stderr.flush()
+
+    return {
+        "type": "result",
+        "returncode": returncode,
+        "seconds": time.perf_counter() - start,
+        "output": "\n".join(tail)
+    }
+
+
+def _worker_main(entry: PhaseEntryPoint, conn) -> None:
+    """Worker process loop: load the entry point once, then serve runs."""
+    entry_point = entry.load()
+    sender = _PipeSender(conn)
+
+    # One loop for the worker's lifetime, so async driver pools stay usable
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    root_logger = logging.getLogger()
+    root_logger.addHandler(_PipeLogHandler(sender))
+    if root_logger.level > logging.INFO:
+        root_logger.setLevel(logging.INFO)
+
+    try:
+        while True:
+            try:
+                request = conn.recv()
+            except EOFError:
+                break
+            if request is None:
+                break
+            sender.send(_run_entry_point(entry_point, request["argv"], entry.name, sender, loop))
+    finally:
+        loop.close()
+        conn.close()
+
+
+class PhaseWorker:
+    """A long-lived process hosting one phase entry point."""
+
+    def __init__(self, entry: PhaseEntryPoint, start_method: str = DEFAULT_START_METHOD):
+        self.entry = entry
+        self.runs = 0
+        self._context = multiprocessing.get_context(start_method)
+        self._process = None
+        self._conn = None
+
+    @property
+    def alive(self) -> bool:
+        """True if the worker process is running."""
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> None:
+        """Start the worker process if it is not running."""
+        if self.alive:
+            return
+        self._discard()
+        parent_conn, child_conn = self._context.Pipe()
+        self._process = self._context.Process(
+            target=_worker_main,
+            args=(self.entry, child_conn),
+            name=f"phase-worker-{self.entry.name}",
+            # Daemonic processes may not have children of their own
+            daemon=False
+        )
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+        _live_workers.add(self)
+        self.runs = 0
+        logger.info(f"Started {self.entry.name} worker (pid {self._process.pid})")
+
+    def run(self, argv: List[str], on_message: Optional[MessageCallback] = None) -> PhaseRunResult:
+        """
+        Run the entry point with argv and wait for it to finish.
+
+        A worker that died is restarted first; a worker that dies during
+        the run is discarded and reported as a failed run.
+
+        Args:
+            argv: Command-line arguments for the entry point
+            on_message: Called with each output and log message as it arrives
+
+        Returns:
+            PhaseRunResult of the run
+        """
+        cold_start = not self.alive
+        self.start()
+        start = time.perf_counter()
+        tail: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+
+        try:
+            self._conn.send({"argv": list(argv)})
+            while True:
+                message = self._conn.recv()
+                if message["type"] == "result":
+                    break
+                if message["type"] == "output":
+                    tail.append(message["message"])
+                if on_message is not None:
+                    on_message(message)
+        except (EOFError, OSError) as e:
+            exitcode = self._process.exitcode if self._process else None
+            self._discard()
+            tail.append(f"{self.entry.name} worker exited unexpectedly ({exitcode}): {e}")
+            return PhaseRunResult(
+                phase=self.entry.name,
+                returncode=-1,
+                seconds=time.perf_counter() - start,
+                output="\n".join(tail),
+                cold_start=cold_start
+            )
+
+        self.runs += 1
+        return PhaseRunResult(
+            phase=self.entry.name,
+            returncode=message["returncode"],
+            seconds=message["seconds"],
+            output=message["output"],
+            cold_start=cold_start
+        )
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Ask the worker to exit, terminating it if it does not."""
+        if self.alive:
+            try:
+                self._conn.send(None)
+            except (OSError, ValueError):
+                pass
+            self._process.join(timeout)
+        self._discard()
+
+    def _discard(self) -> None:
+        """Drop the process and pipe, terminating the process if needed."""
+        if self._process is not None and self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        if self._conn is not None:
+            self._conn.close()
+        self._process = None
+        self._conn = None
+        _live_workers.discard(self)
+
+
+class PhaseWorkerPool:
+    """
+    Warm workers for each pipeline phase.
+
+    Workers are started on first use (or by start()) and serve one run at a
+    time; concurrent runs of the same phase wait for a free worker, and the
+    wait is reported as the run's worker_wait.
+    """
+
+    def __init__(
+        self,
+        entry_points: Dict[str, PhaseEntryPoint],
+        workers_per_phase: Union[int, Dict[str, int]] = 1,
+        start_method: str = DEFAULT_START_METHOD
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            entry_points: Entry point of each phase, by phase name
+            workers_per_phase: Worker processes per phase, either one count
+                for every phase or a count by phase name (1 if not listed)
+            start_method: Multiprocessing start method for the workers
+        """
+        self.entry_points = entry_points
+        self._workers: Dict[str, List[PhaseWorker]] = {}
+        self._idle: Dict[str, "queue.Queue[PhaseWorker]"] = {}
+
+        for phase, entry in entry_points.items():
+            if isinstance(workers_per_phase, dict):
+                count = workers_per_phase.get(phase, 1)
+            else:
+                count = workers_per_phase
+            workers = [PhaseWorker(entry, start_method) for _ in range(max(1, count))]
+            self._workers[phase] = workers
+            self._idle[phase] = queue.Queue()
+            for worker in workers:
+                self._idle[phase].put(worker)
+
+    def start(self, phases: Optional[List[str]] = None) -> None:
+        """Start the workers of the given phases (all by default) ahead of use."""
+        for phase in phases or list(self._workers):
+            for worker in self._workers[phase]:
+                worker.start()
+
+    def run(self, phase: str, argv: List[str], on_message: Optional[MessageCallback] = None) -> PhaseRunResult:
+        """
+        Run a phase on a free worker; blocks until the run completes.
+
+        Args:
+            phase: Phase name
+            argv: Command-line arguments for the entry point
+            on_message: Called with each output and log message as it arrives
+
+        Returns:
+            PhaseRunResult of the run
+        """
+        if phase not in self._idle:
+            raise ValueError(f"No entry point registered for phase: {phase}")
+
+        wait_start = time.perf_counter()
+        worker = self._idle[phase].get()
+        worker_wait = time.perf_counter() - wait_start
+        try:
+            result = worker.run(argv, on_message)
+            result.worker_wait = worker_wait
+            return result
+        finally:
+            self._idle[phase].put(worker)
+
+    def worker_count(self, phase: str) -> int:
+        """Number of worker processes hosting a phase."""
+        return len(self._workers.get(phase, []))
+
+    def close(self) -> None:
+        """Stop every worker."""
+        for workers in self._workers.values():
+            for worker in workers:
+                worker.close()
@@ -0,0 +1,220 @@
+"""
+Job scheduling for the orchestrator.
+
+Jobs are submitted to a bounded run queue and started as slots free up:
+- At most max_running_jobs pipelines run at once
+- Jobs are queued in lanes (one per codebase); a lane runs one job at a
+  time, since jobs of the same codebase share the extractor's cache state
+  and, for incremental runs, the graph namespace they update
+- Lanes are served round-robin: the lane served least recently goes
+  first, so a codebase with many queued jobs does not starve the others
+- Each phase has its own concurrency limit (CPU-bound extraction and
+  transformation versus I/O-bound upload), taken with phase_slot()
+"""
+
+import asyncio
+import contextlib
+import itertools
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_RUNNING_JOBS = 4
+DEFAULT_MAX_QUEUED_JOBS = 100
+
+
+def default_phase_limits() -> Dict[str, int]:
+    """Concurrent runs allowed per phase, sized for the machine."""
+    cpu_bound = max(1, (os.cpu_count() or 2) // 2)
+    return {
+        "extraction": cpu_bound,
+        "transformation": cpu_bound,
+        "backup": 1,
+        "upload": 4
+    }
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted to a full run queue."""
+
+
+@dataclass
+class _Lane:
+    """Queued jobs of one codebase."""
+
+    pending: Deque[str] = field(default_factory=deque)
+    running: Optional[str] = None
+    last_served: int = -1  # Dispatch sequence number, -1 if never served
+
+
+class JobScheduler:
+    """Bounded, fair run queue with per-phase concurrency limits."""
+
+    def __init__(
+        self,
+        runner: Callable[[str], Awaitable[None]],
+        max_running_jobs: int = DEFAULT_MAX_RUNNING_JOBS,
+        max_queued_jobs: int = DEFAULT_MAX_QUEUED_JOBS,
+        phase_limits: Optional[Dict[str, int]] = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            runner: Coroutine function running a job to completion
+            max_running_jobs: Jobs running at once
+            max_queued_jobs: Jobs waiting to run before submit() is refused
+            phase_limits: Concurrent runs per phase; phases not listed are unlimited
+        """
+        self.runner = runner
+        self.max_running_jobs = max(1, max_running_jobs)
+        self.max_queued_jobs = max_queued_jobs
+        self.phase_limits = phase_limits if phase_limits is not None else default_phase_limits()
+
+        self._lanes: Dict[str, _Lane] = {}
+        # Last dispatch of every lane key, kept after idle lanes are dropped so
+        # a codebase resubmitting one job at a time keeps its place in the rotation
+        self._last_served: Dict[str, int] = {}
+        self._queued = 0
+        self._tasks: Set[asyncio.Task] = set()
+        self._sequence = itertools.count()
+        self._submitted: Dict[str, Tuple[int, float]] = {}  # Submission sequence and time
+
+        self._phase_semaphores: Dict[str, asyncio.Semaphore] = {
+            phase: asyncio.Semaphore(max(1, limit)) for phase, limit in self.phase_limits.items()
+        }
+        self._phase_active: Dict[str, int] = {phase: 0 for phase in self.phase_limits}
+        self._phase_waiting: Dict[str, int] = {phase: 0 for phase in self.phase_limits}
+
+    @property
+    def running_jobs(self) -> int:
+        """Number of jobs currently running."""
+        return sum(1 for lane in self._lanes.values() if lane.running)
+
+    @property
+    def queued_jobs(self) -> int:
+        """Number of jobs waiting to run."""
+        return self._queued
+
+    def submit(self, job_id: str, lane: str) -> None:
+        """
+        Queue a job and start it as soon as a slot is free.
+
+        Must be called from the event loop the jobs run on.
+
+        Args:
+            job_id: Job to run
+            lane: Key of the jobs that must not run concurrently (the codebase path)
+
+        Raises:
+            QueueFullError: If max_queued_jobs jobs are already waiting
+        """
+        if self._queued >= self.max_queued_jobs:
+            raise QueueFullError(f"Run queue is full ({self._queued} jobs waiting)")
+
+        if lane not in self._lanes:
+            self._lanes[lane] = _Lane(last_served=self._last_served.get(lane, -1))
+        self._lanes[lane].pending.append(job_id)
+        self._queued += 1
+        self._submitted[job_id] = (next(self._sequence), time.monotonic())
+        self._dispatch()
+
+    def queue_position(self, job_id: str) -> Optional[int]:
+        """1-based position of a job within its lane's queue, or None if not queued."""
+        for lane in self._lanes.values():
+            if job_id in lane.pending:
+                return lane.pending.index(job_id) + 1
+        return None
+
+    @contextlib.asynccontextmanager
+    async def phase_slot(self, phase: str) -> AsyncIterator[float]:
+        """
+        Hold one of the phase's concurrency slots.
+
+        Yields:
+            Seconds spent waiting for the slot
+        """
+        semaphore = self._phase_semaphores.get(phase)
+        if semaphore is None:
+            yield 0.0
+            return
+
+        start = time.monotonic()
+        self._phase_waiting[phase] += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self._phase_waiting[phase] -= 1
+
+        self._phase_active[phase] += 1
+        try:
+            yield time.monotonic() - start
+        finally:
+            self._phase_active[phase] -= 1
+            semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of the queue and phase slot usage."""
+        return {
+            "running_jobs": self.running_jobs,
+            "queued_jobs": self._queued,
+            "max_running_jobs": self.max_running_jobs,
+            "max_queued_jobs": self.max_queued_jobs,
+            "lanes": len(self._lanes),
+            "phases": {
+                phase: {
+                    "limit": limit,
+                    "active": self._phase_active[phase],
+                    "waiting": self._phase_waiting[phase]
+                }
+                for phase, limit in self.phase_limits.items()
+            }
+        }
+
+    async def join(self) -> None:
+        """Wait until every submitted job has finished."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def _dispatch(self) -> None:
+        """Start queued jobs while slots are free, serving the least recently served lane first."""
+        while self.running_jobs < self.max_running_jobs:
+            ready = [key for key, lane in self._lanes.items() if lane.running is None and lane.pending]
+            if not ready:
+                return
+
+            lane_key = min(
+                ready,
+                key=lambda key: (self._lanes[key].last_served, self._submitted[self._lanes[key].pending[0]][0])
+            )
+            lane = self._lanes[lane_key]
+            job_id = lane.pending.popleft()
+            lane.running = job_id
+            lane.last_served = self._last_served[lane_key] = next(self._sequence)
+            self._queued -= 1
+
+            waited = time.monotonic() - self._submitted.pop(job_id)[1]
+            logger.info(f"Starting job {job_id} after {waited:.2f}s in queue "
+                        f"({self.running_jobs}/{self.max_running_jobs} running, {self._queued} queued)")
+
+            task = asyncio.get_running_loop().create_task(self._run(job_id, lane_key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, job_id: str, lane_key: str) -> None:
+        """Run a job, then free its lane and start the next jobs."""
+        try:
+            await self.runner(job_id)
+        except Exception as e:
+            logger.error(f"Job {job_id} raised out of its runner: {e}")
+        finally:
+            lane = self._lanes[lane_key]
+            lane.running = None
+            if not lane.pending:
+                del self._lanes[lane_key]
+            self._dispatch()
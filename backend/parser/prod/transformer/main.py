@@ -14,13 +14,14 @@ from pathlib import Path
 # Add parent directories to path to access new transformer
 sys.path.append(str(Path(__file__).parent.parent.parent.parent))
 
-from transformer.main import transform_file
+from transformer.main import transform_file, transform_file_to_stream
+from transformer.core.parallel_generator import DEFAULT_SHARD_SIZE
 
 
 async def main():
     """Command-line entry point for transformer."""
     parser = argparse.ArgumentParser(
-        description="Transform code extraction output to Neo4j Cypher commands"
+        description="Transform code extraction output to Neo4j tuples"
     )
     parser.add_argument(
         "--input",
@@ -34,7 +35,29 @@ async def main():
     )
     parser.add_argument(
         "--output",
-        help="Custom output file path (default: cypher_commands_<job_id>.txt)"
+        help="Tuple stream output path for the uploader (default: tuples_<job_id>.tuplestream)"
+    )
+    parser.add_argument(
+        "--cypher-output",
+        help="Also export the tuples as a Cypher text file at this path"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=100,
+        help="Modules per tuple stream frame"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for tuple generation (0: one per CPU; default: in-process)"
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=DEFAULT_SHARD_SIZE,
+        help="Modules sent to a worker process at a time"
     )
     parser.add_argument(
         "--verbose",
@@ -49,22 +72,35 @@ async def main():
         logging.getLogger().setLevel(logging.DEBUG)
     
     try:
-        # Use the new transformer implementation
-        result = await transform_file(
+        # Tuple stream handed to the uploader; batches are written as they are produced
+        output_file = args.output or f"tuples_{args.job_id}.tuplestream"
+        result = await transform_file_to_stream(
             input_file=args.input,
-            output_directory=Path(args.output).parent if args.output else ".",
-            output_formats=["neo4j"],
-            job_id=args.job_id
+            output_file=output_file,
+            job_id=args.job_id,
+            batch_size=args.batch_size,
+            parallel_workers=args.workers,
+            shard_size=args.shard_size
         )
         
-        if result.success:
-            # Rename output file to match orchestrator expectations
-            if args.output and "neo4j" in result.output_files:
-                source_file = Path(result.output_files["neo4j"])
-                target_file = Path(args.output)
+        if result.success and args.cypher_output:
+            # Cypher text is an optional export for inspection or manual loading
+            export = await transform_file(
+                input_file=args.input,
+                output_directory=Path(args.cypher_output).parent,
+                output_formats=["neo4j"],
+                job_id=args.job_id,
+                parallel_workers=args.workers,
+                shard_size=args.shard_size
+            )
+            if export.success and "neo4j" in export.output_files:
+                source_file = Path(export.output_files["neo4j"])
                 if source_file.exists():
-                    source_file.rename(target_file)
-            
+                    source_file.rename(args.cypher_output)
+            else:
+                print(f"Cypher export failed: {', '.join(export.errors)}")
+        
+        if result.success:
             print(f"Transformation successful. Job ID: {result.job_id}")
             sys.exit(0)
         else:
@@ -1,7 +1,23 @@
 """Core transformation logic."""
 
 from .tuple_generator import TupleGenerator
+from .extraction_reader import (
+    is_extraction_stream,
+    iter_extraction_modules,
+    load_extraction_file,
+    read_extraction_delta,
+    read_extraction_summary,
+    read_extraction_trailer,
+    stream_extraction_file,
+)
 
 __all__ = [
-    "TupleGenerator"
-]
\ No newline at end of file
+    "TupleGenerator",
+    "is_extraction_stream",
+    "iter_extraction_modules",
+    "load_extraction_file",
+    "read_extraction_delta",
+    "read_extraction_summary",
+    "read_extraction_trailer",
+    "stream_extraction_file"
+]
@@ -0,0 +1,316 @@
+"""
+Readers for Phase 1 extraction output.
+
+The extractor writes either a single JSON document or newline-delimited
+JSON (header record, one record per module, trailer with summary
+statistics). Both layouts are read incrementally, module by module: the
+document layout is walked with an event-based scanner that only ever
+decodes one module at a time, so memory use does not grow with the size of
+the extraction.
+"""
+
+import json
+import logging
+import os
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, TextIO, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = " \t\r\n"
+
+
+class _JsonDocumentScanner:
+    """
+    Incremental scanner over a JSON document.
+
+    Objects are walked member by member with members(); any value can be
+    decoded whole with value(). Only the text of the value being decoded is
+    buffered, read from the file in growing chunks.
+    """
+
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, file: TextIO):
+        self._file = file
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def members(self) -> Iterator[str]:
+        """
+        Iterate the keys of the object at the current position.
+
+        After each key is yielded the caller must consume its value, with
+        value() or a nested members() loop, before resuming the iteration.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise ValueError("Malformed extraction document: object key is not a string")
+            self._expect(":")
+            yield key
+
+            separator = self._peek()
+            self._pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Malformed extraction document: unexpected {separator!r} in object")
+
+    def value(self) -> Any:
+        """Decode the value at the current position."""
+        self._peek()
+        read_size = self.CHUNK_SIZE
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A value ending at the buffer end (e.g. a number) may continue
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                if self._eof:
+                    raise ValueError(f"Malformed extraction document: {e}") from e
+            self._fill(read_size)
+            read_size *= 2
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill(self.CHUNK_SIZE):
+                raise ValueError("Malformed extraction document: unexpected end of file")
+
+    def _expect(self, char: str) -> None:
+        """Consume char, which must be the next non-whitespace character."""
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Malformed extraction document: expected {char!r}, found {found!r}")
+        self._pos += 1
+
+    def _fill(self, size: int) -> bool:
+        """Drop consumed text and read more; returns False at end of file."""
+        if self._eof:
+            return False
+        data = self._file.read(size)
+        if not data:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + data
+        self._pos = 0
+        return True
+
+
+def is_extraction_stream(input_file: str) -> bool:
+    """Return True if the file is newline-delimited extraction output."""
+    # Only the first member is scanned: compact documents are a single line
+    with open(input_file, 'r', encoding='utf-8') as f:
+        scanner = _JsonDocumentScanner(f)
+        try:
+            for key in scanner.members():
+                return key == "type" and scanner.value() == "header"
+        except ValueError:
+            return False
+    return False
+
+
+def read_extraction_trailer(input_file: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the trailer record of a streamed extraction without reading the rest.
+
+    Returns:
+        The trailer record, or None if the stream was not completed
+    """
+    with open(input_file, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        chunk = b""
+        # Walk back from the end until the last full line is buffered
+        while position > 0 and chunk.count(b"\n") < 2:
+            step = min(8192, position)
+            position -= step
+            f.seek(position)
+            chunk = f.read(step) + chunk
+
+    lines = chunk.rstrip(b"\n").split(b"\n")
+    try:
+        record = json.loads(lines[-1])
+    except json.JSONDecodeError:
+        return None
+    return record if record.get("type") == "trailer" else None
+
+
+def iter_extraction_records(input_file: str) -> Iterator[Dict[str, Any]]:
+    """Yield the records of a streamed extraction one at a time."""
+    with open(input_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _iter_document_modules(input_file: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield the modules of a single-document extraction one at a time."""
+    with open(input_file, 'r', encoding='utf-8') as f:
+        scanner = _JsonDocumentScanner(f)
+        for section in scanner.members():
+            if section != "modules":
+                scanner.value()
+                continue
+            for module_path in scanner.members():
+                yield module_path, scanner.value()
+
+
+def _iter_stream_modules(input_file: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield the modules of a streamed extraction, checking it is complete."""
+    header_seen = False
+    trailer_seen = False
+
+    for record in iter_extraction_records(input_file):
+        record_type = record.get("type")
+        if record_type == "header":
+            header_seen = True
+        elif record_type == "module":
+            yield record["path"], record["module"]
+        elif record_type == "trailer":
+            trailer_seen = True
+
+    if not header_seen:
+        raise ValueError(f"Extraction stream has no header: {input_file}")
+    if not trailer_seen:
+        raise ValueError(f"Extraction stream is incomplete (no trailer): {input_file}")
+
+
+def iter_extraction_modules(input_file: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield (module_path, module_data) pairs from extraction output.
+
+    Works for both layouts and holds a single module in memory at a time.
+
+    Raises:
+        ValueError: If the file is malformed or a stream is incomplete
+    """
+    if is_extraction_stream(input_file):
+        return _iter_stream_modules(input_file)
+    return _iter_document_modules(input_file)
+
+
+def read_extraction_delta(input_file: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the module delta of an incremental extraction, if there is one.
+
+    Streams carry it in the header. Documents written by current extractors
+    put it ahead of the modules; for older documents, where it follows them,
+    the modules are skipped over (decoded one at a time and discarded) to
+    reach it.
+    """
+    if is_extraction_stream(input_file):
+        with open(input_file, 'r', encoding='utf-8') as f:
+            return json.loads(f.readline()).get("delta")
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        scanner = _JsonDocumentScanner(f)
+        for section in scanner.members():
+            if section == "delta":
+                return scanner.value()
+            if section == "modules":
+                for _ in scanner.members():
+                    scanner.value()
+            else:
+                scanner.value()
+    return None
+
+
+def read_extraction_summary(input_file: str) -> Dict[str, Any]:
+    """
+    Read the summary statistics of extraction output without its modules.
+
+    Streams carry them in the trailer. Documents only have them after the
+    modules, so just the module count from their metadata is returned.
+    """
+    if is_extraction_stream(input_file):
+        trailer = read_extraction_trailer(input_file) or {}
+        return trailer.get("summary", {})
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        scanner = _JsonDocumentScanner(f)
+        for section in scanner.members():
+            if section == "metadata":
+                metadata = scanner.value() or {}
+                return {"total_modules": metadata.get("module_count", 0)}
+            if section == "modules":
+                break
+            scanner.value()
+    return {}
+
+
+async def stream_extraction_file(
+    input_file: str,
+    modules_per_chunk: int = 100
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Read extraction output as extraction data chunks.
+
+    Each chunk has the layout of a (partial) extraction document, so it can
+    be fed to TransformationOrchestrator.stream_transform. The delta is
+    attached to the first chunk, so stale modules are known before any
+    replacement is transformed.
+
+    Args:
+        input_file: Path to the extraction output (JSON or NDJSON)
+        modules_per_chunk: Modules per yielded chunk
+
+    Yields:
+        Dictionaries with "modules" (and "delta" on the first chunk)
+
+    Raises:
+        ValueError: If the file is malformed or a stream is incomplete
+    """
+    chunk: Dict[str, Any] = {"modules": {}}
+    delta = read_extraction_delta(input_file)
+    if delta:
+        chunk["delta"] = delta
+
+    for module_path, module_data in iter_extraction_modules(input_file):
+        chunk["modules"][module_path] = module_data
+        if len(chunk["modules"]) >= modules_per_chunk:
+            yield chunk
+            chunk = {"modules": {}}
+
+    if chunk["modules"] or chunk.get("delta"):
+        yield chunk
+
+
+def load_extraction_file(input_file: str) -> Dict[str, Any]:
+    """
+    Load extraction output as a single document, whatever its layout.
+
+    Streamed output is assembled into the document layout (metadata,
+    modules, summary and delta), which holds every module in memory; prefer
+    stream_extraction_file where the consumer can work chunk by chunk.
+    """
+    if not is_extraction_stream(input_file):
+        with open(input_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    extraction_data: Dict[str, Any] = {"modules": {}}
+    for record in iter_extraction_records(input_file):
+        record_type = record.get("type")
+        if record_type == "header":
+            extraction_data["metadata"] = record.get("metadata", {})
+            if "delta" in record:
+                extraction_data["delta"] = record["delta"]
+        elif record_type == "module":
+            extraction_data["modules"][record["path"]] = record["module"]
+        elif record_type == "trailer":
+            extraction_data["summary"] = record.get("summary", {})
+            extraction_data.setdefault("metadata", {})["module_count"] = record.get("module_count", 0)
+
+    return extraction_data
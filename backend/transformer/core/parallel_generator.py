@@ -0,0 +1,160 @@
+"""
+Process-pool tuple generation.
+
+TupleGenerator.generate_module_tuples is a pure function of
+(module_path, module_data), so modules can be transformed in worker
+processes. Modules are sent in shards to amortize the pickling round trip;
+each worker returns one compact TupleSet per shard (TupleSet.to_tuple), and
+shards are handed back in submission order so the output is the same as a
+serial run.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from .tuple_generator import TupleGenerator
+from ..models.tuples import TupleSet
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARD_SIZE = 200
+
+ModuleItems = Union[Iterable[Tuple[str, Dict[str, Any]]], AsyncIterable[Tuple[str, Dict[str, Any]]]]
+
+# "spawn" keeps workers independent of the event loop's threads
+DEFAULT_START_METHOD = "spawn"
+
+# Per-process generator, created by _init_worker
+_worker_generator: Optional[TupleGenerator] = None
+
+
+def _init_worker() -> None:
+    """Create the worker process's TupleGenerator."""
+    global _worker_generator
+    _worker_generator = TupleGenerator()
+
+
+def _generate_shard(shard: List[Tuple[str, Dict[str, Any]]]) -> Tuple[tuple, List[Tuple[str, str]], float]:
+    """
+    Generate the tuples of a shard of modules in a worker process.
+
+    Returns:
+        (TupleSet.to_tuple() payload, [(module_path, error)], seconds spent)
+    """
+    start = time.perf_counter()
+    tuple_set = TupleSet()
+    failures = []
+
+    for module_path, module_data in shard:
+        try:
+            tuple_set.extend(_worker_generator.generate_module_tuples(module_path, module_data))
+        except Exception as e:
+            failures.append((module_path, str(e)))
+
+    return tuple_set.to_tuple(), failures, time.perf_counter() - start
+
+
+@dataclass
+class ShardResult:
+    """Tuples generated for one shard of modules."""
+
+    tuple_set: TupleSet
+    module_count: int
+    failures: List[Tuple[str, str]] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+class ParallelTupleGenerator:
+    """Generates module tuples on a pool of worker processes."""
+
+    def __init__(
+        self,
+        max_workers: int = 0,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        start_method: str = DEFAULT_START_METHOD
+    ):
+        """
+        Initialize the generator.
+
+        Args:
+            max_workers: Number of worker processes; 0 means one per CPU
+            shard_size: Number of modules sent to a worker at a time
+            start_method: Multiprocessing start method for the workers
+        """
+        self.max_workers = max_workers if max_workers > 0 else (os.cpu_count() or 1)
+        self.shard_size = max(1, shard_size)
+        self.start_method = start_method
+
+    async def generate(self, modules: ModuleItems) -> AsyncIterator[ShardResult]:
+        """
+        Generate tuples for modules, shard by shard.
+
+        A few shards per worker are kept in flight; results are yielded in
+        submission order while the event loop stays free in between.
+        Modules may come from an async iterator (e.g. an extraction stream),
+        in which case shards that finish while the source is still being
+        read are handed back as soon as they are ready.
+
+        Args:
+            modules: (module_path, module_data) pairs, sync or async
+
+        Yields:
+            ShardResult for each shard, in input order
+        """
+        loop = asyncio.get_running_loop()
+        max_in_flight = self.max_workers * 2
+        in_flight: Deque[Tuple[asyncio.Future, int]] = deque()
+
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context(self.start_method),
+            initializer=_init_worker
+        ) as executor:
+            async for shard in self._shards(modules):
+                in_flight.append((loop.run_in_executor(executor, _generate_shard, shard), len(shard)))
+                if len(in_flight) >= max_in_flight:
+                    yield await self._collect(*in_flight.popleft())
+                while in_flight and in_flight[0][0].done():
+                    yield await self._collect(*in_flight.popleft())
+
+            while in_flight:
+                yield await self._collect(*in_flight.popleft())
+
+    async def _shards(self, modules: ModuleItems) -> AsyncIterator[List[Tuple[str, Dict[str, Any]]]]:
+        """Split modules into lists of at most shard_size modules."""
+        shard = []
+        async for module in self._iterate(modules):
+            shard.append(module)
+            if len(shard) >= self.shard_size:
+                yield shard
+                shard = []
+        if shard:
+            yield shard
+
+    @staticmethod
+    async def _iterate(modules: ModuleItems) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate sync and async module sources alike."""
+        if hasattr(modules, "__aiter__"):
+            async for module in modules:
+                yield module
+        else:
+            for module in modules:
+                yield module
+
+    @staticmethod
+    async def _collect(future: asyncio.Future, module_count: int) -> ShardResult:
+        """Await a shard and rebuild its TupleSet."""
+        payload, failures, seconds = await future
+        return ShardResult(
+            tuple_set=TupleSet.from_tuple(payload),
+            module_count=module_count,
+            failures=failures,
+            seconds=seconds
+        )
@@ -55,17 +55,17 @@ class TupleGenerator:
             # Generate class nodes and relationships
             for class_data in module_data.get("classes", []):
                 class_tuples = self._create_class_tuples(module_path, class_data)
-                tuple_set = tuple_set.merge(class_tuples)
+                tuple_set.extend(class_tuples)
                 
             # Generate function nodes and relationships  
             for function_data in module_data.get("functions", []):
                 function_tuples = self._create_function_tuples(module_path, function_data)
-                tuple_set = tuple_set.merge(function_tuples)
+                tuple_set.extend(function_tuples)
                 
             # Generate variable nodes and relationships
             for variable_data in module_data.get("variables", []):
                 variable_tuples = self._create_variable_tuples(module_path, variable_data)
-                tuple_set = tuple_set.merge(variable_tuples)
+                tuple_set.extend(variable_tuples)
                 
             # Add metadata
             tuple_set.metadata = {
@@ -195,7 +195,7 @@ class TupleGenerator:
         # Process methods
         for method_data in class_data.get("methods", []):
             method_tuples = self._create_method_tuples(module_path, class_name, method_data)
-            tuple_set = tuple_set.merge(method_tuples)
+            tuple_set.extend(method_tuples)
         
         return tuple_set
     
@@ -1,7 +1,11 @@
 """Output formatters for transformation results."""
 
 from .neo4j_formatter import Neo4jFormatter
+from .tuple_stream import TupleStreamWriter, TUPLE_STREAM_MAGIC, TUPLE_STREAM_SUFFIX
 
 __all__ = [
-    "Neo4jFormatter"
-]
\ No newline at end of file
+    "Neo4jFormatter",
+    "TupleStreamWriter",
+    "TUPLE_STREAM_MAGIC",
+    "TUPLE_STREAM_SUFFIX"
+]
@@ -10,10 +10,18 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, List, Set
 
-from ..models.tuples import TupleSet, Neo4jNodeTuple, Neo4jRelationshipTuple
+from ..models.tuples import TupleSet, Neo4jNodeTuple, Neo4jRelationshipTuple, NodeLabel
 
 logger = logging.getLogger(__name__)
 
+# Labels of nodes owned by a module through their module_path property
+MODULE_CHILD_LABELS = [
+    NodeLabel.CLASS.value,
+    NodeLabel.FUNCTION.value,
+    NodeLabel.METHOD.value,
+    NodeLabel.VARIABLE.value
+]
+
 
 class Neo4jFormatter:
     """
@@ -41,10 +49,16 @@ class Neo4jFormatter:
         self.queries.clear()
         self.parameters.clear()
         
-        if tuple_set.size == 0:
+        if tuple_set.size == 0 and not tuple_set.has_stale_modules:
             logger.warning("Empty tuple set provided for formatting")
             return self._generate_empty_output()
         
+        # Delete stale module subgraphs before merging their replacements
+        for module_path in tuple_set.replaced_modules:
+            self._format_stale_module(module_path, delete_module=False)
+        for module_path in tuple_set.deleted_modules:
+            self._format_stale_module(module_path, delete_module=True)
+        
         # Generate node creation queries
         for node in tuple_set.nodes:
             self._format_node(node)
@@ -95,6 +109,28 @@ MERGE (n:{node.label} {{{merge_clause}}})
         self.queries.append(query.strip())
         self.parameters.append(params)
     
+    def _format_stale_module(self, module_path: str, delete_module: bool) -> None:
+        """
+        Format the queries that delete a module's existing subgraph.
+        
+        Child nodes are matched per label so each lookup can use a
+        module_path index. A replaced module keeps its Module node (and the
+        relationships other modules have to it) and only loses its outgoing
+        relationships; a deleted module is removed entirely.
+        """
+        params = {"module_path": module_path}
+        
+        for label in MODULE_CHILD_LABELS:
+            self.queries.append(f"MATCH (n:{label} {{module_path: $module_path}})\nDETACH DELETE n")
+            self.parameters.append(params)
+        
+        if delete_module:
+            query = f"MATCH (m:{NodeLabel.MODULE.value} {{path: $module_path}})\nDETACH DELETE m"
+        else:
+            query = f"MATCH (m:{NodeLabel.MODULE.value} {{path: $module_path}})-[r]->()\nDELETE r"
+        self.queries.append(query)
+        self.parameters.append(params)
+    
     def _format_relationship(self, relationship: Neo4jRelationshipTuple) -> None:
         """Format a single relationship tuple into Cypher."""
         # Build match clauses for source and target nodes
@@ -188,6 +224,7 @@ MERGE (source)-[r:{relationship.relationship_type}{rel_props}]->(target)
             "// === EXECUTION STATISTICS ===",
             f"// Total nodes: {self._count_node_queries()}",
             f"// Total relationships: {self._count_relationship_queries()}",
+            f"// Stale subgraph deletions: {self._count_deletion_queries()}",
             f"// Total queries: {len(self.queries)}",
             ""
         ])
@@ -229,6 +266,10 @@ MERGE (source)-[r:{relationship.relationship_type}{rel_props}]->(target)
         """Count the number of relationship creation queries."""
         return sum(1 for query in self.queries if "MERGE (source)-[r:" in query)
     
+    def _count_deletion_queries(self) -> int:
+        """Count the number of stale subgraph deletion queries."""
+        return sum(1 for query in self.queries if "DELETE" in query)
+    
     def _generate_empty_output(self) -> str:
         """Generate output for empty tuple set."""
         return f"""
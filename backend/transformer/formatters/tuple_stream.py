@@ -0,0 +1,93 @@
+"""
+Framed tuple stream output for transformation results.
+
+Writes TupleSet batches to a binary file as a sequence of length-prefixed
+frames, so the uploader can consume them batch by batch without loading or
+re-parsing the whole output:
+
+    MAGIC (b"NTS2\\n")
+    frame*: 4-byte big-endian payload length + UTF-8 JSON of TupleSet.to_dict()
+    trailer: 4-byte 0xFFFFFFFF marker + frame, node and relationship counts
+             (8-byte big-endian each)
+
+The trailer is only written when the writer is closed without an error, so
+a reader can tell a complete stream from one cut short by a crash.
+"""
+
+import json
+import logging
+import struct
+from pathlib import Path
+
+from ..models.tuples import TupleSet
+
+logger = logging.getLogger(__name__)
+
+# Keep in sync with the reader in backend/uploader/core/bulk_writer.py
+TUPLE_STREAM_MAGIC = b"NTS2\n"
+TUPLE_STREAM_SUFFIX = ".tuplestream"
+
+_FRAME_HEADER = struct.Struct(">I")
+# Frame header value announcing the trailer instead of a frame
+_TRAILER_MARKER = 0xFFFFFFFF
+_TRAILER = struct.Struct(">QQQ")
+
+
+class TupleStreamWriter:
+    """
+    Writes TupleSet batches as frames of a tuple stream file.
+
+    Use as a context manager; frames are appended as batches are written so
+    memory use stays bounded by the batch size. Leaving the context with an
+    exception closes the file without the trailer.
+    """
+
+    def __init__(self, output_file: Path):
+        """
+        Initialize the writer.
+
+        Args:
+            output_file: Path of the tuple stream file to create
+        """
+        self.output_file = Path(output_file)
+        self.frames_written = 0
+        self.nodes_written = 0
+        self.relationships_written = 0
+        self._file = None
+
+    def __enter__(self) -> "TupleStreamWriter":
+        self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.output_file, "wb")
+        self._file.write(TUPLE_STREAM_MAGIC)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(complete=exc_type is None)
+
+    def write(self, tuple_set: TupleSet) -> None:
+        """Append a TupleSet batch as one frame."""
+        payload = json.dumps(tuple_set.to_dict(), separators=(",", ":"), default=str).encode("utf-8")
+        self._file.write(_FRAME_HEADER.pack(len(payload)))
+        self._file.write(payload)
+
+        self.frames_written += 1
+        self.nodes_written += tuple_set.node_count
+        self.relationships_written += tuple_set.relationship_count
+
+    def close(self, complete: bool = True) -> None:
+        """
+        Close the output file.
+
+        Args:
+            complete: Write the trailer first; False leaves the stream
+                unterminated, so readers reject it as truncated
+        """
+        if self._file is not None:
+            if complete:
+                self._file.write(_FRAME_HEADER.pack(_TRAILER_MARKER))
+                self._file.write(_TRAILER.pack(self.frames_written, self.nodes_written, self.relationships_written))
+            self._file.close()
+            self._file = None
+            logger.info(f"Wrote {'' if complete else 'incomplete '}tuple stream {self.output_file}: "
+                        f"{self.frames_written} frames, {self.nodes_written} nodes, "
+                        f"{self.relationships_written} relationships")
@@ -8,16 +8,21 @@ from Phase 1 into standardized Neo4j tuples ready for Phase 3 upload.
 import asyncio
 import json
 import logging
+import time
 import uuid
 from pathlib import Path
+from contextlib import ExitStack
 from typing import Dict, Any, List, Optional, AsyncIterator
 from datetime import datetime
 
 from .core.tuple_generator import TupleGenerator
+from .core.parallel_generator import ParallelTupleGenerator, DEFAULT_SHARD_SIZE
+from .core.extraction_reader import read_extraction_summary, stream_extraction_file
 from .models.tuples import TupleSet
 from .models.metadata import TransformationMetadata, TransformationResult, TransformationStatus
 from .services.progress_service import ProgressService, NullProgressService
 from .formatters.neo4j_formatter import Neo4jFormatter
+from .formatters.tuple_stream import TupleStreamWriter, TUPLE_STREAM_SUFFIX
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +39,9 @@ class TransformationOrchestrator:
         self,
         job_id: Optional[str] = None,
         orchestrator_url: Optional[str] = None,
-        enable_progress_reporting: bool = True
+        enable_progress_reporting: bool = True,
+        parallel_workers: Optional[int] = None,
+        shard_size: int = DEFAULT_SHARD_SIZE
     ):
         """
         Initialize the transformation orchestrator.
@@ -43,6 +50,10 @@ class TransformationOrchestrator:
             job_id: Unique job identifier (auto-generated if not provided)
             orchestrator_url: URL of the main orchestrator for progress reporting
             enable_progress_reporting: Whether to enable progress reporting
+            parallel_workers: Worker processes for tuple generation, used by
+                both the whole-extraction and the streaming paths; None
+                generates tuples in this process, 0 uses one per CPU
+            shard_size: Number of modules sent to a worker process at a time
         """
         self.job_id = job_id or str(uuid.uuid4())
         
@@ -54,6 +65,9 @@ class TransformationOrchestrator:
             
         self.tuple_generator = TupleGenerator()
         self.neo4j_formatter = Neo4jFormatter()
+        self.parallel_generator = (
+            ParallelTupleGenerator(parallel_workers, shard_size) if parallel_workers is not None else None
+        )
         
         logger.info(f"Initialized TransformationOrchestrator with job_id: {self.job_id}")
     
@@ -85,7 +99,10 @@ class TransformationOrchestrator:
                 raise ValueError("Invalid extraction data: missing 'modules' section")
             
             modules = extraction_data["modules"]
-            if not modules:
+            
+            # Incremental extraction only contains added and changed modules
+            delta = extraction_data.get("delta")
+            if not modules and not delta:
                 raise ValueError("No modules found in extraction data")
             
             # Calculate input statistics
@@ -96,30 +113,18 @@ class TransformationOrchestrator:
             logger.info(f"Starting transformation of {len(modules)} modules")
             
             # Generate tuples for all modules
-            all_tuples = TupleSet()
-            total_modules = len(modules)
+            start = time.perf_counter()
+            if self.parallel_generator is not None:
+                all_tuples = await self._generate_parallel(modules, result)
+            else:
+                all_tuples = self._generate_serial(modules, result)
+            result.metadata.record_generation(len(modules), all_tuples.size, time.perf_counter() - start)
+            logger.info(f"Generated {all_tuples.size} tuples at {result.metadata.modules_per_second:.0f} modules/s "
+                        f"with {result.metadata.worker_count} worker(s)")
             
-            for i, (module_path, module_data) in enumerate(modules.items()):
-                try:
-                    # Generate tuples for this module
-                    module_tuples = self.tuple_generator.generate_module_tuples(
-                        module_path, module_data
-                    )
-                    
-                    # Merge with overall tuple set
-                    all_tuples = all_tuples.merge(module_tuples)
-                    
-                    # Report progress
-                    self.progress_service.report_progress(
-                        current=i + 1,
-                        total=total_modules,
-                        step="tuple_generation",
-                        message=f"Generated tuples for {module_data.get('name', 'unknown')}"
-                    )
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to process module {module_path}: {e}")
-                    result.add_warning(f"Module {module_path}: {str(e)}")
+            if delta:
+                all_tuples.replaced_modules = list(delta.get("changed", []))
+                all_tuples.deleted_modules = list(delta.get("deleted", []))
             
             # Report tuple generation completion
             self.progress_service.report_step_completed("tuple_generation")
@@ -169,6 +174,63 @@ class TransformationOrchestrator:
             self.progress_service.report_error(str(e))
             return result
     
+    def _generate_serial(self, modules: Dict[str, Any], result: TransformationResult) -> TupleSet:
+        """Generate tuples for all modules in this process."""
+        all_tuples = TupleSet()
+        total_modules = len(modules)
+        
+        for i, (module_path, module_data) in enumerate(modules.items()):
+            try:
+                # Generate tuples for this module
+                module_tuples = self.tuple_generator.generate_module_tuples(
+                    module_path, module_data
+                )
+                
+                # Append to overall tuple set
+                all_tuples.extend(module_tuples)
+                
+                # Report progress
+                self.progress_service.report_progress(
+                    current=i + 1,
+                    total=total_modules,
+                    step="tuple_generation",
+                    message=f"Generated tuples for {module_data.get('name', 'unknown')}"
+                )
+                
+            except Exception as e:
+                logger.warning(f"Failed to process module {module_path}: {e}")
+                result.add_warning(f"Module {module_path}: {str(e)}")
+        
+        return all_tuples
+    
+    async def _generate_parallel(self, modules: Dict[str, Any], result: TransformationResult) -> TupleSet:
+        """Generate tuples for all modules on the worker process pool."""
+        all_tuples = TupleSet()
+        total_modules = len(modules)
+        modules_done = 0
+        shard_count = 0
+        
+        async for shard in self.parallel_generator.generate(modules.items()):
+            # Shards arrive in input order, so the output matches a serial run
+            all_tuples.extend(shard.tuple_set)
+            shard_count += 1
+            modules_done += shard.module_count
+            
+            for module_path, error in shard.failures:
+                logger.warning(f"Failed to process module {module_path}: {error}")
+                result.add_warning(f"Module {module_path}: {error}")
+            
+            self.progress_service.report_progress(
+                current=modules_done,
+                total=total_modules,
+                step="tuple_generation",
+                message=f"Generated tuples for shard {shard_count} ({shard.module_count} modules)"
+            )
+        
+        result.metadata.worker_count = self.parallel_generator.max_workers
+        result.metadata.shard_count = shard_count
+        return all_tuples
+    
     async def stream_transform(
         self,
         extraction_stream: AsyncIterator[Dict[str, Any]],
@@ -177,6 +239,11 @@ class TransformationOrchestrator:
         """
         Transform extraction data in streaming fashion.
         
+        Stale module lists of an incremental extraction's delta are carried
+        on the next yielded batch, so consumers delete stale subgraphs before
+        merging the replacements. With parallel workers configured, modules
+        are sharded across the process pool as they arrive.
+        
         Args:
             extraction_stream: Async iterator of extraction data
             batch_size: Number of modules to process per batch
@@ -189,10 +256,20 @@ class TransformationOrchestrator:
         module_count = 0
         
         try:
+            if self.parallel_generator is not None:
+                async for batch in self._stream_transform_parallel(extraction_stream, batch_size):
+                    yield batch
+                return
+            
             async for extraction_data in extraction_stream:
                 # Extract modules from current data
                 modules = extraction_data.get("modules", {})
                 
+                delta = extraction_data.get("delta")
+                if delta:
+                    batch_tuples.replaced_modules.extend(delta.get("changed", []))
+                    batch_tuples.deleted_modules.extend(delta.get("deleted", []))
+                
                 for module_path, module_data in modules.items():
                     try:
                         # Generate tuples for this module
@@ -201,7 +278,7 @@ class TransformationOrchestrator:
                         )
                         
                         # Add to current batch
-                        batch_tuples = batch_tuples.merge(module_tuples)
+                        batch_tuples.extend(module_tuples)
                         module_count += 1
                         
                         # Yield batch when it reaches target size
@@ -220,8 +297,8 @@ class TransformationOrchestrator:
                     except Exception as e:
                         logger.warning(f"Failed to process module {module_path}: {e}")
             
-            # Yield final batch if it has any tuples
-            if batch_tuples.size > 0:
+            # Yield final batch if it has any tuples or stale modules
+            if batch_tuples.size > 0 or batch_tuples.has_stale_modules:
                 batch_count += 1
                 self.progress_service.report_batch_processed(
                     batch_count, batch_tuples.size, 0.0
@@ -233,6 +310,320 @@ class TransformationOrchestrator:
             self.progress_service.report_error(str(e))
             raise
     
+    async def _stream_transform_parallel(
+        self,
+        extraction_stream: AsyncIterator[Dict[str, Any]],
+        batch_size: int
+    ) -> AsyncIterator[TupleSet]:
+        """
+        Stream batches with tuple generation sharded over the process pool.
+        
+        A delta always precedes the modules it replaces in the stream, so
+        its stale lists are attached to the batch holding (or preceding)
+        the first shard read after it.
+        """
+        stale = TupleSet()
+        
+        async def module_items():
+            async for extraction_data in extraction_stream:
+                delta = extraction_data.get("delta")
+                if delta:
+                    stale.replaced_modules.extend(delta.get("changed", []))
+                    stale.deleted_modules.extend(delta.get("deleted", []))
+                for item in extraction_data.get("modules", {}).items():
+                    yield item
+        
+        def take_stale(batch: TupleSet) -> None:
+            batch.replaced_modules.extend(stale.replaced_modules)
+            batch.deleted_modules.extend(stale.deleted_modules)
+            stale.replaced_modules.clear()
+            stale.deleted_modules.clear()
+        
+        batch_tuples = TupleSet()
+        batch_count = 0
+        module_count = 0
+        batch_seconds = 0.0
+        
+        async for shard in self.parallel_generator.generate(module_items()):
+            take_stale(batch_tuples)
+            batch_tuples.extend(shard.tuple_set)
+            module_count += shard.module_count
+            batch_seconds += shard.seconds
+            for module_path, error in shard.failures:
+                logger.warning(f"Failed to process module {module_path}: {error}")
+            
+            if module_count >= batch_size:
+                batch_count += 1
+                self.progress_service.report_batch_processed(
+                    batch_count, batch_tuples.size, batch_seconds
+                )
+                yield batch_tuples
+                batch_tuples = TupleSet()
+                module_count = 0
+                batch_seconds = 0.0
+        
+        take_stale(batch_tuples)
+        if batch_tuples.size > 0 or batch_tuples.has_stale_modules:
+            batch_count += 1
+            self.progress_service.report_batch_processed(
+                batch_count, batch_tuples.size, batch_seconds
+            )
+            yield batch_tuples
+    
+    async def transform_to_stream(
+        self,
+        extraction_data: Dict[str, Any],
+        output_file: str,
+        batch_size: int = 100
+    ) -> TransformationResult:
+        """
+        Transform extraction data into a framed tuple stream file.
+        
+        Batches from stream_transform are written as they are produced, so
+        the full TupleSet is never held in memory and no Cypher text is
+        rendered; the uploader reads the frames back batch by batch.
+        
+        Args:
+            extraction_data: Raw extraction data from Phase 1
+            output_file: Path of the tuple stream file to write
+            batch_size: Number of modules per frame
+            
+        Returns:
+            TransformationResult with the tuple stream as its output file
+        """
+        if not extraction_data or "modules" not in extraction_data:
+            return self._failed_result("Invalid extraction data: missing 'modules' section")
+        if not extraction_data["modules"] and not extraction_data.get("delta"):
+            return self._failed_result("No modules found in extraction data")
+        
+        async def single_extraction():
+            yield extraction_data
+        
+        return await self.transform_stream_to_file(
+            single_extraction(),
+            output_file,
+            batch_size=batch_size,
+            input_stats=self._calculate_input_stats(extraction_data)
+        )
+    
+    async def transform_stream_to_file(
+        self,
+        extraction_stream: AsyncIterator[Dict[str, Any]],
+        output_file: str,
+        batch_size: int = 100,
+        input_stats: Optional[Dict[str, int]] = None
+    ) -> TransformationResult:
+        """
+        Transform a stream of extraction data chunks into a tuple stream file.
+        
+        Neither the extraction nor the tuples are held in memory as a whole:
+        chunks are transformed as they arrive and each batch is written out
+        as a frame.
+        
+        Args:
+            extraction_stream: Async iterator of extraction data chunks
+            output_file: Path of the tuple stream file to write
+            batch_size: Number of modules per frame
+            input_stats: Input statistics to report, if known up front
+            
+        Returns:
+            TransformationResult with the tuple stream as its output file
+        """
+        result = TransformationResult(
+            job_id=self.job_id,
+            metadata=self.progress_service.get_metadata()
+        )
+        
+        try:
+            self.progress_service.start_transformation(input_stats or {})
+            
+            with TupleStreamWriter(Path(output_file)) as writer:
+                async for batch in self.stream_transform(extraction_stream, batch_size=batch_size):
+                    writer.write(batch)
+            
+            result.add_output_file("tuple_stream", str(output_file))
+            result.metadata.output_nodes_count = writer.nodes_written
+            result.metadata.output_relationships_count = writer.relationships_written
+            if self.parallel_generator is not None:
+                result.metadata.worker_count = self.parallel_generator.max_workers
+            
+            final_stats = {
+                "nodes": writer.nodes_written,
+                "relationships": writer.relationships_written,
+                "total_tuples": writer.nodes_written + writer.relationships_written,
+                "frames": writer.frames_written
+            }
+            self.progress_service.complete_transformation(result.output_files, final_stats)
+            logger.info(f"Stream transformation completed successfully: {final_stats}")
+            
+            return result
+            
+        except Exception as e:
+            logger.error(f"Stream transformation failed: {e}")
+            result.add_error(str(e))
+            self.progress_service.report_error(str(e))
+            return result
+    
+    def _failed_result(self, error: str) -> TransformationResult:
+        """Build a failed result for input rejected before transformation starts."""
+        logger.error(f"Stream transformation failed: {error}")
+        result = TransformationResult(
+            job_id=self.job_id,
+            metadata=self.progress_service.get_metadata()
+        )
+        result.add_error(error)
+        self.progress_service.report_error(error)
+        return result
+    
+    async def transform_extraction_file(
+        self,
+        input_file: str,
+        output_formats: List[str] = ["neo4j"],
+        output_directory: Optional[str] = None,
+        batch_size: int = 100
+    ) -> TransformationResult:
+        """
+        Transform an extraction file, reading it incrementally.
+        
+        Either extraction layout (JSON document or NDJSON stream) is read
+        module by module, so the extraction is never loaded as a whole and
+        tuple generation starts with the first module.
+        
+        Args:
+            input_file: Path to extraction output (JSON or NDJSON)
+            output_formats: List of output formats to generate
+            output_directory: Directory to write output files
+            batch_size: Number of modules per batch
+            
+        Returns:
+            TransformationResult with output file paths and metadata
+        """
+        return await self.transform_extraction_stream(
+            stream_extraction_file(input_file, modules_per_chunk=batch_size),
+            output_formats,
+            output_directory,
+            batch_size=batch_size,
+            input_stats=self._summary_input_stats(read_extraction_summary(input_file))
+        )
+    
+    async def transform_extraction_stream(
+        self,
+        extraction_stream: AsyncIterator[Dict[str, Any]],
+        output_formats: List[str] = ["neo4j"],
+        output_directory: Optional[str] = None,
+        batch_size: int = 100,
+        input_stats: Optional[Dict[str, int]] = None
+    ) -> TransformationResult:
+        """
+        Transform a stream of extraction data chunks into the requested formats.
+        
+        Batches from stream_transform are written to the tuple stream as
+        they are produced. The other formats describe the whole tuple set,
+        so batches are accumulated for them; the extraction itself is never
+        held in memory.
+        
+        Args:
+            extraction_stream: Async iterator of extraction data chunks
+            output_formats: List of output formats to generate
+            output_directory: Directory to write output files
+            batch_size: Number of modules per batch
+            input_stats: Input statistics to report, if known up front
+            
+        Returns:
+            TransformationResult with output file paths and metadata
+        """
+        result = TransformationResult(
+            job_id=self.job_id,
+            metadata=self.progress_service.get_metadata()
+        )
+        
+        try:
+            self.progress_service.start_transformation(input_stats or {})
+            
+            output_dir_path = Path(output_directory or ".")
+            output_dir_path.mkdir(parents=True, exist_ok=True)
+            
+            whole_set_formats = [name for name in output_formats if name != "tuple_stream"]
+            all_tuples = TupleSet() if whole_set_formats else None
+            node_count = 0
+            relationship_count = 0
+            batch_count = 0
+            
+            with ExitStack() as stack:
+                stream_writer = None
+                if "tuple_stream" in output_formats:
+                    stream_writer = stack.enter_context(TupleStreamWriter(
+                        output_dir_path / f"tuples_{self.job_id}{TUPLE_STREAM_SUFFIX}"
+                    ))
+                
+                async for batch in self.stream_transform(extraction_stream, batch_size=batch_size):
+                    batch_count += 1
+                    node_count += batch.node_count
+                    relationship_count += batch.relationship_count
+                    if stream_writer is not None:
+                        stream_writer.write(batch)
+                    if all_tuples is not None:
+                        all_tuples.extend(batch)
+            
+            if batch_count == 0:
+                raise ValueError("No modules found in extraction data")
+            
+            self.progress_service.report_step_completed("tuple_generation")
+            
+            for format_name in output_formats:
+                if format_name == "tuple_stream":
+                    result.add_output_file(format_name, str(stream_writer.output_file))
+                    continue
+                try:
+                    output_file = await self._generate_output_format(
+                        format_name, all_tuples, output_dir_path
+                    )
+                    result.add_output_file(format_name, str(output_file))
+                    
+                except Exception as e:
+                    logger.error(f"Failed to generate {format_name} output: {e}")
+                    result.add_error(f"Output format {format_name}: {str(e)}")
+            
+            final_stats = {
+                "nodes": node_count,
+                "relationships": relationship_count,
+                "total_tuples": node_count + relationship_count
+            }
+            
+            result.metadata.output_nodes_count = node_count
+            result.metadata.output_relationships_count = relationship_count
+            if self.parallel_generator is not None:
+                result.metadata.worker_count = self.parallel_generator.max_workers
+            
+            if not result.has_errors:
+                self.progress_service.complete_transformation(
+                    result.output_files, final_stats
+                )
+                logger.info(f"Transformation completed successfully: {final_stats}")
+            else:
+                self.progress_service.report_error(
+                    f"Transformation completed with {len(result.errors)} errors"
+                )
+            
+            return result
+            
+        except Exception as e:
+            logger.error(f"Transformation failed: {e}")
+            result.add_error(str(e))
+            self.progress_service.report_error(str(e))
+            return result
+    
+    @staticmethod
+    def _summary_input_stats(summary: Dict[str, Any]) -> Dict[str, int]:
+        """Convert extraction summary statistics into input statistics."""
+        return {
+            "modules": summary.get("total_modules", 0),
+            "classes": summary.get("total_classes", 0),
+            "functions": summary.get("total_functions", 0) + summary.get("total_methods", 0),
+            "variables": summary.get("total_variables", 0),
+            "imports": summary.get("total_imports", 0)
+        }
+    
     def _calculate_input_stats(self, extraction_data: Dict[str, Any]) -> Dict[str, int]:
         """Calculate statistics about input data."""
         modules = extraction_data.get("modules", {})
@@ -293,6 +684,15 @@ class TransformationOrchestrator:
             logger.info(f"Generated JSON output: {output_file}")
             return output_file
             
+        elif format_name == "tuple_stream":
+            output_file = output_directory / f"tuples_{self.job_id}{TUPLE_STREAM_SUFFIX}"
+            
+            with TupleStreamWriter(output_file) as writer:
+                writer.write(tuple_set)
+                
+            logger.info(f"Generated tuple stream output: {output_file}")
+            return output_file
+            
         else:
             raise ValueError(f"Unsupported output format: {format_name}")
     
@@ -310,26 +710,64 @@ async def transform_file(
     input_file: str,
     output_directory: str = ".",
     output_formats: List[str] = ["neo4j"],
-    job_id: Optional[str] = None
+    job_id: Optional[str] = None,
+    parallel_workers: Optional[int] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE
 ) -> TransformationResult:
     """
     Transform a single extraction file.
     
     Args:
-        input_file: Path to extraction JSON file
+        input_file: Path to extraction output (JSON or NDJSON)
         output_directory: Directory for output files
         output_formats: List of output formats to generate
         job_id: Optional job ID
+        parallel_workers: Worker processes for tuple generation (None: serial)
+        shard_size: Number of modules sent to a worker process at a time
         
     Returns:
         TransformationResult
     """
-    # Load extraction data
-    with open(input_file, 'r', encoding='utf-8') as f:
-        extraction_data = json.load(f)
+    orchestrator = TransformationOrchestrator(
+        job_id=job_id, parallel_workers=parallel_workers, shard_size=shard_size
+    )
+    return await orchestrator.transform_extraction_file(
+        input_file, output_formats, output_directory
+    )
+
+
+async def transform_file_to_stream(
+    input_file: str,
+    output_file: str,
+    job_id: Optional[str] = None,
+    batch_size: int = 100,
+    parallel_workers: Optional[int] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE
+) -> TransformationResult:
+    """
+    Transform a single extraction file into a tuple stream file.
+    
+    The extraction is read chunk by chunk and every batch is written out as
+    a frame, so neither side of the transformation is held in memory as a
+    whole.
     
-    # Create orchestrator and transform
-    orchestrator = TransformationOrchestrator(job_id=job_id)
-    return await orchestrator.transform_extraction_data(
-        extraction_data, output_formats, output_directory
-    )
\ No newline at end of file
+    Args:
+        input_file: Path to extraction output (JSON or NDJSON)
+        output_file: Path of the tuple stream file to write
+        job_id: Optional job ID
+        batch_size: Number of modules per frame
+        parallel_workers: Worker processes for tuple generation (None: serial)
+        shard_size: Number of modules sent to a worker process at a time
+        
+    Returns:
+        TransformationResult
+    """
+    orchestrator = TransformationOrchestrator(
+        job_id=job_id, parallel_workers=parallel_workers, shard_size=shard_size
+    )
+    return await orchestrator.transform_stream_to_file(
+        stream_extraction_file(input_file, modules_per_chunk=batch_size),
+        output_file,
+        batch_size=batch_size,
+        input_stats=orchestrator._summary_input_stats(read_extraction_summary(input_file))
+    )
@@ -52,6 +52,13 @@ class TransformationMetadata:
     error_count: int = 0
     warning_count: int = 0
     
+    # Tuple generation throughput
+    worker_count: int = 1
+    shard_count: int = 0
+    generation_time_seconds: float = 0.0
+    modules_per_second: float = 0.0
+    tuples_per_second: float = 0.0
+    
     # Detailed progress tracking
     steps_completed: List[str] = field(default_factory=list)
     steps_remaining: List[str] = field(default_factory=list)
@@ -91,6 +98,13 @@ class TransformationMetadata:
         if step in self.steps_remaining:
             self.steps_remaining.remove(step)
             
+    def record_generation(self, module_count: int, tuple_count: int, seconds: float) -> None:
+        """Record tuple generation timing and derive throughput."""
+        self.generation_time_seconds = seconds
+        if seconds > 0:
+            self.modules_per_second = module_count / seconds
+            self.tuples_per_second = tuple_count / seconds
+            
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -118,6 +132,13 @@ class TransformationMetadata:
                 "error_count": self.error_count,
                 "warning_count": self.warning_count
             },
+            "generation_statistics": {
+                "worker_count": self.worker_count,
+                "shard_count": self.shard_count,
+                "time_seconds": self.generation_time_seconds,
+                "modules_per_second": self.modules_per_second,
+                "tuples_per_second": self.tuples_per_second
+            },
             "progress": {
                 "steps_completed": self.steps_completed,
                 "steps_remaining": self.steps_remaining
@@ -20,7 +20,7 @@ class NodeLabel(Enum):
     IMPORT = "Import"
 
 
-@dataclass
+@dataclass(slots=True)
 class Neo4jNodeTuple:
     """
     Standardized node tuple for Neo4j upload.
@@ -50,9 +50,19 @@ class Neo4jNodeTuple:
             "properties": self.properties,
             "merge_properties": list(self.merge_properties) if self.merge_properties else ["unique_key"]
         }
+        
+    def to_tuple(self) -> tuple:
+        """Convert the node to a positional tuple for compact transport."""
+        return (self.label, self.properties, self.unique_key, tuple(self.merge_properties))
+        
+    @classmethod
+    def from_tuple(cls, data: tuple) -> "Neo4jNodeTuple":
+        """Rebuild a node from the output of ``to_tuple``."""
+        label, properties, unique_key, merge_properties = data
+        return cls(label, properties, unique_key, set(merge_properties))
 
 
-@dataclass 
+@dataclass(slots=True)
 class Neo4jRelationshipTuple:
     """
     Standardized relationship tuple for Neo4j upload.
@@ -85,19 +95,42 @@ class Neo4jRelationshipTuple:
             "source_label": self.source_label,
             "target_label": self.target_label
         }
+        
+    def to_tuple(self) -> tuple:
+        """Convert the relationship to a positional tuple for compact transport."""
+        return (
+            self.source_key,
+            self.target_key,
+            self.relationship_type,
+            self.properties,
+            self.source_label,
+            self.target_label,
+        )
+        
+    @classmethod
+    def from_tuple(cls, data: tuple) -> "Neo4jRelationshipTuple":
+        """Rebuild a relationship from the output of ``to_tuple``."""
+        return cls(*data)
 
 
-@dataclass
+@dataclass(slots=True)
 class TupleSet:
     """
     Collection of nodes and relationships for batch processing.
     
     This represents a complete set of tuples generated from
     transformation processing, ready for Neo4j upload.
+    
+    A delta set (from incremental extraction) also lists the modules whose
+    existing graph data is stale: replaced modules have their contents
+    deleted before the new tuples are merged, deleted modules are removed
+    entirely.
     """
     nodes: List[Neo4jNodeTuple] = field(default_factory=list)
     relationships: List[Neo4jRelationshipTuple] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    replaced_modules: List[str] = field(default_factory=list)  # Module paths re-extracted with new content
+    deleted_modules: List[str] = field(default_factory=list)   # Module paths removed from the codebase
     
     def add_node(self, node: Neo4jNodeTuple) -> None:
         """Add a node tuple to the set."""
@@ -107,20 +140,46 @@ class TupleSet:
         """Add a relationship tuple to the set."""
         self.relationships.append(relationship)
         
+    def extend(self, other: 'TupleSet') -> 'TupleSet':
+        """
+        Append another TupleSet's contents to this one in place.
+        
+        Amortized O(len(other)), so accumulating many module tuple sets
+        stays linear. Returns self to allow chaining.
+        """
+        self.nodes.extend(other.nodes)
+        self.relationships.extend(other.relationships)
+        self.metadata.update(other.metadata)
+        self.replaced_modules.extend(other.replaced_modules)
+        self.deleted_modules.extend(other.deleted_modules)
+        return self
+        
     def merge(self, other: 'TupleSet') -> 'TupleSet':
-        """Merge another TupleSet into this one."""
+        """
+        Return a new TupleSet combining this one and another.
+        
+        Both inputs are left unchanged. This copies every tuple reference,
+        so use extend() when accumulating in a loop.
+        """
         merged = TupleSet(
-            nodes=self.nodes + other.nodes,
-            relationships=self.relationships + other.relationships,
-            metadata={**self.metadata, **other.metadata}
+            nodes=list(self.nodes),
+            relationships=list(self.relationships),
+            metadata=dict(self.metadata),
+            replaced_modules=list(self.replaced_modules),
+            deleted_modules=list(self.deleted_modules)
         )
-        return merged
+        return merged.extend(other)
         
     @property
     def size(self) -> int:
         """Total number of tuples in the set."""
         return len(self.nodes) + len(self.relationships)
         
+    @property
+    def has_stale_modules(self) -> bool:
+        """True if existing graph data must be deleted before upload."""
+        return bool(self.replaced_modules or self.deleted_modules)
+        
     @property
     def node_count(self) -> int:
         """Number of node tuples."""
@@ -131,12 +190,41 @@ class TupleSet:
         """Number of relationship tuples."""
         return len(self.relationships)
         
+    def to_tuple(self) -> tuple:
+        """
+        Convert the set to nested positional tuples for compact transport.
+        
+        Used to return tuple sets from worker processes: plain tuples pickle
+        smaller and faster than the dataclass instances.
+        """
+        return (
+            [node.to_tuple() for node in self.nodes],
+            [relationship.to_tuple() for relationship in self.relationships],
+            self.metadata,
+            self.replaced_modules,
+            self.deleted_modules,
+        )
+        
+    @classmethod
+    def from_tuple(cls, data: tuple) -> "TupleSet":
+        """Rebuild a tuple set from the output of ``to_tuple``."""
+        nodes, relationships, metadata, replaced_modules, deleted_modules = data
+        return cls(
+            nodes=[Neo4jNodeTuple.from_tuple(node) for node in nodes],
+            relationships=[Neo4jRelationshipTuple.from_tuple(rel) for rel in relationships],
+            metadata=metadata,
+            replaced_modules=replaced_modules,
+            deleted_modules=deleted_modules
+        )
+        
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format for serialization."""
         return {
             "nodes": [node.to_cypher_params() for node in self.nodes],
             "relationships": [rel.to_cypher_params() for rel in self.relationships],
             "metadata": self.metadata,
+            "replaced_modules": self.replaced_modules,
+            "deleted_modules": self.deleted_modules,
             "statistics": {
                 "node_count": self.node_count,
                 "relationship_count": self.relationship_count,
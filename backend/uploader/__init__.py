@@ -4,7 +4,7 @@ Uploader Package
 Domain for uploading Phase 2 transformation results to Neo4j database.
 """
 
-from .core import Neo4jClient, BatchUploader
+from .core import Neo4jClient, AdaptiveBatchSizer, BatchUploader, GraphCleaner, GraphFingerprinter, GraphSnapshot
 from .services import ValidationService
 from .models import (
     UploadResult,
@@ -20,7 +20,11 @@ from .models import (
 __all__ = [
     # Core components
     "Neo4jClient",
+    "AdaptiveBatchSizer",
     "BatchUploader",
+    "GraphCleaner",
+    "GraphFingerprinter",
+    "GraphSnapshot",
     
     # Services
     "ValidationService",
@@ -5,9 +5,26 @@ Exports core components for Neo4j upload operations.
 """
 
 from .neo4j_client import Neo4jClient
+from .batch_sizer import AdaptiveBatchSizer, BatchSizeLimits
 from .batch_uploader import BatchUploader
+from .bulk_writer import BulkWriter
+from .dead_letter import DeadLetterLog
+from .graph_cleaner import GraphCleaner
+from .graph_fingerprint import GraphFingerprinter
+from .graph_snapshot import GraphSnapshot
+from .schema_manager import SchemaManager
+from .upload_checkpoint import UploadCheckpoint
 
 __all__ = [
     "Neo4jClient",
-    "BatchUploader"
+    "AdaptiveBatchSizer",
+    "BatchSizeLimits",
+    "BatchUploader",
+    "BulkWriter",
+    "DeadLetterLog",
+    "GraphCleaner",
+    "GraphFingerprinter",
+    "GraphSnapshot",
+    "SchemaManager",
+    "UploadCheckpoint"
 ]
\ No newline at end of file
@@ -0,0 +1,174 @@
+"""
+Adaptive Batch Sizer for Neo4j - AIMD batch sizes per statement kind
+
+A fixed batch size is either too small for cheap statements (a MERGE of a
+Variable node) or too large for expensive ones (relationships matching
+two endpoints and carrying properties). The sizer keeps one batch size per
+statement kind and adjusts it from each executed batch:
+
+- A full batch that committed within the target latency grows the size by
+  a constant step (additive increase)
+- A failed batch, or one over the target latency, shrinks it by a factor
+  (multiplicative decrease), further when far over the target
+- Sizes stay between configurable bounds, and a batch never holds more
+  than max_batch_bytes of row data, estimated from sampled rows
+
+Sizes chosen and throughput per kind are reported by summary().
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+from ..models.upload_result import BatchResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TARGET_BATCH_SECONDS = 2.0
+DEFAULT_MAX_BATCH_BYTES = 64 * 1024 * 1024
+
+# Rows serialized to estimate the size of a kind's rows
+_SAMPLE_ROWS = 8
+
+
+@dataclass
+class BatchSizeLimits:
+    """Envelope the batch sizes of one sizer stay within."""
+
+    initial_size: int
+    min_size: int = 1
+    max_size: Optional[int] = None  # Defaults to 10x initial_size
+    target_seconds: float = DEFAULT_TARGET_BATCH_SECONDS
+    max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES
+    increase_step: Optional[int] = None  # Defaults to a quarter of initial_size
+    decrease_factor: float = 0.5
+
+    def __post_init__(self):
+        self.min_size = max(1, min(self.min_size, self.initial_size))
+        if self.max_size is None:
+            self.max_size = self.initial_size * 10
+        self.max_size = max(self.max_size, self.initial_size)
+        if self.increase_step is None:
+            self.increase_step = max(1, self.initial_size // 4)
+
+
+@dataclass
+class _KindState:
+    """Batch size and running totals of one statement kind."""
+
+    size: float
+    bytes_per_row: float = 0.0
+    batches: int = 0
+    rows: int = 0
+    seconds: float = 0.0
+    failures: int = 0
+    decreases: int = 0
+    smallest: Optional[int] = None
+    largest: Optional[int] = None
+
+
+class AdaptiveBatchSizer:
+    """Chooses batch sizes per statement kind with additive increase, multiplicative decrease."""
+
+    def __init__(self, limits: BatchSizeLimits, adaptive: bool = True):
+        """
+        Initialize the sizer.
+
+        Args:
+            limits: Size, latency and memory envelope
+            adaptive: Whether to adjust sizes at all; a fixed sizer still reports throughput
+        """
+        self.limits = limits
+        self.adaptive = adaptive
+        self._kinds: Dict[str, _KindState] = {}
+
+    @classmethod
+    def fixed(cls, batch_size: int) -> "AdaptiveBatchSizer":
+        """Sizer that always chooses batch_size."""
+        return cls(BatchSizeLimits(initial_size=batch_size, min_size=batch_size, max_size=batch_size),
+                   adaptive=False)
+
+    def observe_rows(self, kind: str, rows: Iterable[Any]) -> None:
+        """Update the row size estimate of a kind from a sample of its rows (dicts or Cypher strings)."""
+        sample = []
+        for row in rows:
+            sample.append(row)
+            if len(sample) >= _SAMPLE_ROWS:
+                break
+        if not sample:
+            return
+
+        size = sum(
+            len(row) if isinstance(row, str) else len(json.dumps(row, default=str))
+            for row in sample
+        ) / len(sample)
+        state = self._state(kind)
+        state.bytes_per_row = max(state.bytes_per_row, size)
+
+    def next_size(self, kind: str) -> int:
+        """Batch size to use for the next batch of a kind."""
+        state = self._state(kind)
+        size = max(self.limits.min_size, min(self.limits.max_size, int(state.size)))
+        if state.bytes_per_row:
+            # The memory envelope wins over the minimum size
+            size = min(size, max(1, int(self.limits.max_batch_bytes // state.bytes_per_row)))
+        return size
+
+    def record(self, batch: BatchResult) -> None:
+        """
+        Adjust the kind's batch size from an executed batch.
+
+        Args:
+            batch: Result with statement_kind, batch_size (the size chosen),
+                commands_in_batch, execution_time_seconds and success
+        """
+        kind = batch.statement_kind or "default"
+        state = self._state(kind)
+        state.batches += 1
+        state.rows += batch.commands_in_batch
+        state.seconds += batch.execution_time_seconds
+        state.smallest = batch.batch_size if state.smallest is None else min(state.smallest, batch.batch_size)
+        state.largest = batch.batch_size if state.largest is None else max(state.largest, batch.batch_size)
+        if not batch.success:
+            state.failures += 1
+
+        if not self.adaptive:
+            return
+
+        limits = self.limits
+        over_target = batch.execution_time_seconds > limits.target_seconds
+        if not batch.success or over_target:
+            factor = limits.decrease_factor
+            if over_target and batch.execution_time_seconds > 0:
+                factor = min(factor, limits.target_seconds / batch.execution_time_seconds)
+            state.size = max(limits.min_size, min(state.size, batch.commands_in_batch) * factor)
+            state.decreases += 1
+            logger.debug(f"Batch size for {kind} decreased to {int(state.size)} "
+                         f"({batch.execution_time_seconds:.2f}s, success={batch.success})")
+        elif batch.commands_in_batch >= batch.batch_size:
+            # Only full batches show that the current size is comfortable
+            state.size = min(limits.max_size, state.size + limits.increase_step)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Sizes chosen and throughput per statement kind."""
+        return {
+            kind: {
+                "batch_size": self.next_size(kind),
+                "smallest_batch_size": state.smallest or 0,
+                "largest_batch_size": state.largest or 0,
+                "batches": state.batches,
+                "rows": state.rows,
+                "seconds": state.seconds,
+                "rows_per_second": state.rows / state.seconds if state.seconds > 0 else 0.0,
+                "failures": state.failures,
+                "decreases": state.decreases
+            }
+            for kind, state in self._kinds.items()
+        }
+
+    def _state(self, kind: str) -> _KindState:
+        state = self._kinds.get(kind)
+        if state is None:
+            state = self._kinds[kind] = _KindState(size=float(self.limits.initial_size))
+        return state
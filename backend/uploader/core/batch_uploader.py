@@ -2,23 +2,70 @@
 Batch Uploader for Neo4j - Optimized bulk upload operations
 
 Handles large-scale uploads with:
-- Memory-efficient streaming processing
+- UNWIND-based bulk writes of transformer tuple sets (the default), handed
+  over in-process or through framed tuple stream files
+- Memory-efficient streaming processing of literal Cypher files
+- Node and relationship batches written over several sessions at once
+- Batch sizes adapted per statement kind from observed latency and
+  failures (AIMD), within latency and memory limits
 - Progress tracking and reporting
 - Error recovery and partial upload support
+- Checkpoints after each committed batch of a Cypher file, so an
+  interrupted upload resumes after its last committed batch
+- Graph fingerprints invalidated before every write and recorded after
+  successful ones, so backups never trust a fingerprint of an older graph
 """
 
 import asyncio
+import json
 import logging
-from typing import List, Optional, AsyncIterator
+import re
+from typing import Any, AsyncIterable, Dict, Iterable, List, Optional, AsyncIterator, Tuple, Union
 from pathlib import Path
 from datetime import datetime
 
+from .graph_fingerprint import GraphFingerprinter
 from .neo4j_client import Neo4jClient
+from .upload_checkpoint import UploadCheckpoint
+from .batch_sizer import DEFAULT_TARGET_BATCH_SECONDS, AdaptiveBatchSizer, BatchSizeLimits
+from .bulk_writer import (
+    BulkWriter,
+    DEFAULT_ROWS_PER_BATCH,
+    TUPLE_STREAM_SUFFIX,
+    TupleBatch,
+    iter_tuple_stream
+)
 from ..services.validation_service import ValidationService
 from ..models.upload_result import UploadResult, BatchResult
 
 logger = logging.getLogger(__name__)
 
+# String literals, blanked before classifying so property values
+# (e.g. a method named 'delete_backup') are not taken for clauses
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_DELETE_CLAUSE = re.compile(r"(?:^|\s)(?:DETACH\s+)?DELETE\s+[\w`]", re.IGNORECASE)
+_NODE_WRITE = re.compile(r"^(?:MERGE|CREATE)\s*\(", re.IGNORECASE)
+
+
+def statement_kind(command: str) -> str:
+    """
+    Kind of a literal Cypher command that batch sizes are adapted per.
+    
+    Commands are classified by their clauses: deletes, relationship writes,
+    node writes, or else their leading keyword. Node writes are one kind
+    whatever their label, since the transformer interleaves Module, Class,
+    Function and Variable nodes and a batch ends where the kind changes.
+    """
+    text = _STRING_LITERAL.sub("''", command).strip()
+    if _DELETE_CLAUSE.search(text):
+        return "delete"
+    if "]->" in text or "<-[" in text:
+        return "relationship"
+    if _NODE_WRITE.match(text):
+        return "node"
+    keyword = text.split(None, 1)[0] if text else ""
+    return keyword.lower() or "empty"
+
 
 class BatchUploader:
     """Optimized batch uploader for Neo4j operations."""
@@ -27,27 +74,97 @@ class BatchUploader:
         self,
         neo4j_client: Neo4jClient,
         batch_size: int = 100,
-        max_memory_mb: int = 500
+        max_memory_mb: int = 500,
+        rows_per_batch: int = DEFAULT_ROWS_PER_BATCH,
+        namespace: Optional[str] = None,
+        adaptive_batches: bool = True,
+        target_batch_seconds: float = DEFAULT_TARGET_BATCH_SECONDS,
+        max_batch_size: Optional[int] = None,
+        max_rows_per_batch: Optional[int] = None,
+        upload_sessions: int = 1,
+        fingerprint_tracker: Optional[Any] = None,
+        track_fingerprints: bool = True
     ):
+        """
+        Initialize the uploader.
+        
+        Args:
+            neo4j_client: Client the uploads run on
+            batch_size: Initial commands per transaction for literal Cypher files
+            max_memory_mb: Most statement or row data held by one batch
+            rows_per_batch: Initial rows per UNWIND query for tuple uploads
+            namespace: Graph namespace to write into, if any
+            adaptive_batches: Adapt batch sizes per statement kind; otherwise they stay fixed
+            target_batch_seconds: Latency a batch should commit within
+            max_batch_size: Largest literal command batch (default 10x batch_size)
+            max_rows_per_batch: Largest UNWIND row batch (default 10x rows_per_batch)
+            upload_sessions: Sessions tuple uploads are written over concurrently
+            fingerprint_tracker: Registry of graph fingerprints (a DatabaseTracker);
+                the configured one if not given
+            track_fingerprints: Invalidate the graph's recorded fingerprint before
+                writing and record a new one after successful uploads
+        """
         self.neo4j_client = neo4j_client
         self.batch_size = batch_size
         self.max_memory_mb = max_memory_mb
+        self.namespace = namespace
+        self.fingerprint_tracker = fingerprint_tracker
+        self.track_fingerprints = track_fingerprints
+        
+        max_batch_bytes = max_memory_mb * 1024 * 1024
+        self.command_sizer = AdaptiveBatchSizer(
+            BatchSizeLimits(initial_size=batch_size, max_size=max_batch_size,
+                            target_seconds=target_batch_seconds, max_batch_bytes=max_batch_bytes),
+            adaptive=adaptive_batches
+        )
+        self.row_sizer = AdaptiveBatchSizer(
+            BatchSizeLimits(initial_size=rows_per_batch, max_size=max_rows_per_batch,
+                            target_seconds=target_batch_seconds, max_batch_bytes=max_batch_bytes),
+            adaptive=adaptive_batches
+        )
         
         # Services
         self.validator = ValidationService()
+        self.bulk_writer = BulkWriter(
+            neo4j_client, rows_per_batch=rows_per_batch, namespace=namespace, batch_sizer=self.row_sizer,
+            sessions=upload_sessions
+        )
     
     async def upload_from_file(
         self, 
         cypher_file_path: str, 
         job_id: str,
-        validate_before_upload: bool = True
+        validate_before_upload: bool = True,
+        checkpoint_path: Optional[str] = None,
+        resume: bool = False
     ) -> UploadResult:
-        """Upload Cypher commands from file with validation and progress tracking."""
+        """
+        Upload a transformer output file with validation and progress tracking.
+        
+        Tuple stream files (.tuplestream) and tuples files (.json) go
+        through the UNWIND bulk writer; any other file is treated as literal
+        Cypher commands and uploaded statement by statement. Literal Cypher
+        cannot be written into a namespace.
+        
+        With a checkpoint_path, a Cypher upload records its progress there
+        after each committed batch; with resume, it continues after the
+        checkpointed batch instead of starting over. Tuple uploads write
+        with MERGE throughout and are simply run again.
+        """
+        suffix = Path(cypher_file_path).suffix
+        if suffix == TUPLE_STREAM_SUFFIX:
+            return await self.upload_from_tuple_stream_file(cypher_file_path, job_id, validate_before_upload)
+        if suffix == ".json":
+            return await self.upload_from_tuples_file(cypher_file_path, job_id, validate_before_upload)
         
         result = UploadResult(job_id=job_id)
         result.cypher_file_path = cypher_file_path
         result.started_at = datetime.now()
         
+        if self.namespace:
+            result.add_error(f"Namespaced uploads need tuple input, not Cypher commands: {cypher_file_path}")
+            return result
+        
         try:
             cypher_path = Path(cypher_file_path)
             if not cypher_path.exists():
@@ -56,6 +173,18 @@ class BatchUploader:
             
             result.cypher_file_size_bytes = cypher_path.stat().st_size
             
+            checkpoint = None
+            if checkpoint_path:
+                checkpoint = self._open_checkpoint(Path(checkpoint_path), job_id, cypher_path, resume)
+                if checkpoint.batch_number:
+                    result.resumed_from_batch = checkpoint.batch_number
+                    result.total_commands_executed = checkpoint.commands_committed
+                if checkpoint.completed:
+                    logger.info(f"Upload of {cypher_file_path} already completed, nothing to resume")
+                    result.success = True
+                    result.completed_at = datetime.now()
+                    return result
+            
             # Validate file before upload
             if validate_before_upload:
                 validation_result = await self.validator.validate_cypher_file(cypher_file_path)
@@ -67,9 +196,20 @@ class BatchUploader:
                 result.estimated_nodes = validation_result.estimated_nodes
                 result.estimated_relationships = validation_result.estimated_relationships
             
+            # Relationship statements match endpoints on unique_key
+            schema_manager = self.bulk_writer.schema_manager
+            result.index_build_seconds = await schema_manager.ensure_labels(job_id=job_id)
+            result.schema_items_ensured = len(schema_manager.ensured)
+            
             # Stream and upload in batches
-            async for batch_result in self._stream_upload_batches(cypher_file_path, job_id):
+            await self._invalidate_fingerprint()
+            async for batch_result in self._stream_upload_batches(
+                cypher_file_path, job_id, checkpoint, Path(checkpoint_path) if checkpoint_path else None
+            ):
                 result.merge_batch_result(batch_result)
+            result.batch_sizing = self.command_sizer.summary()
+            if result.dead_lettered and self.neo4j_client.dead_letters:
+                result.dead_letter_path = str(self.neo4j_client.dead_letters.path)
             
             result.completed_at = datetime.now()
             if result.completed_at and result.started_at:
@@ -78,6 +218,10 @@ class BatchUploader:
             # Mark as successful if no errors
             if not result.has_errors:
                 result.success = True
+                if checkpoint:
+                    checkpoint.completed = True
+                    checkpoint.save(Path(checkpoint_path))
+                await self._record_fingerprint()
             
             return result
             
@@ -87,6 +231,120 @@ class BatchUploader:
             result.completed_at = datetime.now()
             return result
     
+    async def upload_from_tuples_file(
+        self,
+        tuples_file_path: str,
+        job_id: str,
+        validate_before_upload: bool = True
+    ) -> UploadResult:
+        """Upload a transformer tuples file (tuples_<job_id>.json) with UNWIND bulk writes."""
+        
+        result = UploadResult(job_id=job_id)
+        result.cypher_file_path = tuples_file_path
+        result.started_at = datetime.now()
+        
+        try:
+            tuples_path = Path(tuples_file_path)
+            if not tuples_path.exists():
+                result.add_error(f"Tuples file not found: {tuples_file_path}")
+                return result
+            
+            result.cypher_file_size_bytes = tuples_path.stat().st_size
+            
+            if validate_before_upload:
+                validation_result = await self.validator.validate_tuples_file(tuples_file_path)
+                if not validation_result.is_valid:
+                    result.add_error(f"Validation failed: {', '.join(validation_result.errors)}")
+                    return result
+                
+                result.estimated_nodes = validation_result.estimated_nodes
+                result.estimated_relationships = validation_result.estimated_relationships
+            
+            with open(tuples_path, 'r', encoding='utf-8') as f:
+                tuple_data = json.load(f)
+            
+            upload_result = await self.upload_tuple_set(tuple_data, job_id)
+            upload_result.cypher_file_path = result.cypher_file_path
+            upload_result.cypher_file_size_bytes = result.cypher_file_size_bytes
+            upload_result.estimated_nodes = result.estimated_nodes
+            upload_result.estimated_relationships = result.estimated_relationships
+            upload_result.started_at = result.started_at
+            return upload_result
+            
+        except Exception as e:
+            logger.error(f"Upload from tuples file failed: {e}")
+            result.add_error(str(e))
+            result.completed_at = datetime.now()
+            return result
+    
+    async def upload_from_tuple_stream_file(
+        self,
+        stream_file_path: str,
+        job_id: str,
+        validate_before_upload: bool = True
+    ) -> UploadResult:
+        """Upload a framed tuple stream file frame by frame with UNWIND bulk writes."""
+        
+        result = UploadResult(job_id=job_id)
+        result.cypher_file_path = stream_file_path
+        result.started_at = datetime.now()
+        
+        stream_path = Path(stream_file_path)
+        if not stream_path.exists():
+            result.add_error(f"Tuple stream file not found: {stream_file_path}")
+            return result
+        
+        result.cypher_file_size_bytes = stream_path.stat().st_size
+        
+        if validate_before_upload:
+            validation_result = await self.validator.validate_tuple_stream_file(stream_file_path)
+            if not validation_result.is_valid:
+                result.add_error(f"Validation failed: {', '.join(validation_result.errors)}")
+                return result
+        
+        upload_result = await self.upload_tuple_stream(iter_tuple_stream(stream_path), job_id)
+        upload_result.cypher_file_path = result.cypher_file_path
+        upload_result.cypher_file_size_bytes = result.cypher_file_size_bytes
+        return upload_result
+    
+    async def upload_tuple_set(
+        self,
+        tuple_data: Dict[str, Any],
+        job_id: str
+    ) -> UploadResult:
+        """Upload a serialized tuple set (TupleSet.to_dict output) with UNWIND bulk writes."""
+        return await self.upload_tuple_stream([tuple_data], job_id)
+    
+    async def upload_tuple_stream(
+        self,
+        batches: Union[Iterable[TupleBatch], AsyncIterable[TupleBatch]],
+        job_id: str
+    ) -> UploadResult:
+        """
+        Upload TupleSet batches as they are produced.
+        
+        This is the in-process handoff from the transformer: pass
+        TransformationOrchestrator.stream_transform(...) directly, and no
+        Cypher text or intermediate file is generated.
+        """
+        
+        started_at = datetime.now()
+        
+        try:
+            await self._invalidate_fingerprint()
+            result = await self.bulk_writer.write_stream(batches, job_id)
+            if result.success:
+                await self._record_fingerprint()
+        except Exception as e:
+            logger.error(f"Bulk upload failed: {e}")
+            result = UploadResult(job_id=job_id)
+            result.add_error(str(e))
+        
+        result.started_at = started_at
+        result.completed_at = datetime.now()
+        result.upload_duration_seconds = (result.completed_at - started_at).total_seconds()
+        return result
+    
     async def upload_from_commands(
         self,
         cypher_commands: List[str],
@@ -100,6 +358,7 @@ class BatchUploader:
         
         try:
             # Process in batches
+            await self._invalidate_fingerprint()
             for i in range(0, len(cypher_commands), self.batch_size):
                 batch = cypher_commands[i:i + self.batch_size]
                 
@@ -118,6 +377,7 @@ class BatchUploader:
             # Mark as successful if no errors
             if not result.has_errors:
                 result.success = True
+                await self._record_fingerprint()
             
             return result
             
@@ -127,52 +387,141 @@ class BatchUploader:
             result.completed_at = datetime.now()
             return result
     
+    def _get_fingerprint_tracker(self) -> Optional[Any]:
+        """The fingerprint registry, created from the settings on first use; None if unavailable."""
+        if self.fingerprint_tracker is None and self.track_fingerprints:
+            try:
+                from neo4j_manager import DatabaseTracker
+                self.fingerprint_tracker = DatabaseTracker()
+            except Exception as e:
+                logger.warning(f"Graph fingerprint registry unavailable, not tracking fingerprints: {e}")
+                self.track_fingerprints = False
+        return self.fingerprint_tracker if self.track_fingerprints else None
+    
+    async def _invalidate_fingerprint(self) -> None:
+        """Forget the recorded fingerprint of the graph (or namespace) about to be written."""
+        tracker = self._get_fingerprint_tracker()
+        if tracker is None:
+            return
+        try:
+            await tracker.invalidate_graph_fingerprint(self.namespace)
+        except Exception as e:
+            logger.warning(f"Could not invalidate the graph fingerprint: {e}")
+    
+    async def _record_fingerprint(self) -> None:
+        """Record the fingerprint of the graph (or namespace) just written, so unchanged graphs skip backups."""
+        tracker = self._get_fingerprint_tracker()
+        if tracker is None:
+            return
+        try:
+            fingerprint = await GraphFingerprinter(self.neo4j_client).fingerprint(self.namespace)
+            await tracker.record_graph_fingerprint(fingerprint.to_dict())
+        except Exception as e:
+            logger.warning(f"Could not record the graph fingerprint: {e}")
+    
+    def _open_checkpoint(
+        self,
+        checkpoint_path: Path,
+        job_id: str,
+        cypher_path: Path,
+        resume: bool
+    ) -> UploadCheckpoint:
+        """Load the checkpoint to resume from, or start a new one; raises ValueError if it does not match."""
+        if resume:
+            checkpoint = UploadCheckpoint.load(checkpoint_path)
+            if checkpoint:
+                checkpoint.verify(job_id, cypher_path)
+                logger.info(f"Resuming {cypher_path} after batch {checkpoint.batch_number} "
+                            f"(byte {checkpoint.byte_offset} of {checkpoint.input_size_bytes})")
+                return checkpoint
+            logger.warning(f"No checkpoint at {checkpoint_path}, uploading {cypher_path} from the start")
+        
+        checkpoint = UploadCheckpoint.start(job_id, cypher_path)
+        checkpoint.save(checkpoint_path)
+        return checkpoint
+    
     async def _stream_upload_batches(
         self, 
         cypher_file_path: str, 
-        job_id: str
+        job_id: str,
+        checkpoint: Optional[UploadCheckpoint] = None,
+        checkpoint_path: Optional[Path] = None
     ) -> AsyncIterator[BatchResult]:
-        """Stream Cypher commands from file and upload in batches."""
+        """
+        Stream Cypher commands from file and upload in batches.
         
-        current_batch = []
-        batch_number = 1
+        A batch holds commands of one statement kind (node writes of any
+        label share one); its size is chosen by the command sizer when the
+        batch is started. With a checkpoint, the
+        file is read from its byte offset and the checkpoint advances past
+        each committed batch until a batch fails, so a resume replays it.
+        """
         
-        async for command in self._stream_cypher_commands(cypher_file_path):
-            current_batch.append(command)
+        current_batch: List[str] = []
+        current_kind = None
+        current_size = self.batch_size
+        batch_start = start_offset = checkpoint.byte_offset if checkpoint else 0
+        batch_end = start_offset
+        batch_number = checkpoint.batch_number + 1 if checkpoint else 1
+        checkpointing = checkpoint is not None
+        
+        async def upload() -> BatchResult:
+            nonlocal checkpointing
+            batch_result = await self._upload_single_batch(
+                current_batch, batch_number, job_id, current_kind, current_size
+            )
+            if checkpointing and batch_result.success:
+                checkpoint.advance(Path(cypher_file_path), batch_number, batch_start, batch_end,
+                                   batch_result.commands_in_batch - batch_result.dead_lettered)
+                checkpoint.save(checkpoint_path)
+            else:
+                checkpointing = False
+            return batch_result
+        
+        async for command, command_start, command_end in self._stream_cypher_commands(cypher_file_path, start_offset):
+            kind = statement_kind(command)
             
-            if len(current_batch) >= self.batch_size:
+            if current_batch and (kind != current_kind or len(current_batch) >= current_size):
                 # Upload current batch
-                batch_result = await self._upload_single_batch(
-                    current_batch, 
-                    batch_number, 
-                    job_id
-                )
-                yield batch_result
+                yield await upload()
                 
                 # Reset for next batch
                 current_batch = []
                 batch_number += 1
+            
+            if not current_batch:
+                current_kind = kind
+                batch_start = command_start
+                self.command_sizer.observe_rows(kind, [command])
+                current_size = self.command_sizer.next_size(kind)
+            current_batch.append(command)
+            batch_end = command_end
         
         # Upload final batch if it has commands
         if current_batch:
-            batch_result = await self._upload_single_batch(
-                current_batch, 
-                batch_number, 
-                job_id
-            )
-            yield batch_result
+            yield await upload()
     
     async def _stream_cypher_commands(
         self, 
-        cypher_file_path: str
-    ) -> AsyncIterator[str]:
-        """Stream Cypher commands from file for memory-efficient processing."""
+        cypher_file_path: str,
+        start_offset: int = 0
+    ) -> AsyncIterator[Tuple[str, int, int]]:
+        """
+        Stream Cypher commands from file for memory-efficient processing.
         
-        with open(cypher_file_path, 'r', encoding='utf-8') as f:
+        Yields each command with the byte range it was read from: from the
+        end of the previous command (including comments in between) to the
+        end of its own last line.
+        """
+        
+        with open(cypher_file_path, 'rb') as f:
+            f.seek(start_offset)
+            offset = command_start = start_offset
             current_command = []
             
-            for line in f:
-                line = line.strip()
+            for raw_line in f:
+                offset += len(raw_line)
+                line = raw_line.decode('utf-8').strip()
                 
                 # Skip empty lines and comments
                 if not line or line.startswith('//'):
@@ -183,26 +532,31 @@ class BatchUploader:
                 # Check if command is complete (ends with semicolon)
                 if line.endswith(';'):
                     command = ' '.join(current_command)
-                    yield command
+                    yield command, command_start, offset
+                    command_start = offset
                     current_command = []
             
             # Handle final command without semicolon
             if current_command:
                 command = ' '.join(current_command)
                 if command.strip():
-                    yield command
+                    yield command, command_start, offset
     
     async def _upload_single_batch(
         self, 
         batch_commands: List[str], 
         batch_number: int, 
-        job_id: str
+        job_id: str,
+        kind: Optional[str] = None,
+        batch_size: Optional[int] = None
     ) -> BatchResult:
-        """Upload a single batch with detailed result tracking."""
+        """Upload a single batch with detailed result tracking, and feed its latency to the command sizer."""
         
         batch_result = BatchResult(
             batch_number=batch_number,
             job_id=job_id,
+            statement_kind=kind,
+            batch_size=batch_size or len(batch_commands),
             commands_in_batch=len(batch_commands)
         )
         
@@ -220,6 +574,7 @@ class BatchUploader:
             batch_result.relationships_created = upload_result.relationships_created
             batch_result.properties_set = upload_result.properties_set
             batch_result.errors.extend(upload_result.errors)
+            batch_result.dead_lettered = upload_result.dead_lettered
             
             batch_result.success = not upload_result.has_errors
             
@@ -229,8 +584,10 @@ class BatchUploader:
             batch_result.success = False
         
         batch_result.execution_time_seconds = (datetime.now() - start_time).total_seconds()
+        self.command_sizer.record(batch_result)
         
-        logger.info(f"Batch {batch_number}: {batch_result.commands_in_batch} commands, "
+        logger.info(f"Batch {batch_number} ({kind}, size {batch_result.batch_size}): "
+                   f"{batch_result.commands_in_batch} commands, "
                    f"{batch_result.nodes_created} nodes, {batch_result.relationships_created} relationships, "
                    f"{batch_result.execution_time_seconds:.2f}s")
         
@@ -0,0 +1,645 @@
+"""
+Bulk Writer for Neo4j - UNWIND-based parameterized ingestion
+
+Uploads transformer tuple sets (tuples_<job_id>.json, framed tuple stream
+files or TupleSet batches handed over in-process) without generating a
+Cypher statement per node or relationship:
+- Nodes are grouped by label and merge keys, relationships by type, endpoint
+  labels and property keys
+- Each group is sent as a single `UNWIND $rows AS row MERGE ...` query with
+  parameter lists of a few thousand rows, so Neo4j plans each query shape
+  once and serves the rest from its query cache
+- Rows per query can be adapted per statement kind by an
+  AdaptiveBatchSizer, from the latency and failures of earlier queries
+- The indexes and constraints those queries rely on are created by the
+  SchemaManager before the first nodes of a label are written
+- Batches can be written over several sessions at once. Rows are
+  partitioned by a hash of their node key, so concurrent transactions never
+  merge the same nodes, and relationship batches start as soon as the
+  labels of their endpoints are loaded
+- Throughput is reported as nodes and relationships per second, index
+  build time separately
+- Optionally every node is written into a namespace (a `namespace`
+  property that is part of each MERGE and MATCH pattern), so the graphs of
+  independent jobs can share one database without clearing each other
+"""
+
+import asyncio
+import json
+import logging
+import struct
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .batch_sizer import AdaptiveBatchSizer
+from .neo4j_client import Neo4jClient
+from .schema_manager import NAMESPACE_PROPERTY, SchemaManager
+from ..models.upload_result import BatchResult, UploadResult
+
+logger = logging.getLogger(__name__)
+
+# Labels of nodes owned by a module through their module_path property
+# (mirrors MODULE_CHILD_LABELS in the transformer's Neo4jFormatter)
+MODULE_CHILD_LABELS = ["Class", "Function", "Method", "Variable"]
+
+DEFAULT_ROWS_PER_BATCH = 2000
+DEFAULT_UPLOAD_SESSIONS = 4
+
+# Framed tuple stream format written by the transformer's TupleStreamWriter
+TUPLE_STREAM_MAGIC = b"NTS2\n"
+TUPLE_STREAM_SUFFIX = ".tuplestream"
+
+_FRAME_HEADER = struct.Struct(">I")
+# Frame header value announcing the trailer: frame, node and relationship counts
+_TRAILER_MARKER = 0xFFFFFFFF
+_TRAILER = struct.Struct(">QQQ")
+
+# A tuple set batch: TupleSet.to_dict() output or any object providing to_dict()
+TupleBatch = Union[Dict[str, Any], Any]
+
+
+@dataclass
+class UnwindBatch:
+    """A parameterized UNWIND query and the rows it is executed with."""
+
+    query: str
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    parameters: Dict[str, Any] = field(default_factory=dict)  # Passed alongside $rows
+    kind: str = "unwind"  # Statement kind batch sizes are adapted per, e.g. node:Module
+    label: Optional[str] = None  # Label a node batch writes
+    endpoint_labels: Tuple[Optional[str], ...] = ()  # Labels a relationship batch matches; None is any label
+
+    def chunks(self, size: int) -> Iterable[List[Dict[str, Any]]]:
+        """Yield the rows in chunks of at most size rows."""
+        for start in range(0, len(self.rows), size):
+            yield self.rows[start:start + size]
+
+
+def read_tuple_stream_trailer(stream_file: Path) -> Dict[str, int]:
+    """
+    Read the counts recorded in a tuple stream's trailer without reading its frames.
+
+    Args:
+        stream_file: Path of a file written by TupleStreamWriter
+
+    Returns:
+        Dict with frames, nodes and relationships counts
+
+    Raises:
+        ValueError: If the file is not a tuple stream or has no trailer
+    """
+    trailer_size = _FRAME_HEADER.size + _TRAILER.size
+    with open(stream_file, "rb") as f:
+        if f.read(len(TUPLE_STREAM_MAGIC)) != TUPLE_STREAM_MAGIC:
+            raise ValueError(f"Not a tuple stream file: {stream_file}")
+        size = f.seek(0, 2)
+        if size < len(TUPLE_STREAM_MAGIC) + trailer_size:
+            raise ValueError(f"Truncated tuple stream, no end marker in {stream_file}")
+        f.seek(size - trailer_size)
+        data = f.read(trailer_size)
+
+    (marker,) = _FRAME_HEADER.unpack(data[:_FRAME_HEADER.size])
+    if marker != _TRAILER_MARKER:
+        raise ValueError(f"Truncated tuple stream, no end marker in {stream_file}")
+    frames, nodes, relationships = _TRAILER.unpack(data[_FRAME_HEADER.size:])
+    return {"frames": frames, "nodes": nodes, "relationships": relationships}
+
+
+def iter_tuple_stream(stream_file: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Read the frames of a tuple stream file one at a time.
+
+    The stream must end with the writer's trailer, and the frame, node and
+    relationship counts read must match it; a stream cut short between
+    frames is rejected instead of being taken as complete.
+
+    Args:
+        stream_file: Path of a file written by TupleStreamWriter
+
+    Yields:
+        Serialized tuple set batches
+
+    Raises:
+        ValueError: If the file is not a tuple stream, is truncated or does
+            not match its trailer
+    """
+    frames = nodes = relationships = 0
+    with open(stream_file, "rb") as f:
+        if f.read(len(TUPLE_STREAM_MAGIC)) != TUPLE_STREAM_MAGIC:
+            raise ValueError(f"Not a tuple stream file: {stream_file}")
+
+        while True:
+            header = f.read(_FRAME_HEADER.size)
+            if not header:
+                raise ValueError(f"Truncated tuple stream, no end marker in {stream_file}")
+            if len(header) < _FRAME_HEADER.size:
+                raise ValueError(f"Truncated frame header in {stream_file}")
+
+            (length,) = _FRAME_HEADER.unpack(header)
+            if length == _TRAILER_MARKER:
+                break
+            payload = f.read(length)
+            if len(payload) < length:
+                raise ValueError(f"Truncated frame in {stream_file}")
+            frame = json.loads(payload)
+            frames += 1
+            nodes += len(frame.get("nodes", ()))
+            relationships += len(frame.get("relationships", ()))
+            yield frame
+
+        trailer = f.read(_TRAILER.size)
+        if len(trailer) < _TRAILER.size:
+            raise ValueError(f"Truncated end marker in {stream_file}")
+        if _TRAILER.unpack(trailer) != (frames, nodes, relationships):
+            raise ValueError(f"Tuple stream {stream_file} does not match its end marker "
+                             f"(read {frames} frames, {nodes} nodes, {relationships} relationships)")
+        if f.read(1):
+            raise ValueError(f"Unexpected data after the end marker in {stream_file}")
+
+
+async def _iterate(batches: Union[Iterable[TupleBatch], AsyncIterable[TupleBatch]]) -> AsyncIterator[TupleBatch]:
+    """Iterate sync and async batch sources alike."""
+    if hasattr(batches, "__aiter__"):
+        async for batch in batches:
+            yield batch
+    else:
+        for batch in batches:
+            yield batch
+
+
+async def _gather_or_cancel(*coroutines: Any) -> List[Any]:
+    """Run coroutines concurrently; if one fails, cancel the others instead of leaving them waiting."""
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+def _quote(identifier: str) -> str:
+    """Quote a label or relationship type for use in a query."""
+    return "`" + identifier.replace("`", "``") + "`"
+
+
+def _namespace_parameters(namespace: Optional[str]) -> Dict[str, Any]:
+    """Query parameters of a batch written into namespace."""
+    return {NAMESPACE_PROPERTY: namespace} if namespace else {}
+
+
+def _namespace_pattern(namespace: Optional[str]) -> str:
+    """Pattern entry restricting a node to the namespace, if any."""
+    return f"{NAMESPACE_PROPERTY}: ${NAMESPACE_PROPERTY}, " if namespace else ""
+
+
+def _present_keys(properties: Dict[str, Any], keys: Iterable[str]) -> Tuple[str, ...]:
+    """Return the sorted keys that have a non-null value (MERGE rejects nulls)."""
+    return tuple(sorted(k for k in keys if properties.get(k) is not None))
+
+
+def build_node_batches(nodes: Iterable[Dict[str, Any]], namespace: Optional[str] = None) -> List[UnwindBatch]:
+    """
+    Group serialized node tuples into UNWIND batches.
+
+    Nodes are merged on their merge properties (falling back to unique_key
+    like Neo4jFormatter does) and get unique_key set, which relationship
+    batches match on.
+
+    Args:
+        nodes: Node dictionaries as produced by Neo4jNodeTuple.to_cypher_params
+        namespace: Graph namespace to merge the nodes into, if any
+
+    Returns:
+        One batch per (label, merge keys) group
+    """
+    groups: Dict[Tuple[str, Tuple[str, ...]], UnwindBatch] = {}
+
+    for node in nodes:
+        properties = node.get("properties") or {}
+        merge_keys = _present_keys(properties, node.get("merge_properties") or ())
+        group_key = (node["label"], merge_keys)
+
+        batch = groups.get(group_key)
+        if batch is None:
+            if merge_keys:
+                merge_clause = ", ".join(f"{_quote(k)}: row.properties.{_quote(k)}" for k in merge_keys)
+            else:
+                merge_clause = "unique_key: row.unique_key"
+            batch = UnwindBatch(
+                query=(
+                    "UNWIND $rows AS row\n"
+                    f"MERGE (n:{_quote(node['label'])} {{{_namespace_pattern(namespace)}{merge_clause}}})\n"
+                    "SET n += row.properties, n.unique_key = row.unique_key"
+                ),
+                parameters=_namespace_parameters(namespace),
+                kind=f"node:{node['label']}",
+                label=node["label"]
+            )
+            groups[group_key] = batch
+
+        batch.rows.append({"unique_key": node["unique_key"], "properties": properties})
+
+    return list(groups.values())
+
+
+def build_relationship_batches(
+    relationships: Iterable[Dict[str, Any]],
+    namespace: Optional[str] = None
+) -> List[UnwindBatch]:
+    """
+    Group serialized relationship tuples into UNWIND batches.
+
+    Relationship properties are part of the MERGE pattern, as in
+    Neo4jFormatter, so relationships that differ only in their properties
+    (e.g. two imports on different lines) stay distinct.
+
+    Args:
+        relationships: Relationship dictionaries as produced by
+            Neo4jRelationshipTuple.to_cypher_params
+        namespace: Graph namespace both endpoints are matched in, if any
+
+    Returns:
+        One batch per (type, source label, target label, property keys) group
+    """
+    groups: Dict[Tuple[str, Optional[str], Optional[str], Tuple[str, ...]], UnwindBatch] = {}
+
+    for relationship in relationships:
+        properties = relationship.get("properties") or {}
+        property_keys = _present_keys(properties, properties)
+        source_label = relationship.get("source_label")
+        target_label = relationship.get("target_label")
+        group_key = (relationship["relationship_type"], source_label, target_label, property_keys)
+
+        batch = groups.get(group_key)
+        if batch is None:
+            source = f"source:{_quote(source_label)}" if source_label else "source"
+            target = f"target:{_quote(target_label)}" if target_label else "target"
+            rel_props = ""
+            if property_keys:
+                rel_props = " {" + ", ".join(f"{_quote(k)}: row.properties.{_quote(k)}" for k in property_keys) + "}"
+            scope = _namespace_pattern(namespace)
+            batch = UnwindBatch(
+                query=(
+                    "UNWIND $rows AS row\n"
+                    f"MATCH ({source} {{{scope}unique_key: row.source_key}})\n"
+                    f"MATCH ({target} {{{scope}unique_key: row.target_key}})\n"
+                    f"MERGE (source)-[r:{_quote(relationship['relationship_type'])}{rel_props}]->(target)"
+                ),
+                parameters=_namespace_parameters(namespace),
+                kind=f"relationship:{relationship['relationship_type']}",
+                endpoint_labels=(source_label, target_label)
+            )
+            groups[group_key] = batch
+
+        batch.rows.append({
+            "source_key": relationship["source_key"],
+            "target_key": relationship["target_key"],
+            "properties": {k: properties[k] for k in property_keys}
+        })
+
+    return list(groups.values())
+
+
+def partition_batch(batch: UnwindBatch, partitions: int, key: str) -> List[UnwindBatch]:
+    """
+    Split a batch's rows into partitions by a stable hash of row[key].
+
+    Rows of the same node always land in the same partition, so partitions
+    written concurrently never lock the same nodes.
+
+    Args:
+        batch: Batch to split
+        partitions: Number of partitions; partition i is written by session i
+        key: Row field identifying the node, e.g. unique_key or source_key
+
+    Returns:
+        partitions batches, some possibly without rows
+    """
+    if partitions <= 1:
+        return [batch]
+
+    parts = [
+        UnwindBatch(query=batch.query, parameters=batch.parameters, kind=batch.kind,
+                    label=batch.label, endpoint_labels=batch.endpoint_labels)
+        for _ in range(partitions)
+    ]
+    for row in batch.rows:
+        parts[zlib.crc32(str(row[key]).encode("utf-8")) % partitions].rows.append(row)
+    return parts
+
+
+class _LoadedLabels:
+    """Node labels with writes outstanding, so relationship batches can wait for their endpoints."""
+
+    def __init__(self):
+        self._pending: Dict[str, int] = {}
+        self._events: Dict[str, asyncio.Event] = {}
+
+    def started(self, labels: Iterable[str]) -> None:
+        """Note node batches of labels that are scheduled but not yet written, one label per batch."""
+        for label in labels:
+            self._pending[label] = self._pending.get(label, 0) + 1
+            self._events.setdefault(label, asyncio.Event()).clear()
+
+    def finished(self, label: str) -> None:
+        self._pending[label] -= 1
+        if not self._pending[label]:
+            self._events[label].set()
+
+    async def wait(self, labels: Iterable[Optional[str]]) -> None:
+        """Wait until every node batch of labels is written; None stands for any label."""
+        labels = list(labels)
+        if not labels or None in labels:
+            events = list(self._events.values())
+        else:
+            events = [self._events[label] for label in labels if label in self._events]
+        for event in events:
+            await event.wait()
+
+
+def build_stale_module_batches(
+    replaced_modules: Iterable[str],
+    deleted_modules: Iterable[str],
+    namespace: Optional[str] = None
+) -> List[UnwindBatch]:
+    """
+    Build the batches deleting stale module subgraphs of a delta upload.
+
+    Same semantics as Neo4jFormatter: replaced modules keep their Module
+    node and only lose their contents and outgoing relationships, deleted
+    modules are removed entirely. With a namespace, only that namespace's
+    subgraphs are touched.
+    """
+    replaced = [{"module_path": path} for path in replaced_modules]
+    deleted = [{"module_path": path} for path in deleted_modules]
+    stale = replaced + deleted
+    if not stale:
+        return []
+
+    scope = _namespace_pattern(namespace)
+    parameters = _namespace_parameters(namespace)
+    batches = [
+        UnwindBatch(
+            query=f"UNWIND $rows AS row\nMATCH (n:{label} {{{scope}module_path: row.module_path}})\nDETACH DELETE n",
+            rows=stale,
+            parameters=parameters,
+            kind=f"delete:{label}"
+        )
+        for label in MODULE_CHILD_LABELS
+    ]
+    if replaced:
+        batches.append(UnwindBatch(
+            query=f"UNWIND $rows AS row\nMATCH (m:Module {{{scope}path: row.module_path}})-[r]->()\nDELETE r",
+            rows=replaced,
+            parameters=parameters,
+            kind="delete:module_relationships"
+        ))
+    if deleted:
+        batches.append(UnwindBatch(
+            query=f"UNWIND $rows AS row\nMATCH (m:Module {{{scope}path: row.module_path}})\nDETACH DELETE m",
+            rows=deleted,
+            parameters=parameters,
+            kind="delete:Module"
+        ))
+    return batches
+
+
+class BulkWriter:
+    """Writes tuple sets to Neo4j with grouped UNWIND queries."""
+
+    def __init__(
+        self,
+        neo4j_client: Neo4jClient,
+        rows_per_batch: int = DEFAULT_ROWS_PER_BATCH,
+        namespace: Optional[str] = None,
+        batch_sizer: Optional[AdaptiveBatchSizer] = None,
+        sessions: int = 1
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            neo4j_client: Client the UNWIND queries run on
+            rows_per_batch: Rows per query when no batch_sizer is given
+            namespace: Graph namespace to write into, if any
+            batch_sizer: Chooses rows per query per statement kind; defaults to a fixed rows_per_batch
+            sessions: Sessions node and relationship batches are written over concurrently
+        """
+        self.neo4j_client = neo4j_client
+        self.rows_per_batch = rows_per_batch
+        self.namespace = namespace
+        self.schema_manager = SchemaManager(neo4j_client, namespace)
+        self.batch_sizer = batch_sizer or AdaptiveBatchSizer.fixed(rows_per_batch)
+        self.sessions = max(1, sessions)
+        self._session_slots: Optional[asyncio.Semaphore] = None
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+    async def write(self, tuple_data: Dict[str, Any], job_id: str) -> UploadResult:
+        """
+        Write a serialized tuple set (TupleSet.to_dict output) to Neo4j.
+
+        Args:
+            tuple_data: Serialized tuple set
+            job_id: Job identifier
+
+        Returns:
+            UploadResult with counters and throughput
+        """
+        return await self.write_stream([tuple_data], job_id)
+
+    async def write_stream(
+        self,
+        batches: Union[Iterable[TupleBatch], AsyncIterable[TupleBatch]],
+        job_id: str
+    ) -> UploadResult:
+        """
+        Write a stream of tuple set batches to Neo4j.
+
+        Each batch has its stale module subgraphs deleted, the schema for its
+        labels ensured and its nodes merged as soon as it arrives. Relationships are held back until
+        every batch's nodes are written, since they may point at nodes of
+        later batches (e.g. imports of modules transformed further on).
+        Throughput only counts time spent writing, not waiting for batches.
+
+        Nodes and relationships are partitioned by key over the writer's
+        sessions. While one batch's nodes are written, the next batch is
+        already being read, and a relationship batch starts once the
+        nodes of its endpoint labels are written.
+
+        Args:
+            batches: TupleSet objects or their to_dict() output, sync or async
+            job_id: Job identifier
+
+        Returns:
+            UploadResult with counters and throughput
+        """
+        result = UploadResult(job_id=job_id, upload_sessions=self.sessions)
+        relationships: List[Dict[str, Any]] = []
+        node_count = 0
+        node_seconds = 0.0
+        index_seconds = 0.0
+        batch_count = 0
+        loaded = _LoadedLabels()
+        node_phase: Optional[asyncio.Future] = None
+        # Node and relationship lanes overlap; together they never exceed the sessions
+        self._session_slots = asyncio.Semaphore(self.sessions)
+        self._peak_in_flight = 0
+
+        try:
+            async for batch in _iterate(batches):
+                tuple_data = batch if isinstance(batch, dict) else batch.to_dict()
+                batch_count += 1
+
+                # The previous batch's nodes are written before this batch deletes stale subgraphs
+                if node_phase is not None:
+                    node_seconds += await node_phase
+                    node_phase = None
+
+                stale_batches = build_stale_module_batches(
+                    tuple_data.get("replaced_modules", []),
+                    tuple_data.get("deleted_modules", []),
+                    self.namespace
+                )
+                nodes = tuple_data.get("nodes", [])
+                # Stale module deletes match by module_path, which needs its own index
+                index_seconds += await self.schema_manager.ensure_nodes(
+                    nodes, job_id, MODULE_CHILD_LABELS if stale_batches else ()
+                )
+                await self._run_batches(stale_batches, result, job_id)
+
+                node_lanes = self._lanes(build_node_batches(nodes, self.namespace), "unique_key")
+                loaded.started(part.label for lane in node_lanes for part in lane)
+                node_phase = asyncio.ensure_future(self._run_sessions(node_lanes, result, job_id, loaded))
+                node_count += len(nodes)
+
+                relationships.extend(tuple_data.get("relationships", []))
+
+            relationship_batches = build_relationship_batches(relationships, self.namespace)
+            relationship_phase = self._run_sessions(
+                self._lanes(relationship_batches, "source_key"), result, job_id, loaded
+            )
+            if node_phase is not None:
+                last_node_seconds, relationship_seconds = await _gather_or_cancel(node_phase, relationship_phase)
+                node_seconds += last_node_seconds
+            else:
+                relationship_seconds = await relationship_phase
+        finally:
+            if node_phase is not None:
+                node_phase.cancel()
+
+        result.index_build_seconds = index_seconds
+        result.schema_items_ensured = len(self.schema_manager.ensured)
+        result.batch_sizing = self.batch_sizer.summary()
+        result.peak_concurrent_batches = self._peak_in_flight
+        if node_seconds > 0:
+            result.nodes_per_second = node_count / node_seconds
+        if relationship_seconds > 0:
+            result.relationships_per_second = len(relationships) / relationship_seconds
+
+        logger.info(f"Bulk upload of {batch_count} batches: {node_count} nodes "
+                    f"({result.nodes_per_second:.0f}/s), {len(relationships)} relationships in "
+                    f"{len(relationship_batches)} groups ({result.relationships_per_second:.0f}/s), "
+                    f"{index_seconds:.2f}s building indexes, {self.sessions} sessions "
+                    f"(peak {self._peak_in_flight} in flight, {result.deadlock_retries} deadlock retries)")
+
+        if not result.has_errors:
+            result.success = True
+        return result
+
+    async def _run_batches(self, batches: List[UnwindBatch], result: UploadResult, job_id: str) -> float:
+        """Execute batches one after the other; returns the elapsed seconds."""
+        start = time.perf_counter()
+        for batch in batches:
+            await self._run_chunks(batch, result, job_id)
+        return time.perf_counter() - start
+
+    def _lanes(self, batches: List[UnwindBatch], key: str) -> List[List[UnwindBatch]]:
+        """Partition batches by row[key] into one lane per session; lane i holds partition i of each batch."""
+        lanes: List[List[UnwindBatch]] = [[] for _ in range(self.sessions)]
+        for batch in batches:
+            for lane, part in zip(lanes, partition_batch(batch, self.sessions, key)):
+                lane.append(part)
+        return lanes
+
+    async def _run_sessions(
+        self,
+        lanes: List[List[UnwindBatch]],
+        result: UploadResult,
+        job_id: str,
+        loaded: _LoadedLabels
+    ) -> float:
+        """
+        Execute lanes concurrently, each lane's batches in order.
+
+        Node batches report their label as written to loaded; relationship
+        batches wait there for their endpoint labels.
+
+        Returns:
+            Seconds from the first write starting to the last one finishing
+        """
+        spans = await _gather_or_cancel(*(self._run_lane(lane, result, job_id, loaded) for lane in lanes))
+        starts = [start for start, _ in spans if start is not None]
+        ends = [end for _, end in spans if end is not None]
+        return max(ends) - min(starts) if starts else 0.0
+
+    async def _run_lane(
+        self,
+        lane: List[UnwindBatch],
+        result: UploadResult,
+        job_id: str,
+        loaded: _LoadedLabels
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """Execute one session's partitions in order; returns when its writes started and ended."""
+        start = end = None
+        for batch in lane:
+            try:
+                if batch.label is None:
+                    await loaded.wait(batch.endpoint_labels)
+                if batch.rows:
+                    start = start or time.perf_counter()
+                    await self._run_chunks(batch, result, job_id)
+                    end = time.perf_counter()
+            finally:
+                if batch.label is not None:
+                    loaded.finished(batch.label)
+        return start, end
+
+    async def _run_chunks(self, batch: UnwindBatch, result: UploadResult, job_id: str) -> None:
+        """Execute a batch chunk by chunk, sized by the batch sizer."""
+        self.batch_sizer.observe_rows(batch.kind, batch.rows)
+        offset = 0
+        while offset < len(batch.rows):
+            size = self.batch_sizer.next_size(batch.kind)
+            rows = batch.rows[offset:offset + size]
+            offset += len(rows)
+            result.total_commands += 1
+
+            async with self._session_slots:
+                chunk_start = time.perf_counter()
+                self._in_flight += 1
+                self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+                try:
+                    if batch.parameters:
+                        chunk_result = await self.neo4j_client.execute_unwind(
+                            batch.query, rows, job_id=job_id, parameters=batch.parameters
+                        )
+                    else:
+                        chunk_result = await self.neo4j_client.execute_unwind(batch.query, rows, job_id=job_id)
+                finally:
+                    self._in_flight -= 1
+            result.merge_stats(chunk_result)
+
+            self.batch_sizer.record(BatchResult(
+                batch_number=result.total_commands,
+                job_id=job_id,
+                statement_kind=batch.kind,
+                batch_size=size,
+                commands_in_batch=len(rows),
+                success=not chunk_result.has_errors,
+                execution_time_seconds=time.perf_counter() - chunk_start
+            ))
@@ -0,0 +1,62 @@
+"""
+Dead Letter Log for Neo4j - statements that failed on their own
+
+When a batch fails for a reason other than a transient server condition,
+the client splits it until the failing statements or rows are isolated,
+commits the rest, and sets the isolated ones aside here instead of failing
+the whole upload. The log is a JSON Lines file, one failed statement or
+row per line, so it can be inspected, fixed and replayed.
+"""
+
+import json
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DeadLetterLog:
+    """Appends failed statements and rows to a JSON Lines file."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def write(
+        self,
+        job_id: Optional[str],
+        statement: str,
+        error: str,
+        row: Optional[Dict[str, Any]] = None,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Record one failed statement, or one failed row of an UNWIND statement.
+
+        Args:
+            job_id: Job the statement belongs to
+            statement: Cypher command, or the UNWIND query the row was passed to
+            error: Error the statement failed with on its own
+            row: The failed $rows entry of an UNWIND query
+            parameters: Other parameters of the UNWIND query
+        """
+        entry = {
+            "job_id": job_id,
+            "statement": statement,
+            "row": row,
+            "parameters": parameters or None,
+            "error": error,
+            "failed_at": datetime.now().isoformat()
+        }
+        line = json.dumps(entry, default=str) + "\n"
+
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+            self.count += 1
+        logger.warning(f"Dead-lettered a statement of job {job_id} to {self.path}: {error}")
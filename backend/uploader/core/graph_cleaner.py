@@ -0,0 +1,175 @@
+"""
+Graph Cleaner for Neo4j - online, batched deletion
+
+Clears the whole graph, or one namespace of it, without one huge
+transaction and without taking the database offline:
+- Relationships are deleted first, then nodes, at most batch_size per
+  write transaction, so heap use is bounded however large the graph is
+- A whole-graph clear scans relationships once, then nodes once, with
+  CALL { ... } IN TRANSACTIONS committing every batch_size rows; a LIMITed
+  query per batch would rescan everything already cleared each time
+- Namespaced clears go label by label through the (namespace, unique_key)
+  indexes, then sweep whatever is left in the namespace
+- Progress is reported after every committed batch, or after each pass of
+  a whole-graph clear
+"""
+
+import logging
+import math
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .neo4j_client import Neo4jClient
+from .schema_manager import NAMESPACE_PROPERTY, NODE_LABELS, _quote
+from ..models.upload_result import ClearResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLEAR_BATCH_SIZE = 10000
+
+# Called with the running result after every committed batch
+ProgressCallback = Callable[[ClearResult], None]
+
+
+class GraphCleaner:
+    """Deletes graph data in bounded batches while the database stays online."""
+
+    def __init__(
+        self,
+        neo4j_client: Neo4jClient,
+        batch_size: int = DEFAULT_CLEAR_BATCH_SIZE,
+        labels: Iterable[str] = NODE_LABELS
+    ):
+        self.neo4j_client = neo4j_client
+        self.batch_size = max(1, batch_size)
+        self.labels = list(labels)
+
+    async def clear(
+        self,
+        namespace: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> ClearResult:
+        """
+        Delete every node and relationship in scope.
+
+        Args:
+            namespace: Only clear nodes of this namespace; None clears the whole graph
+            progress_callback: Called with the running result after every batch
+
+        Returns:
+            ClearResult with totals, deleted counts and duration
+        """
+        result = ClearResult(namespace=namespace, batch_size=self.batch_size)
+        start = time.perf_counter()
+        parameters = {NAMESPACE_PROPERTY: namespace} if namespace else {}
+
+        try:
+            await self._count(result, namespace, parameters)
+            logger.info(f"Clearing {result.total_nodes} nodes and {result.total_relationships} relationships "
+                        f"({'namespace ' + namespace if namespace else 'whole graph'}) "
+                        f"in batches of {self.batch_size}")
+
+            if namespace:
+                for node_pattern, where in self._scopes(namespace):
+                    await self._delete_in_batches(
+                        f"MATCH {node_pattern}-[r]->(){where} WITH r LIMIT $limit DELETE r",
+                        "relationships_deleted", result, parameters, progress_callback
+                    )
+                    await self._delete_in_batches(
+                        f"MATCH {node_pattern}{where} WITH n LIMIT $limit DETACH DELETE n",
+                        "nodes_deleted", result, parameters, progress_callback
+                    )
+            else:
+                await self._delete_in_transactions(
+                    "MATCH ()-[r]->() CALL { WITH r DELETE r } IN TRANSACTIONS OF $limit ROWS "
+                    "RETURN count(*) AS deleted",
+                    "relationships_deleted", result, progress_callback
+                )
+                await self._delete_in_transactions(
+                    "MATCH (n) CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF $limit ROWS "
+                    "RETURN count(*) AS deleted",
+                    "nodes_deleted", result, progress_callback
+                )
+
+            result.success = True
+
+        except Exception as e:
+            logger.error(f"Clear failed after {result.batches} batches: {e}")
+            result.add_error(str(e))
+
+        result.clear_duration_seconds = time.perf_counter() - start
+        logger.info(f"Cleared {result.nodes_deleted} nodes and {result.relationships_deleted} relationships "
+                    f"in {result.batches} batches ({result.clear_duration_seconds:.2f}s)")
+        return result
+
+    def _scopes(self, namespace: str) -> List[Tuple[str, str]]:
+        """(node pattern, WHERE clause) pairs covering a namespace, in deletion order."""
+        where = f" WHERE n.{NAMESPACE_PROPERTY} = ${NAMESPACE_PROPERTY}"
+        # Indexed label by label first (the composite index needs a predicate
+        # on unique_key too), then a sweep for anything unlabeled or unknown
+        indexed = f"{where} AND n.unique_key IS NOT NULL"
+        return [(f"(n:{_quote(label)})", indexed) for label in self.labels] + [("(n)", where)]
+
+    async def _count(self, result: ClearResult, namespace: Optional[str], parameters: Dict[str, Any]) -> None:
+        """Record how many nodes and relationships are in scope."""
+        if namespace:
+            # Through each label's index; the final sweep's stragglers are not counted
+            patterns = [(node_pattern, where) for node_pattern, where in self._scopes(namespace)[:-1]]
+        else:
+            # Served from the count store
+            patterns = [("(n)", "")]
+
+        result.total_nodes = result.total_relationships = 0
+        for node_pattern, where in patterns:
+            records, _ = await self.neo4j_client.execute_write(
+                f"MATCH {node_pattern}{where} RETURN count(n) AS total", parameters
+            )
+            result.total_nodes += records[0]["total"] if records else 0
+            relationship_pattern = f"{node_pattern}-[r]->()" if namespace else "()-[r]->()"
+            records, _ = await self.neo4j_client.execute_write(
+                f"MATCH {relationship_pattern}{where} RETURN count(r) AS total", parameters
+            )
+            result.total_relationships += records[0]["total"] if records else 0
+
+    async def _delete_in_transactions(
+        self,
+        query: str,
+        counter: str,
+        result: ClearResult,
+        progress_callback: Optional[ProgressCallback]
+    ) -> None:
+        """Run a single-pass delete query whose rows the server commits batch_size at a time."""
+        records, _ = await self.neo4j_client.execute_write(query, {"limit": self.batch_size}, implicit=True)
+        deleted = records[0]["deleted"] if records else 0
+        if not deleted:
+            return
+
+        setattr(result, counter, getattr(result, counter) + deleted)
+        result.batches += math.ceil(deleted / self.batch_size)
+        logger.info(f"Clear progress: {result.progress_percentage:.1f}% "
+                    f"({result.nodes_deleted} nodes, {result.relationships_deleted} relationships)")
+        if progress_callback is not None:
+            progress_callback(result)
+
+    async def _delete_in_batches(
+        self,
+        query: str,
+        counter: str,
+        result: ClearResult,
+        parameters: Dict[str, Any],
+        progress_callback: Optional[ProgressCallback]
+    ) -> None:
+        """Run a LIMITed delete query, one transaction per batch, until it deletes nothing."""
+        while True:
+            _, counters = await self.neo4j_client.execute_write(query, {**parameters, "limit": self.batch_size})
+            deleted = counters[counter]
+            if not deleted:
+                return
+
+            result.nodes_deleted += counters["nodes_deleted"]
+            result.relationships_deleted += counters["relationships_deleted"]
+            result.batches += 1
+            logger.info(f"Clear progress: {result.progress_percentage:.1f}% "
+                        f"({result.nodes_deleted} nodes, {result.relationships_deleted} relationships)")
+            if progress_callback is not None:
+                progress_callback(result)
@@ -0,0 +1,421 @@
+"""
+Graph Snapshot for Neo4j - online logical backups and bulk restore
+
+Backs the graph, or one namespace of it (read label by label through the
+namespace indexes), up while Neo4j keeps serving queries, instead of
+stopping the service and tarring its data directory:
+- Nodes and relationships are streamed from read transactions and
+  buffered per label (nodes) or per type and endpoint labels
+  (relationships)
+- Full buffers are written as gzip-compressed, columnar JSON chunk files
+  (one list per property rather than one map per row), compressed on
+  worker threads while the stream continues
+- A manifest lists the chunks and counts of the snapshot
+
+Restore clears the snapshot's scope in batches (see GraphCleaner) and
+loads the chunks back through parameterized UNWIND batches. Nodes carry
+their snapshot element ID in a temporary, indexed property while the
+relationships are matched to them; the property and its indexes are
+removed afterwards, also when the restore fails.
+
+The snapshot is online, not point-in-time: writes committed while it is
+streamed may or may not be included, and relationships whose endpoint
+nodes are missing from the snapshot are skipped on restore.
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .graph_cleaner import DEFAULT_CLEAR_BATCH_SIZE, GraphCleaner
+from .neo4j_client import Neo4jClient
+from .schema_manager import INDEX_AWAIT_TIMEOUT_SECONDS, NAMESPACE_PROPERTY, NODE_LABELS, SchemaItem, _quote
+from ..models.upload_result import SnapshotResult
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+
+DEFAULT_CHUNK_ROWS = 50000
+DEFAULT_RESTORE_BATCH_SIZE = 5000
+
+# Fast compression keeps the chunk writers ahead of the read stream
+COMPRESSION_LEVEL = 1
+
+# Temporary node property relationships are matched on during restore
+SNAPSHOT_ID_PROPERTY = "_snapshot_id"
+
+# Chunks being compressed at once
+MAX_PENDING_WRITES = max(2, os.cpu_count() or 2)
+
+
+def _to_columns(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Pivot property maps into one list per key, None where a row lacks the key."""
+    keys = list(dict.fromkeys(key for row in rows for key in row))
+    return {key: [row.get(key) for row in rows] for key in keys}
+
+
+def _from_columns(columns: Dict[str, List[Any]], count: int) -> List[Dict[str, Any]]:
+    """Rebuild property maps from columns; Neo4j stores no nulls, so None is dropped."""
+    return [
+        {key: values[index] for key, values in columns.items() if values[index] is not None}
+        for index in range(count)
+    ]
+
+
+def _write_chunk(path: Path, chunk: Dict[str, Any]) -> int:
+    """Compress a chunk to path; returns the bytes written."""
+    data = json.dumps(chunk, separators=(",", ":"), default=str).encode("utf-8")
+    with gzip.open(path, "wb", compresslevel=COMPRESSION_LEVEL) as chunk_file:
+        chunk_file.write(data)
+    return path.stat().st_size
+
+
+def _read_chunk(path: Path) -> Dict[str, Any]:
+    """Decompress and parse a chunk file."""
+    with gzip.open(path, "rb") as chunk_file:
+        return json.loads(chunk_file.read())
+
+
+def _primary_label(labels: List[str]) -> Optional[str]:
+    """Label a node is matched on during restore."""
+    return min(labels) if labels else None
+
+
+def _node_pattern(variable: str, label: Optional[str]) -> str:
+    """Node pattern with an optional label."""
+    return f"({variable}:{_quote(label)})" if label else f"({variable})"
+
+
+class GraphSnapshot:
+    """Writes and restores chunked, columnar snapshots while the database stays online."""
+
+    def __init__(
+        self,
+        neo4j_client: Neo4jClient,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        restore_batch_size: int = DEFAULT_RESTORE_BATCH_SIZE,
+        clear_batch_size: int = DEFAULT_CLEAR_BATCH_SIZE,
+        labels: Iterable[str] = NODE_LABELS
+    ):
+        self.neo4j_client = neo4j_client
+        self.chunk_rows = max(1, chunk_rows)
+        self.restore_batch_size = max(1, restore_batch_size)
+        self.clear_batch_size = clear_batch_size
+        self.labels = list(labels)
+
+    async def snapshot(self, snapshot_dir: Path, namespace: Optional[str] = None) -> SnapshotResult:
+        """
+        Stream the graph into a new snapshot directory.
+
+        Args:
+            snapshot_dir: Directory to create for the manifest and chunk files
+            namespace: Only snapshot nodes of this namespace (and their outgoing
+                relationships), read label by label through the (namespace,
+                unique_key) indexes; None snapshots the whole graph
+
+        Returns:
+            SnapshotResult with counts, compressed size and throughput
+        """
+        snapshot_dir = Path(snapshot_dir)
+        result = SnapshotResult(operation="snapshot", snapshot_path=str(snapshot_dir), namespace=namespace)
+        start = time.perf_counter()
+        writer = _ChunkWriter(snapshot_dir)
+
+        try:
+            snapshot_dir.mkdir(parents=True, exist_ok=False)
+            parameters = {NAMESPACE_PROPERTY: namespace} if namespace else {}
+            scopes = self._scopes(namespace)
+
+            node_buffers: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+            async for record in self._stream_scopes(
+                scopes, "labels",
+                "MATCH {pattern}{where} RETURN elementId(n) AS id, labels(n) AS labels, properties(n) AS properties",
+                parameters
+            ):
+                labels = tuple(sorted(record["labels"]))
+                buffer = node_buffers.setdefault(labels, [])
+                buffer.append(record)
+                result.nodes += 1
+                if len(buffer) >= self.chunk_rows:
+                    await writer.submit("nodes", self._node_chunk(labels, buffer))
+                    node_buffers[labels] = []
+            for labels, buffer in node_buffers.items():
+                if buffer:
+                    await writer.submit("nodes", self._node_chunk(labels, buffer))
+
+            relationship_buffers: Dict[Tuple[str, Optional[str], Optional[str]], List[Dict[str, Any]]] = {}
+            async for record in self._stream_scopes(
+                scopes, "source_labels",
+                "MATCH {pattern}-[r]->(m){where} "
+                "RETURN elementId(n) AS source, elementId(m) AS target, labels(n) AS source_labels, "
+                "labels(m) AS target_labels, type(r) AS type, properties(r) AS properties",
+                parameters
+            ):
+                key = (record["type"], _primary_label(record["source_labels"]),
+                       _primary_label(record["target_labels"]))
+                buffer = relationship_buffers.setdefault(key, [])
+                buffer.append(record)
+                result.relationships += 1
+                if len(buffer) >= self.chunk_rows:
+                    await writer.submit("relationships", self._relationship_chunk(key, buffer))
+                    relationship_buffers[key] = []
+            for key, buffer in relationship_buffers.items():
+                if buffer:
+                    await writer.submit("relationships", self._relationship_chunk(key, buffer))
+
+            chunks = await writer.finish()
+            manifest = {
+                "format_version": SNAPSHOT_FORMAT_VERSION,
+                "created_at": datetime.now().isoformat(),
+                "namespace": namespace,
+                "node_count": result.nodes,
+                "relationship_count": result.relationships,
+                "chunks": chunks
+            }
+            (snapshot_dir / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2))
+
+            result.chunks = len(chunks)
+            result.size_bytes = sum(chunk["size_bytes"] for chunk in chunks)
+            result.success = True
+
+        except Exception as e:
+            await writer.finish(raise_errors=False)
+            logger.error(f"Snapshot failed after {result.nodes} nodes and {result.relationships} relationships: {e}")
+            result.add_error(str(e))
+
+        result.duration_seconds = time.perf_counter() - start
+        logger.info(f"Snapshot of {result.nodes} nodes and {result.relationships} relationships in "
+                    f"{result.chunks} chunks ({result.size_bytes / 1024 / 1024:.2f} MB) took "
+                    f"{result.duration_seconds:.2f}s ({result.nodes_per_second:.0f} nodes/s)")
+        return result
+
+    async def restore(self, snapshot_dir: Path, job_id: str = "restore") -> SnapshotResult:
+        """
+        Replace the snapshot's scope of the graph with the snapshot contents.
+
+        The namespace of the snapshot (or the whole graph) is cleared first.
+
+        Args:
+            snapshot_dir: Directory written by snapshot()
+            job_id: Job ID the UNWIND batches are attributed to
+
+        Returns:
+            SnapshotResult with restored counts and throughput
+        """
+        snapshot_dir = Path(snapshot_dir)
+        result = SnapshotResult(operation="restore", snapshot_path=str(snapshot_dir))
+        start = time.perf_counter()
+        labels: Set[Optional[str]] = set()
+        id_indexes: List[SchemaItem] = []
+
+        try:
+            manifest = json.loads((snapshot_dir / MANIFEST_FILE).read_text())
+            if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+                raise ValueError(f"Unsupported snapshot format version: {manifest.get('format_version')}")
+            result.namespace = manifest.get("namespace")
+
+            clear_result = await GraphCleaner(self.neo4j_client, batch_size=self.clear_batch_size).clear(
+                result.namespace
+            )
+            if not clear_result.success:
+                raise RuntimeError(f"Clearing before restore failed: {', '.join(clear_result.errors)}")
+
+            node_chunks = [chunk for chunk in manifest["chunks"] if chunk["kind"] == "nodes"]
+            relationship_chunks = [chunk for chunk in manifest["chunks"] if chunk["kind"] == "relationships"]
+            labels = {_primary_label(chunk["labels"]) for chunk in node_chunks}
+            id_indexes = [SchemaItem(label, (SNAPSHOT_ID_PROPERTY,)) for label in sorted(labels - {None})]
+
+            for item in id_indexes:
+                await self.neo4j_client.execute_write(item.statement())
+            await self.neo4j_client.execute_write(f"CALL db.awaitIndexes({INDEX_AWAIT_TIMEOUT_SECONDS})")
+
+            async for chunk in self._read_chunks(snapshot_dir, node_chunks, result):
+                result.nodes += await self._restore_nodes(chunk, job_id)
+            async for chunk in self._read_chunks(snapshot_dir, relationship_chunks, result):
+                result.relationships += await self._restore_relationships(chunk, job_id)
+
+            result.success = True
+
+        except Exception as e:
+            logger.error(f"Restore failed after {result.nodes} nodes and {result.relationships} relationships: {e}")
+            result.add_error(str(e))
+
+        finally:
+            # Restored or not, nodes must not keep their snapshot IDs and indexes
+            if id_indexes:
+                try:
+                    await self._remove_snapshot_ids(labels)
+                    for item in id_indexes:
+                        await self.neo4j_client.execute_write(f"DROP INDEX {_quote(item.name)} IF EXISTS")
+                except Exception as e:
+                    logger.error(f"Removing the snapshot IDs after restore failed: {e}")
+                    result.success = False
+                    result.add_error(f"Snapshot ID cleanup failed: {e}")
+
+        result.duration_seconds = time.perf_counter() - start
+        logger.info(f"Restored {result.nodes} nodes and {result.relationships} relationships from "
+                    f"{result.chunks} chunks in {result.duration_seconds:.2f}s "
+                    f"({result.nodes_per_second:.0f} nodes/s)")
+        return result
+
+    def _scopes(self, namespace: Optional[str]) -> List[Tuple[str, str, Optional[str]]]:
+        """(node pattern, WHERE clause, label) triples covering the snapshot's scope."""
+        if not namespace:
+            return [("(n)", "", None)]
+        # Label by label, with a predicate on every key of the composite index
+        where = f" WHERE n.{NAMESPACE_PROPERTY} = ${NAMESPACE_PROPERTY} AND n.unique_key IS NOT NULL"
+        return [(f"(n:{_quote(label)})", where, label) for label in self.labels]
+
+    async def _stream_scopes(
+        self,
+        scopes: List[Tuple[str, str, Optional[str]]],
+        labels_field: str,
+        query: str,
+        parameters: Dict[str, Any]
+    ):
+        """Stream query over each scope, yielding every node (or its relationships) once."""
+        for pattern, where, label in scopes:
+            scoped_query = query.format(pattern=pattern, where=where)
+            async for record in self.neo4j_client.stream_read(scoped_query, parameters):
+                # A node with several known labels is read under the first of them
+                if label is not None and next(
+                    (known for known in self.labels if known in record[labels_field]), label
+                ) != label:
+                    continue
+                yield record
+
+    def _node_chunk(self, labels: Tuple[str, ...], records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Columnar chunk of nodes sharing a label set."""
+        return {
+            "kind": "nodes",
+            "labels": list(labels),
+            "rows": len(records),
+            "ids": [record["id"] for record in records],
+            "properties": _to_columns([record["properties"] for record in records])
+        }
+
+    def _relationship_chunk(
+        self,
+        key: Tuple[str, Optional[str], Optional[str]],
+        records: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Columnar chunk of relationships sharing a type and endpoint labels."""
+        relationship_type, source_label, target_label = key
+        return {
+            "kind": "relationships",
+            "type": relationship_type,
+            "source_label": source_label,
+            "target_label": target_label,
+            "rows": len(records),
+            "sources": [record["source"] for record in records],
+            "targets": [record["target"] for record in records],
+            "properties": _to_columns([record["properties"] for record in records])
+        }
+
+    async def _read_chunks(self, snapshot_dir: Path, chunks: List[Dict[str, Any]], result: SnapshotResult):
+        """Yield chunks in order, decompressing the next one while the current one is written."""
+        pending: Optional[asyncio.Task] = None
+        for index, chunk in enumerate(chunks):
+            if pending is None:
+                pending = asyncio.ensure_future(asyncio.to_thread(_read_chunk, snapshot_dir / chunk["file"]))
+            data = await pending
+            pending = None
+            if index + 1 < len(chunks):
+                pending = asyncio.ensure_future(
+                    asyncio.to_thread(_read_chunk, snapshot_dir / chunks[index + 1]["file"])
+                )
+            result.chunks += 1
+            result.size_bytes += chunk["size_bytes"]
+            yield data
+
+    async def _restore_nodes(self, chunk: Dict[str, Any], job_id: str) -> int:
+        """Create a chunk's nodes, tagged with their snapshot IDs."""
+        labels = "".join(f":{_quote(label)}" for label in chunk["labels"])
+        query = (f"UNWIND $rows AS row CREATE (n{labels}) "
+                 f"SET n = row.properties, n.{_quote(SNAPSHOT_ID_PROPERTY)} = row.id")
+        properties = _from_columns(chunk["properties"], chunk["rows"])
+        rows = [{"id": node_id, "properties": props} for node_id, props in zip(chunk["ids"], properties)]
+        return await self._unwind(query, rows, job_id, "nodes_created")
+
+    async def _restore_relationships(self, chunk: Dict[str, Any], job_id: str) -> int:
+        """Create a chunk's relationships between the restored nodes."""
+        snapshot_id = _quote(SNAPSHOT_ID_PROPERTY)
+        query = (f"UNWIND $rows AS row "
+                 f"MATCH {_node_pattern('s', chunk['source_label'])} WHERE s.{snapshot_id} = row.source "
+                 f"MATCH {_node_pattern('t', chunk['target_label'])} WHERE t.{snapshot_id} = row.target "
+                 f"CREATE (s)-[r:{_quote(chunk['type'])}]->(t) SET r = row.properties")
+        properties = _from_columns(chunk["properties"], chunk["rows"])
+        rows = [
+            {"source": source, "target": target, "properties": props}
+            for source, target, props in zip(chunk["sources"], chunk["targets"], properties)
+        ]
+        return await self._unwind(query, rows, job_id, "relationships_created")
+
+    async def _unwind(self, query: str, rows: List[Dict[str, Any]], job_id: str, counter: str) -> int:
+        """Write rows in restore_batch_size UNWIND batches; returns the entities created."""
+        created = 0
+        for offset in range(0, len(rows), self.restore_batch_size):
+            # A restore is all or nothing: never set rows aside
+            batch_result = await self.neo4j_client.execute_unwind(
+                query, rows[offset:offset + self.restore_batch_size], job_id=job_id, isolate_failures=False
+            )
+            if batch_result.has_errors:
+                raise RuntimeError(", ".join(batch_result.errors))
+            created += getattr(batch_result, counter)
+        return created
+
+    async def _remove_snapshot_ids(self, labels: Set[Optional[str]]) -> None:
+        """Remove the temporary snapshot IDs in bounded batches."""
+        snapshot_id = _quote(SNAPSHOT_ID_PROPERTY)
+        for label in sorted(labels, key=lambda label: label or ""):
+            query = (f"MATCH {_node_pattern('n', label)} WHERE n.{snapshot_id} IS NOT NULL "
+                     f"WITH n LIMIT $limit REMOVE n.{snapshot_id}")
+            while True:
+                _, counters = await self.neo4j_client.execute_write(query, {"limit": self.clear_batch_size})
+                if not counters["properties_set"]:
+                    break
+
+
+class _ChunkWriter:
+    """Compresses chunk files on worker threads, a bounded number at a time."""
+
+    def __init__(self, snapshot_dir: Path):
+        self.snapshot_dir = snapshot_dir
+        self.chunks: List[Dict[str, Any]] = []
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Task]] = []
+
+    async def submit(self, kind: str, chunk: Dict[str, Any]) -> None:
+        """Start writing a chunk, waiting for the oldest write if too many are in flight."""
+        if len(self._pending) >= MAX_PENDING_WRITES:
+            await self._complete_oldest()
+
+        entry = {"file": f"{kind}-{len(self.chunks) + len(self._pending):05d}.json.gz",
+                 "kind": kind, "rows": chunk["rows"]}
+        if kind == "nodes":
+            entry["labels"] = chunk["labels"]
+        task = asyncio.ensure_future(asyncio.to_thread(_write_chunk, self.snapshot_dir / entry["file"], chunk))
+        self._pending.append((entry, task))
+
+    async def finish(self, raise_errors: bool = True) -> List[Dict[str, Any]]:
+        """Wait for every write; returns the manifest entries of the chunks in order."""
+        while self._pending:
+            try:
+                await self._complete_oldest()
+            except Exception:
+                if raise_errors:
+                    raise
+        return self.chunks
+
+    async def _complete_oldest(self) -> None:
+        """Wait for the oldest write in flight and record its chunk."""
+        entry, task = self._pending.pop(0)
+        entry["size_bytes"] = await task
+        self.chunks.append(entry)
@@ -3,28 +3,98 @@ Enhanced Neo4j Client for Phase 3 Upload Operations
 
 Provides production-ready Neo4j connectivity with:
 - Connection pooling and health monitoring
-- Automatic retry logic with exponential backoff
+- Automatic retry logic with exponential backoff for transient failures,
+  and jittered retries of deadlocks between concurrent upload sessions
 - Transaction management with rollback support  
+- Failed batches split until the failing statements or rows are isolated;
+  the rest is committed and the isolated ones go to a dead-letter log
 - Comprehensive error handling and logging
 """
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import random
+from pathlib import Path
+from typing import List, Dict, Any, AsyncIterator, Awaitable, Callable, Optional, Sequence, Tuple, TypeVar
 from datetime import datetime, timedelta
 
 try:
-    from neo4j import GraphDatabase, AsyncGraphDatabase
-    from neo4j.exceptions import ServiceUnavailable, AuthError, Neo4jError
+    from neo4j import GraphDatabase, AsyncGraphDatabase, READ_ACCESS
+    from neo4j.exceptions import ServiceUnavailable, SessionExpired, TransientError, AuthError, Neo4jError
     NEO4J_AVAILABLE = True
 except ImportError:
     NEO4J_AVAILABLE = False
     logging.warning("Neo4j driver not available - install with: pip install neo4j")
 
+from .dead_letter import DeadLetterLog
 from ..models.upload_result import UploadResult, ConnectionHealth
 
 logger = logging.getLogger(__name__)
 
+MAX_TRANSIENT_RETRIES = 3
+
+# Deadlocks between concurrent sessions resolve on a prompt retry; they get
+# their own, larger budget and short jittered delays instead of the backoff
+MAX_DEADLOCK_RETRIES = 10
+
+# Error codes of failures in the database itself, which every statement or
+# row of a batch hits alike
+SYSTEMIC_ERROR_PREFIXES = ("Neo.DatabaseError.",)
+
+# Error codes of failures in the query text. Rows of an UNWIND share one query,
+# so these hit every row alike; literal commands fail on them one by one (e.g.
+# a malformed docstring), and such a command is isolated like any other.
+QUERY_ERROR_CODES = ("Neo.ClientError.Statement.SyntaxError", "Neo.ClientError.Statement.ParameterMissing")
+
+# A Cypher command or an UNWIND row
+_Item = TypeVar("_Item")
+
+# Update counters of a committed transaction: nodes, relationships, properties
+_Counters = Tuple[int, int, int]
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Whether a failure is worth retrying as is.
+    
+    Transient failures (deadlocks, leader switches, lost connections) are
+    retried with backoff; any other failure is caused by the statements
+    themselves and is isolated by splitting the batch.
+    """
+    if isinstance(error, (ConnectionError, asyncio.TimeoutError)):
+        return True
+    if NEO4J_AVAILABLE and isinstance(error, (ServiceUnavailable, SessionExpired, TransientError)):
+        return True
+    is_retryable = getattr(error, "is_retryable", None)
+    return bool(callable(is_retryable) and is_retryable())
+
+
+def is_deadlock(error: BaseException) -> bool:
+    """Whether a failure is a deadlock the server detected between concurrent transactions."""
+    code = getattr(error, "code", None) or ""
+    return "DeadlockDetected" in code or "deadlock" in str(error).lower()
+
+
+def is_systemic(error: BaseException, shared_query: bool = False) -> bool:
+    """
+    Whether a failure affects every item of a batch alike, so splitting the batch cannot isolate it.
+    
+    shared_query tells whether the items are rows run with one query (UNWIND),
+    in which case errors in the query text are systemic too. Other statement
+    errors (e.g. a type error in one row) belong to a single item.
+    """
+    if NEO4J_AVAILABLE and isinstance(error, AuthError):
+        return True
+    code = getattr(error, "code", None) or ""
+    if code.startswith(SYSTEMIC_ERROR_PREFIXES):
+        return True
+    return shared_query and code in QUERY_ERROR_CODES
+
+# Drivers shared by clients of the same server, credentials and event loop,
+# so a long-lived process (e.g. a warm pipeline worker) keeps its connection
+# pool across uploads: key -> [driver, number of connected clients]
+_shared_drivers: Dict[Tuple[Any, ...], List[Any]] = {}
+
 
 class Neo4jClient:
     """Enhanced Neo4j client for Phase 3 upload operations."""
@@ -35,7 +105,8 @@ class Neo4jClient:
         auth: Optional[Tuple[str, str]] = None,
         database: str = "neo4j",
         max_connection_lifetime: int = 3600,
-        max_connection_pool_size: int = 100
+        max_connection_pool_size: int = 100,
+        dead_letter_path: Optional[str] = None
     ):
         if not NEO4J_AVAILABLE:
             raise ImportError("Neo4j driver not available. Install with: pip install neo4j")
@@ -59,6 +130,9 @@ class Neo4jClient:
         self.max_connection_lifetime = max_connection_lifetime
         self.max_connection_pool_size = max_connection_pool_size
         
+        # Statements that failed on their own (see _commit_isolating)
+        self.dead_letters = DeadLetterLog(Path(dead_letter_path)) if dead_letter_path else None
+        
         # Health monitoring
         self.last_health_check = None
         self.health_check_interval = timedelta(minutes=5)
@@ -68,12 +142,35 @@ class Neo4jClient:
             "total_connections": 0,
             "successful_queries": 0,
             "failed_queries": 0,
+            "deadlock_retries": 0,
             "total_upload_time": 0,
             "last_upload": None
         }
     
     async def connect(self) -> bool:
-        """Establish connection to Neo4j with health validation."""
+        """
+        Establish connection to Neo4j with health validation.
+        
+        Reuses the driver (and its connection pool) of another client
+        connected to the same server with the same credentials on this
+        event loop; a shared driver that fails verification is replaced.
+        """
+        key = self._driver_key()
+        shared = _shared_drivers.get(key)
+        
+        if shared is not None:
+            self.driver = shared[0]
+            try:
+                await self._verify_connectivity()
+                shared[1] += 1
+                logger.info(f"Reusing Neo4j driver for {self.uri}")
+                return True
+            except Exception as e:
+                logger.warning(f"Shared Neo4j driver unusable, reconnecting: {e}")
+                _shared_drivers.pop(key, None)
+                await self._close_quietly(shared[0])
+                self.driver = None
+        
         try:
             self.driver = AsyncGraphDatabase.driver(
                 self.uri,
@@ -83,19 +180,48 @@ class Neo4jClient:
             # Verify connectivity
             await self._verify_connectivity()
             
+            _shared_drivers[key] = [self.driver, 1]
             logger.info(f"Connected to Neo4j at {self.uri}")
             self.connection_stats["total_connections"] += 1
             return True
             
         except Exception as e:
             logger.error(f"Failed to connect to Neo4j: {e}")
+            if self.driver:
+                await self._close_quietly(self.driver)
+                self.driver = None
             return False
     
     async def disconnect(self) -> None:
-        """Close Neo4j connection."""
-        if self.driver:
-            await self.driver.close()
-            logger.info("Disconnected from Neo4j")
+        """Release the Neo4j connection; the driver closes with its last client."""
+        if not self.driver:
+            return
+        
+        key = self._driver_key()
+        shared = _shared_drivers.get(key)
+        if shared is not None and shared[0] is self.driver:
+            shared[1] -= 1
+            if shared[1] > 0:
+                self.driver = None
+                return
+            _shared_drivers.pop(key, None)
+        
+        await self.driver.close()
+        self.driver = None
+        logger.info("Disconnected from Neo4j")
+    
+    def _driver_key(self) -> Tuple[Any, ...]:
+        """Key of the shared driver this client may use."""
+        auth = tuple(self.auth) if isinstance(self.auth, (list, tuple)) else self.auth
+        return (self.uri, auth, id(asyncio.get_running_loop()))
+    
+    @staticmethod
+    async def _close_quietly(driver) -> None:
+        """Close a driver, ignoring errors from an already broken one."""
+        try:
+            await driver.close()
+        except Exception as e:
+            logger.debug(f"Error closing Neo4j driver: {e}")
     
     async def health_check(self) -> ConnectionHealth:
         """Perform comprehensive health check."""
@@ -194,49 +320,285 @@ class Neo4jClient:
             self.connection_stats["failed_queries"] += 1
             return result
     
-    async def _execute_batch_with_retry(
-        self, 
-        batch: List[str], 
-        job_id: Optional[str]
+    async def execute_unwind(
+        self,
+        query: str,
+        rows: List[Dict[str, Any]],
+        job_id: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        isolate_failures: bool = True
     ) -> UploadResult:
-        """Execute a single batch with retry logic."""
-        
+        """
+        Execute a parameterized UNWIND query over a list of rows.
+
+        The rows are passed as the $rows parameter in a single transaction,
+        retried with exponential backoff on transient failures. Further
+        query parameters (e.g. $namespace) come from parameters.
+
+        If the rows fail for any other reason, they are split in halves
+        until the failing rows are isolated: the other rows are committed
+        and the failing ones dead-lettered. With isolate_failures=False the
+        batch fails as a whole instead (e.g. restores that must be complete).
+        """
+        result = UploadResult(job_id=job_id or "unknown")
+
+        if not self.driver:
+            if not await self.connect():
+                result.add_error("Failed to connect to Neo4j")
+                return result
+
+        async def run(chunk: Sequence[Dict[str, Any]]) -> _Counters:
+            async with self.driver.session(database=self.database) as session:
+                async with session.begin_transaction() as tx:
+                    query_result = await tx.run(query, parameters, rows=list(chunk))
+                    summary = await query_result.consume()
+            counters = summary.counters
+            return counters.nodes_created, counters.relationships_created, counters.properties_set
+
+        def dead_letter(row: Dict[str, Any], error: BaseException) -> None:
+            self._dead_letter(result, job_id, query, str(error), row=row, parameters=parameters)
+
+        await self._commit_isolating(rows, run, result, dead_letter if isolate_failures else None,
+                                     f"UNWIND batch of {len(rows)} rows", query)
+        result.total_commands_executed = 0 if result.has_errors else 1
+        return result
+
+    async def execute_write(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        implicit: bool = False
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """
+        Execute a query in its own write transaction.
+
+        Retried with exponential backoff like UNWIND batches.
+
+        Args:
+            query: Cypher query
+            parameters: Query parameters
+            implicit: Run in an auto-commit transaction, as CALL { ... } IN
+                TRANSACTIONS requires; such a query commits its own batches,
+                so it must be safe to run again after a partial failure
+
+        Returns:
+            (records as dictionaries, update counters of the transaction)
+
+        Raises:
+            RuntimeError: If the query still fails after retries
+        """
+        if not self.driver:
+            if not await self.connect():
+                raise RuntimeError("Failed to connect to Neo4j")
+
         max_retries = 3
         retry_count = 0
-        
-        while retry_count < max_retries:
+
+        while True:
             try:
-                batch_result = UploadResult(job_id=job_id)
-                
                 async with self.driver.session(database=self.database) as session:
-                    async with session.begin_transaction() as tx:
-                        for command in batch:
-                            try:
-                                result = await tx.run(command)
-                                summary = await result.consume()
-                                
-                                # Update statistics from summary
-                                batch_result.nodes_created += summary.counters.nodes_created
-                                batch_result.relationships_created += summary.counters.relationships_created
-                                batch_result.properties_set += summary.counters.properties_set
-                                
-                            except Exception as e:
-                                logger.error(f"Command failed: {command[:100]}... Error: {e}")
-                                batch_result.add_error(f"Command failed: {str(e)}", command)
-                
-                return batch_result
-                
+                    if implicit:
+                        query_result = await session.run(query, parameters)
+                        records = await query_result.data()
+                        summary = await query_result.consume()
+                    else:
+                        async with session.begin_transaction() as tx:
+                            query_result = await tx.run(query, parameters)
+                            records = await query_result.data()
+                            summary = await query_result.consume()
+
+                counters = summary.counters
+                self.connection_stats["successful_queries"] += 1
+                return records, {
+                    "nodes_created": counters.nodes_created,
+                    "nodes_deleted": counters.nodes_deleted,
+                    "relationships_created": counters.relationships_created,
+                    "relationships_deleted": counters.relationships_deleted,
+                    "properties_set": counters.properties_set
+                }
+
             except Exception as e:
                 retry_count += 1
                 if retry_count < max_retries:
                     delay = min(2 ** retry_count, 30)  # Exponential backoff, max 30s
-                    logger.warning(f"Batch failed, retrying in {delay}s (attempt {retry_count}/{max_retries})")
+                    logger.warning(f"Write query failed, retrying in {delay}s (attempt {retry_count}/{max_retries})")
                     await asyncio.sleep(delay)
                 else:
-                    logger.error(f"Batch failed after {max_retries} retries: {e}")
-                    batch_result = UploadResult(job_id=job_id)
-                    batch_result.add_error(f"Batch failed after retries: {str(e)}")
-                    return batch_result
+                    self.connection_stats["failed_queries"] += 1
+                    raise RuntimeError(f"Write query failed after {max_retries} retries: {e}") from e
+
+    async def stream_read(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        fetch_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the records of a query from a read transaction.
+
+        Records are pulled from the server fetch_size at a time as the caller
+        consumes them, so results of any size are never held in memory at
+        once. A partly consumed stream cannot be replayed, so unlike writes
+        it is not retried.
+
+        Yields:
+            Records as dictionaries
+
+        Raises:
+            RuntimeError: If the client cannot connect
+        """
+        if not self.driver:
+            if not await self.connect():
+                raise RuntimeError("Failed to connect to Neo4j")
+
+        async with self.driver.session(
+            database=self.database, default_access_mode=READ_ACCESS, fetch_size=fetch_size
+        ) as session:
+            async with session.begin_transaction() as tx:
+                query_result = await tx.run(query, parameters)
+                async for record in query_result:
+                    yield record.data()
+
+        self.connection_stats["successful_queries"] += 1
+
+    async def _execute_batch_with_retry(
+        self, 
+        batch: List[str], 
+        job_id: Optional[str]
+    ) -> UploadResult:
+        """
+        Execute a batch of commands in one transaction.
+        
+        Transient failures are retried with backoff. Any other failure
+        aborts the transaction, so the batch is split in halves until the
+        failing commands are isolated: the rest is committed and the
+        failing commands are dead-lettered.
+        """
+        batch_result = UploadResult(job_id=job_id or "unknown")
+        
+        async def run(commands: Sequence[str]) -> _Counters:
+            nodes = relationships = properties = 0
+            async with self.driver.session(database=self.database) as session:
+                async with session.begin_transaction() as tx:
+                    for command in commands:
+                        summary = await (await tx.run(command)).consume()
+                        nodes += summary.counters.nodes_created
+                        relationships += summary.counters.relationships_created
+                        properties += summary.counters.properties_set
+            return nodes, relationships, properties
+        
+        def dead_letter(command: str, error: BaseException) -> None:
+            self._dead_letter(batch_result, job_id, command, f"Command failed: {error}")
+        
+        await self._commit_isolating(batch, run, batch_result, dead_letter, f"Batch of {len(batch)} commands")
+        return batch_result
+    
+    async def _commit_isolating(
+        self,
+        items: Sequence[_Item],
+        run: Callable[[Sequence[_Item]], Awaitable[_Counters]],
+        result: UploadResult,
+        dead_letter: Optional[Callable[[_Item, BaseException], None]],
+        description: str,
+        statement: Optional[str] = None
+    ) -> None:
+        """
+        Commit items with run(), isolating the ones that fail on their own.
+        
+        Each chunk is run in its own transaction, retried on transient
+        failures. A chunk failing for another reason is split in halves, so
+        k bad items among n cost about 2k*log2(n) extra transactions rather
+        than the whole batch; a single failing item is passed to dead_letter.
+        Without dead_letter, or on systemic failures (e.g. authentication,
+        a database error, or a syntax error in the statement shared by all
+        rows) and exhausted retries, the chunk's failure is recorded as an
+        error. So is a batch whose items were all
+        dead-lettered: nothing failed on its own there.
+        """
+        dead_lettered = 0
+        pending = [items]
+        while pending:
+            chunk = pending.pop()
+            try:
+                nodes, relationships, properties = await self._retry_transient(lambda: run(chunk), description, result)
+            except Exception as e:
+                # Only UNWIND rows pass their shared query as the statement
+                if dead_letter is None or is_transient(e) or is_systemic(e, shared_query=statement is not None):
+                    logger.error(f"{description} failed: {e}")
+                    self.connection_stats["failed_queries"] += 1
+                    result.add_error(f"{description} failed: {e}", statement)
+                elif len(chunk) == 1:
+                    dead_letter(chunk[0], e)
+                    dead_lettered += 1
+                else:
+                    middle = len(chunk) // 2
+                    logger.info(f"{description}: chunk of {len(chunk)} failed, splitting to isolate the cause: {e}")
+                    # Left half first, preserving statement order
+                    pending.append(chunk[middle:])
+                    pending.append(chunk[:middle])
+                continue
+            
+            result.nodes_created += nodes
+            result.relationships_created += relationships
+            result.properties_set += properties
+            self.connection_stats["successful_queries"] += 1
+        
+        if len(items) > 1 and dead_lettered == len(items):
+            self.connection_stats["failed_queries"] += 1
+            result.add_error(f"{description} failed: all {dead_lettered} items were dead-lettered", statement)
+    
+    async def _retry_transient(
+        self,
+        attempt: Callable[[], Awaitable[_Counters]],
+        description: str,
+        result: Optional[UploadResult] = None
+    ) -> _Counters:
+        """
+        Run attempt(), retrying transient failures with exponential backoff.
+        
+        Deadlocks are retried after a short random delay, so the competing
+        transactions do not collide again, and counted in result.
+        """
+        retry_count = 0
+        deadlock_count = 0
+        while True:
+            try:
+                return await attempt()
+            except Exception as e:
+                if is_deadlock(e) and deadlock_count < MAX_DEADLOCK_RETRIES:
+                    deadlock_count += 1
+                    self.connection_stats["deadlock_retries"] += 1
+                    if result is not None:
+                        result.deadlock_retries += 1
+                    delay = random.uniform(0.05, 0.1 * 2 ** min(deadlock_count, 5))
+                    logger.info(f"{description} deadlocked, retrying in {delay:.2f}s "
+                                f"(attempt {deadlock_count}/{MAX_DEADLOCK_RETRIES})")
+                    await asyncio.sleep(delay)
+                    continue
+                retry_count += 1
+                if not is_transient(e) or retry_count >= MAX_TRANSIENT_RETRIES:
+                    raise
+                delay = min(2 ** retry_count, 30)  # Exponential backoff, max 30s
+                logger.warning(f"{description} hit a transient failure, retrying in {delay}s "
+                               f"(attempt {retry_count}/{MAX_TRANSIENT_RETRIES}): {e}")
+                await asyncio.sleep(delay)
+    
+    def _dead_letter(
+        self,
+        result: UploadResult,
+        job_id: Optional[str],
+        statement: str,
+        error: str,
+        row: Optional[Dict[str, Any]] = None,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Set aside a statement or row that failed on its own."""
+        result.add_dead_letter(error, statement)
+        if self.dead_letters:
+            self.dead_letters.write(job_id, statement, error, row=row, parameters=parameters)
+            result.dead_letter_path = str(self.dead_letters.path)
+        else:
+            logger.warning(f"Skipped a failing statement of job {job_id} (no dead-letter file): {error}")
     
     async def _verify_connectivity(self) -> None:
         """Verify database connectivity with detailed error reporting."""
@@ -0,0 +1,189 @@
+"""
+Schema Manager for Neo4j - index and constraint bootstrap before upload
+
+Relationship writes match their endpoints on unique_key and node writes
+merge on each label's merge properties. Without indexes on those
+properties every match is a label scan, so upload time grows
+quadratically with the graph. The schema manager derives the required
+schema from the node labels and the tuples' merge_properties and creates
+it idempotently (IF NOT EXISTS) before the first nodes of a label are
+written:
+- A lookup index on unique_key per label
+- A uniqueness constraint on the merge properties per label for
+  namespaced uploads (the namespace is part of the constraint, so equal
+  modules in different namespaces do not conflict); a plain index for
+  uploads without a namespace, whose graphs may share a database with
+  namespaced ones
+Creation waits for the new indexes to come online and its time is
+reported separately from the time spent loading data.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .neo4j_client import Neo4jClient
+
+logger = logging.getLogger(__name__)
+
+# Labels written by the transformer (mirrors NodeLabel in the transformer's tuple models)
+NODE_LABELS = ["Module", "Class", "Function", "Method", "Variable", "Import"]
+
+# Node property holding the graph namespace of namespaced uploads
+NAMESPACE_PROPERTY = "namespace"
+
+# Seconds to wait for new indexes to come online
+INDEX_AWAIT_TIMEOUT_SECONDS = 300
+
+
+def _quote(identifier: str) -> str:
+    """Quote a label, property or schema name for use in a statement."""
+    return "`" + identifier.replace("`", "``") + "`"
+
+
+@dataclass(frozen=True)
+class SchemaItem:
+    """An index, or uniqueness constraint, on properties of one label."""
+
+    label: str
+    properties: Tuple[str, ...]
+    unique: bool = False
+
+    @property
+    def name(self) -> str:
+        """Deterministic schema name, so re-creating an item is a no-op."""
+        name = "_".join([self.label.lower(), *self.properties])
+        return f"{name}_unique" if self.unique else name
+
+    def statement(self) -> str:
+        """The idempotent CREATE statement of the item."""
+        properties = ", ".join(f"n.{_quote(p)}" for p in self.properties)
+        if self.unique:
+            return (f"CREATE CONSTRAINT {_quote(self.name)} IF NOT EXISTS "
+                    f"FOR (n:{_quote(self.label)}) REQUIRE ({properties}) IS UNIQUE")
+        return f"CREATE INDEX {_quote(self.name)} IF NOT EXISTS FOR (n:{_quote(self.label)}) ON ({properties})"
+
+
+def lookup_index(label: str, namespace: Optional[str] = None) -> SchemaItem:
+    """Index relationship writes match endpoints of label on."""
+    scope = (NAMESPACE_PROPERTY,) if namespace else ()
+    return SchemaItem(label, scope + ("unique_key",))
+
+
+def required_schema(
+    nodes: Iterable[Dict[str, Any]],
+    namespace: Optional[str] = None,
+    module_path_labels: Iterable[str] = ()
+) -> List[SchemaItem]:
+    """
+    Derive the schema needed to write serialized node tuples.
+
+    Args:
+        nodes: Node dictionaries as produced by Neo4jNodeTuple.to_cypher_params
+        namespace: Graph namespace the nodes are written into, if any
+        module_path_labels: Labels whose nodes are matched by module_path alone
+            (stale module deletes), which a prefix of the merge keys cannot serve
+
+    Returns:
+        Schema items in a stable order, without duplicates
+    """
+    scope = (NAMESPACE_PROPERTY,) if namespace else ()
+    items: Dict[SchemaItem, None] = {}
+
+    for label, merge_keys in sorted({
+        (node["label"], tuple(sorted(node.get("merge_properties") or ())))
+        for node in nodes
+    }):
+        lookup = lookup_index(label, namespace)
+        items[lookup] = None
+        if merge_keys and merge_keys != ("unique_key",):
+            items[SchemaItem(label, scope + merge_keys, unique=bool(namespace))] = None
+
+    for label in module_path_labels:
+        items[SchemaItem(label, scope + ("module_path",))] = None
+
+    return list(items)
+
+
+class SchemaManager:
+    """Creates the indexes and constraints an upload needs, once per item."""
+
+    def __init__(
+        self,
+        neo4j_client: Neo4jClient,
+        namespace: Optional[str] = None,
+        await_timeout: int = INDEX_AWAIT_TIMEOUT_SECONDS
+    ):
+        self.neo4j_client = neo4j_client
+        self.namespace = namespace
+        self.await_timeout = await_timeout
+
+        # Items created (or found existing) by this manager, and the time spent
+        self.ensured: Set[SchemaItem] = set()
+        self.build_seconds = 0.0
+
+    async def ensure_nodes(
+        self,
+        nodes: List[Dict[str, Any]],
+        job_id: str,
+        module_path_labels: Iterable[str] = ()
+    ) -> float:
+        """
+        Ensure the schema for a batch of serialized node tuples.
+
+        Args:
+            nodes: Node dictionaries of the batch
+            job_id: Job the schema statements are attributed to
+            module_path_labels: Labels the batch's stale module deletes match by module_path
+
+        Returns:
+            Seconds spent creating and awaiting schema items
+        """
+        return await self._ensure(required_schema(nodes, self.namespace, module_path_labels), job_id)
+
+    async def ensure_labels(self, labels: Iterable[str] = NODE_LABELS, job_id: str = "unknown") -> float:
+        """
+        Ensure the unique_key lookup indexes of labels.
+
+        Used for literal Cypher uploads, whose merge properties are not known.
+
+        Returns:
+            Seconds spent creating and awaiting schema items
+        """
+        return await self._ensure([lookup_index(label, self.namespace) for label in labels], job_id)
+
+    async def _ensure(self, items: List[SchemaItem], job_id: str) -> float:
+        """Create the items not ensured yet and wait for them to come online."""
+        missing = [item for item in items if item not in self.ensured]
+        if not missing:
+            return 0.0
+
+        start = time.perf_counter()
+        for item in missing:
+            if await self._create(item, job_id) or not item.unique:
+                continue
+            # Existing duplicates prevent the constraint; an index still avoids the scans
+            logger.warning(f"Constraint {item.name} could not be created, indexing its properties instead")
+            await self._create(SchemaItem(item.label, item.properties), job_id)
+
+        await_result = await self.neo4j_client.execute_cypher_batch(
+            [f"CALL db.awaitIndexes({int(self.await_timeout)})"], batch_size=1, job_id=job_id
+        )
+        if not await_result.success:
+            logger.warning(f"Indexes did not come online: {', '.join(await_result.errors)}")
+
+        self.ensured.update(missing)
+        elapsed = time.perf_counter() - start
+        self.build_seconds += elapsed
+        logger.info(f"Ensured {len(missing)} indexes and constraints in {elapsed:.2f}s: "
+                    f"{', '.join(item.name for item in missing)}")
+        return elapsed
+
+    async def _create(self, item: SchemaItem, job_id: str) -> bool:
+        """Run an item's CREATE statement; returns whether it succeeded."""
+        # Schema statements run one per transaction
+        result = await self.neo4j_client.execute_cypher_batch([item.statement()], batch_size=1, job_id=job_id)
+        if not result.success:
+            logger.warning(f"Failed to create {item.name}: {', '.join(result.errors)}")
+        return result.success
@@ -0,0 +1,104 @@
+"""
+Upload Checkpoints for Neo4j - resuming interrupted Cypher file uploads
+
+After each committed batch of a literal Cypher upload, the uploader records
+where the committed part of the file ends: the batch number, the byte
+offset just past the batch's last command, and a hash of the bytes the
+batch was read from. A resumed upload verifies that hash against the file,
+seeks to the offset and carries on with the next batch.
+
+The checkpoint only advances over a contiguous run of committed batches,
+so a batch that failed is sent again on resume. A batch committed just
+before the process died may be sent again too; MERGE statements make that
+harmless, which is why resuming relies on the transformer's MERGE output.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def range_hash(file_path: Path, start: int, end: int) -> str:
+    """SHA-256 of the bytes [start, end) of a file."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = f.read(min(remaining, 1024 * 1024))
+            if not chunk:
+                break
+            digest.update(chunk)
+            remaining -= len(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class UploadCheckpoint:
+    """Committed prefix of a Cypher file upload."""
+
+    job_id: str
+    input_path: str
+    input_size_bytes: int
+    batch_number: int = 0  # Last committed batch; 0 before the first
+    byte_offset: int = 0  # End of the last committed batch's commands
+    batch_start_offset: int = 0  # Where the last committed batch was read from
+    range_hash: Optional[str] = None  # Hash of [batch_start_offset, byte_offset)
+    commands_committed: int = 0
+    completed: bool = False
+    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    @classmethod
+    def start(cls, job_id: str, input_path: Path) -> "UploadCheckpoint":
+        """Checkpoint of an upload that has not committed anything yet."""
+        return cls(job_id=job_id, input_path=str(input_path), input_size_bytes=input_path.stat().st_size)
+
+    @classmethod
+    def load(cls, checkpoint_path: Path) -> Optional["UploadCheckpoint"]:
+        """Read a checkpoint, or None if there is none."""
+        try:
+            with open(checkpoint_path, "r", encoding="utf-8") as f:
+                return cls(**json.load(f))
+        except FileNotFoundError:
+            return None
+
+    def save(self, checkpoint_path: Path) -> None:
+        """Write the checkpoint atomically, so a crash leaves the previous one intact."""
+        self.updated_at = datetime.now().isoformat()
+        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, checkpoint_path)
+
+    def advance(self, input_path: Path, batch_number: int, start: int, end: int, commands: int) -> None:
+        """Move past a committed batch read from bytes [start, end) of the input."""
+        self.batch_number = batch_number
+        self.batch_start_offset = start
+        self.byte_offset = end
+        self.range_hash = range_hash(input_path, start, end)
+        self.commands_committed += commands
+
+    def verify(self, job_id: str, input_path: Path) -> None:
+        """
+        Check that the checkpoint belongs to this job and input file.
+
+        Raises:
+            ValueError: If the job or file differ from the ones checkpointed
+        """
+        if self.job_id != job_id:
+            raise ValueError(f"Checkpoint belongs to job {self.job_id}, not {job_id}")
+        size = input_path.stat().st_size
+        if size != self.input_size_bytes:
+            raise ValueError(f"Input file changed since the checkpoint ({self.input_size_bytes} bytes, now {size})")
+        if self.range_hash and range_hash(input_path, self.batch_start_offset, self.byte_offset) != self.range_hash:
+            raise ValueError(f"Input file does not match the checkpoint at batch {self.batch_number}")
@@ -11,36 +11,83 @@ import asyncio
 import sys
 import json
 from pathlib import Path
+from typing import Optional
 
 from .core.neo4j_client import Neo4jClient
+from .core.batch_sizer import DEFAULT_TARGET_BATCH_SECONDS
 from .core.batch_uploader import BatchUploader
+from .core.bulk_writer import DEFAULT_UPLOAD_SESSIONS
+from .core.graph_cleaner import DEFAULT_CLEAR_BATCH_SIZE, GraphCleaner
 from .services.validation_service import ValidationService
-from .models.upload_result import UploadResult
+from .models.upload_result import ClearResult, UploadResult
 
 async def main():
     """Command-line entry point for uploader."""
     parser = argparse.ArgumentParser(
         description="Upload Phase 2 transformation results to Neo4j"
     )
-    parser.add_argument("--input", required=True, help="Path to cypher_commands file")
+    parser.add_argument("--input", required=True,
+                        help="Path to a tuple stream (.tuplestream), tuples JSON or cypher_commands file")
     parser.add_argument("--job-id", required=True, help="Job identifier")
     parser.add_argument("--output", help="Path to save upload results JSON")
     parser.add_argument("--neo4j-uri", help="Neo4j connection URI")
-    parser.add_argument("--batch-size", type=int, default=100, help="Batch size for uploads")
+    parser.add_argument("--batch-size", type=int, default=100, help="Initial batch size for Cypher command uploads")
+    parser.add_argument("--rows-per-batch", type=int, default=2000,
+                        help="Initial rows per UNWIND query for bulk tuple uploads")
+    parser.add_argument("--max-rows-per-batch", type=int,
+                        help="Largest rows per UNWIND query the adaptive sizing may reach (default 10x initial)")
+    parser.add_argument("--target-batch-seconds", type=float, default=DEFAULT_TARGET_BATCH_SECONDS,
+                        help="Latency each batch should commit within; slower batches shrink the batch size")
+    parser.add_argument("--max-batch-memory-mb", type=int, default=500,
+                        help="Most statement or row data held by one batch")
+    parser.add_argument("--fixed-batch-size", action="store_true",
+                        help="Keep batch sizes fixed instead of adapting them per statement kind")
+    parser.add_argument("--upload-sessions", type=int, default=DEFAULT_UPLOAD_SESSIONS,
+                        help="Sessions tuple uploads write node and relationship batches over concurrently")
+    parser.add_argument("--dead-letter-file",
+                        help="JSON Lines file for statements that fail on their own "
+                             "(default: dead_letter_<job-id>.jsonl next to the input)")
+    parser.add_argument("--checkpoint-file",
+                        help="Where Cypher uploads record their last committed batch "
+                             "(default: upload_checkpoint_<job-id>.json next to the input)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted upload after its last committed batch, without clearing")
     parser.add_argument("--validate-only", action="store_true", help="Only validate, don't upload")
     parser.add_argument("--clear-database", help="Clear database before upload (true/false)")
+    parser.add_argument("--namespace",
+                        help="Graph namespace to write into; --clear-database then only clears this namespace")
+    parser.add_argument("--clear-batch-size", type=int, default=DEFAULT_CLEAR_BATCH_SIZE,
+                        help="Nodes or relationships deleted per transaction when clearing")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
     
     args = parser.parse_args()
     
     # Initialize services
-    neo4j_client = Neo4jClient(uri=args.neo4j_uri)
+    dead_letter_file = args.dead_letter_file or str(Path(args.input).parent / f"dead_letter_{args.job_id}.jsonl")
+    checkpoint_file = args.checkpoint_file or str(Path(args.input).parent / f"upload_checkpoint_{args.job_id}.json")
+    neo4j_client = Neo4jClient(uri=args.neo4j_uri, dead_letter_path=dead_letter_file)
     validator = ValidationService()
-    uploader = BatchUploader(neo4j_client, batch_size=args.batch_size)
+    uploader = BatchUploader(
+        neo4j_client,
+        batch_size=args.batch_size,
+        max_memory_mb=args.max_batch_memory_mb,
+        rows_per_batch=args.rows_per_batch,
+        namespace=args.namespace,
+        adaptive_batches=not args.fixed_batch_size,
+        target_batch_seconds=args.target_batch_seconds,
+        max_rows_per_batch=args.max_rows_per_batch,
+        upload_sessions=args.upload_sessions
+    )
     
     try:
         # Validate input file
-        validation_result = await validator.validate_cypher_file(args.input)
+        input_suffix = Path(args.input).suffix
+        if input_suffix == ".tuplestream":
+            validation_result = await validator.validate_tuple_stream_file(args.input)
+        elif input_suffix == ".json":
+            validation_result = await validator.validate_tuples_file(args.input)
+        else:
+            validation_result = await validator.validate_cypher_file(args.input)
         if not validation_result.is_valid:
             print(f"Validation failed: {', '.join(validation_result.errors)}")
             if args.output:
@@ -53,15 +100,20 @@ async def main():
                 _save_validation_result(args.output, validation_result)
             sys.exit(0)
         
-        # Clear database if requested
+        # Clear database (or only the job's namespace) if requested; a resumed
+        # upload keeps what the interrupted one committed
         if args.clear_database and args.clear_database.lower() == "true":
-            print("Clearing database before upload...")
-            await _clear_database(neo4j_client)
+            if args.resume:
+                print("Resuming: not clearing the database")
+            else:
+                await _clear_database(neo4j_client, args.namespace, args.clear_batch_size)
         
         # Perform upload
         upload_result = await uploader.upload_from_file(
             args.input, 
-            job_id=args.job_id
+            job_id=args.job_id,
+            checkpoint_path=checkpoint_file,
+            resume=args.resume
         )
         
         # Save results if output path provided
@@ -70,9 +122,25 @@ async def main():
         
         if upload_result.success:
             print(f"Upload successful. Job ID: {upload_result.job_id}")
+            if upload_result.resumed_from_batch:
+                print(f"Resumed after batch {upload_result.resumed_from_batch}")
             print(f"Uploaded: {upload_result.nodes_created} nodes, {upload_result.relationships_created} relationships")
             if upload_result.upload_duration_seconds:
-                print(f"Duration: {upload_result.upload_duration_seconds:.2f} seconds")
+                print(f"Duration: {upload_result.upload_duration_seconds:.2f} seconds "
+                      f"({upload_result.index_build_seconds:.2f} seconds building indexes)")
+            if upload_result.nodes_per_second or upload_result.relationships_per_second:
+                print(f"Throughput: {upload_result.nodes_per_second:.0f} nodes/s, "
+                      f"{upload_result.relationships_per_second:.0f} relationships/s")
+            if upload_result.peak_concurrent_batches > 1:
+                print(f"Concurrency: {upload_result.upload_sessions} sessions, "
+                      f"peak {upload_result.peak_concurrent_batches} batches in flight, "
+                      f"{upload_result.deadlock_retries} deadlock retries")
+            if upload_result.dead_lettered:
+                print(f"Warning: {upload_result.dead_lettered} failing statements were set aside in "
+                      f"{upload_result.dead_letter_path or dead_letter_file}")
+            for kind, sizing in upload_result.batch_sizing.items():
+                print(f"  {kind}: batch size {sizing['smallest_batch_size']}-{sizing['largest_batch_size']}, "
+                      f"{sizing['rows_per_second']:.0f}/s over {sizing['batches']} batches")
             sys.exit(0)
         else:
             print(f"Upload failed: {', '.join(upload_result.errors)}")
@@ -85,33 +153,28 @@ async def main():
         sys.exit(1)
 
 
-async def _clear_database(neo4j_client: Neo4jClient) -> None:
-    """Clear the Neo4j database before upload."""
-    try:
-        # Connect to Neo4j
-        await neo4j_client.connect()
-        
-        # Clear all nodes and relationships
-        clear_commands = [
-            "MATCH (n) DETACH DELETE n;",
-            "CALL apoc.schema.assert({},{},true) YIELD label, key RETURN *;"  # Clear constraints/indexes if APOC available
-        ]
-        
-        for command in clear_commands:
-            try:
-                result = await neo4j_client.execute_cypher_batch([command], batch_size=1)
-                if not result.success:
-                    print(f"Warning: Clear command failed: {command}")
-            except Exception as e:
-                # APOC may not be available, ignore errors for the second command
-                if "apoc" not in command.lower():
-                    raise e
-        
-        print("Database cleared successfully")
-        
-    except Exception as e:
-        print(f"Failed to clear database: {e}")
-        raise
+async def _clear_database(neo4j_client: Neo4jClient, namespace: Optional[str], batch_size: int) -> None:
+    """
+    Clear the database, or only one namespace, before upload.
+    
+    Deletes in bounded batches while the database stays online. Indexes and
+    constraints are kept: the upload would only have to rebuild them.
+    """
+    scope = f"namespace {namespace}" if namespace else "database"
+    print(f"Clearing {scope} before upload...")
+    
+    def report(progress: ClearResult) -> None:
+        print(f"Clear progress: {progress.progress_percentage:.1f}% "
+              f"({progress.nodes_deleted}/{progress.total_nodes} nodes, "
+              f"{progress.relationships_deleted}/{progress.total_relationships} relationships)")
+    
+    result = await GraphCleaner(neo4j_client, batch_size=batch_size).clear(namespace, report)
+    if not result.success:
+        print(f"Failed to clear {scope}: {', '.join(result.errors)}")
+        raise RuntimeError(f"Failed to clear {scope}")
+    
+    print(f"Cleared {scope}: {result.nodes_deleted} nodes, {result.relationships_deleted} relationships "
+          f"in {result.clear_duration_seconds:.2f} seconds")
 
 
 def _save_upload_result(output_path: str, result: UploadResult) -> None:
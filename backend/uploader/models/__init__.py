@@ -7,6 +7,9 @@ Exports all model classes for Neo4j upload operations.
 from .upload_result import (
     UploadResult,
     BatchResult,
+    ClearResult,
+    SnapshotResult,
+    GraphFingerprint,
     ConnectionHealth,
     ValidationResult
 )
@@ -22,6 +25,9 @@ __all__ = [
     # Upload result models
     "UploadResult",
     "BatchResult",
+    "ClearResult",
+    "SnapshotResult",
+    "GraphFingerprint",
     "ConnectionHealth",
     "ValidationResult",
     
@@ -25,10 +25,21 @@ class UploadResult(BaseModel):
     # Performance metrics
     upload_duration_seconds: float = Field(default=0.0, description="Total upload duration in seconds")
     average_command_time_ms: float = Field(default=0.0, description="Average time per command in milliseconds")
+    nodes_per_second: float = Field(default=0.0, description="Node write throughput of bulk uploads")
+    relationships_per_second: float = Field(default=0.0, description="Relationship write throughput of bulk uploads")
+    index_build_seconds: float = Field(default=0.0, description="Time spent creating indexes and constraints before loading")
+    schema_items_ensured: int = Field(default=0, description="Indexes and constraints ensured before loading")
+    batch_sizing: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict, description="Batch sizes chosen and throughput per statement kind"
+    )
+    upload_sessions: int = Field(default=1, description="Sessions bulk batches were written over concurrently")
+    peak_concurrent_batches: int = Field(default=0, description="Most batches observed in flight at once")
+    deadlock_retries: int = Field(default=0, description="Batches retried after deadlocking with a concurrent one")
     
     # File information
     cypher_file_path: Optional[str] = Field(None, description="Path to the Cypher commands file")
     cypher_file_size_bytes: Optional[int] = Field(None, description="Size of the Cypher file in bytes")
+    resumed_from_batch: Optional[int] = Field(None, description="Checkpointed batch a resumed upload continued after")
     
     # Estimation vs actual
     estimated_nodes: Optional[int] = Field(None, description="Estimated number of nodes before upload")
@@ -37,6 +48,8 @@ class UploadResult(BaseModel):
     # Error tracking
     errors: List[str] = Field(default_factory=list, description="List of errors encountered")
     failed_commands: List[Dict[str, Any]] = Field(default_factory=list, description="Commands that failed with details")
+    dead_lettered: int = Field(default=0, description="Statements or rows that failed on their own and were set aside")
+    dead_letter_path: Optional[str] = Field(None, description="JSON Lines file the set aside statements were written to")
     
     # Timestamps
     started_at: Optional[datetime] = Field(None, description="When the upload started")
@@ -46,11 +59,19 @@ class UploadResult(BaseModel):
         """Add an error to the result."""
         self.errors.append(error)
         if command:
-            self.failed_commands.append({
-                "command": command[:200] + "..." if len(command) > 200 else command,
-                "error": error,
-                "timestamp": datetime.now().isoformat()
-            })
+            self._add_failed_command(error, command)
+    
+    def add_dead_letter(self, error: str, command: str) -> None:
+        """Record a statement set aside after failing on its own; the upload itself carries on."""
+        self.dead_lettered += 1
+        self._add_failed_command(error, command)
+    
+    def _add_failed_command(self, error: str, command: str) -> None:
+        self.failed_commands.append({
+            "command": command[:200] + "..." if len(command) > 200 else command,
+            "error": error,
+            "timestamp": datetime.now().isoformat()
+        })
     
     @property
     def has_errors(self) -> bool:
@@ -72,13 +93,17 @@ class UploadResult(BaseModel):
         self.total_commands_executed += other.total_commands_executed
         self.errors.extend(other.errors)
         self.failed_commands.extend(other.failed_commands)
+        self.dead_lettered += other.dead_lettered
+        self.dead_letter_path = self.dead_letter_path or other.dead_letter_path
+        self.deadlock_retries += other.deadlock_retries
     
     def merge_batch_result(self, batch: 'BatchResult') -> None:
         """Merge statistics from a batch result."""
         self.nodes_created += batch.nodes_created
         self.relationships_created += batch.relationships_created
         self.properties_set += batch.properties_set
-        self.total_commands_executed += batch.commands_in_batch
+        self.total_commands_executed += batch.commands_in_batch - batch.dead_lettered
+        self.dead_lettered += batch.dead_lettered
         self.errors.extend(batch.errors)
         if not batch.success:
             self.success = False
@@ -96,13 +121,24 @@ class UploadResult(BaseModel):
             "completion_percentage": self.completion_percentage,
             "upload_duration_seconds": self.upload_duration_seconds,
             "average_command_time_ms": self.average_command_time_ms,
+            "nodes_per_second": self.nodes_per_second,
+            "relationships_per_second": self.relationships_per_second,
+            "index_build_seconds": self.index_build_seconds,
+            "schema_items_ensured": self.schema_items_ensured,
+            "batch_sizing": self.batch_sizing,
+            "upload_sessions": self.upload_sessions,
+            "peak_concurrent_batches": self.peak_concurrent_batches,
+            "deadlock_retries": self.deadlock_retries,
             "cypher_file_path": self.cypher_file_path,
             "cypher_file_size_bytes": self.cypher_file_size_bytes,
+            "resumed_from_batch": self.resumed_from_batch,
             "estimated_nodes": self.estimated_nodes,
             "estimated_relationships": self.estimated_relationships,
             "errors": self.errors,
             "error_count": len(self.errors),
             "failed_commands": self.failed_commands,
+            "dead_lettered": self.dead_lettered,
+            "dead_letter_path": self.dead_letter_path,
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "has_errors": self.has_errors
@@ -117,6 +153,8 @@ class BatchResult(BaseModel):
     success: bool = Field(default=False, description="Whether the batch was successful")
     
     # Batch statistics
+    statement_kind: Optional[str] = Field(None, description="Kind of statement batched, e.g. node:Module")
+    batch_size: int = Field(default=0, description="Batch size chosen for this batch")
     commands_in_batch: int = Field(..., description="Number of commands in this batch")
     nodes_created: int = Field(default=0, description="Nodes created in this batch")
     relationships_created: int = Field(default=0, description="Relationships created in this batch")
@@ -127,28 +165,166 @@ class BatchResult(BaseModel):
     
     # Errors
     errors: List[str] = Field(default_factory=list, description="Errors in this batch")
+    dead_lettered: int = Field(default=0, description="Commands of this batch set aside after failing on their own")
     
     def add_error(self, error: str) -> None:
         """Add an error to the batch result."""
         self.errors.append(error)
         self.success = False
     
+    @property
+    def commands_per_second(self) -> float:
+        """Throughput of this batch."""
+        if self.execution_time_seconds <= 0:
+            return 0.0
+        return self.commands_in_batch / self.execution_time_seconds
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
             "batch_number": self.batch_number,
             "job_id": self.job_id,
             "success": self.success,
+            "statement_kind": self.statement_kind,
+            "batch_size": self.batch_size,
             "commands_in_batch": self.commands_in_batch,
             "nodes_created": self.nodes_created,
             "relationships_created": self.relationships_created,
             "properties_set": self.properties_set,
             "execution_time_seconds": self.execution_time_seconds,
+            "commands_per_second": self.commands_per_second,
+            "dead_lettered": self.dead_lettered,
+            "errors": self.errors,
+            "error_count": len(self.errors)
+        }
+
+
+class ClearResult(BaseModel):
+    """Result model for clearing the graph, or one namespace of it, in batches."""
+    
+    namespace: Optional[str] = Field(None, description="Namespace cleared, or None for the whole graph")
+    success: bool = Field(default=False, description="Whether the clear completed")
+    
+    # Progress
+    total_nodes: int = Field(default=0, description="Nodes in scope when the clear started")
+    total_relationships: int = Field(default=0, description="Relationships in scope when the clear started")
+    nodes_deleted: int = Field(default=0, description="Nodes deleted so far")
+    relationships_deleted: int = Field(default=0, description="Relationships deleted so far")
+    batches: int = Field(default=0, description="Delete transactions committed so far")
+    batch_size: int = Field(default=0, description="Maximum nodes or relationships deleted per transaction")
+    
+    clear_duration_seconds: float = Field(default=0.0, description="Time taken to clear")
+    errors: List[str] = Field(default_factory=list, description="List of errors encountered")
+    
+    def add_error(self, error: str) -> None:
+        """Add an error to the result."""
+        self.errors.append(error)
+        self.success = False
+    
+    @property
+    def progress_percentage(self) -> float:
+        """Share of the nodes and relationships in scope deleted so far."""
+        total = self.total_nodes + self.total_relationships
+        if total == 0:
+            return 100.0
+        return min(100.0, (self.nodes_deleted + self.relationships_deleted) / total * 100)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "namespace": self.namespace,
+            "success": self.success,
+            "total_nodes": self.total_nodes,
+            "total_relationships": self.total_relationships,
+            "nodes_deleted": self.nodes_deleted,
+            "relationships_deleted": self.relationships_deleted,
+            "batches": self.batches,
+            "batch_size": self.batch_size,
+            "progress_percentage": self.progress_percentage,
+            "clear_duration_seconds": self.clear_duration_seconds,
+            "errors": self.errors,
+            "error_count": len(self.errors)
+        }
+
+
+class SnapshotResult(BaseModel):
+    """Result model for writing or restoring an online graph snapshot."""
+
+    operation: str = Field(..., description="Operation performed (snapshot, restore)")
+    snapshot_path: str = Field(..., description="Directory holding the snapshot manifest and chunks")
+    namespace: Optional[str] = Field(None, description="Namespace snapshotted, or None for the whole graph")
+    success: bool = Field(default=False, description="Whether the operation completed")
+
+    nodes: int = Field(default=0, description="Nodes written to or restored from the snapshot")
+    relationships: int = Field(default=0, description="Relationships written to or restored from the snapshot")
+    chunks: int = Field(default=0, description="Chunk files written or read")
+    size_bytes: int = Field(default=0, description="Compressed size of the chunk files")
+
+    duration_seconds: float = Field(default=0.0, description="Time taken by the operation")
+    errors: List[str] = Field(default_factory=list, description="List of errors encountered")
+
+    def add_error(self, error: str) -> None:
+        """Add an error to the result."""
+        self.errors.append(error)
+        self.success = False
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Node throughput of the operation."""
+        return self.nodes / self.duration_seconds if self.duration_seconds > 0 else 0.0
+
+    @property
+    def relationships_per_second(self) -> float:
+        """Relationship throughput of the operation."""
+        return self.relationships / self.duration_seconds if self.duration_seconds > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """Compressed snapshot bytes written or read per second, in megabytes."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.size_bytes / (1024 * 1024) / self.duration_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "operation": self.operation,
+            "snapshot_path": self.snapshot_path,
+            "namespace": self.namespace,
+            "success": self.success,
+            "nodes": self.nodes,
+            "relationships": self.relationships,
+            "chunks": self.chunks,
+            "size_bytes": self.size_bytes,
+            "duration_seconds": self.duration_seconds,
+            "nodes_per_second": self.nodes_per_second,
+            "relationships_per_second": self.relationships_per_second,
+            "megabytes_per_second": self.megabytes_per_second,
             "errors": self.errors,
             "error_count": len(self.errors)
         }
 
 
+class GraphFingerprint(BaseModel):
+    """Cheap identity of the graph, or one namespace of it, used to skip redundant backups."""
+
+    namespace: Optional[str] = Field(None, description="Namespace fingerprinted, or None for the whole graph")
+    node_count: int = Field(..., description="Nodes in scope")
+    relationship_count: int = Field(..., description="Relationships in scope")
+    key_hash: str = Field(..., description="Order-independent hash of node keys and properties in scope (hex)")
+    computed_at: datetime = Field(default_factory=datetime.now, description="When the fingerprint was taken")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "namespace": self.namespace,
+            "node_count": self.node_count,
+            "relationship_count": self.relationship_count,
+            "key_hash": self.key_hash,
+            "computed_at": self.computed_at.isoformat()
+        }
+
+
 class ConnectionHealth(BaseModel):
     """Model for Neo4j connection health status."""
     
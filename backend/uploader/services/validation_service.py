@@ -4,6 +4,7 @@ Validation Service for Neo4j Uploader
 Validates Cypher files and commands before upload to ensure data integrity.
 """
 
+import json
 import re
 import logging
 from pathlib import Path
@@ -115,6 +116,111 @@ class ValidationService:
             result.add_error(f"Validation error: {str(e)}")
             return result
     
+    async def validate_tuples_file(self, file_path: str) -> ValidationResult:
+        """
+        Validate a transformer tuples file (tuples_<job_id>.json).
+        
+        Args:
+            file_path: Path to the tuples JSON file
+            
+        Returns:
+            ValidationResult with validation status and statistics
+        """
+        result = ValidationResult(
+            is_valid=True,
+            file_path=file_path
+        )
+        
+        try:
+            tuples_file = Path(file_path)
+            
+            if not tuples_file.exists():
+                result.add_error(f"File does not exist: {file_path}")
+                return result
+            
+            result.file_size_bytes = tuples_file.stat().st_size
+            
+            with open(tuples_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            nodes = data.get("nodes")
+            relationships = data.get("relationships")
+            if not isinstance(nodes, list) or not isinstance(relationships, list):
+                result.add_error("Tuples file must contain 'nodes' and 'relationships' lists")
+                return result
+            
+            for i, node in enumerate(nodes):
+                if not node.get("label") or not node.get("unique_key"):
+                    result.add_error(f"Node {i + 1}: missing label or unique_key")
+            for i, relationship in enumerate(relationships):
+                if not all(relationship.get(k) for k in ("source_key", "target_key", "relationship_type")):
+                    result.add_error(f"Relationship {i + 1}: missing source_key, target_key or relationship_type")
+            
+            stale_modules = len(data.get("replaced_modules", [])) + len(data.get("deleted_modules", []))
+            if not nodes and not relationships and not stale_modules:
+                result.add_error("Tuples file contains no data")
+            
+            result.estimated_nodes = len(nodes)
+            result.estimated_relationships = len(relationships)
+            result.total_commands = len(nodes) + len(relationships) + stale_modules
+            
+            logger.info(f"Validation completed: {file_path} - Valid: {result.is_valid}, "
+                        f"Nodes: {len(nodes)}, Relationships: {len(relationships)}")
+            
+            return result
+            
+        except Exception as e:
+            logger.error(f"Validation failed for {file_path}: {e}")
+            result.add_error(f"Validation error: {str(e)}")
+            return result
+    
+    async def validate_tuple_stream_file(self, file_path: str) -> ValidationResult:
+        """
+        Validate a framed tuple stream file.
+        
+        Only the header and the trailer are checked; frames are validated
+        as they are read during upload, so the file is never loaded as a
+        whole.
+        
+        Args:
+            file_path: Path to the tuple stream file
+            
+        Returns:
+            ValidationResult with validation status
+        """
+        from ..core.bulk_writer import read_tuple_stream_trailer
+        
+        result = ValidationResult(
+            is_valid=True,
+            file_path=file_path
+        )
+        
+        try:
+            stream_file = Path(file_path)
+            
+            if not stream_file.exists():
+                result.add_error(f"File does not exist: {file_path}")
+                return result
+            
+            result.file_size_bytes = stream_file.stat().st_size
+            
+            # The trailer is only written once the transformer finished the stream
+            try:
+                trailer = read_tuple_stream_trailer(stream_file)
+            except ValueError as e:
+                result.add_error(str(e))
+                return result
+            
+            if trailer["frames"] == 0:
+                result.add_error("Tuple stream contains no frames")
+            
+            return result
+            
+        except Exception as e:
+            logger.error(f"Validation failed for {file_path}: {e}")
+            result.add_error(f"Validation error: {str(e)}")
+            return result
+    
     async def validate_cypher_commands(self, commands: List[str]) -> ValidationResult:
         """
         Validate a list of Cypher commands.
@@ -9,6 +9,27 @@ Test Structure:
 - test_parallel_processor.py: Unit tests for parallel processing system
 - test_hash_based_cache.py: Unit tests for hash-based caching system
 - test_integration.py: Integration tests for complete system workflows
+- test_ast_visitors.py: Unit tests for the single-pass CombinedVisitor
+- test_status_reporter.py: Unit tests for the batched StatusReporter transport
+- test_incremental_pipeline.py: Module deltas and stale subgraph deletion for incremental runs
+- test_bulk_writer.py: UNWIND batch grouping and chunking for the uploader's bulk path
+- test_batch_sizer.py: Adaptive (AIMD) batch sizes per statement kind within latency and memory limits
+- test_dead_letter.py: Bisecting failed batches, dead-lettering poison statements and transient retries
+- test_upload_checkpoint.py: Checkpoints after committed batches and resuming interrupted Cypher uploads
+- test_parallel_upload.py: Key-partitioned concurrent upload sessions, endpoint label ordering and deadlock retries
+- test_tuple_set.py: In-place TupleSet accumulation and slotted tuple classes
+- test_parallel_generator.py: Process-pool tuple generation, shard ordering and throughput metrics
+- test_extraction_stream.py: NDJSON extraction output, byte-offset index and incremental reading of both layouts
+- test_phase_workers.py: Warm phase worker processes, streamed progress and restarts
+- test_job_scheduler.py: Bounded, fair job scheduling with per-phase concurrency limits
+- test_schema_manager.py: Index and constraint bootstrap before upload
+- test_graph_cleaner.py: Online graph clear in bounded batches, scoped to a namespace
+- test_graph_snapshot.py: Online columnar graph snapshots and their UNWIND restore
+- test_chunk_store.py: Content-defined chunking, deduplicated backups and parallel restore
+- test_graph_fingerprint.py: Graph fingerprints and skipping backups of an unchanged graph
+- test_registry_store.py: SQLite backup registry, legacy JSON import, paginated listing and concurrent writers
+- benchmark_ast_visitors.py: Extraction timing, single-pass vs multi-pass visitor
+- benchmark_tuple_set.py: Transformer accumulation timing at 10k and 100k modules, extend vs merge, serial vs process pool
 
 To run all performance tests:
     pytest tests/performance/ -v
@@ -0,0 +1,186 @@
+"""
+Benchmark for the single-pass CombinedVisitor.
+
+Compares per-file extraction time of the current single-pass CombinedVisitor
+against the previous multi-pass implementation (separate class, import and
+variable traversals plus an ast.walk for functions) on synthetic modules of
+1k to 20k lines. Parsing with ast.parse is done once per module and is not
+included in the timings.
+
+Usage:
+    python tests/performance/benchmark_ast_visitors.py
+    python tests/performance/benchmark_ast_visitors.py --lines 1000 5000 --repeat 5
+"""
+
+import argparse
+import ast
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# The extractor runs with its own directory on sys.path (flat imports)
+EXTRACTOR_DIR = Path(__file__).resolve().parents[2] / "backend" / "parser" / "prod" / "extractor"
+sys.path.insert(0, str(EXTRACTOR_DIR))
+
+from ast_visitors import (  # noqa: E402
+    ClassVisitor,
+    CombinedVisitor,
+    FunctionVisitor,
+    ImportVisitor,
+    VariableVisitor,
+)
+from models import ParsedClass  # noqa: E402
+
+
+class LegacyCombinedVisitor:
+    """The multi-pass extraction CombinedVisitor used before the single-pass rewrite."""
+
+    def __init__(self, status_reporter=None):
+        self.class_visitor = ClassVisitor(status_reporter)
+        self.function_visitor = FunctionVisitor(status_reporter)
+        self.import_visitor = ImportVisitor(status_reporter)
+        self.variable_visitor = VariableVisitor(status_reporter)
+
+    def visit(self, node: ast.AST) -> Dict[str, List]:
+        self.class_visitor.visit(node)
+        self.import_visitor.visit(node)
+        self._extract_functions_with_context(node)
+        self.variable_visitor.visit(node)
+        return {
+            "classes": self.class_visitor.classes,
+            "functions": self.function_visitor.functions,
+            "imports": self.import_visitor.imports,
+            "variables": self.variable_visitor.variables
+        }
+
+    def _extract_functions_with_context(self, node: ast.AST) -> None:
+        for child in ast.walk(node):
+            if isinstance(child, ast.ClassDef):
+                parsed_class = self._find_parsed_class(child.name)
+                if parsed_class:
+                    self.function_visitor.set_current_class(parsed_class)
+                    for item in child.body:
+                        if isinstance(item, ast.FunctionDef):
+                            self.function_visitor.visit(item)
+                    self.function_visitor.set_current_class(None)
+            elif isinstance(child, ast.FunctionDef):
+                if not self._is_method(child):
+                    self.function_visitor.visit(child)
+
+    def _find_parsed_class(self, name: str) -> Optional[ParsedClass]:
+        for cls in self.class_visitor.classes:
+            if cls.name == name:
+                return cls
+            found = self._find_inner_class(cls, name)
+            if found:
+                return found
+        return None
+
+    def _find_inner_class(self, parent: ParsedClass, name: str) -> Optional[ParsedClass]:
+        for inner in parent.inner_classes:
+            if inner.name == name:
+                return inner
+            found = self._find_inner_class(inner, name)
+            if found:
+                return found
+        return None
+
+    def _is_method(self, node: ast.FunctionDef) -> bool:
+        for parent in ast.walk(node):
+            if isinstance(parent, ast.ClassDef):
+                return True
+        return False
+
+
+def generate_module(target_lines: int) -> str:
+    """Generate a realistic module of roughly target_lines lines."""
+    lines = [
+        '"""Synthetic benchmark module."""',
+        "",
+        "import os",
+        "import logging",
+        "from typing import Any, Dict, List, Optional",
+        "",
+        "logger = logging.getLogger(__name__)",
+        "MAX_ITEMS = 100",
+        "",
+    ]
+    index = 0
+    while len(lines) < target_lines:
+        lines.extend([
+            f"class Service{index}(object):",
+            f'    """Service number {index}."""',
+            "",
+            "    retries: int = 3",
+            "    timeout = 5.0",
+            "",
+            "    def __init__(self, name: str, options: Optional[Dict[str, Any]] = None):",
+            "        self.name = name",
+            "        self.options = options or {}",
+            "        self.items: List[str] = []",
+            "",
+            "    def process(self, values: List[int]) -> int:",
+            "        total = 0",
+            "        for value in values:",
+            "            if value % 2 == 0:",
+            "                total += value * 2",
+            "            else:",
+            "                total -= value",
+            "        def clamp(x):",
+            "            limit = MAX_ITEMS",
+            "            return min(x, limit)",
+            "        return clamp(total)",
+            "",
+            "    @staticmethod",
+            "    def describe(item: Dict[str, Any]) -> str:",
+            "        return ', '.join(f'{k}={v}' for k, v in sorted(item.items()))",
+            "",
+            "    class Config:",
+            "        enabled = True",
+            "",
+            "        def as_dict(self):",
+            "            return {'enabled': self.enabled}",
+            "",
+            "",
+            f"def helper_{index}(path: str, *args, **kwargs) -> Optional[str]:",
+            '    """Module level helper."""',
+            "    result = os.path.join(path, *args)",
+            "    if kwargs.get('debug'):",
+            "        logger.debug(result)",
+            "    return result",
+            "",
+            "",
+        ])
+        index += 1
+    return "\n".join(lines) + "\n"
+
+
+def time_visitor(visitor_cls, tree: ast.AST, repeat: int) -> float:
+    """Return the best per-run time in seconds for a visitor over a parsed tree."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        visitor_cls().visit(tree)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CombinedVisitor extraction")
+    parser.add_argument("--lines", type=int, nargs="+", default=[1000, 5000, 10000, 20000],
+                        help="Module sizes in lines")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size (best is reported)")
+    args = parser.parse_args()
+
+    print(f"{'lines':>8} {'multi-pass (ms)':>16} {'single-pass (ms)':>17} {'speedup':>8}")
+    for target_lines in args.lines:
+        source = generate_module(target_lines)
+        tree = ast.parse(source)
+        legacy = time_visitor(LegacyCombinedVisitor, tree, args.repeat)
+        single = time_visitor(CombinedVisitor, tree, args.repeat)
+        print(f"{len(source.splitlines()):>8} {legacy * 1000:>16.1f} {single * 1000:>17.1f} {legacy / single:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmark for TupleSet accumulation in the transformer.
+
+Compares building the tuple set of a synthetic codebase with the in-place
+TupleSet.extend (what TransformationOrchestrator now does) against the
+previous copy-on-merge loop (`all_tuples = all_tuples.merge(module_tuples)`),
+which is quadratic in the number of modules. Tuple generation itself is
+included in both timings; the copy-on-merge loop is only run up to
+--legacy-limit modules since it does not finish in reasonable time beyond.
+With --workers, the orchestrator's process-pool mode is timed as well.
+
+Usage:
+    python tests/performance/benchmark_tuple_set.py
+    python tests/performance/benchmark_tuple_set.py --modules 1000 10000 --legacy-limit 10000 --memory
+    python tests/performance/benchmark_tuple_set.py --modules 10000 100000 --workers 4 --shard-size 200
+"""
+
+import argparse
+import asyncio
+import functools
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from backend.transformer.core.tuple_generator import TupleGenerator  # noqa: E402
+from backend.transformer.main import TransformationOrchestrator  # noqa: E402
+from backend.transformer.models.tuples import TupleSet  # noqa: E402
+
+
+def generate_extraction(module_count: int) -> Dict[str, Any]:
+    """Generate extraction data for module_count small but realistic modules."""
+    modules = {}
+    for index in range(module_count):
+        path = f"/src/pkg{index // 100}/module_{index}.py"
+        modules[path] = {
+            "name": f"module_{index}",
+            "line_count": 60,
+            "imports": [
+                {"name": "os", "line_start": 1, "line_end": 1},
+                {"name": f"module_{(index + 1) % module_count}", "fromname": "pkg", "line_start": 2, "line_end": 2},
+            ],
+            "classes": [{
+                "name": f"Service{index}",
+                "bases": ["Base"],
+                "line_start": 5,
+                "line_end": 40,
+                "methods": [
+                    {"name": "__init__", "signature": "(self)", "line_start": 6, "line_end": 10},
+                    {"name": "run", "signature": "(self, value: int) -> int", "line_start": 12, "line_end": 30},
+                ],
+            }],
+            "functions": [{"name": f"helper_{index}", "signature": "(path: str)", "line_start": 42, "line_end": 50}],
+            "variables": [{"name": "MAX_ITEMS", "line_start": 3, "scope": "module"}],
+        }
+    return {"modules": modules}
+
+
+def run_extend(extraction: Dict[str, Any], workers=None, shard_size=200) -> int:
+    """Transform through TransformationOrchestrator; returns the tuple count."""
+    orchestrator = TransformationOrchestrator(
+        job_id="benchmark", enable_progress_reporting=False, parallel_workers=workers, shard_size=shard_size
+    )
+    result = asyncio.run(orchestrator.transform_extraction_data(extraction, output_formats=[]))
+    return result.metadata.output_nodes_count + result.metadata.output_relationships_count
+
+
+def run_legacy_merge(extraction: Dict[str, Any]) -> int:
+    """Accumulate with the previous copy-on-merge loop; returns the tuple count."""
+    generator = TupleGenerator()
+    all_tuples = TupleSet()
+    for module_path, module_data in extraction["modules"].items():
+        all_tuples = all_tuples.merge(generator.generate_module_tuples(module_path, module_data))
+    return all_tuples.size
+
+
+def measure(func, extraction: Dict[str, Any], memory: bool):
+    """Return (seconds, tuple count, peak MiB or None) for one run."""
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    count = func(extraction)
+    elapsed = time.perf_counter() - start
+    peak = None
+    if memory:
+        peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+    return elapsed, count, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TupleSet accumulation")
+    parser.add_argument("--modules", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Codebase sizes in modules")
+    parser.add_argument("--legacy-limit", type=int, default=10000,
+                        help="Largest size the copy-on-merge loop is run for")
+    parser.add_argument("--memory", action="store_true",
+                        help="Also report peak traced memory (slows both runs down)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Also time the process-pool mode with this many workers (0: one per CPU)")
+    parser.add_argument("--shard-size", type=int, default=200,
+                        help="Modules per worker shard in the process-pool mode")
+    args = parser.parse_args()
+
+    print(f"{'modules':>8} {'tuples':>9} {'merge (s)':>10} {'extend (s)':>11} {'speedup':>8} {'peak (MiB)':>11}"
+          f"{' parallel (s)':>14}")
+    for module_count in args.modules:
+        extraction = generate_extraction(module_count)
+        extend_time, count, peak = measure(run_extend, extraction, args.memory)
+
+        if module_count <= args.legacy_limit:
+            legacy_time, _, _ = measure(run_legacy_merge, extraction, False)
+            legacy = f"{legacy_time:>10.2f}"
+            speedup = f"{legacy_time / extend_time:>7.1f}x"
+        else:
+            legacy, speedup = f"{'-':>10}", f"{'-':>8}"
+
+        if args.workers is not None:
+            parallel = functools.partial(run_extend, workers=args.workers, shard_size=args.shard_size)
+            parallel_time, _, _ = measure(parallel, extraction, False)
+            parallel_text = f"{parallel_time:>14.2f}"
+        else:
+            parallel_text = f"{'-':>14}"
+
+        peak_text = f"{peak:>11.1f}" if peak is not None else f"{'-':>11}"
+        print(f"{module_count:>8} {count:>9} {legacy} {extend_time:>11.2f} {speedup} {peak_text}{parallel_text}")
+
+
+if __name__ == "__main__":
+    main()
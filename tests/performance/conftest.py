@@ -0,0 +1,15 @@
+"""
+Shared pytest configuration for the performance test suite.
+
+The extractor modules use flat imports (``from models import ...``) because
+the extractor runs with its own directory on sys.path. The tests import them
+the same way.
+"""
+
+import sys
+from pathlib import Path
+
+EXTRACTOR_DIR = Path(__file__).resolve().parents[2] / "backend" / "parser" / "prod" / "extractor"
+
+if str(EXTRACTOR_DIR) not in sys.path:
+    sys.path.insert(0, str(EXTRACTOR_DIR))
@@ -0,0 +1,97 @@
+"""
+Unit tests for the single-pass CombinedVisitor.
+
+Tests cover:
+- Method-to-class linking, including classes with duplicate names
+- Nested functions and inner classes
+- Async functions
+- Import and variable extraction scopes
+"""
+
+import ast
+
+import pytest
+
+from ast_visitors import CombinedVisitor
+
+
+SOURCE = '''
+import os
+from typing import List as L
+
+MAX_SIZE = 10
+
+class Worker(Base):
+    limit = 5
+
+    def __init__(self):
+        self.name = "worker"
+        def helper():
+            value = 1
+
+    async def run(self):
+        pass
+
+    class Settings:
+        def load(self):
+            pass
+
+def main(argv: L[str]) -> int:
+    import sys
+    def nested():
+        pass
+    return 0
+
+async def serve():
+    pass
+
+class Worker:
+    def duplicate(self):
+        pass
+'''
+
+
+@pytest.fixture
+def elements():
+    """Extract elements from the sample source."""
+    return CombinedVisitor().visit(ast.parse(SOURCE))
+
+
+class TestCombinedVisitor:
+    """Test cases for CombinedVisitor."""
+
+    def test_methods_linked_to_their_class(self, elements):
+        """Test that methods are attached to the class that defines them."""
+        first, second = elements["classes"]
+        assert [m.name for m in first.methods] == ["__init__", "run"]
+        assert [m.name for m in second.methods] == ["duplicate"]
+        assert all(m.is_method for m in first.methods + second.methods)
+
+    def test_methods_not_reported_as_functions(self, elements):
+        """Test that only module-level functions are top-level functions."""
+        assert [f.name for f in elements["functions"]] == ["main", "serve"]
+
+    def test_nested_definitions(self, elements):
+        """Test that nested functions and inner classes stay with their parents."""
+        worker = elements["classes"][0]
+        init = worker.methods[0]
+        assert [f.name for f in init.nested_functions] == ["helper"]
+        assert not init.nested_functions[0].is_method
+        assert [c.name for c in worker.inner_classes] == ["Settings"]
+        assert [m.name for m in worker.inner_classes[0].methods] == ["load"]
+        assert [f.name for f in elements["functions"][0].nested_functions] == ["nested"]
+
+    def test_imports_include_function_local(self, elements):
+        """Test that all imports are extracted."""
+        assert [i.name for i in elements["imports"]] == ["os", "List", "sys"]
+        assert elements["imports"][1].asname == "L"
+
+    def test_variable_scopes(self, elements):
+        """Test that variables carry the scope they were assigned in."""
+        scopes = {v.name: v.scope for v in elements["variables"]}
+        assert scopes == {
+            "MAX_SIZE": "module",
+            "limit": "class",
+            "self.name": "function",
+            "value": "function",
+        }
@@ -8,8 +8,8 @@ import pytest
 import tempfile
 from pathlib import Path
 
-from backend.parser.config import get_parser_config
-from backend.parser.codebase_parser import CodebaseParser
+from config import get_parser_config
+from codebase_parser import CodebaseParser
 
 
 class TestBasicFunctionality:
@@ -0,0 +1,142 @@
+"""
+Unit tests for adaptive batch sizing in the uploader.
+
+Tests cover:
+- Additive increase on fast full batches, multiplicative decrease on slow or failed ones
+- The memory envelope capping batch sizes from sampled row sizes
+- Per statement kind sizing in the bulk writer, reported in UploadResult
+- Splitting literal Cypher batches by statement kind
+"""
+
+import asyncio
+
+from backend.uploader.core.batch_sizer import AdaptiveBatchSizer, BatchSizeLimits
+from backend.uploader.core.batch_uploader import BatchUploader, statement_kind
+from backend.uploader.core.bulk_writer import BulkWriter
+from backend.uploader.models.upload_result import BatchResult, UploadResult
+
+
+def executed(kind, size, rows=None, seconds=0.1, success=True):
+    return BatchResult(batch_number=1, job_id="job-1", statement_kind=kind, batch_size=size,
+                       commands_in_batch=size if rows is None else rows,
+                       execution_time_seconds=seconds, success=success)
+
+
+class LatencyClient:
+    """Client double whose UNWIND latency depends on the statement."""
+
+    def __init__(self, relationship_seconds):
+        self.relationship_seconds = relationship_seconds
+        self.calls = []
+
+    async def execute_unwind(self, query, rows, job_id=None, parameters=None):
+        self.calls.append((query, len(rows)))
+        if "MATCH (source" in query:
+            await asyncio.sleep(self.relationship_seconds)
+        return UploadResult(job_id=job_id, total_commands_executed=1)
+
+    async def execute_cypher_batch(self, commands, batch_size=100, job_id=None):
+        return UploadResult(job_id=job_id, success=True)
+
+
+class TestAdaptiveBatchSizer:
+    """Test cases for AdaptiveBatchSizer."""
+
+    def test_additive_increase_multiplicative_decrease(self):
+        """Test that sizes grow by a step, shrink by a factor and stay within bounds."""
+        sizer = AdaptiveBatchSizer(BatchSizeLimits(initial_size=100, min_size=10, max_size=160,
+                                                   target_seconds=1.0, increase_step=25))
+
+        sizes = []
+        for _ in range(4):
+            size = sizer.next_size("node:Module")
+            sizes.append(size)
+            sizer.record(executed("node:Module", size))
+        assert sizes == [100, 125, 150, 160]
+
+        sizer.record(executed("node:Module", 160, rows=40))  # A short final batch says nothing
+        assert sizer.next_size("node:Module") == 160
+
+        sizer.record(executed("node:Module", 160, success=False))
+        assert sizer.next_size("node:Module") == 80
+        sizer.record(executed("node:Module", 80, seconds=4.0))  # Four times over target
+        assert sizer.next_size("node:Module") == 20
+        sizer.record(executed("node:Module", 20, seconds=4.0))
+        assert sizer.next_size("node:Module") == 10
+
+        assert sizer.next_size("relationship:CALLS") == 100  # Other kinds are unaffected
+        summary = sizer.summary()["node:Module"]
+        assert (summary["smallest_batch_size"], summary["largest_batch_size"]) == (20, 160)
+        assert (summary["failures"], summary["decreases"]) == (1, 3)
+
+    def test_memory_envelope_caps_size(self):
+        """Test that large rows cap the batch size below the minimum if needed."""
+        sizer = AdaptiveBatchSizer(BatchSizeLimits(initial_size=1000, min_size=100, max_batch_bytes=50_000))
+        sizer.observe_rows("relationship:IMPORTS", [{"properties": {"source": "x" * 990}}] * 3)
+
+        assert sizer.next_size("relationship:IMPORTS") < 100
+        assert sizer.next_size("node:Module") == 1000
+
+    def test_fixed_sizer_never_adapts(self):
+        """Test that a fixed sizer keeps its size but still reports throughput."""
+        sizer = AdaptiveBatchSizer.fixed(50)
+        sizer.record(executed("node:Class", 50, seconds=100.0, success=False))
+
+        assert sizer.next_size("node:Class") == 50
+        assert sizer.summary()["node:Class"]["rows_per_second"] == 0.5
+
+
+class TestAdaptiveUploads:
+    """Test cases for adaptive sizing in the bulk writer and batch uploader."""
+
+    def test_bulk_writer_sizes_each_kind(self):
+        """Test that cheap node merges grow while slow relationship merges shrink."""
+        client = LatencyClient(relationship_seconds=0.03)
+        sizer = AdaptiveBatchSizer(BatchSizeLimits(initial_size=20, target_seconds=0.01, increase_step=20))
+        tuple_data = {
+            "nodes": [{"label": "Module", "unique_key": f"module:{i}", "properties": {"path": f"{i}.py"},
+                       "merge_properties": ["path"]} for i in range(300)],
+            "relationships": [{"source_key": f"module:{i}", "target_key": f"module:{i + 1}",
+                               "relationship_type": "IMPORTS", "properties": {},
+                               "source_label": "Module", "target_label": "Module"} for i in range(40)],
+        }
+
+        result = asyncio.run(BulkWriter(client, batch_sizer=sizer).write(tuple_data, "job-1"))
+
+        node_sizes = [size for query, size in client.calls if "MERGE (n:" in query]
+        assert node_sizes[:3] == [20, 40, 60] and sum(node_sizes) == 300
+        nodes = result.batch_sizing["node:Module"]
+        relationships = result.batch_sizing["relationship:IMPORTS"]
+        assert nodes["largest_batch_size"] > 20 and nodes["rows"] == 300
+        assert relationships["smallest_batch_size"] < 20 and relationships["decreases"] >= 1
+        assert result.to_dict()["batch_sizing"] == result.batch_sizing
+
+    def test_cypher_batches_split_by_kind(self, tmp_path):
+        """Test that literal command batches hold one statement kind each, whatever the label."""
+        cypher_file = tmp_path / "cypher_commands.cypher"
+        cypher_file.write_text(
+            "MERGE (m:Module {path: 'a.py'});\nMERGE (m:Module {path: 'b.py'});\n"
+            "MERGE (c:Class {name: 'A'});\nMERGE (f:Method {name: 'delete_backup'});\n"
+            "MERGE (m:Module {path: 'c.py'});\n"
+            "MATCH (m:Module {path: 'a.py'}), (c:Class {name: 'A'}) MERGE (m)-[:CONTAINS]->(c);\n"
+        )
+        uploader = BatchUploader(None, batch_size=10)
+        batches = []
+
+        async def upload(commands, number, job_id, kind=None, batch_size=None):
+            batches.append((kind, len(commands), batch_size))
+            return executed(kind, batch_size, rows=len(commands))
+
+        uploader._upload_single_batch = upload
+
+        async def collect():
+            return [batch async for batch in uploader._stream_upload_batches(str(cypher_file), "job-1")]
+
+        asyncio.run(collect())
+
+        assert batches == [("node", 5, 10), ("relationship", 1, 10)]
+        assert statement_kind("MATCH (n {namespace: $ns}) DETACH DELETE n") == "delete"
+        assert statement_kind("MATCH (m:Module {path: $p})-[r]->()\nDELETE r") == "delete"
+        assert statement_kind("CREATE (:`Function` {name: 'f'})") == "node"
+        assert statement_kind("MERGE (n:Method {doc: 'DELETE n ]->'})") == "node"
+        assert statement_kind("MATCH (n) SET n.deleted = true") == "match"
@@ -0,0 +1,243 @@
+"""
+Unit tests for the UNWIND-based bulk writer.
+
+Tests cover:
+- Grouping nodes by label and merge keys
+- Grouping relationships by type, endpoint labels and property keys
+- Stale module deletion ahead of the merges
+- Chunking rows and reporting throughput
+- Scoping every query to the upload's graph namespace
+- Ensuring the schema before the first nodes of a label are written
+- Tuple stream files and the in-process handoff from stream_transform
+"""
+
+import asyncio
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.transformer.formatters.tuple_stream import TupleStreamWriter
+from backend.transformer.main import TransformationOrchestrator
+from backend.transformer.models.tuples import Neo4jNodeTuple, TupleSet
+from backend.uploader.core.bulk_writer import (
+    BulkWriter,
+    build_node_batches,
+    build_relationship_batches,
+    iter_tuple_stream,
+    read_tuple_stream_trailer,
+)
+from backend.uploader.core.schema_manager import SchemaItem
+from backend.uploader.models.upload_result import UploadResult
+
+
+def node(label, key, merge=("path",), **properties):
+    """Create a serialized node tuple."""
+    return {"label": label, "unique_key": key, "properties": properties, "merge_properties": list(merge)}
+
+
+def relationship(rel_type, source, target, source_label="Module", target_label="Class", **properties):
+    """Create a serialized relationship tuple."""
+    return {
+        "source_key": source,
+        "target_key": target,
+        "relationship_type": rel_type,
+        "properties": properties,
+        "source_label": source_label,
+        "target_label": target_label,
+    }
+
+
+def make_client() -> AsyncMock:
+    """Create a client whose UNWIND executions succeed."""
+    client = AsyncMock()
+    client.execute_unwind.side_effect = lambda query, rows, job_id=None: UploadResult(
+        job_id=job_id, total_commands_executed=1
+    )
+    return client
+
+
+class TestBatchBuilding:
+    """Test cases for grouping tuples into UNWIND batches."""
+
+    def test_nodes_grouped_by_label_and_merge_keys(self):
+        """Test that one query is built per label and merge key set."""
+        batches = build_node_batches([
+            node("Module", "module:a", path="a.py", name="a"),
+            node("Module", "module:b", path="b.py", name="b"),
+            node("Class", "class:a.A", merge=("name", "module_path"), name="A", module_path="a.py"),
+        ])
+
+        assert len(batches) == 2
+        module_batch = batches[0]
+        assert module_batch.query.startswith("UNWIND $rows AS row\nMERGE (n:`Module` {`path`: row.properties.`path`})")
+        assert "n.unique_key = row.unique_key" in module_batch.query
+        assert [row["unique_key"] for row in module_batch.rows] == ["module:a", "module:b"]
+
+    def test_nodes_without_merge_values_use_unique_key(self):
+        """Test that nodes missing their merge properties merge on unique_key."""
+        batches = build_node_batches([node("Variable", "var:x", merge=("path",), name="x")])
+
+        assert "{unique_key: row.unique_key}" in batches[0].query
+
+    def test_relationships_grouped_by_shape(self):
+        """Test that relationships sharing type, labels and keys share a query."""
+        batches = build_relationship_batches([
+            relationship("CONTAINS", "module:a", "class:a.A"),
+            relationship("CONTAINS", "module:b", "class:b.B"),
+            relationship("IMPORTS", "module:a", "module:b", target_label="Module", line_number=3),
+            relationship("IMPORTS", "module:a", "module:c", target_label="Module", line_number=None),
+        ])
+
+        assert [len(batch.rows) for batch in batches] == [2, 1, 1]
+        assert "MERGE (source)-[r:`IMPORTS` {`line_number`: row.properties.`line_number`}]->(target)" in batches[1].query
+        # Null properties cannot be part of a MERGE pattern
+        assert "line_number" not in batches[2].query
+
+
+class TestBulkWriter:
+    """Test cases for BulkWriter.write."""
+
+    def test_stale_modules_deleted_before_merge(self):
+        """Test that stale subgraphs are deleted before nodes are merged."""
+        client = make_client()
+        tuple_data = {
+            "nodes": [node("Module", "module:a", path="a.py")],
+            "relationships": [],
+            "replaced_modules": ["a.py"],
+            "deleted_modules": ["b.py"],
+        }
+
+        result = asyncio.run(BulkWriter(client).write(tuple_data, "job-1"))
+
+        queries = [call.args[0] for call in client.execute_unwind.call_args_list]
+        assert result.success
+        assert "DETACH DELETE m" in queries[-2]
+        assert queries[-1].startswith("UNWIND $rows AS row\nMERGE")
+        assert all("DELETE" in query for query in queries[:-1])
+
+    def test_rows_chunked_and_throughput_reported(self):
+        """Test that large groups are split into chunks and rates are reported."""
+        client = make_client()
+        tuple_data = {
+            "nodes": [node("Module", f"module:{i}", path=f"{i}.py") for i in range(25)],
+            "relationships": [relationship("CONTAINS", f"module:{i}", f"class:{i}") for i in range(10)],
+        }
+
+        result = asyncio.run(BulkWriter(client, rows_per_batch=10).write(tuple_data, "job-1"))
+
+        chunk_sizes = [len(call.args[1]) for call in client.execute_unwind.call_args_list]
+        assert chunk_sizes == [10, 10, 5, 10]
+        assert result.total_commands == result.total_commands_executed == 4
+        assert result.nodes_per_second > 0
+        assert result.relationships_per_second > 0
+
+    def test_namespace_scopes_every_query(self):
+        """Test that a namespaced upload merges, matches and deletes only in its namespace."""
+        client = AsyncMock()
+        client.execute_unwind.return_value = UploadResult(job_id="job-1", total_commands_executed=1)
+        client.execute_cypher_batch.return_value = UploadResult(job_id="job-1", success=True)
+        tuple_data = {
+            "nodes": [node("Module", "module:a", path="a.py"), node("Class", "class:a.A", merge=(), name="A")],
+            "relationships": [relationship("CONTAINS", "module:a", "class:a.A")],
+            "replaced_modules": ["a.py"],
+        }
+
+        writer = BulkWriter(client, namespace="job-1")
+        result = asyncio.run(writer.write(tuple_data, "job-1"))
+        asyncio.run(writer.write(tuple_data, "job-1"))
+
+        calls = client.execute_unwind.call_args_list
+        assert result.success
+        assert all(call.kwargs["parameters"] == {"namespace": "job-1"} for call in calls)
+        assert all("namespace: $namespace" in call.args[0] for call in calls)
+        assert "MERGE (n:`Module` {namespace: $namespace, `path`: row.properties.`path`})" in calls[-3].args[0]
+        # Stale module deletes match by (namespace, module_path), so that is indexed too
+        assert SchemaItem("Function", ("namespace", "module_path")) in writer.schema_manager.ensured
+        # The schema is ensured by the first write only
+        assert writer.schema_manager.ensured
+        assert result.schema_items_ensured == len(writer.schema_manager.ensured)
+        statements = [call.args[0][0] for call in client.execute_cypher_batch.call_args_list]
+        assert len(statements) == len(writer.schema_manager.ensured) + 1
+        assert statements[-1].startswith("CALL db.awaitIndexes")
+
+
+class TestTupleHandoff:
+    """Test cases for handing TupleSet batches to the uploader without Cypher text."""
+
+    @staticmethod
+    def module_tuples(path: str) -> TupleSet:
+        """Create a tuple set holding a single Module node."""
+        tuple_set = TupleSet()
+        tuple_set.add_node(Neo4jNodeTuple(
+            label="Module", properties={"path": path}, unique_key=f"module:{path}", merge_properties={"path"}
+        ))
+        return tuple_set
+
+    def test_tuple_stream_round_trip(self):
+        """Test that frames are read back one batch at a time."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            stream_file = Path(temp_dir) / "tuples_job-1.tuplestream"
+            with TupleStreamWriter(stream_file) as writer:
+                writer.write(self.module_tuples("a.py"))
+                writer.write(self.module_tuples("b.py"))
+
+            frames = list(iter_tuple_stream(stream_file))
+
+        assert [frame["nodes"][0]["unique_key"] for frame in frames] == ["module:a.py", "module:b.py"]
+
+    def test_truncated_tuple_stream_rejected(self):
+        """Test that a partially written stream is reported instead of silently cut short."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            stream_file = Path(temp_dir) / "tuples_job-1.tuplestream"
+            with TupleStreamWriter(stream_file) as writer:
+                writer.write(self.module_tuples("a.py"))
+            stream_file.write_bytes(stream_file.read_bytes()[:-5])
+
+            with pytest.raises(ValueError, match="Truncated"):
+                list(iter_tuple_stream(stream_file))
+
+    def test_stream_cut_between_frames_rejected(self):
+        """Test that a stream whose writer failed has no end marker and is rejected."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            stream_file = Path(temp_dir) / "tuples_job-1.tuplestream"
+            with pytest.raises(RuntimeError):
+                with TupleStreamWriter(stream_file) as writer:
+                    writer.write(self.module_tuples("a.py"))
+                    raise RuntimeError("transformation failed")
+
+            with pytest.raises(ValueError, match="no end marker"):
+                read_tuple_stream_trailer(stream_file)
+            with pytest.raises(ValueError, match="no end marker"):
+                list(iter_tuple_stream(stream_file))
+
+            with TupleStreamWriter(stream_file) as writer:
+                writer.write(self.module_tuples("a.py"))
+            assert read_tuple_stream_trailer(stream_file) == {"frames": 1, "nodes": 1, "relationships": 0}
+
+    def test_stream_transform_handed_over_in_process(self):
+        """Test that relationships are written after the nodes of every batch."""
+        extraction = {
+            "modules": {
+                "a.py": {"name": "a", "imports": [{"name": "b.py", "line_start": 1}]},
+                "b.py": {"name": "b"},
+            },
+            "delta": {"changed": ["a.py"], "deleted": ["c.py"]},
+        }
+
+        async def extraction_stream():
+            yield extraction
+
+        transformer = TransformationOrchestrator(job_id="job-1", enable_progress_reporting=False)
+        client = make_client()
+        result = asyncio.run(BulkWriter(client).write_stream(
+            transformer.stream_transform(extraction_stream(), batch_size=1), "job-1"
+        ))
+
+        queries = [call.args[0] for call in client.execute_unwind.call_args_list]
+        merges = [query.split("\n")[1].split(" ")[0] for query in queries if "MERGE" in query]
+        assert result.success
+        assert "DELETE" in queries[0]
+        # Module b is only merged in the second batch, after a's import was generated
+        assert merges == ["MERGE", "MERGE", "MATCH"]
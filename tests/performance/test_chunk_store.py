@@ -0,0 +1,207 @@
+"""
+Unit tests for the deduplicating backup chunk store.
+
+Tests cover:
+- Content-defined chunk boundaries that survive insertions
+- Chunking and storing a file about as fast as tarball mode compresses it
+- Round-tripping a directory through store and restore
+- Storing only new chunks and skipping unchanged files on later backups
+- Garbage collection of unreferenced chunks past a grace period, and detection of corrupt chunks
+- Restarting Neo4j when a chunked backup fails
+"""
+
+import asyncio
+import hashlib
+import os
+import random
+import time
+import zlib
+from types import SimpleNamespace
+
+from backend.neo4j_manager.core.backup_manager import BackupManager
+from backend.neo4j_manager.core.chunk_store import (
+    AVG_CHUNK_SIZE,
+    MAX_CHUNK_SIZE,
+    MIN_CHUNK_SIZE,
+    ChunkStore,
+    _store_segment,
+    chunk_boundaries,
+)
+from backend.neo4j_manager.core.tarball_manager import TarballManager
+from backend.neo4j_manager.models.backup_metadata import ChunkStoreResult
+
+SIZES = {"min_chunk_size": 256, "avg_chunk_size": 1024, "max_chunk_size": 4096}
+
+
+def random_bytes(size, seed):
+    return random.Random(seed).randbytes(size)
+
+
+def digests(data, cuts):
+    starts = [0] + cuts[:-1]
+    return {hashlib.sha256(data[start:end]).hexdigest() for start, end in zip(starts, cuts)}
+
+
+def make_store(tmp_path, segment_size=16 * 1024):
+    return ChunkStore(tmp_path / "backups", workers=2, segment_size=segment_size, **SIZES)
+
+
+def read_tree(root):
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in sorted(root.rglob("*")) if path.is_file()
+    }
+
+
+class TestChunkBoundaries:
+    """Test cases for chunk_boundaries."""
+
+    def test_boundaries_bounded_and_shift_resistant(self):
+        """Test that chunks respect the size limits and an insertion only changes nearby chunks."""
+        data = random_bytes(200 * 1024, seed=1)
+        cuts = chunk_boundaries(data, 256, 1024, 4096)
+        sizes = [end - start for start, end in zip([0] + cuts[:-1], cuts)]
+
+        assert cuts[-1] == len(data)
+        assert all(size <= 4096 for size in sizes)
+        assert all(size >= 256 for size in sizes[:-1])
+
+        shifted = b"inserted" + data
+        shared = digests(data, cuts) & digests(shifted, chunk_boundaries(shifted, 256, 1024, 4096))
+        assert len(shared) >= len(cuts) - 2
+
+    def test_store_throughput_keeps_up_with_tarball(self, tmp_path):
+        """Test that chunking, hashing and compressing a file is not much slower than tarball mode."""
+        source = tmp_path / "data"
+        source.mkdir()
+        store_file = source / "neostore.nodestore.db"
+        store_file.write_bytes(random_bytes(8 * 1024 * 1024, seed=3))
+
+        def best_of(runs, operation):
+            timings = []
+            for run in range(runs):
+                start = time.perf_counter()
+                operation(run)
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        # Default chunk sizes, each run into an empty store so every chunk is compressed
+        chunked = best_of(2, lambda run: _store_segment(
+            str(tmp_path / f"store-{run}"), str(store_file), 0, store_file.stat().st_size,
+            (MIN_CHUNK_SIZE, AVG_CHUNK_SIZE, MAX_CHUNK_SIZE)
+        ))
+        tarball = best_of(2, lambda run: TarballManager()._create_tarball_sync(
+            source, tmp_path / f"backup-{run}.tar.gz", "w:gz"
+        ))
+
+        assert chunked < 2 * tarball
+
+
+class TestChunkStore:
+    """Test cases for ChunkStore store, restore and garbage collection."""
+
+    def test_directory_round_trip(self, tmp_path):
+        """Test that a restored directory matches the stored one byte for byte."""
+        source = tmp_path / "data"
+        (source / "databases" / "neo4j").mkdir(parents=True)
+        (source / "transactions").mkdir()
+        (source / "databases" / "neo4j" / "neostore.nodestore.db").write_bytes(random_bytes(50 * 1024, seed=2))
+        (source / "databases" / "neo4j" / "empty.db").write_bytes(b"")
+        (source / "store_lock").write_bytes(b"\0" * 10000)
+        store = make_store(tmp_path)
+
+        stored = asyncio.run(store.store_directory(source, store.root / "b1.manifest.json"))
+        restored = asyncio.run(store.restore_directory(store.root / "b1.manifest.json", tmp_path / "restored"))
+
+        assert stored.success and restored.success
+        assert stored.files == restored.files == 3
+        assert stored.new_chunks <= stored.chunks == restored.chunks
+        assert read_tree(tmp_path / "restored") == read_tree(source)
+        assert (tmp_path / "restored" / "transactions").is_dir()
+        original = (source / "store_lock").stat().st_mtime_ns
+        assert (tmp_path / "restored" / "store_lock").stat().st_mtime_ns == original
+
+    def test_second_backup_stores_only_changes(self, tmp_path):
+        """Test that unchanged files are reused and an edited file adds few chunks."""
+        source = tmp_path / "data"
+        source.mkdir()
+        (source / "static.db").write_bytes(random_bytes(40 * 1024, seed=3))
+        edited = random_bytes(60 * 1024, seed=4)
+        (source / "edited.db").write_bytes(edited)
+        # One segment per file, so the insertion shifts no forced segment cuts
+        store = make_store(tmp_path, segment_size=1024 * 1024)
+
+        first = asyncio.run(store.store_directory(source, store.root / "b1.manifest.json"))
+        (source / "edited.db").write_bytes(edited[:30000] + b"new record" + edited[30000:])
+        os.utime(source / "edited.db", ns=(1, 1))
+        second = asyncio.run(store.store_directory(source, store.root / "b2.manifest.json"))
+
+        assert first.new_chunks == first.chunks
+        assert second.files_unchanged == 1
+        assert 0 < second.new_chunks <= 3
+        assert second.stored_bytes < first.stored_bytes / 4
+        assert second.deduplication_ratio > 0.9
+
+        (store.root / "b1.manifest.json").unlink()
+        in_flight = next((store.root / "chunks").glob("*/*")).with_name("0" * 64 + ".123.tmp")
+        in_flight.write_bytes(b"partial")
+        assert store.collect_garbage() == 0  # Within the grace period of a concurrent store
+        assert store.collect_garbage(grace_seconds=0) > 0  # The first backup's versions of the edited chunks
+        assert in_flight.exists()
+        restored = asyncio.run(store.restore_directory(store.root / "b2.manifest.json", tmp_path / "restored"))
+        assert restored.success
+        assert read_tree(tmp_path / "restored") == read_tree(source)
+
+    def test_corrupt_chunk_fails_restore(self, tmp_path):
+        """Test that a chunk whose content does not match its digest fails the restore."""
+        source = tmp_path / "data"
+        source.mkdir()
+        (source / "nodes.db").write_bytes(random_bytes(8 * 1024, seed=5))
+        store = make_store(tmp_path)
+        asyncio.run(store.store_directory(source, store.root / "b1.manifest.json"))
+
+        chunk = next((store.root / "chunks").glob("*/*"))
+        chunk.write_bytes(zlib.compress(b"tampered"))
+        result = asyncio.run(store.restore_directory(store.root / "b1.manifest.json", tmp_path / "restored"))
+
+        assert not result.success
+        assert "corrupt" in result.error
+
+
+class FakeNeo4jService:
+    """Records service lifecycle calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def stop(self):
+        self.calls.append("stop")
+        return SimpleNamespace(success=True, error=None)
+
+    async def start(self):
+        self.calls.append("start")
+        return SimpleNamespace(success=True, error=None)
+
+
+class FailingChunkStore:
+    """Chunk store whose backups always fail."""
+
+    async def store_directory(self, source_dir, manifest_path):
+        return ChunkStoreResult(operation="store", error="disk full")
+
+
+class TestChunkedBackup:
+    """Test cases for BackupManager's chunked backup mode."""
+
+    def test_failed_store_restarts_neo4j(self, tmp_path):
+        """Test that Neo4j is started again when the chunk store fails."""
+        (tmp_path / "data").mkdir()
+        manager = BackupManager(str(tmp_path / "data"), str(tmp_path / "backups"), "neo4j", backup_mode="chunked")
+        manager.neo4j_service = FakeNeo4jService()
+        manager.chunk_store = FailingChunkStore()
+
+        result = asyncio.run(manager.create_backup("job-1"))
+
+        assert not result.success
+        assert "disk full" in result.errors[0]
+        assert manager.neo4j_service.calls == ["stop", "start"]
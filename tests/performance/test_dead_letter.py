@@ -0,0 +1,245 @@
+"""
+Unit tests for isolating failing statements instead of replaying whole batches.
+
+Tests cover:
+- Splitting a failed command batch until the poison command is isolated
+- Isolating failing UNWIND rows and committing the rest
+- Failing as a whole when isolation is disabled
+- Retrying transient failures without splitting
+- Failing without splitting on errors in a shared UNWIND query, and when every row failed
+- Isolating coded statement errors of single commands and rows
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from backend.uploader.core import neo4j_client as neo4j_client_module
+from backend.uploader.core.neo4j_client import Neo4jClient
+
+
+class FakeTransaction:
+    """Transaction double that fails on poison statements or rows."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pending = []
+
+    async def run(self, query, parameters=None, **kwargs):
+        if self.driver.transient_failures:
+            self.driver.transient_failures -= 1
+            raise ConnectionError("connection reset")
+        if self.driver.statement_error:
+            raise StatementError("Expected parameter(s): namespace")
+        rows = kwargs.get("rows")
+        items = rows if rows is not None else [query]
+        if any("POISON" in json.dumps(item) for item in items):
+            if self.driver.poison_code:
+                raise CodedError(self.driver.poison_code, "Invalid input 'POISON'")
+            raise ValueError("Invalid input 'POISON'")
+        self.pending.extend(items)
+        counters = SimpleNamespace(nodes_created=len(items), relationships_created=0, properties_set=0)
+        return SimpleNamespace(consume=lambda: _summary(counters))
+
+    async def __aenter__(self):
+        self.driver.transactions += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.driver.committed.extend(self.pending)
+        return False
+
+
+async def _summary(counters):
+    return SimpleNamespace(counters=counters)
+
+
+class FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def begin_transaction(self):
+        return FakeTransaction(self.driver)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class StatementError(Exception):
+    code = "Neo.ClientError.Statement.ParameterMissing"
+
+
+class CodedError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+class FakeDriver:
+    def __init__(self, transient_failures=0, statement_error=False, poison_code=None):
+        self.committed = []
+        self.transactions = 0
+        self.transient_failures = transient_failures
+        self.statement_error = statement_error
+        self.poison_code = poison_code
+
+    def session(self, database=None, **kwargs):
+        return FakeSession(self)
+
+
+@pytest.fixture
+def make_client(tmp_path, monkeypatch):
+    """Build a client on a fake driver, writing dead letters into tmp_path."""
+
+    def build(driver):
+        with monkeypatch.context() as patch:
+            patch.setattr(neo4j_client_module, "NEO4J_AVAILABLE", True)
+            client = Neo4jClient(uri="bolt://test", auth=("neo4j", "test"),
+                                 dead_letter_path=str(tmp_path / "dead_letter.jsonl"))
+        client.driver = driver
+        return client
+
+    return build
+
+
+def read_dead_letters(tmp_path):
+    return [json.loads(line) for line in (tmp_path / "dead_letter.jsonl").read_text().splitlines()]
+
+
+class TestIsolatingFailures:
+    """Test cases for bisecting failed batches."""
+
+    def test_poison_command_isolated(self, make_client, tmp_path):
+        """Test that one bad command is dead-lettered and the others are committed."""
+        driver = FakeDriver()
+        client = make_client(driver)
+        commands = [f"MERGE (n:Module {{path: '{i}.py'}})" for i in range(8)]
+        commands[5] = "MERGE (n:Module {docstring: 'POISON'})"
+
+        result = asyncio.run(client._execute_batch_with_retry(commands, "job-1"))
+
+        assert not result.has_errors
+        assert result.dead_lettered == 1 and result.nodes_created == 7
+        assert driver.committed == commands[:5] + commands[6:]
+        assert driver.transactions <= 1 + 2 * 3  # The whole batch, then two halves per level
+        (entry,) = read_dead_letters(tmp_path)
+        assert entry["statement"] == commands[5] and "POISON" in entry["error"]
+        assert entry["job_id"] == "job-1"
+
+    def test_poison_rows_isolated(self, make_client, tmp_path):
+        """Test that failing UNWIND rows are dead-lettered with their query and parameters."""
+        driver = FakeDriver()
+        client = make_client(driver)
+        rows = [{"unique_key": f"module:{i}", "properties": {"doc": "ok"}} for i in range(16)]
+        rows[3]["properties"]["doc"] = rows[12]["properties"]["doc"] = "POISON"
+
+        result = asyncio.run(client.execute_unwind(
+            "UNWIND $rows AS row MERGE (n:Module {unique_key: row.unique_key})", rows,
+            job_id="job-1", parameters={"namespace": "ns"}
+        ))
+
+        assert not result.has_errors and result.total_commands_executed == 1
+        assert result.dead_lettered == 2
+        assert result.dead_letter_path == str(tmp_path / "dead_letter.jsonl")
+        assert len(driver.committed) == 14
+        entries = read_dead_letters(tmp_path)
+        assert [entry["row"]["unique_key"] for entry in entries] == ["module:3", "module:12"]
+        assert all(entry["parameters"] == {"namespace": "ns"} for entry in entries)
+
+    def test_isolation_disabled_fails_whole_batch(self, make_client, tmp_path):
+        """Test that without isolation nothing is committed and the batch reports an error."""
+        driver = FakeDriver()
+        client = make_client(driver)
+        rows = [{"unique_key": "module:0"}, {"unique_key": "POISON"}]
+
+        result = asyncio.run(client.execute_unwind("UNWIND $rows AS row CREATE (n)", rows,
+                                                   isolate_failures=False))
+
+        assert result.has_errors and result.dead_lettered == 0
+        assert driver.committed == [] and driver.transactions == 1
+        assert not (tmp_path / "dead_letter.jsonl").exists()
+
+    def test_transient_failure_retried_not_split(self, make_client, monkeypatch):
+        """Test that a transient failure replays the batch instead of splitting it."""
+        async def no_sleep(delay):
+            return None
+
+        monkeypatch.setattr(neo4j_client_module.asyncio, "sleep", no_sleep)
+        driver = FakeDriver(transient_failures=1)
+        client = make_client(driver)
+        commands = [f"MERGE (n:Module {{path: '{i}.py'}})" for i in range(4)]
+
+        result = asyncio.run(client._execute_batch_with_retry(commands, "job-1"))
+
+        assert not result.has_errors and result.dead_lettered == 0
+        assert driver.transactions == 2
+        assert driver.committed == commands
+
+    def test_statement_error_fails_batch_without_splitting(self, make_client, tmp_path):
+        """Test that a query-level error fails the batch in one transaction instead of bisecting it."""
+        driver = FakeDriver(statement_error=True)
+        client = make_client(driver)
+        rows = [{"unique_key": f"module:{i}"} for i in range(64)]
+
+        result = asyncio.run(client.execute_unwind("UNWIND $rows AS row MERGE (n:Module)", rows))
+
+        assert result.has_errors and result.dead_lettered == 0
+        assert driver.transactions == 1
+        assert not (tmp_path / "dead_letter.jsonl").exists()
+
+    def test_syntax_error_in_one_command_isolated(self, make_client, tmp_path):
+        """Test that a literal command with a syntax error is dead-lettered, not the whole batch."""
+        driver = FakeDriver(poison_code="Neo.ClientError.Statement.SyntaxError")
+        client = make_client(driver)
+        commands = [f"MERGE (n:Module {{path: '{i}.py'}})" for i in range(8)]
+        commands[2] = "MERGE (n:Module {docstring: 'POISON'})"
+
+        result = asyncio.run(client._execute_batch_with_retry(commands, "job-1"))
+
+        assert not result.has_errors
+        assert result.dead_lettered == 1 and result.nodes_created == 7
+        assert driver.committed == commands[:2] + commands[3:]
+        (entry,) = read_dead_letters(tmp_path)
+        assert entry["statement"] == commands[2]
+
+    def test_type_error_in_one_row_isolated(self, make_client, tmp_path):
+        """Test that a row failing with a statement type error is isolated from the other rows."""
+        driver = FakeDriver(poison_code="Neo.ClientError.Statement.TypeError")
+        client = make_client(driver)
+        rows = [{"unique_key": f"module:{i}"} for i in range(8)]
+        rows[6]["unique_key"] = "POISON"
+
+        result = asyncio.run(client.execute_unwind("UNWIND $rows AS row MERGE (n:Module)", rows))
+
+        assert not result.has_errors and result.dead_lettered == 1
+        assert len(driver.committed) == 7
+        (entry,) = read_dead_letters(tmp_path)
+        assert entry["row"] == {"unique_key": "POISON"}
+
+    def test_database_error_fails_batch_without_splitting(self, make_client, tmp_path):
+        """Test that a database error fails a command batch without bisecting it."""
+        driver = FakeDriver(poison_code="Neo.DatabaseError.General.UnknownError")
+        client = make_client(driver)
+        commands = ["MERGE (n:Module {docstring: 'POISON'})"] * 8
+
+        result = asyncio.run(client._execute_batch_with_retry(commands, "job-1"))
+
+        assert result.has_errors and result.dead_lettered == 0
+        assert driver.transactions == 1
+        assert not (tmp_path / "dead_letter.jsonl").exists()
+
+    def test_all_rows_dead_lettered_fails_batch(self, make_client):
+        """Test that a batch whose every row was dead-lettered is reported as failed."""
+        client = make_client(FakeDriver())
+        rows = [{"unique_key": f"POISON:{i}"} for i in range(4)]
+
+        result = asyncio.run(client.execute_unwind("UNWIND $rows AS row MERGE (n:Module)", rows))
+
+        assert result.dead_lettered == 4
+        assert result.has_errors and "all 4 items were dead-lettered" in result.errors[0]
@@ -0,0 +1,215 @@
+"""
+Tests for the streamed (NDJSON) extraction output.
+
+Tests cover:
+- Header, module and trailer records and the byte-offset index
+- Handing parsed modules to a sink instead of retaining them
+- The incremental delta landing in the header
+- Reading the stream back chunk by chunk in the transformer
+- Reading single-document extraction output incrementally
+"""
+
+import asyncio
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from codebase_parser import CodebaseParser
+from config import get_parser_config
+from serialization import ExtractionStreamWriter
+from backend.transformer.core import extraction_reader
+from backend.transformer.core.extraction_reader import (
+    is_extraction_stream,
+    iter_extraction_modules,
+    load_extraction_file,
+    read_extraction_delta,
+    read_extraction_trailer,
+    stream_extraction_file,
+)
+from backend.transformer.main import TransformationOrchestrator
+
+
+@pytest.fixture
+def codebase():
+    """Create a small codebase."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        for name in ("a", "b", "c"):
+            (root / f"{name}.py").write_text(
+                f"import os\n\nclass {name.upper()}:\n    def run(self):\n        return '{name}'\n"
+            )
+        yield root
+
+
+@pytest.fixture
+def parser():
+    """Create a parser with its cache in a temporary directory."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        config = get_parser_config("standard")
+        config.tool_options['cache']['cache_dir'] = cache_dir
+        yield CodebaseParser(config)
+
+
+@pytest.fixture
+def output_dir():
+    """Create a directory for extraction output."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+def read_records(path: Path):
+    """Read every record of an NDJSON file."""
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestExtractionStreamWriter:
+    """Test cases for ExtractionStreamWriter."""
+
+    def test_records_written_as_modules_are_parsed(self, parser, codebase, output_dir):
+        """Test that the sink writes one record per module between header and trailer."""
+        output = output_dir / "extraction.ndjson"
+        with ExtractionStreamWriter(output, write_index=True) as writer:
+            writer.write_header()
+            modules = parser.parse_codebase(str(codebase), module_sink=writer.write_module)
+            summary = writer.close()
+
+        records = read_records(output)
+        assert modules == {}
+        assert [record["type"] for record in records] == ["header", "module", "module", "module", "trailer"]
+        assert records[0]["metadata"]["format"] == "ndjson"
+        assert records[-1]["module_count"] == 3
+        assert summary["total_classes"] == 3
+        assert summary["total_methods"] == 3
+
+        index = json.loads(Path(f"{output}.idx").read_text())
+        assert index["output"] == "extraction.ndjson"
+        with open(output, "rb") as f:
+            for path, (offset, length) in index["modules"].items():
+                f.seek(offset)
+                assert json.loads(f.read(length))["path"] == path
+
+    def test_incremental_delta_in_header(self, parser, codebase, output_dir):
+        """Test that the delta is written ahead of the changed modules."""
+        parser.parse_codebase_incremental(str(codebase))
+        (codebase / "a.py").write_text("A = 1\n")
+        (codebase / "b.py").unlink()
+
+        output = output_dir / "extraction.ndjson"
+        with ExtractionStreamWriter(output) as writer:
+            parser.parse_codebase_incremental(
+                str(codebase),
+                module_sink=writer.write_module,
+                delta_callback=lambda delta: writer.write_header(delta.to_dict())
+            )
+
+        records = read_records(output)
+        assert records[0]["type"] == "header"
+        assert [Path(p).name for p in records[0]["delta"]["changed"]] == ["a.py"]
+        assert [Path(p).name for p in records[0]["delta"]["deleted"]] == ["b.py"]
+        assert [Path(record["path"]).name for record in records[1:-1]] == ["a.py"]
+
+
+class TestExtractionReader:
+    """Test cases for reading streamed extraction output in the transformer."""
+
+    @pytest.fixture
+    def stream_file(self, parser, codebase, output_dir):
+        """Write the codebase's extraction as a stream."""
+        output = output_dir / "extraction.ndjson"
+        with ExtractionStreamWriter(output) as writer:
+            parser.parse_codebase(str(codebase), module_sink=writer.write_module)
+        return output
+
+    def test_stream_read_in_chunks(self, stream_file):
+        """Test that modules are yielded in chunks without loading the document."""
+        async def collect():
+            return [chunk async for chunk in stream_extraction_file(str(stream_file), modules_per_chunk=2)]
+
+        chunks = asyncio.run(collect())
+
+        assert is_extraction_stream(str(stream_file))
+        assert [len(chunk["modules"]) for chunk in chunks] == [2, 1]
+        assert read_extraction_trailer(str(stream_file))["summary"]["total_modules"] == 3
+        assert len(load_extraction_file(str(stream_file))["modules"]) == 3
+
+    def test_incomplete_stream_rejected(self, stream_file):
+        """Test that a stream without its trailer is reported instead of silently cut short."""
+        lines = stream_file.read_text().splitlines(keepends=True)
+        stream_file.write_text("".join(lines[:-1]))
+
+        async def collect():
+            return [chunk async for chunk in stream_extraction_file(str(stream_file))]
+
+        assert read_extraction_trailer(str(stream_file)) is None
+        with pytest.raises(ValueError, match="no trailer"):
+            asyncio.run(collect())
+
+
+class TestDocumentReader:
+    """Test cases for reading single-document extraction output incrementally."""
+
+    @staticmethod
+    def write_document(path: Path, document, indent=None):
+        """Write an extraction document, compact unless indent is given."""
+        path.write_text(json.dumps(document, indent=indent))
+
+    @pytest.fixture
+    def small_chunks(self, monkeypatch):
+        """Read in tiny chunks so values straddle buffer refills."""
+        monkeypatch.setattr(extraction_reader._JsonDocumentScanner, "CHUNK_SIZE", 7)
+
+    def test_modules_yielded_one_at_a_time(self, output_dir, small_chunks):
+        """Test that modules of a compact document are yielded in order."""
+        modules = {f"m{i}.py": {"name": f"m{i}", "line_count": 10 ** i, "classes": [{"name": "C"}]} for i in range(5)}
+        document = output_dir / "extraction.json"
+        self.write_document(document, {"metadata": {"module_count": 5}, "modules": modules, "summary": {}})
+
+        assert not is_extraction_stream(str(document))
+        assert list(iter_extraction_modules(str(document))) == list(modules.items())
+        assert read_extraction_delta(str(document)) is None
+
+    def test_trailing_delta_attached_to_first_chunk(self, output_dir, small_chunks):
+        """Test that a delta written after the modules still precedes them."""
+        delta = {"added": [], "changed": ["a.py"], "deleted": ["b.py"]}
+        document = output_dir / "extraction.json"
+        self.write_document(
+            document, {"metadata": {}, "modules": {"a.py": {"name": "a"}}, "summary": {}, "delta": delta}, indent=2
+        )
+
+        async def collect():
+            return [chunk async for chunk in stream_extraction_file(str(document))]
+
+        chunks = asyncio.run(collect())
+        assert chunks == [{"modules": {"a.py": {"name": "a"}}, "delta": delta}]
+
+    def test_truncated_document_rejected(self, output_dir):
+        """Test that a cut-off document raises instead of ending early."""
+        document = output_dir / "extraction.json"
+        self.write_document(document, {"metadata": {}, "modules": {"a.py": {"name": "a"}, "b.py": {"name": "b"}}})
+        document.write_text(document.read_text()[:-20])
+
+        with pytest.raises(ValueError, match="Malformed extraction document"):
+            list(iter_extraction_modules(str(document)))
+
+    def test_transform_extraction_file(self, parser, codebase, output_dir):
+        """Test that both layouts transform to the same tuples."""
+        stream_output = output_dir / "extraction.ndjson"
+        with ExtractionStreamWriter(stream_output) as writer:
+            parser.parse_codebase(str(codebase), module_sink=writer.write_module)
+        document_output = output_dir / "extraction.json"
+        self.write_document(document_output, load_extraction_file(str(stream_output)), indent=2)
+
+        counts = []
+        for input_file in (stream_output, document_output):
+            orchestrator = TransformationOrchestrator(job_id="job-1", enable_progress_reporting=False)
+            result = asyncio.run(orchestrator.transform_extraction_file(
+                str(input_file), ["json", "tuple_stream"], str(output_dir), batch_size=2
+            ))
+            assert result.success, result.errors
+            assert set(result.output_files) == {"json", "tuple_stream"}
+            counts.append((result.metadata.output_nodes_count, result.metadata.output_relationships_count))
+
+        assert counts[0] == counts[1]
+        assert counts[0][0] > 0
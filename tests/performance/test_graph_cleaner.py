@@ -0,0 +1,105 @@
+"""
+Unit tests for the uploader's online, batched graph clear.
+
+Tests cover:
+- Deleting relationships, then nodes, in bounded transactions
+- Clearing the whole graph in one pass per phase with CALL { ... } IN TRANSACTIONS
+- Progress reported after every batch
+- Scoping a clear to one namespace through the label indexes
+- Reporting failures instead of raising
+"""
+
+import asyncio
+import re
+
+from backend.uploader.core.graph_cleaner import GraphCleaner
+
+
+class FakeGraph:
+    """Client double holding node and relationship counts per label."""
+
+    def __init__(self, **labels):
+        self.labels = {label: list(counts) for label, counts in labels.items()}
+        self.calls = []
+        self.fail_after = None
+
+    async def execute_write(self, query, parameters=None, implicit=False):
+        self.calls.append((query, dict(parameters or {}), implicit))
+        if self.fail_after is not None and len(self.calls) > self.fail_after:
+            raise RuntimeError("connection lost")
+
+        match = re.search(r"\(n:`(\w+)`\)", query)
+        scope = [match.group(1)] if match else list(self.labels)
+        if "count(n)" in query:
+            return [{"total": sum(self.labels.get(label, [0, 0])[0] for label in scope)}], {}
+        if "count(r)" in query:
+            return [{"total": sum(self.labels.get(label, [0, 0])[1] for label in scope)}], {}
+
+        index = 1 if "DELETE r" in query else 0
+        # CALL { ... } IN TRANSACTIONS deletes every matching row in one query
+        single_pass = "IN TRANSACTIONS" in query
+        budget = float("inf") if single_pass else parameters["limit"]
+        deleted = 0
+        for label in scope:
+            taken = min(budget - deleted, self.labels.get(label, [0, 0])[index])
+            if taken:
+                self.labels[label][index] -= taken
+                deleted += taken
+        counter = "relationships_deleted" if index else "nodes_deleted"
+        records = [{"deleted": deleted}] if single_pass else []
+        return records, {"nodes_deleted": 0, "relationships_deleted": 0, counter: deleted}
+
+
+class TestGraphCleaner:
+    """Test cases for GraphCleaner.clear."""
+
+    def test_whole_graph_cleared_in_bounded_batches(self):
+        """Test that no transaction deletes more than batch_size and progress reaches 100%."""
+        graph = FakeGraph(Module=(15, 12), Class=(10, 0))
+        progress = []
+
+        result = asyncio.run(GraphCleaner(graph, batch_size=10).clear(
+            progress_callback=lambda running: progress.append(running.progress_percentage)
+        ))
+
+        deletes = [(query, parameters, implicit) for query, parameters, implicit in graph.calls if "DELETE" in query]
+        assert result.success
+        assert (result.total_nodes, result.total_relationships) == (25, 12)
+        assert (result.nodes_deleted, result.relationships_deleted) == (25, 12)
+        assert result.batches == 5
+        # One scan per phase, the server committing every batch_size rows
+        assert [query.split(" CALL")[0] for query, _, _ in deletes] == ["MATCH ()-[r]->()", "MATCH (n)"]
+        assert all("IN TRANSACTIONS OF $limit ROWS" in query and implicit for query, _, implicit in deletes)
+        assert all(parameters["limit"] == 10 for _, parameters, _ in deletes)
+        assert progress == sorted(progress) and progress[-1] == 100.0
+        assert graph.labels == {"Module": [0, 0], "Class": [0, 0]}
+
+    def test_namespace_cleared_label_by_label(self):
+        """Test that a namespaced clear goes through each label, then sweeps the rest."""
+        graph = FakeGraph(Module=(3, 2), Class=(4, 0))
+
+        result = asyncio.run(GraphCleaner(graph, batch_size=100, labels=["Module", "Class"]).clear("job-1"))
+
+        node_deletes = [query for query, _, _ in graph.calls if "DETACH DELETE" in query]
+        assert result.success and result.namespace == "job-1"
+        assert all(parameters.get("namespace") == "job-1" for _, parameters, _ in graph.calls)
+        assert all("WHERE n.namespace = $namespace" in query for query, _, _ in graph.calls)
+        # Labelled scopes carry a predicate on every key of the composite index
+        assert all("AND n.unique_key IS NOT NULL" in query for query, _, _ in graph.calls if "(n:`" in query)
+        assert (result.total_nodes, result.total_relationships) == (7, 2)
+        # Each scope repeats until a batch deletes nothing
+        assert list(dict.fromkeys(query.split(" WHERE")[0] for query in node_deletes)) == [
+            "MATCH (n:`Module`)", "MATCH (n:`Class`)", "MATCH (n)"
+        ]
+        assert graph.labels == {"Module": [0, 0], "Class": [0, 0]}
+
+    def test_failure_reported_with_partial_progress(self):
+        """Test that a failing batch ends the clear with an error and the counts so far."""
+        graph = FakeGraph(Module=(30, 0))
+        graph.fail_after = 5  # Two counts, an empty relationship batch, two node batches
+
+        result = asyncio.run(GraphCleaner(graph, batch_size=10, labels=["Module"]).clear("job-1"))
+
+        assert not result.success
+        assert result.nodes_deleted == 20
+        assert "connection lost" in result.errors[0]
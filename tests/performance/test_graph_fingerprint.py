@@ -0,0 +1,229 @@
+"""
+Unit tests for graph fingerprints and skipping redundant backups.
+
+Tests cover:
+- Order-independent hashing of unique_keys and node properties
+- Fingerprinting a namespace through the label indexes
+- Reusing an existing backup while the graph matches its fingerprint
+- Dropping fingerprints of overlapping scopes
+- Invalidating and recording fingerprints in the uploader's write path
+"""
+
+import asyncio
+from pathlib import Path
+
+from backend.neo4j_manager.core.database_tracker import DatabaseTracker
+from backend.neo4j_manager.models.backup_metadata import BackupResult
+from backend.neo4j_manager.services.backup_service import BackupService
+from backend.uploader.core.batch_uploader import BatchUploader
+from backend.uploader.core.graph_fingerprint import GraphFingerprinter, key_hash, node_hash
+from backend.uploader.models.upload_result import UploadResult
+
+
+class FakeGraph:
+    """Client double answering count and key queries per label."""
+
+    def __init__(self, keys_by_label, properties=None):
+        self.keys_by_label = keys_by_label
+        self.properties = properties or {}
+        self.reads = []
+
+    async def stream_read(self, query, parameters=None, fetch_size=1000):
+        self.reads.append((query, dict(parameters or {})))
+        label = query.split("(n:`")[1].split("`")[0]
+        keys = self.keys_by_label.get(label, [])
+        if "count(n)" in query:
+            yield {"nodes": len(keys), "relationships": len(keys) * 2}
+        else:
+            for key in keys:
+                yield {"key": key, "properties": self.properties.get(key, {"unique_key": key})}
+
+
+class WritableGraph(FakeGraph):
+    """Whole-graph double whose Cypher batches set a new docstring on every node."""
+
+    def __init__(self, keys_by_label, events, fail=False):
+        super().__init__(keys_by_label)
+        self.events = events
+        self.fail = fail
+
+    async def stream_read(self, query, parameters=None, fetch_size=1000):
+        keys = [key for keys in self.keys_by_label.values() for key in keys]
+        if "count(n)" in query:
+            yield {"total": len(keys)}
+        elif "count(r)" in query:
+            yield {"total": 0}
+        else:
+            for key in keys:
+                yield {"key": key, "properties": self.properties.get(key, {"unique_key": key})}
+
+    async def execute_cypher_batch(self, commands, batch_size=100, job_id=None):
+        self.events.append("write")
+        result = UploadResult(job_id=job_id or "unknown")
+        if self.fail:
+            result.add_error("Neo.ClientError.General.Unknown")
+            return result
+        for keys in self.keys_by_label.values():
+            for key in keys:
+                self.properties[key] = {"unique_key": key, "docstring": "changed"}
+        return result
+
+
+class RecordingTracker(DatabaseTracker):
+    """Tracker noting when fingerprints are invalidated and recorded."""
+
+    def __init__(self, storage_dir, events):
+        super().__init__(storage_dir)
+        self.events = events
+
+    async def invalidate_graph_fingerprint(self, namespace=None):
+        self.events.append("invalidate")
+        await super().invalidate_graph_fingerprint(namespace)
+
+    async def record_graph_fingerprint(self, fingerprint):
+        self.events.append("record")
+        await super().record_graph_fingerprint(fingerprint)
+
+
+class FakeBackupManager:
+    """Backup manager double taking snapshot backups of a settable fingerprint."""
+
+    backup_mode = "snapshot"
+
+    def __init__(self, backup_dir: Path, fingerprint):
+        self.backup_dir = backup_dir
+        self.fingerprint = fingerprint
+        self.backups_taken = []
+
+    async def graph_fingerprint(self, namespace=None, recorded=None):
+        return self.fingerprint
+
+    async def create_backup(self, job_id, mode=None, namespace=None):
+        path = self.backup_dir / f"neo4j_snapshot_{job_id}"
+        path.mkdir(parents=True)
+        self.backups_taken.append(job_id)
+        return BackupResult(job_id=job_id, success=True, backup_path=str(path), backup_mode="snapshot")
+
+
+def fingerprint(namespace="ns", nodes=3, key_hash_value="00ff"):
+    return {"namespace": namespace, "node_count": nodes, "relationship_count": 2, "key_hash": key_hash_value}
+
+
+class TestGraphFingerprint:
+    """Test cases for key_hash and GraphFingerprinter."""
+
+    def test_key_hash_order_independent(self):
+        """Test that the key hash ignores order but not content or multiplicity."""
+        keys = ["mod:a", "mod:a.B", "mod:a.B.run"]
+        assert key_hash(keys) == key_hash(reversed(keys))
+        assert key_hash(keys) != key_hash(keys[:2] + ["mod:a.B.stop"])
+        assert key_hash(keys + keys[:1]) != key_hash(keys)
+
+    def test_namespace_fingerprinted_label_by_label(self):
+        """Test that counts and keys of a namespace are read through each label."""
+        graph = FakeGraph({"Module": ["mod:a"], "Class": ["mod:a.B", "mod:a.C"]})
+
+        result = asyncio.run(GraphFingerprinter(graph, labels=["Module", "Class"]).fingerprint("job-1"))
+
+        assert (result.namespace, result.node_count, result.relationship_count) == ("job-1", 3, 6)
+        expected = node_hash((key, {"unique_key": key}) for key in ["mod:a", "mod:a.B", "mod:a.C"])
+        assert result.key_hash == f"{expected:016x}"
+        assert all(parameters == {"namespace": "job-1"} for _, parameters in graph.reads)
+        assert all("WHERE n.namespace = $namespace" in query for query, _ in graph.reads)
+
+    def test_property_changes_change_fingerprint(self):
+        """Test that re-merging the same keys with new properties gives a new fingerprint."""
+        keys = {"Function": ["mod:a.run"]}
+        before = GraphFingerprinter(FakeGraph(keys, {"mod:a.run": {"line_start": 3}}), labels=["Function"])
+        after = GraphFingerprinter(FakeGraph(keys, {"mod:a.run": {"line_start": 4}}), labels=["Function"])
+
+        first, second = asyncio.run(before.fingerprint("ns")), asyncio.run(after.fingerprint("ns"))
+
+        assert (first.node_count, first.relationship_count) == (second.node_count, second.relationship_count)
+        assert first.key_hash != second.key_hash
+
+
+class TestBackupSkipping:
+    """Test cases for BackupService reusing backups of an unchanged graph."""
+
+    def test_unchanged_graph_reuses_backup(self, tmp_path):
+        """Test that a matching fingerprint reuses the backup, and a changed one does not."""
+        manager = FakeBackupManager(tmp_path / "backups", fingerprint())
+        tracker = DatabaseTracker(str(tmp_path / "backups"))
+        service = BackupService(manager, tracker)
+
+        first = asyncio.run(service.create_backup("job-1", namespace="ns"))
+        second = asyncio.run(service.create_backup("job-2", namespace="ns"))
+
+        assert first.success and not first.skipped
+        assert second.success and second.skipped
+        assert second.reused_backup_job_id == "job-1"
+        assert second.backup_path == first.backup_path
+        assert manager.backups_taken == ["job-1"]
+
+        # Deleting the original keeps the files the reusing job still points at
+        assert asyncio.run(tracker.delete_backup("job-1"))
+        assert Path(second.backup_path).exists()
+
+        manager.fingerprint = fingerprint(nodes=4, key_hash_value="0100")
+        third = asyncio.run(service.create_backup("job-3", namespace="ns"))
+        assert not third.skipped
+        assert manager.backups_taken == ["job-1", "job-3"]
+
+        forced = asyncio.run(service.create_backup("job-4", namespace="ns", skip_if_unchanged=False))
+        assert not forced.skipped
+
+    def test_overlapping_fingerprints_dropped(self, tmp_path):
+        """Test that whole-graph and namespace fingerprints invalidate each other."""
+        tracker = DatabaseTracker(str(tmp_path))
+
+        async def run():
+            await tracker.record_graph_fingerprint(fingerprint("a"))
+            await tracker.record_graph_fingerprint(fingerprint("b"))
+            both = [await tracker.get_graph_fingerprint(scope) for scope in ("a", "b")]
+            await tracker.record_graph_fingerprint(fingerprint(None))
+            after_whole = [await tracker.get_graph_fingerprint(scope) for scope in ("a", "b", None)]
+            await tracker.invalidate_graph_fingerprint("a")
+            return both, after_whole, await tracker.get_graph_fingerprint(None)
+
+        both, after_whole, whole = asyncio.run(run())
+
+        assert all(both)
+        assert after_whole[:2] == [None, None] and after_whole[2]["namespace"] is None
+        assert whole is None
+        reopened = DatabaseTracker(str(tmp_path))
+        assert [asyncio.run(reopened.get_graph_fingerprint(scope)) for scope in ("a", "b", None)] == [None] * 3
+
+
+class TestUploaderFingerprints:
+    """Test cases for fingerprint tracking in BatchUploader, whichever caller uploads."""
+
+    def upload(self, tmp_path, fail=False):
+        events = []
+        graph = WritableGraph({"Function": ["mod:a.run"]}, events, fail=fail)
+        tracker = RecordingTracker(str(tmp_path), events)
+        stale = asyncio.run(GraphFingerprinter(graph).fingerprint()).to_dict()
+        asyncio.run(tracker.record_graph_fingerprint(stale))
+        events.clear()
+
+        uploader = BatchUploader(graph, fingerprint_tracker=tracker)
+        result = asyncio.run(uploader.upload_from_commands(["MERGE (f:Function {unique_key: 'mod:a.run'})"], "job-1"))
+        return result, events, stale, asyncio.run(tracker.get_graph_fingerprint())
+
+    def test_property_only_upload_records_new_fingerprint(self, tmp_path):
+        """Test that an upload changing only properties replaces the recorded fingerprint."""
+        result, events, stale, recorded = self.upload(tmp_path)
+
+        assert result.success
+        assert events == ["invalidate", "write", "record"]
+        assert (recorded["node_count"], recorded["relationship_count"]) == (stale["node_count"],
+                                                                            stale["relationship_count"])
+        assert recorded["key_hash"] != stale["key_hash"]
+
+    def test_failed_upload_leaves_fingerprint_invalidated(self, tmp_path):
+        """Test that a failed upload records nothing, so backups fingerprint the graph again."""
+        result, events, _, recorded = self.upload(tmp_path, fail=True)
+
+        assert not result.success
+        assert events == ["invalidate", "write"]
+        assert recorded is None
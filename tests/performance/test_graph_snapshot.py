@@ -0,0 +1,160 @@
+"""
+Unit tests for the uploader's online graph snapshots.
+
+Tests cover:
+- Streaming nodes and relationships into bounded, columnar chunk files
+- Round-tripping a snapshot through the UNWIND restore path
+- Scoping snapshot and restore to one namespace
+- Removing temporary snapshot IDs after a failed restore
+- Reporting failures instead of raising
+"""
+
+import asyncio
+import gzip
+import json
+from types import SimpleNamespace
+
+from backend.uploader.core.graph_snapshot import SNAPSHOT_ID_PROPERTY, GraphSnapshot
+
+
+class FakeGraph:
+    """Client double streaming a fixed graph and recording restore writes."""
+
+    def __init__(self, nodes=(), relationships=()):
+        self.nodes = list(nodes)
+        self.relationships = list(relationships)
+        self.reads = []
+        self.writes = []
+        self.created_nodes = []
+        self.created_relationships = []
+        self.fail_reads = False
+        self.fail_relationship_writes = False
+
+    async def stream_read(self, query, parameters=None, fetch_size=1000):
+        self.reads.append((query, dict(parameters or {})))
+        if self.fail_reads:
+            raise RuntimeError("connection lost")
+        records = self.nodes if "labels(n) AS labels" in query else self.relationships
+        for record in records:
+            yield record
+
+    async def execute_write(self, query, parameters=None, implicit=False):
+        self.writes.append((query, dict(parameters or {})))
+        if "count(" in query and "DELETE" not in query:
+            return [{"total": 0}], {}
+        return [], {"nodes_deleted": 0, "relationships_deleted": 0, "properties_set": 0}
+
+    async def execute_unwind(self, query, rows, job_id=None, parameters=None, isolate_failures=True):
+        if "CREATE (n" in query:
+            labels = query.split("CREATE (n")[1].split(")")[0]
+            self.created_nodes.extend((labels, row) for row in rows)
+            return SimpleNamespace(has_errors=False, nodes_created=len(rows), relationships_created=0)
+        if self.fail_relationship_writes:
+            return SimpleNamespace(has_errors=True, errors=["connection lost"])
+        self.created_relationships.extend(rows)
+        return SimpleNamespace(has_errors=False, nodes_created=0, relationships_created=len(rows))
+
+
+def node(node_id, label, **properties):
+    return {"id": node_id, "labels": [label], "properties": properties}
+
+
+def relationship(source, target, relationship_type="CONTAINS", **properties):
+    return {"source": source, "target": target, "source_labels": ["Module"], "target_labels": ["Class"],
+            "type": relationship_type, "properties": properties}
+
+
+def read_chunk(path):
+    with gzip.open(path, "rb") as chunk_file:
+        return json.loads(chunk_file.read())
+
+
+class TestGraphSnapshot:
+    """Test cases for GraphSnapshot.snapshot and restore."""
+
+    def test_snapshot_written_as_bounded_columnar_chunks(self, tmp_path):
+        """Test that chunks hold at most chunk_rows rows, one column per property."""
+        modules = [node(f"m{index}", "Module", unique_key=f"mod{index}", loc=index) for index in range(5)]
+        graph = FakeGraph(
+            nodes=modules + [node("c0", "Class", unique_key="cls0")],
+            relationships=[relationship("m0", "c0", weight=2)]
+        )
+
+        result = asyncio.run(GraphSnapshot(graph, chunk_rows=2).snapshot(tmp_path / "snap"))
+
+        manifest = json.loads((tmp_path / "snap" / "manifest.json").read_text())
+        assert result.success
+        assert (result.nodes, result.relationships, result.chunks) == (6, 1, 5)
+        assert (manifest["node_count"], manifest["relationship_count"]) == (6, 1)
+        assert result.size_bytes == sum(chunk["size_bytes"] for chunk in manifest["chunks"])
+        assert all(chunk["rows"] <= 2 for chunk in manifest["chunks"])
+        assert result.nodes_per_second > 0
+
+        first = read_chunk(tmp_path / "snap" / manifest["chunks"][0]["file"])
+        assert first["labels"] == ["Module"]
+        assert first["ids"] == ["m0", "m1"]
+        assert first["properties"] == {"unique_key": ["mod0", "mod1"], "loc": [0, 1]}
+
+    def test_restore_round_trips_snapshot(self, tmp_path):
+        """Test that restore recreates nodes and relationships and removes its temporary index."""
+        source = FakeGraph(
+            nodes=[node("m0", "Module", unique_key="mod0"), node("c0", "Class", unique_key="cls0", doc=None)],
+            relationships=[relationship("m0", "c0", weight=2)]
+        )
+        asyncio.run(GraphSnapshot(source).snapshot(tmp_path / "snap"))
+
+        target = FakeGraph()
+        result = asyncio.run(GraphSnapshot(target, restore_batch_size=1).restore(tmp_path / "snap"))
+
+        assert result.success
+        assert (result.nodes, result.relationships) == (2, 1)
+        assert sorted(target.created_nodes, key=lambda entry: entry[1]["id"]) == [
+            (":`Class`", {"id": "c0", "properties": {"unique_key": "cls0"}}),
+            (":`Module`", {"id": "m0", "properties": {"unique_key": "mod0"}})
+        ]
+        assert target.created_relationships == [{"source": "m0", "target": "c0", "properties": {"weight": 2}}]
+
+        queries = [query for query, _ in target.writes]
+        assert any(query.startswith("CREATE INDEX") and SNAPSHOT_ID_PROPERTY in query for query in queries)
+        assert any(query.startswith("DROP INDEX") for query in queries)
+        assert any(f"REMOVE n.`{SNAPSHOT_ID_PROPERTY}`" in query for query in queries)
+
+    def test_namespace_scopes_snapshot_and_restore(self, tmp_path):
+        """Test that a namespaced snapshot reads and later clears only its namespace."""
+        graph = FakeGraph(nodes=[node("m0", "Module", unique_key="mod0", namespace="job-1")])
+
+        snapshot = asyncio.run(GraphSnapshot(graph).snapshot(tmp_path / "snap", namespace="job-1"))
+        result = asyncio.run(GraphSnapshot(graph).restore(tmp_path / "snap"))
+
+        assert snapshot.nodes == 1  # Read once, under its own label
+        assert result.success and result.namespace == "job-1"
+        assert all("(n:`" in query for query, _ in graph.reads)
+        assert all("WHERE n.namespace = $namespace AND n.unique_key IS NOT NULL" in query for query, _ in graph.reads)
+        assert all(parameters == {"namespace": "job-1"} for _, parameters in graph.reads)
+        clears = [parameters for query, parameters in graph.writes if "DELETE" in query or "count(" in query]
+        assert clears and all(parameters.get("namespace") == "job-1" for parameters in clears)
+
+    def test_failed_restore_removes_snapshot_ids(self, tmp_path):
+        """Test that a restore failing midway still removes its temporary IDs and indexes."""
+        source = FakeGraph(nodes=[node("m0", "Module"), node("c0", "Class")], relationships=[relationship("m0", "c0")])
+        asyncio.run(GraphSnapshot(source).snapshot(tmp_path / "snap"))
+
+        target = FakeGraph()
+        target.fail_relationship_writes = True
+        result = asyncio.run(GraphSnapshot(target).restore(tmp_path / "snap"))
+
+        queries = [query for query, _ in target.writes]
+        assert not result.success and "connection lost" in result.errors[0]
+        assert any(f"REMOVE n.`{SNAPSHOT_ID_PROPERTY}`" in query for query in queries)
+        assert sum(query.startswith("DROP INDEX") for query in queries) == 2
+
+    def test_failure_reported(self, tmp_path):
+        """Test that a failing read stream ends the snapshot with an error."""
+        graph = FakeGraph(nodes=[node("m0", "Module")])
+        graph.fail_reads = True
+
+        result = asyncio.run(GraphSnapshot(graph).snapshot(tmp_path / "snap"))
+
+        assert not result.success
+        assert "connection lost" in result.errors[0]
+        assert not (tmp_path / "snap" / "manifest.json").exists()
@@ -3,6 +3,8 @@ Unit tests for the HashBasedCache performance optimization system.
 
 Tests cover:
 - Hash-based change detection
+- Stat-first change detection (hash at most once per run)
+- Content-addressed sharing across paths and cache backends
 - Cache persistence and loading
 - Cache invalidation and cleanup
 - Performance metrics
@@ -18,9 +20,9 @@ from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
 import hashlib
 
-from backend.parser.hash_based_cache import HashBasedCache, CacheEntry, FileHash
-from backend.parser.config import get_parser_config
-from backend.parser.models import ParsedModule
+from hash_based_cache import HashBasedCache, CacheEntry, FileHash
+from config import get_parser_config
+from models import ParsedModule
 from backend.graph_builder.relationship_extractor import CodeRelationship
 
 
@@ -213,6 +215,168 @@ class TestChangeDetection(TestHashBasedCache):
         assert len(cached_files) == 0
 
 
+class TestStatFirstChangeDetection(TestHashBasedCache):
+    """Test that change detection only hashes files whose stat data changed."""
+    
+    def test_unchanged_run_hashes_nothing(self, cache_config, temp_cache_dir, temp_files, mock_parsed_module):
+        """Test that a warm run with no changes costs only stat calls."""
+        file_paths = list(temp_files.values())
+        cache1 = HashBasedCache(cache_config, cache_dir=temp_cache_dir)
+        for file_path in file_paths:
+            cache1.store_result(file_path, mock_parsed_module, [], 1.0)
+        cache1.save_hash_cache()
+        
+        cache2 = HashBasedCache(cache_config, cache_dir=temp_cache_dir)
+        changed_files, cached_files = cache2.get_changed_files(file_paths)
+        for file_path in cached_files:
+            cache2.get_cached_result(file_path)
+        
+        assert changed_files == []
+        assert cache2.stats['files_hashed'] == 0
+    
+    def test_touched_file_hashed_once(self, cache, temp_files, mock_parsed_module):
+        """Test that a touched but unchanged file is hashed once and stays cached."""
+        import os
+        file_path = temp_files['test']
+        cache.store_result(file_path, mock_parsed_module, [], 1.0)
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        hashed_before = cache.stats['files_hashed']
+        
+        changed_files, cached_files = cache.get_changed_files([file_path])
+        cache.get_cached_result(file_path)
+        cache.get_changed_files([file_path])
+        
+        assert cached_files == [file_path]
+        assert cache.stats['files_hashed'] == hashed_before + 1
+    
+    def test_store_result_reuses_run_hash(self, cache, temp_files, mock_parsed_module):
+        """Test that storing a re-parsed file does not hash it a second time."""
+        file_path = temp_files['test']
+        cache.store_result(file_path, mock_parsed_module, [], 1.0)
+        Path(file_path).write_text("def modified_function():\n    return 'changed'\n")
+        hashed_before = cache.stats['files_hashed']
+        
+        changed_files, _ = cache.get_changed_files([file_path])
+        cache.store_result(file_path, mock_parsed_module, [], 1.0)
+        
+        assert changed_files == [file_path]
+        assert cache.stats['files_hashed'] == hashed_before + 1
+    
+    def test_parallel_check_preserves_order(self, cache, mock_parsed_module):
+        """Test the thread-pool path on a batch above the parallel threshold."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_paths = []
+            for i in range(HashBasedCache.PARALLEL_CHECK_THRESHOLD * 2):
+                file_path = Path(temp_dir) / f"module_{i}.py"
+                file_path.write_text(f"value = {i}\n")
+                file_paths.append(str(file_path))
+            for file_path in file_paths[::2]:
+                cache.store_result(file_path, mock_parsed_module, [], 1.0)
+            
+            changed_files, cached_files = cache.get_changed_files(file_paths)
+        
+        assert changed_files == file_paths[1::2]
+        assert cached_files == file_paths[::2]
+    
+    def test_parallel_check_counts_every_hash(self, cache, mock_parsed_module):
+        """Test that statistics from the thread-pool path are not lost."""
+        import os
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_paths = []
+            for i in range(HashBasedCache.PARALLEL_CHECK_THRESHOLD * 4):
+                file_path = Path(temp_dir) / f"module_{i}.py"
+                file_path.write_text(f"value = {i}\n")
+                file_paths.append(str(file_path))
+                cache.store_result(str(file_path), mock_parsed_module, [], 1.0)
+            cache.end_run()
+            for file_path in file_paths:
+                stat = os.stat(file_path)
+                os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            hashed_before = cache.stats['files_hashed']
+            
+            changed_files, cached_files = cache.get_changed_files(file_paths)
+        
+        assert cached_files == file_paths
+        assert cache.stats['files_hashed'] == hashed_before + len(file_paths)
+        assert cache.stats['files_skipped'] == len(file_paths)
+
+
+class TestContentAddressedCache(TestHashBasedCache):
+    """Test that parse results are shared by content across paths and caches."""
+    
+    def test_identical_file_at_other_path_is_cached(self, cache, temp_files, mock_parsed_module):
+        """Test that a copy of a parsed file is served from the cache."""
+        file_path = temp_files['test']
+        cache.store_result(file_path, mock_parsed_module, [], 1.0)
+        
+        with tempfile.TemporaryDirectory() as session_dir:
+            copy_path = str(Path(session_dir) / "test.py")
+            Path(copy_path).write_bytes(Path(file_path).read_bytes())
+            
+            changed_files, cached_files = cache.get_changed_files([copy_path])
+            entry = cache.get_cached_result(copy_path)
+        
+        assert cached_files == [copy_path]
+        assert cache.stats['content_hits'] == 1
+        assert entry.parsed_module.path == str(Path(copy_path).absolute())
+    
+    def test_shared_backend_across_caches(self, cache_config, temp_files, mock_parsed_module):
+        """Test that caches with separate local stores share results through a shared directory."""
+        file_path = temp_files['test']
+        with tempfile.TemporaryDirectory() as shared_dir, \
+                tempfile.TemporaryDirectory() as local_a, \
+                tempfile.TemporaryDirectory() as local_b:
+            cache_config.tool_options['cache'].update(backend='shared', shared_dir=shared_dir)
+            
+            cache_a = HashBasedCache(cache_config, cache_dir=local_a)
+            cache_a.store_result(file_path, mock_parsed_module, [], 1.0)
+            cache_b = HashBasedCache(cache_config, cache_dir=local_b)
+            results = cache_b.bulk_load_cached_results([file_path])
+            
+            entries = list(Path(shared_dir).rglob("*.json"))
+        
+        assert file_path in results
+        assert len(entries) == 1
+        assert not entries[0].name.startswith(".tmp-")
+
+    def test_shared_entries_never_unpickled(self, cache_config, temp_files, mock_parsed_module):
+        """Test that a pickle planted in the shared directory is a kept cache miss, never executed."""
+        import pickle
+
+        class Exploit:
+            def __reduce__(self):
+                return (exec, (f"open({str(marker)!r}, 'w').close()",))
+
+        file_path = temp_files['test']
+        with tempfile.TemporaryDirectory() as shared_dir, \
+                tempfile.TemporaryDirectory() as local_a, \
+                tempfile.TemporaryDirectory() as local_b:
+            marker = Path(local_b) / "exploited"
+            cache_config.tool_options['cache'].update(backend='shared', shared_dir=shared_dir)
+            HashBasedCache(cache_config, cache_dir=local_a).store_result(file_path, mock_parsed_module, [], 1.0)
+            entry_path = next(Path(shared_dir).rglob("*.json"))
+            entry_path.write_bytes(pickle.dumps(Exploit()))
+
+            cache_b = HashBasedCache(cache_config, cache_dir=local_b)
+            result = cache_b.get_cached_result(file_path)
+
+            assert result is None
+            assert not marker.exists()
+            assert entry_path.exists()
+
+    def test_config_hash_ignores_runtime_options(self, cache_config, temp_cache_dir):
+        """Test that only parse-affecting settings change the result key."""
+        base_hash = HashBasedCache(cache_config)._config_hash
+        
+        cache_config.tool_options['parallel']['max_workers'] = 64
+        cache_config.tool_options['cache']['cache_dir'] = str(Path(temp_cache_dir) / "other")
+        assert HashBasedCache(cache_config)._config_hash == base_hash
+        
+        cache_config.extract_decorators = not cache_config.extract_decorators
+        assert HashBasedCache(cache_config)._config_hash != base_hash
+
+
 class TestCachePersistence(TestHashBasedCache):
     """Test cache persistence and loading."""
     
@@ -338,6 +502,60 @@ class TestCacheInvalidation(TestHashBasedCache):
         assert file_path in changed_files
         assert len(cached_files) == 0
     
+    def test_shared_parse_result_kept_until_last_path_invalidated(self, cache, temp_files, mock_parsed_module):
+        """Test that a parse result shared by identical files outlives all but the last of them."""
+        file_path = temp_files['test']
+        cache.store_result(file_path, mock_parsed_module, [], 1.0)
+        content_hash = cache.file_hashes[str(Path(file_path).absolute())].content_hash
+        module_key = cache._module_key(content_hash)
+        
+        with tempfile.TemporaryDirectory() as session_dir:
+            copy_path = str(Path(session_dir) / "test.py")
+            Path(copy_path).write_bytes(Path(file_path).read_bytes())
+            cache.get_changed_files([copy_path])
+            assert cache._content_refs[content_hash] == 2
+            
+            assert cache.invalidate_file(file_path)
+            assert cache.backend.has_module(module_key)
+            assert cache.invalidate_file(copy_path)
+        
+        assert not cache.backend.has_module(module_key)
+        assert content_hash not in cache._content_refs
+    
+    def test_shared_content_refcounts_on_parallel_check(self, cache, temp_files, mock_parsed_module):
+        """Test reference counts when the thread-pool path adopts many identical files."""
+        file_path = temp_files['test']
+        cache.store_result(file_path, mock_parsed_module, [], 1.0)
+        content = Path(file_path).read_bytes()
+        content_hash = cache.file_hashes[str(Path(file_path).absolute())].content_hash
+        module_key = cache._module_key(content_hash)
+    
+        with tempfile.TemporaryDirectory() as session_dir:
+            copies = []
+            for i in range(HashBasedCache.PARALLEL_CHECK_THRESHOLD * 4):
+                copy_path = str(Path(session_dir) / f"copy_{i}.py")
+                Path(copy_path).write_text(f"value = {i}\n")
+                copies.append(copy_path)
+            # Index the copies under their own content, then make them identical
+            for copy_path in copies:
+                cache.store_result(copy_path, mock_parsed_module, [], 1.0)
+            cache.end_run()
+            for copy_path in copies:
+                Path(copy_path).write_bytes(content)
+    
+            changed_files, cached_files = cache.get_changed_files(copies)
+    
+            assert cached_files == copies
+            assert cache._content_refs[content_hash] == len(copies) + 1
+            assert sum(cache._content_refs.values()) == len(cache.file_hashes)
+    
+            for copy_path in copies:
+                assert cache.invalidate_file(copy_path)
+            assert cache.backend.has_module(module_key)
+    
+        assert cache.invalidate_file(file_path)
+        assert not cache.backend.has_module(module_key)
+    
     def test_clear_cache(self, cache, temp_files, mock_parsed_module):
         """Test clearing entire cache."""
         # Store multiple files
@@ -468,6 +686,102 @@ class TestErrorHandling(TestHashBasedCache):
                 pass  # Expected to fail, but should not crash
 
 
+
+class TestCacheStore(TestHashBasedCache):
+    """Test the single-file store behind the cache."""
+    
+    @pytest.fixture
+    def parsed_module(self, temp_files):
+        """Create a ParsedModule with nested elements for round-trip tests."""
+        from models import ParsedClass, ParsedFunction, ParsedImport
+        return ParsedModule(
+            name="test",
+            path=str(Path(temp_files['test']).absolute()),
+            imports=[ParsedImport(name="os")],
+            classes=[ParsedClass(name="Example", methods=[
+                ParsedFunction(name="run", signature="def run(self)", is_method=True)
+            ])],
+            functions=[ParsedFunction(name="test_function", signature="def test_function()")],
+            line_count=2
+        )
+    
+    def test_round_trip_returns_parsed_module(self, cache_config, temp_cache_dir, temp_files, parsed_module):
+        """Test that cached results come back as equal ParsedModule objects."""
+        file_path = temp_files['test']
+        cache1 = HashBasedCache(cache_config, cache_dir=temp_cache_dir)
+        cache1.store_result(file_path, parsed_module, [], 1.0)
+        cache1.save_hash_cache()
+        
+        cache2 = HashBasedCache(cache_config, cache_dir=temp_cache_dir)
+        entry = cache2.get_cached_result(file_path)
+        
+        assert isinstance(entry.parsed_module, ParsedModule)
+        assert entry.parsed_module == parsed_module
+        assert entry.file_hash.parse_duration == 1.0
+    
+    def test_bulk_load_after_restart(self, cache_config, temp_cache_dir, temp_files, parsed_module):
+        """Test bulk loading many entries from a fresh cache instance."""
+        file_paths = list(temp_files.values())
+        cache1 = HashBasedCache(cache_config, cache_dir=temp_cache_dir)
+        for file_path in file_paths:
+            cache1.store_result(file_path, parsed_module, [], 1.0)
+        cache1.save_hash_cache()
+        
+        cache2 = HashBasedCache(cache_config, cache_dir=temp_cache_dir)
+        results = cache2.bulk_load_cached_results(file_paths)
+        
+        assert set(results) == set(file_paths)
+        assert all(isinstance(e.parsed_module, ParsedModule) for e in results.values())
+        # Modules are rebased onto the path they were looked up for
+        for file_path, entry in results.items():
+            assert entry.parsed_module.path == str(Path(file_path).absolute())
+    
+    def test_single_store_file(self, cache_config, temp_cache_dir, temp_files, parsed_module):
+        """Test that results are kept in one database instead of per-file JSON."""
+        cache = HashBasedCache(cache_config, cache_dir=temp_cache_dir)
+        for file_path in temp_files.values():
+            cache.store_result(file_path, parsed_module, [], 1.0)
+        cache.save_hash_cache()
+        
+        assert (Path(temp_cache_dir) / HashBasedCache.STORE_FILENAME).exists()
+        assert not list(Path(temp_cache_dir).rglob("*.json"))
+    
+    def test_store_not_locked_between_writes(self, cache_config, temp_cache_dir, temp_files, parsed_module):
+        """Test that another process can write to the store while a cache is mid-run."""
+        from cache_store import ParseCacheStore
+        cache1 = HashBasedCache(cache_config, cache_dir=temp_cache_dir)
+        cache1.store_result(temp_files['test'], parsed_module, [], 1.0)
+        cache1.get_changed_files(list(temp_files.values()))
+        
+        other = ParseCacheStore(Path(temp_cache_dir) / HashBasedCache.STORE_FILENAME, busy_timeout=0.1)
+        other.put_module("other-key", b"payload")
+        other.commit()
+        other.close()
+        
+        cache2 = HashBasedCache(cache_config, cache_dir=temp_cache_dir)
+        assert cache2.store_result(temp_files['another'], parsed_module, [], 1.0)
+        assert cache2.get_cached_result(temp_files['test']).parsed_module == parsed_module
+    
+    def test_locked_store_degrades_to_cache_miss(self, cache, temp_files, parsed_module):
+        """Test that a store locked by another process costs cache hits, not the parse."""
+        import os
+        import sqlite3
+        file_path = temp_files['test']
+        cache.store_result(file_path, parsed_module, [], 1.0)
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        locked = sqlite3.OperationalError("database is locked")
+        
+        with patch.object(cache.store, 'put_file_entry', side_effect=locked), \
+                patch.object(cache.store, 'commit', side_effect=locked):
+            changed_files, cached_files = cache.get_changed_files([file_path])
+        assert cached_files == [file_path]
+        
+        with patch.object(cache.backend, 'get_module', side_effect=locked):
+            assert cache.get_cached_result(file_path) is None
+        assert cache.get_cached_result(file_path).parsed_module == parsed_module
+
+
 class TestIntegrationScenarios(TestHashBasedCache):
     """Integration tests for complete cache workflows."""
     
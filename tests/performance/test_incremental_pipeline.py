@@ -0,0 +1,119 @@
+"""
+Tests for the incremental (diff-driven) pipeline.
+
+Tests cover:
+- Module delta computation from the hash cache state
+- Skipping unchanged modules on repeat runs
+- Stale subgraph deletion ahead of the delta upload
+"""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from codebase_parser import CodebaseParser
+from config import get_parser_config
+from backend.transformer.formatters.neo4j_formatter import Neo4jFormatter
+from backend.transformer.models.tuples import Neo4jNodeTuple, TupleSet
+
+
+class TestIncrementalExtraction:
+    """Test cases for CodebaseParser.parse_codebase_incremental."""
+
+    @pytest.fixture
+    def codebase(self):
+        """Create a small codebase."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            for name in ("a", "b", "c"):
+                (root / f"{name}.py").write_text(f"def {name}():\n    return '{name}'\n")
+            yield root
+
+    @pytest.fixture
+    def parser(self):
+        """Create a parser with its cache in a temporary directory."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            config = get_parser_config("standard")
+            config.tool_options['cache']['cache_dir'] = cache_dir
+            yield CodebaseParser(config)
+
+    def test_first_run_adds_everything(self, parser, codebase):
+        """Test that all modules are added when nothing was indexed yet."""
+        modules, delta = parser.parse_codebase_incremental(str(codebase))
+
+        assert len(delta.added) == 3
+        assert delta.changed == [] and delta.deleted == []
+        assert set(modules) == set(delta.added)
+
+    def test_repeat_run_is_empty(self, parser, codebase):
+        """Test that an unchanged codebase produces an empty delta."""
+        parser.parse_codebase_incremental(str(codebase))
+        modules, delta = parser.parse_codebase_incremental(str(codebase))
+
+        assert delta.is_empty
+        assert delta.unchanged_count == 3
+        assert modules == {}
+
+    def test_delta_after_edits(self, parser, codebase):
+        """Test that added, changed and deleted modules are reported."""
+        parser.parse_codebase_incremental(str(codebase))
+
+        (codebase / "a.py").write_text("def a():\n    return 'changed'\n")
+        (codebase / "b.py").unlink()
+        (codebase / "d.py").write_text("D = 1\n")
+
+        modules, delta = parser.parse_codebase_incremental(str(codebase))
+
+        assert [Path(p).name for p in delta.added] == ["d.py"]
+        assert [Path(p).name for p in delta.changed] == ["a.py"]
+        assert [Path(p).name for p in delta.deleted] == ["b.py"]
+        assert {Path(p).name for p in modules} == {"a.py", "d.py"}
+
+    def test_full_run_indexes_for_incremental(self, parser, codebase):
+        """Test that a full parse leaves the index ready for incremental runs."""
+        parser.parse_codebase(str(codebase))
+        _, delta = parser.parse_codebase_incremental(str(codebase))
+
+        assert delta.is_empty
+
+
+class TestDeltaFormatting:
+    """Test cases for formatting delta tuple sets."""
+
+    def test_stale_modules_deleted_before_merge(self):
+        """Test that stale subgraphs are deleted ahead of the merged delta."""
+        tuple_set = TupleSet(replaced_modules=["/src/a.py"], deleted_modules=["/src/b.py"])
+        tuple_set.add_node(Neo4jNodeTuple(
+            label="Module",
+            properties={"path": "/src/a.py", "name": "a"},
+            unique_key="module:/src/a.py",
+            merge_properties={"path"}
+        ))
+
+        formatter = Neo4jFormatter()
+        formatter.format(tuple_set)
+
+        deletes = [q for q in formatter.queries if "DELETE" in q]
+        assert formatter.queries.index(deletes[-1]) < formatter.queries.index(
+            next(q for q in formatter.queries if q.startswith("MERGE"))
+        )
+        # Replaced modules keep their Module node, deleted ones lose it
+        assert any("DELETE r" in q for q in deletes)
+        assert any("DETACH DELETE m" in q for q in deletes)
+        assert {p["module_path"] for p in formatter.parameters if "module_path" in p} == {"/src/a.py", "/src/b.py"}
+
+    def test_deletion_only_delta_is_not_empty(self):
+        """Test that a delta with only deletions still produces commands."""
+        output = Neo4jFormatter().format(TupleSet(deleted_modules=["/src/b.py"]))
+
+        assert "DETACH DELETE" in output
+        assert "No data to transform" not in output
+
+    def test_merge_keeps_stale_modules(self):
+        """Test that merging tuple sets keeps the stale module lists."""
+        merged = TupleSet(replaced_modules=["/a.py"]).merge(TupleSet(deleted_modules=["/b.py"]))
+
+        assert merged.replaced_modules == ["/a.py"]
+        assert merged.deleted_modules == ["/b.py"]
+        assert merged.has_stale_modules
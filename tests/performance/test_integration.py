@@ -17,9 +17,9 @@ import threading
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from backend.parser.codebase_parser import CodebaseParser
-from backend.parser.config import get_parser_config
-from backend.parser.models import ParsedModule
+from codebase_parser import CodebaseParser
+from config import get_parser_config
+from models import ParsedModule
 
 
 class TestSystemIntegration:
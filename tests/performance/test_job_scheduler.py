@@ -0,0 +1,133 @@
+"""
+Unit tests for the orchestrator's job scheduler.
+
+Tests cover:
+- Bounded concurrency and one running job per codebase lane
+- Round-robin ordering across lanes, remembered across idle periods
+- Refusing submissions to a full run queue
+- Per-phase concurrency slots
+"""
+
+import asyncio
+
+import pytest
+
+from backend.parser.prod.orchestrator.scheduler import JobScheduler, QueueFullError
+
+
+class Recorder:
+    """Runner recording when each job starts and ends."""
+
+    def __init__(self, seconds: float = 0.01):
+        self.seconds = seconds
+        self.events = []
+        self.running = 0
+        self.peak = 0
+
+    async def __call__(self, job_id: str) -> None:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        self.events.append(("start", job_id))
+        await asyncio.sleep(self.seconds)
+        self.events.append(("end", job_id))
+        self.running -= 1
+
+    def started(self):
+        """Job IDs in the order they started."""
+        return [job_id for event, job_id in self.events if event == "start"]
+
+
+class TestJobScheduler:
+    """Test cases for JobScheduler."""
+
+    def test_lanes_serialized_and_served_round_robin(self):
+        """Test that a busy codebase does not starve others or run twice at once."""
+        recorder = Recorder()
+
+        async def run():
+            scheduler = JobScheduler(recorder, max_running_jobs=2, phase_limits={})
+            for job_id in ("a1", "a2", "a3"):
+                scheduler.submit(job_id, "/src/a")
+            scheduler.submit("b1", "/src/b")
+            scheduler.submit("c1", "/src/c")
+            await scheduler.join()
+            return scheduler
+
+        scheduler = asyncio.run(run())
+
+        assert recorder.peak == 2
+        assert recorder.started() == ["a1", "b1", "c1", "a2", "a3"]
+        for first, second in (("a1", "a2"), ("a2", "a3")):
+            assert recorder.events.index(("end", first)) < recorder.events.index(("start", second))
+        assert scheduler.stats()["running_jobs"] == 0
+        assert scheduler.stats()["lanes"] == 0
+
+    def test_resubmitted_lane_keeps_its_turn(self):
+        """Test that a lane emptied and resubmitted does not jump ahead of waiting lanes."""
+        recorder = Recorder()
+
+        async def run():
+            scheduler = JobScheduler(recorder, max_running_jobs=1, phase_limits={})
+            scheduler.submit("a1", "/src/a")  # Starts right away
+            scheduler.submit("b1", "/src/b")
+            scheduler.submit("b2", "/src/b")
+            while recorder.started() != ["a1", "b1"]:
+                await asyncio.sleep(0.001)
+            # Lane /src/a was dropped when a1 finished; its next job waits for b's turn
+            scheduler.submit("a2", "/src/a")
+            scheduler.submit("c1", "/src/c")
+            await scheduler.join()
+
+        asyncio.run(run())
+
+        assert recorder.started() == ["a1", "b1", "c1", "a2", "b2"]
+
+    def test_full_queue_refused(self):
+        """Test that submissions beyond max_queued_jobs raise QueueFullError."""
+        recorder = Recorder()
+
+        async def run():
+            scheduler = JobScheduler(recorder, max_running_jobs=1, max_queued_jobs=2, phase_limits={})
+            scheduler.submit("a1", "/src/a")  # Starts right away
+            scheduler.submit("a2", "/src/a")
+            scheduler.submit("a3", "/src/a")
+            positions = [scheduler.queue_position(job_id) for job_id in ("a1", "a2", "a3")]
+            with pytest.raises(QueueFullError):
+                scheduler.submit("b1", "/src/b")
+            await scheduler.join()
+            return positions
+
+        assert asyncio.run(run()) == [None, 1, 2]
+        assert recorder.started() == ["a1", "a2", "a3"]
+
+    def test_phase_slots_limit_concurrency(self):
+        """Test that a phase never runs more often at once than its limit."""
+        active = {"extraction": 0, "upload": 0}
+        peaks = {"extraction": 0, "upload": 0}
+        waits = []
+
+        async def run():
+            scheduler = None
+
+            async def runner(job_id):
+                for phase in ("extraction", "upload"):
+                    async with scheduler.phase_slot(phase) as waited:
+                        waits.append(waited)
+                        active[phase] += 1
+                        peaks[phase] = max(peaks[phase], active[phase])
+                        await asyncio.sleep(0.01)
+                        active[phase] -= 1
+
+            scheduler = JobScheduler(runner, max_running_jobs=4, phase_limits={"extraction": 3, "upload": 1})
+            for index in range(4):
+                scheduler.submit(f"job-{index}", f"/src/{index}")
+            stats = scheduler.stats()
+            await scheduler.join()
+            return stats
+
+        stats = asyncio.run(run())
+
+        assert stats["running_jobs"] == 4
+        assert stats["phases"]["upload"]["limit"] == 1
+        assert peaks == {"extraction": 3, "upload": 1}
+        assert max(waits) > 0
@@ -0,0 +1,126 @@
+"""
+Unit tests for process-pool tuple generation.
+
+Tests cover:
+- Compact transport of tuple sets from worker processes
+- Parallel output matching a serial run, shard by shard
+- Per-module failures reported as warnings
+- Throughput metrics in TransformationMetadata
+"""
+
+import asyncio
+
+from backend.transformer.core.parallel_generator import ParallelTupleGenerator
+from backend.transformer.core.tuple_generator import TupleGenerator
+from backend.transformer.main import TransformationOrchestrator
+from backend.transformer.models.tuples import TupleSet
+
+
+def make_extraction(module_count: int):
+    """Create extraction data with a class, function and import per module."""
+    modules = {}
+    for index in range(module_count):
+        modules[f"/src/module_{index}.py"] = {
+            "name": f"module_{index}",
+            "imports": [{"name": "os", "line_start": 1, "line_end": 1}],
+            "classes": [{
+                "name": f"Service{index}",
+                "bases": ["Base"],
+                "methods": [{"name": "run", "signature": "(self)", "line_start": 4, "line_end": 6}],
+            }],
+            "functions": [{"name": f"helper_{index}", "signature": "(value)"}],
+        }
+    return {"modules": modules}
+
+
+def tuple_keys(tuple_set: TupleSet):
+    """Return the node keys and relationship endpoints of a tuple set, in order."""
+    return (
+        [node.unique_key for node in tuple_set.nodes],
+        [(rel.source_key, rel.relationship_type, rel.target_key) for rel in tuple_set.relationships],
+    )
+
+
+class TestCompactTransport:
+    """Test cases for TupleSet.to_tuple / from_tuple."""
+
+    def test_round_trip(self):
+        """Test that a tuple set survives the compact representation."""
+        modules = make_extraction(2)["modules"]
+        generator = TupleGenerator()
+        tuple_set = TupleSet(replaced_modules=["/src/module_0.py"])
+        for module_path, module_data in modules.items():
+            tuple_set.extend(generator.generate_module_tuples(module_path, module_data))
+
+        rebuilt = TupleSet.from_tuple(tuple_set.to_tuple())
+
+        assert rebuilt.nodes == tuple_set.nodes
+        assert rebuilt.relationships == tuple_set.relationships
+        assert rebuilt.replaced_modules == ["/src/module_0.py"]
+
+
+class TestParallelGeneration:
+    """Test cases for ParallelTupleGenerator and the orchestrator's parallel mode."""
+
+    def test_shards_in_input_order(self):
+        """Test that shards come back in order and match serial generation."""
+        modules = make_extraction(7)["modules"]
+        generator = TupleGenerator()
+        serial = TupleSet()
+        for module_path, module_data in modules.items():
+            serial.extend(generator.generate_module_tuples(module_path, module_data))
+
+        async def collect():
+            parallel = ParallelTupleGenerator(max_workers=2, shard_size=3)
+            return [shard async for shard in parallel.generate(modules.items())]
+
+        shards = asyncio.run(collect())
+        merged = TupleSet()
+        for shard in shards:
+            merged.extend(shard.tuple_set)
+
+        assert [shard.module_count for shard in shards] == [3, 3, 1]
+        assert tuple_keys(merged) == tuple_keys(serial)
+
+    def test_orchestrator_parallel_mode(self):
+        """Test that failures become warnings and throughput is reported."""
+        extraction = make_extraction(5)
+        extraction["modules"]["/src/broken.py"] = {"name": "broken", "functions": [42]}
+
+        orchestrator = TransformationOrchestrator(
+            job_id="job-1", enable_progress_reporting=False, parallel_workers=2, shard_size=2
+        )
+        result = asyncio.run(orchestrator.transform_extraction_data(extraction, output_formats=[]))
+
+        statistics = result.metadata.to_dict()["generation_statistics"]
+        assert result.success
+        assert len(result.warnings) == 1 and "/src/broken.py" in result.warnings[0]
+        assert statistics["worker_count"] == 2
+        assert statistics["shard_count"] == 3
+        assert statistics["modules_per_second"] > 0
+        assert result.metadata.output_nodes_count > 0
+
+    def test_stream_transform_parallel_matches_serial(self):
+        """Test that streamed batches are sharded and keep the delta's stale lists."""
+        extraction = make_extraction(7)
+        modules = list(extraction["modules"].items())
+
+        async def chunks():
+            yield {"modules": dict(modules[:4]), "delta": {"changed": ["/src/module_0.py"], "deleted": ["/src/gone.py"]}}
+            yield {"modules": dict(modules[4:])}
+
+        async def collect(**options):
+            orchestrator = TransformationOrchestrator(enable_progress_reporting=False, **options)
+            return [batch async for batch in orchestrator.stream_transform(chunks(), batch_size=3)]
+
+        serial = asyncio.run(collect())
+        parallel = asyncio.run(collect(parallel_workers=2, shard_size=2))
+
+        merged_serial, merged_parallel = TupleSet(), TupleSet()
+        for batch in serial:
+            merged_serial.extend(batch)
+        for batch in parallel:
+            merged_parallel.extend(batch)
+        assert tuple_keys(merged_parallel) == tuple_keys(merged_serial)
+        assert parallel[0].replaced_modules == ["/src/module_0.py"]
+        assert parallel[0].deleted_modules == ["/src/gone.py"]
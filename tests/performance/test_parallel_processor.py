@@ -18,10 +18,10 @@ from unittest.mock import Mock, patch, MagicMock
 from concurrent.futures import Future
 import threading
 
-from backend.parser.parallel_processor import ParallelProcessor
-from backend.parser.processing_types import ProcessingStrategy, ProcessingMetrics, ParsingTask, ProgressTracker
-from backend.parser.config import get_parser_config
-from backend.parser.models import ParsedModule
+from parallel_processor import ParallelProcessor
+from processing_types import ProcessingStrategy, ProcessingMetrics, ParsingTask, ProgressTracker
+from config import get_parser_config
+from models import ParsedModule
 
 
 class TestParallelProcessor:
@@ -43,22 +43,25 @@ class TestParallelProcessor:
             
             # Medium file
             medium_file = temp_path / "medium.py"
-            medium_content = "# Medium file\n" + "def func_{}():\n    pass\n\n" * 50
+            medium_content = "# Medium file\n" + "".join(f"def func_{i}():\n    pass\n\n" for i in range(50))
             medium_file.write_text(medium_content)
             files['medium'] = str(medium_file)
             
             # Large file
             large_file = temp_path / "large.py"
-            large_content = "# Large file\n" + "class Class_{}:\n    def method(self): pass\n\n" * 200
+            large_content = "# Large file\n" + "".join(
+                f"class Class_{i}:\n    def method(self): pass\n\n" for i in range(200)
+            )
             large_file.write_text(large_content)
             files['large'] = str(large_file)
             
             yield files
     
     @pytest.fixture
-    def processor(self):
+    def processor(self, tmp_path):
         """Create ParallelProcessor instance with test configuration."""
         config = get_parser_config("minimal")  # Use minimal config for testing
+        config.tool_options['cache']['cache_dir'] = str(tmp_path / "cache")  # No results from earlier runs
         config.tool_options['parallel']['max_workers'] = 2
         config.tool_options['parallel']['strategy'] = 'thread_based'
         return ParallelProcessor(config)
@@ -355,6 +358,63 @@ class TestIntegrationScenarios(TestParallelProcessor):
         assert isinstance(memory_stats, dict)
 
 
+class TestProcessBackend(TestParallelProcessor):
+    """Test process-pool and hybrid processing."""
+    
+    def test_parsed_module_tuple_round_trip(self):
+        """Test that the compact worker payload rebuilds an identical module."""
+        from models import ParsedClass, ParsedFunction, ParsedImport, ParsedVariable
+        
+        method = ParsedFunction(
+            name="run", signature="def run(self)", is_method=True,
+            variables=[ParsedVariable(name="x", scope="function")],
+            nested_functions=[ParsedFunction(name="inner", signature="def inner()")]
+        )
+        module = ParsedModule(
+            name="sample", path="/tmp/sample.py",
+            imports=[ParsedImport(name="os", symbols=[{"name": "path", "asname": None}])],
+            classes=[ParsedClass(name="Runner", methods=[method], inner_classes=[ParsedClass(name="Inner")])],
+            functions=[ParsedFunction(name="main", signature="def main()")],
+            variables=[ParsedVariable(name="CONSTANT", is_constant=True)],
+            line_count=10
+        )
+        
+        assert ParsedModule.from_tuple(module.to_tuple()) == module
+    
+    def test_partition_by_size(self, processor, temp_files):
+        """Test that hybrid mode splits tasks on the process threshold."""
+        processor.parallel_options['process_threshold_kb'] = 4
+        tasks = [ParsingTask(file_path=temp_files['small']), ParsingTask(file_path=temp_files['large'])]
+        
+        large_tasks, small_tasks = processor._partition_by_size(tasks)
+        
+        assert [t.file_path for t in large_tasks] == [temp_files['large']]
+        assert [t.file_path for t in small_tasks] == [temp_files['small']]
+    
+    def test_process_strategy_from_config(self, tmp_path):
+        """Test that preset strategy names map to processing strategies."""
+        config = get_parser_config("minimal")
+        config.tool_options['cache']['cache_dir'] = str(tmp_path / "cache")
+        assert ParallelProcessor(config).strategy == ProcessingStrategy.THREAD_BASED
+        
+        config.tool_options['parallel']['strategy'] = 'hybrid'
+        assert ParallelProcessor(config).strategy == ProcessingStrategy.HYBRID
+    
+    def test_hybrid_processing_uses_worker_processes(self, processor, temp_files, mock_parse_func):
+        """Test that large files are parsed by worker processes in hybrid mode."""
+        processor.parallel_options['process_threshold_kb'] = 4
+        files = [temp_files['small'], temp_files['large']]
+        
+        tasks = [ParsingTask(file_path=path) for path in files]
+        processor.progress_tracker = ProgressTracker(len(tasks))
+        results = processor._process_hybrid(tasks, mock_parse_func)
+        
+        assert set(results) == set(files)
+        # The mock parser returns empty modules; the worker's ModuleParser does not
+        assert len(results[temp_files['large']].classes) == 200
+        assert results[temp_files['small']].classes == []
+
+
 # Pytest fixtures for module-level setup
 @pytest.fixture(scope="module")
 def test_config():
@@ -0,0 +1,169 @@
+"""
+Unit tests for concurrent multi-session bulk uploads.
+
+Tests cover:
+- Stable partitioning of rows by node key
+- Node batches written over several sessions without sharing nodes
+- Relationship batches waiting only for their endpoint labels
+- Retrying deadlocked transactions and reporting them in UploadResult
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from backend.uploader.core import neo4j_client as neo4j_client_module
+from backend.uploader.core.bulk_writer import BulkWriter, UnwindBatch, partition_batch
+from backend.uploader.core.neo4j_client import Neo4jClient
+from backend.uploader.models.upload_result import UploadResult
+
+
+def node(label, key):
+    return {"label": label, "unique_key": key, "properties": {"name": key}, "merge_properties": ["name"]}
+
+
+def relationship(source_key, target_key):
+    return {"source_key": source_key, "target_key": target_key, "relationship_type": "IMPORTS",
+            "properties": {}, "source_label": "Module", "target_label": "Module"}
+
+
+class ConcurrentClient:
+    """Client double recording when each UNWIND query ran and which nodes it touched."""
+
+    def __init__(self, seconds_by_label=None):
+        self.seconds_by_label = seconds_by_label or {}
+        self.in_flight = []
+        self.overlapping_keys = False
+        self.calls = []
+
+    async def execute_unwind(self, query, rows, job_id=None, parameters=None):
+        keys = {row.get("unique_key") or row.get("source_key") for row in rows}
+        if any(keys & other for other in self.in_flight):
+            self.overlapping_keys = True
+        self.in_flight.append(keys)
+        label = query.split(":`", 1)[1].split("`", 1)[0]
+        start = asyncio.get_running_loop().time()
+        await asyncio.sleep(self.seconds_by_label.get(label, 0.01))
+        self.calls.append((label, "MATCH (source" in query, start, asyncio.get_running_loop().time(), len(rows)))
+        self.in_flight.remove(keys)
+        return UploadResult(job_id=job_id, total_commands_executed=1)
+
+    async def execute_cypher_batch(self, commands, batch_size=100, job_id=None):
+        return UploadResult(job_id=job_id, success=True)
+
+
+class TestPartitioning:
+    """Test cases for partition_batch."""
+
+    def test_rows_partitioned_by_key(self):
+        """Test that partitions keep every row once and the same key in the same partition."""
+        rows = [{"unique_key": f"module:{i % 50}"} for i in range(200)]
+        batch = UnwindBatch(query="UNWIND $rows AS row MERGE (n:`Module` {unique_key: row.unique_key})",
+                            rows=rows, kind="node:Module", label="Module")
+
+        parts = partition_batch(batch, 4, "unique_key")
+        again = partition_batch(batch, 4, "unique_key")
+
+        assert len(parts) == 4 and sum(len(part.rows) for part in parts) == 200
+        key_sets = [{row["unique_key"] for row in part.rows} for part in parts]
+        assert all(not (a & b) for i, a in enumerate(key_sets) for b in key_sets[i + 1:])
+        assert [part.rows for part in parts] == [part.rows for part in again]
+        assert all(part.label == "Module" and part.query == batch.query for part in parts)
+        assert partition_batch(batch, 1, "unique_key") == [batch]
+
+
+class TestConcurrentWrites:
+    """Test cases for BulkWriter sessions."""
+
+    def test_nodes_written_concurrently_without_shared_nodes(self):
+        """Test that sessions overlap, never on the same nodes, and the concurrency is reported."""
+        client = ConcurrentClient()
+        tuple_data = {
+            "nodes": [node("Module", f"module:{i}") for i in range(400)]
+                     + [node("Class", f"class:{i}") for i in range(400)],
+            "relationships": [relationship(f"module:{i}", f"module:{i + 1}") for i in range(100)],
+        }
+
+        result = asyncio.run(BulkWriter(client, rows_per_batch=50, sessions=4).write(tuple_data, "job-1"))
+
+        assert result.success and not client.overlapping_keys
+        assert result.upload_sessions == 4
+        assert 1 < result.peak_concurrent_batches <= 4
+        assert sum(rows for label, is_relationship, *_, rows in client.calls if not is_relationship) == 800
+        assert sum(rows for label, is_relationship, *_, rows in client.calls if is_relationship) == 100
+        assert result.to_dict()["peak_concurrent_batches"] == result.peak_concurrent_batches
+
+    def test_relationships_wait_only_for_endpoint_labels(self):
+        """Test that Module imports start after the Module nodes, while slow Variable nodes still load."""
+        client = ConcurrentClient(seconds_by_label={"Variable": 0.2})
+        tuple_data = {
+            "nodes": [node("Module", f"module:{i}") for i in range(20)]
+                     + [node("Variable", "variable:0")],  # Keeps one session busy
+            "relationships": [relationship(f"module:{i}", f"module:{i + 1}") for i in range(19)],
+        }
+
+        result = asyncio.run(BulkWriter(client, sessions=2).write(tuple_data, "job-1"))
+
+        modules_written = max(end for label, rel, start, end, _ in client.calls if label == "Module" and not rel)
+        variables_written = max(end for label, rel, start, end, _ in client.calls if label == "Variable")
+        imports_started = min(start for label, rel, start, end, _ in client.calls if rel)
+        assert result.success
+        assert modules_written <= imports_started < variables_written
+
+
+class DeadlockError(Exception):
+    code = "Neo.TransientError.Transaction.DeadlockDetected"
+
+
+class DeadlockingDriver:
+    """Driver double whose first transactions deadlock."""
+
+    def __init__(self, deadlocks):
+        self.deadlocks = deadlocks
+        self.commits = 0
+
+    def session(self, database=None, **kwargs):
+        return self
+
+    def begin_transaction(self):
+        return self
+
+    async def run(self, query, parameters=None, **kwargs):
+        if self.deadlocks:
+            self.deadlocks -= 1
+            raise DeadlockError("ForsetiClient can't acquire ExclusiveLock")
+        self.commits += 1
+        counters = SimpleNamespace(nodes_created=0, relationships_created=len(kwargs["rows"]), properties_set=0)
+
+        async def consume():
+            return SimpleNamespace(counters=counters)
+
+        return SimpleNamespace(consume=consume)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class TestDeadlockRetries:
+    """Test cases for retrying deadlocked UNWIND batches."""
+
+    def test_deadlocks_retried_and_counted(self, monkeypatch):
+        """Test that deadlocks get their own retry budget beyond the transient one and are reported."""
+        async def no_sleep(delay):
+            return None
+
+        monkeypatch.setattr(neo4j_client_module.asyncio, "sleep", no_sleep)
+        with monkeypatch.context() as patch:
+            patch.setattr(neo4j_client_module, "NEO4J_AVAILABLE", True)
+            client = Neo4jClient(uri="bolt://test", auth=("neo4j", "test"))
+        client.driver = DeadlockingDriver(deadlocks=neo4j_client_module.MAX_TRANSIENT_RETRIES + 2)
+
+        result = asyncio.run(client.execute_unwind("UNWIND $rows AS row MERGE (a)-[:IMPORTS]->(b)",
+                                                   [{"source_key": "a"}, {"source_key": "b"}]))
+
+        assert not result.has_errors and result.dead_lettered == 0
+        assert result.relationships_created == 2 and client.driver.commits == 1
+        assert result.deadlock_retries == neo4j_client_module.MAX_TRANSIENT_RETRIES + 2
+        assert client.connection_stats["deadlock_retries"] == result.deadlock_retries
@@ -0,0 +1,153 @@
+"""
+Unit tests for warm phase worker processes.
+
+Tests cover:
+- Reusing one worker process, and its module state, across runs
+- Streaming output and log lines while a phase runs
+- Exit statuses of sync and async entry points
+- Restarting a worker that died
+- Entry points that start process pools of their own
+- Sizing workers per phase and reporting the wait for a free worker
+"""
+
+import tempfile
+import textwrap
+import threading
+from pathlib import Path
+
+import pytest
+
+from backend.parser.prod.orchestrator.phase_workers import PhaseEntryPoint, PhaseWorkerPool
+
+ENTRY_POINT = textwrap.dedent('''
+    import asyncio
+    import logging
+    import multiprocessing
+    import os
+    import sys
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    logger = logging.getLogger("phase")
+    runs = 0
+
+
+    def main():
+        global runs
+        runs += 1
+        command = sys.argv[1]
+        if command == "crash":
+            os._exit(3)
+        if command == "sleep":
+            time.sleep(0.3)
+        if command == "pool":
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=2, mp_context=context) as executor:
+                print(f"pool={sum(executor.map(abs, [-1, -2, -3]))}")
+        logger.info("starting run %d", runs)
+        print(f"pid={os.getpid()} runs={runs}")
+        if command == "fail":
+            print("something went wrong", file=sys.stderr)
+            sys.exit(2)
+
+
+    async def async_main():
+        await asyncio.sleep(0)
+        print("async done")
+''')
+
+
+@pytest.fixture
+def pool():
+    """Create a pool hosting the test entry points."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        script = Path(temp_dir) / "entry.py"
+        script.write_text(ENTRY_POINT)
+        pool = PhaseWorkerPool({
+            "sync": PhaseEntryPoint(name="sync", script=str(script)),
+            "async": PhaseEntryPoint(name="async", script=str(script), function="async_main"),
+        })
+        try:
+            yield pool
+        finally:
+            pool.close()
+
+
+class TestPhaseWorkerPool:
+    """Test cases for PhaseWorkerPool.run."""
+
+    def test_worker_stays_warm_across_runs(self, pool):
+        """Test that the second run reuses the process and its module state."""
+        first = pool.run("sync", ["ok"])
+        second = pool.run("sync", ["ok"])
+
+        assert first.success and second.success
+        assert first.cold_start and not second.cold_start
+        assert first.output.split()[0] == second.output.split()[0]
+        assert second.output.endswith("runs=2")
+
+    def test_messages_streamed_during_run(self, pool):
+        """Test that log records and output lines reach the callback."""
+        messages = []
+        pool.run("sync", ["ok"], messages.append)
+
+        assert [message["type"] for message in messages] == ["log", "output"]
+        assert messages[0]["message"] == "starting run 1"
+        assert messages[0]["level"] == "INFO"
+        assert messages[1]["stream"] == "stdout"
+
+    def test_exit_status_and_async_entry_points(self, pool):
+        """Test that SystemExit codes are reported and coroutines are awaited."""
+        failed = pool.run("sync", ["fail"])
+        awaited = pool.run("async", [])
+
+        assert failed.returncode == 2
+        assert "something went wrong" in failed.output
+        assert awaited.success and awaited.output == "async done"
+
+    def test_entry_point_with_process_pool(self, pool):
+        """Test that a hosted phase can start a process pool (e.g. the extractor's hybrid mode)."""
+        result = pool.run("sync", ["pool"])
+
+        assert result.success, result.output
+        assert "pool=6" in result.output.splitlines()
+
+    def test_dead_worker_restarted(self, pool):
+        """Test that a crashed worker fails its run and is replaced for the next."""
+        crashed = pool.run("sync", ["crash"])
+        recovered = pool.run("sync", ["ok"])
+
+        assert crashed.returncode == -1
+        assert "exited unexpectedly" in crashed.output
+        assert recovered.success and recovered.cold_start
+        assert recovered.output.endswith("runs=1")
+
+    def test_workers_sized_per_phase(self):
+        """Test per-phase worker counts and the reported wait for a busy worker."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            script = Path(temp_dir) / "entry.py"
+            script.write_text(ENTRY_POINT)
+            pool = PhaseWorkerPool({
+                "sync": PhaseEntryPoint(name="sync", script=str(script)),
+                "async": PhaseEntryPoint(name="async", script=str(script), function="async_main"),
+            }, workers_per_phase={"async": 2})
+            try:
+                assert pool.worker_count("async") == 2
+                assert pool.worker_count("sync") == 1
+
+                pool.start(["sync"])
+                results = []
+                threads = [
+                    threading.Thread(target=lambda: results.append(pool.run("sync", ["sleep"])))
+                    for _ in range(2)
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+                assert all(result.success for result in results)
+                assert min(result.worker_wait for result in results) < 0.2
+                assert max(result.worker_wait for result in results) >= 0.2
+            finally:
+                pool.close()
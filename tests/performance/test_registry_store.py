@@ -0,0 +1,110 @@
+"""
+Unit tests for the SQLite backup registry behind DatabaseTracker.
+
+Tests cover:
+- Importing the JSON registry, version history and fingerprints of earlier releases
+- Paginated, newest-first listing of backups and versions
+- Version numbering that stays unique across concurrent writers
+- Storage statistics aggregated in SQL
+"""
+
+import asyncio
+import json
+import threading
+from datetime import datetime, timedelta
+
+from backend.neo4j_manager.core.database_tracker import DatabaseTracker
+from backend.neo4j_manager.core.registry_store import RegistryStore
+from backend.neo4j_manager.models.database_version import DatabaseVersion
+
+
+def write_legacy_files(directory, backup_path):
+    created = datetime(2026, 1, 2, 3, 4, 5)
+    (directory / "backup_registry.json").write_text(json.dumps({"backups": {"job-1": {
+        "job_id": "job-1", "backup_path": str(backup_path), "created_at": created.isoformat(),
+        "size_bytes": 42, "description": "nightly", "node_count": 7
+    }}}))
+    (directory / "version_history.json").write_text(json.dumps({"current_version": 2, "versions": [
+        {"job_id": "job-1", "version_number": 1, "created_at": created.isoformat(), "tags": ["a"]},
+        {"job_id": "job-2", "version_number": 2, "created_at": (created + timedelta(hours=1)).isoformat()}
+    ]}))
+    (directory / "graph_fingerprints.json").write_text(json.dumps({"ns": {"namespace": "ns", "key_hash": "ff"}}))
+
+
+class TestRegistryStore:
+    """Test cases for RegistryStore and the DatabaseTracker built on it."""
+
+    def test_legacy_json_imported_once(self, tmp_path):
+        """Test that the JSON files of earlier releases are imported, then set aside."""
+        backup_path = tmp_path / "neo4j_backup_job-1.tar.gz"
+        backup_path.write_bytes(b"backup")
+        write_legacy_files(tmp_path, backup_path)
+
+        tracker = DatabaseTracker(str(tmp_path))
+        backup = asyncio.run(tracker.get_backup_by_job_id("job-1"))
+        current = asyncio.run(tracker.get_current_database_version())
+
+        assert (backup.size_bytes, backup.description, backup.node_count) == (42, "nightly", 7)
+        assert (current.job_id, current.version_number, current.is_active) == ("job-2", 2, True)
+        assert asyncio.run(tracker.get_database_version(1)).tags == ["a"]
+        assert asyncio.run(tracker.get_graph_fingerprint("ns"))["key_hash"] == "ff"
+        assert not (tmp_path / "backup_registry.json").exists()
+        assert (tmp_path / "backup_registry.json.migrated").exists()
+
+        version = asyncio.run(DatabaseTracker(str(tmp_path)).add_database_version("job-3"))
+        assert version.version_number == 3
+        versions = asyncio.run(tracker.list_database_versions())
+        assert [(v.version_number, v.is_active) for v in versions] == [(3, True), (2, False), (1, False)]
+
+    def test_backups_listed_newest_first_in_pages(self, tmp_path):
+        """Test that pages follow creation order and skip missing files before paging."""
+        tracker = DatabaseTracker(str(tmp_path))
+        start = datetime.now() - timedelta(days=10)
+        for index in range(600):
+            path = tmp_path / f"backup_{index}.tar.gz"
+            path.write_bytes(b"x")
+            asyncio.run(tracker.register_backup(f"job-{index:03d}", str(path)))
+            # Registration stamps the current time; spread the backups over ten days
+            backup = asyncio.run(tracker.get_backup_by_job_id(f"job-{index:03d}"))
+            backup.created_at = start + timedelta(minutes=24 * index)
+            tracker.store.put_backup(backup)
+        for index in range(0, 600, 2):
+            (tmp_path / f"backup_{index}.tar.gz").unlink()
+
+        first = asyncio.run(tracker.list_all_backups(limit=3))
+        second = asyncio.run(tracker.list_all_backups(limit=3, offset=3))
+        everything = asyncio.run(tracker.list_all_backups(include_missing=True))
+        recent = asyncio.run(tracker.list_all_backups(max_age_days=1))
+
+        assert [b.job_id for b in first + second] == [f"job-{index:03d}" for index in range(599, 587, -2)]
+        assert len(everything) == 600
+        assert [b.created_at for b in everything] == sorted((b.created_at for b in everything), reverse=True)
+        assert recent and all(b.age_days <= 1 for b in recent)
+        assert len(recent) < 100
+
+        assert asyncio.run(tracker.cleanup_missing_backups()) and tracker.store.count_backups() == 300
+
+        stats = asyncio.run(tracker.get_storage_statistics())
+        assert stats["total_backups"] == 300
+        assert stats["total_size_mb"] == 300 / (1024 * 1024)
+        assert (stats["oldest_backup_days"], stats["newest_backup_days"]) == (9, 0)
+        assert 4 < stats["average_backup_age_days"] < 6
+
+    def test_concurrent_writers_get_unique_versions(self, tmp_path):
+        """Test that writers on separate connections never hand out the same version number."""
+        stores = [RegistryStore(tmp_path / "registry.db") for _ in range(4)]
+
+        def add_versions(store, writer):
+            for index in range(25):
+                store.add_version(DatabaseVersion(job_id=f"job-{writer}-{index}", version_number=0))
+
+        threads = [threading.Thread(target=add_versions, args=(store, writer)) for writer, store in enumerate(stores)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        numbers = sorted(version.version_number for version in stores[0].list_versions())
+        assert numbers == list(range(1, 101))
+        assert stores[1].current_version() == 100
+        assert len(stores[2].list_versions(limit=10, offset=95)) == 5
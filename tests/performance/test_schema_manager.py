@@ -0,0 +1,111 @@
+"""
+Unit tests for the uploader's index and constraint bootstrap.
+
+Tests cover:
+- Deriving indexes and constraints from node labels and merge properties
+- Creating each schema item once and waiting for it to come online
+- Falling back to an index when a constraint cannot be created
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from backend.uploader.core.schema_manager import SchemaItem, SchemaManager, required_schema
+from backend.uploader.models.upload_result import UploadResult
+
+NODES = [
+    {"label": "Module", "unique_key": "module:a", "merge_properties": ["path"]},
+    {"label": "Module", "unique_key": "module:b", "merge_properties": ["path"]},
+    {"label": "Class", "unique_key": "class:a.A", "merge_properties": ["module_path", "name"]},
+    {"label": "Variable", "unique_key": "var:x", "merge_properties": ["unique_key"]},
+]
+
+
+def make_client(failing: str = "") -> AsyncMock:
+    """Create a client whose schema statements succeed unless they contain failing."""
+    client = AsyncMock()
+
+    def execute(commands, batch_size=100, job_id=None):
+        result = UploadResult(job_id=job_id or "unknown", success=not (failing and failing in commands[0]))
+        if not result.success:
+            result.add_error("constraint violated by existing data")
+        return result
+
+    client.execute_cypher_batch.side_effect = execute
+    return client
+
+
+def statements(client: AsyncMock):
+    """Statements sent to the client, in order."""
+    return [call.args[0][0] for call in client.execute_cypher_batch.call_args_list]
+
+
+class TestRequiredSchema:
+    """Test cases for required_schema."""
+
+    def test_lookup_indexes_and_merge_keys(self):
+        """Test that labels get a unique_key index and an index on their merge keys."""
+        assert required_schema(NODES) == [
+            SchemaItem("Class", ("unique_key",)),
+            SchemaItem("Class", ("module_path", "name")),
+            SchemaItem("Module", ("unique_key",)),
+            SchemaItem("Module", ("path",)),
+            SchemaItem("Variable", ("unique_key",)),
+        ]
+
+    def test_namespaced_merge_keys_are_unique(self):
+        """Test that namespaced uploads constrain (namespace, merge keys)."""
+        schema = required_schema(NODES[:1], namespace="job-1")
+
+        assert schema == [
+            SchemaItem("Module", ("namespace", "unique_key")),
+            SchemaItem("Module", ("namespace", "path"), unique=True),
+        ]
+        assert schema[1].statement() == (
+            "CREATE CONSTRAINT `module_namespace_path_unique` IF NOT EXISTS "
+            "FOR (n:`Module`) REQUIRE (n.`namespace`, n.`path`) IS UNIQUE"
+        )
+
+    def test_module_path_indexes_for_stale_deletes(self):
+        """Test that labels deleted by module_path get an index on (namespace, module_path)."""
+        schema = required_schema([], namespace="job-1", module_path_labels=["Class", "Function"])
+
+        assert schema == [
+            SchemaItem("Class", ("namespace", "module_path")),
+            SchemaItem("Function", ("namespace", "module_path")),
+        ]
+
+
+class TestSchemaManager:
+    """Test cases for SchemaManager."""
+
+    def test_items_created_once_then_awaited(self):
+        """Test that each item is created once and new items are awaited."""
+        client = make_client()
+        manager = SchemaManager(client)
+
+        async def run():
+            first = await manager.ensure_nodes(NODES, "job-1")
+            second = await manager.ensure_nodes(NODES, "job-1")
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        sent = statements(client)
+        assert len(sent) == 6
+        assert all(statement.startswith("CREATE INDEX") for statement in sent[:5])
+        assert sent[-1].startswith("CALL db.awaitIndexes")
+        assert first > 0 and second == 0.0
+        assert manager.build_seconds == first
+
+    def test_failed_constraint_falls_back_to_index(self):
+        """Test that duplicates blocking a constraint still leave an index behind."""
+        client = make_client(failing="IS UNIQUE")
+        manager = SchemaManager(client, namespace="job-1")
+
+        asyncio.run(manager.ensure_nodes(NODES[:1], "job-1"))
+
+        assert statements(client)[1:3] == [
+            SchemaItem("Module", ("namespace", "path"), unique=True).statement(),
+            SchemaItem("Module", ("namespace", "path")).statement(),
+        ]
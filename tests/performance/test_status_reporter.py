@@ -0,0 +1,138 @@
+"""
+Unit tests for the batched StatusReporter transport.
+
+Tests cover:
+- Non-blocking reporting while the orchestrator is slow
+- Batching to the bulk status endpoint
+- Progress coalescing
+- Backpressure dropping of file events
+- Local fallback when the orchestrator is unreachable
+- Stopping the sender when the final flush fails
+"""
+
+import json
+import os
+import tempfile
+import time
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from communication import StatusReporter
+
+
+def make_session(delay: float = 0.0, fail: bool = False) -> Mock:
+    """Create a mock HTTP session that records posted batches."""
+    session = Mock()
+
+    def post(url, json, timeout):
+        time.sleep(delay)
+        if fail:
+            raise requests.exceptions.ConnectionError("orchestrator down")
+        return Mock(raise_for_status=Mock())
+
+    session.post.side_effect = post
+    return session
+
+
+def posted_updates(session: Mock):
+    """Return every update posted through the mock session."""
+    return [
+        update
+        for call in session.post.call_args_list
+        for update in call.kwargs["json"]["updates"]
+    ]
+
+
+class TestStatusReporter:
+    """Test cases for StatusReporter."""
+
+    @pytest.fixture
+    def reporter(self):
+        reporter = StatusReporter("job-1", "http://orchestrator", flush_interval=0.05)
+        yield reporter
+        reporter.close()
+
+    def test_reporting_does_not_block_on_network(self, reporter):
+        """Test that a slow orchestrator does not slow down reporting."""
+        reporter.session = make_session(delay=0.5)
+
+        start = time.time()
+        for i in range(200):
+            reporter.report_file_processing(f"file_{i}.py", "completed")
+
+        assert time.time() - start < 0.5
+
+    def test_updates_sent_in_batches(self, reporter):
+        """Test that updates are posted to the bulk endpoint in batches."""
+        reporter.session = make_session()
+        for i in range(250):
+            reporter.report_status("extraction", "parsing", f"step {i}")
+
+        assert reporter.flush()
+        urls = {call.args[0] for call in reporter.session.post.call_args_list}
+        assert urls == {"http://orchestrator/v1/jobs/job-1/status/batch"}
+        assert len(posted_updates(reporter.session)) == 250
+        assert reporter.session.post.call_count < 250
+
+    def test_progress_updates_coalesced(self, reporter):
+        """Test that only the latest progress update is sent."""
+        reporter.session = make_session(delay=0.2)
+        for i in range(100):
+            reporter.report_progress(i + 1, 100)
+
+        reporter.flush()
+        progress = [u["progress"] for u in posted_updates(reporter.session)]
+        assert progress[-1] == 100
+        assert len(progress) < 100
+        assert reporter.stats["coalesced"] > 0
+
+    def test_file_events_dropped_under_backpressure(self):
+        """Test that file events are dropped but lifecycle events are kept."""
+        reporter = StatusReporter("job-1", "http://orchestrator", max_queue_size=10, flush_interval=0.05)
+        reporter.session = make_session(delay=0.2)
+
+        for i in range(500):
+            reporter.report_file_processing(f"file_{i}.py", "started")
+        reporter.report_status("extraction", "completed", "done")
+        reporter.close()
+
+        statuses = [u["status"] for u in posted_updates(reporter.session)]
+        assert reporter.stats["dropped"] > 0
+        assert statuses[-1] == "completed"
+
+    def test_local_fallback_when_orchestrator_down(self):
+        """Test that updates are written locally when sending fails."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cwd = os.getcwd()
+            os.chdir(temp_dir)
+            try:
+                reporter = StatusReporter("job-2", "http://orchestrator", flush_interval=0.05)
+                reporter.session = make_session(fail=True)
+                for i in range(5):
+                    reporter.report_status("extraction", "parsing", f"step {i}")
+                reporter.close()
+
+                with open("extraction_status_job-2.jsonl") as f:
+                    lines = [json.loads(line) for line in f]
+            finally:
+                os.chdir(cwd)
+
+        assert [u["message"] for u in lines] == [f"step {i}" for i in range(5)]
+        # Orchestrator is skipped during the cooldown after the first failure
+        assert reporter.session.post.call_count == 1
+
+    def test_close_stops_sender_when_flush_fails(self):
+        """Test that close() still stops the sender, which sends what is queued, if flushing raises."""
+        reporter = StatusReporter("job-3", "http://orchestrator", flush_interval=10.0)
+        reporter.session = make_session()
+        for i in range(5):
+            reporter.report_status("extraction", "parsing", f"step {i}")
+        reporter.flush = Mock(side_effect=RuntimeError("interrupted"))
+
+        with pytest.raises(RuntimeError):
+            reporter.close()
+
+        assert not reporter._sender.is_alive()
+        assert [u["message"] for u in posted_updates(reporter.session)] == [f"step {i}" for i in range(5)]
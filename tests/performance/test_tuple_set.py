@@ -0,0 +1,59 @@
+"""
+Unit tests for TupleSet accumulation.
+
+Tests cover:
+- In-place extend
+- Copying merge leaving its inputs unchanged
+- Slotted tuple classes
+"""
+
+import pytest
+
+from backend.transformer.models.tuples import Neo4jNodeTuple, Neo4jRelationshipTuple, TupleSet
+
+
+def module_set(path: str) -> TupleSet:
+    """Create a tuple set for a module with one outgoing relationship."""
+    tuple_set = TupleSet(metadata={"module_path": path})
+    tuple_set.add_node(Neo4jNodeTuple(
+        label="Module", properties={"path": path}, unique_key=f"module:{path}", merge_properties={"path"}
+    ))
+    tuple_set.add_relationship(Neo4jRelationshipTuple(
+        source_key=f"module:{path}", target_key="module:os", relationship_type="IMPORTS"
+    ))
+    return tuple_set
+
+
+class TestTupleSetAccumulation:
+    """Test cases for TupleSet.extend and TupleSet.merge."""
+
+    def test_extend_in_place(self):
+        """Test that extend appends to the same lists and returns self."""
+        all_tuples = TupleSet()
+        nodes = all_tuples.nodes
+
+        for path in ("a.py", "b.py", "c.py"):
+            assert all_tuples.extend(module_set(path)) is all_tuples
+
+        assert all_tuples.nodes is nodes
+        assert [n.unique_key for n in all_tuples.nodes] == ["module:a.py", "module:b.py", "module:c.py"]
+        assert all_tuples.relationship_count == 3
+        assert all_tuples.metadata == {"module_path": "c.py"}
+
+    def test_merge_leaves_inputs_unchanged(self):
+        """Test that merge still returns a new set without touching its inputs."""
+        first, second = module_set("a.py"), module_set("b.py")
+
+        merged = first.merge(second)
+
+        assert merged.size == 4
+        assert first.size == 2 and second.size == 2
+        assert first.metadata == {"module_path": "a.py"}
+
+    def test_tuples_are_slotted(self):
+        """Test that tuple classes carry no per-instance __dict__."""
+        node = module_set("a.py").nodes[0]
+
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.extra = 1
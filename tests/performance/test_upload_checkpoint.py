@@ -0,0 +1,131 @@
+"""
+Unit tests for checkpointed, resumable Cypher file uploads.
+
+Tests cover:
+- Resuming after the last committed batch of an interrupted upload
+- Holding the checkpoint before a failed batch so a resume replays it
+- Refusing to resume against a changed input file
+- Resuming an upload that already completed
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from backend.uploader.core.batch_uploader import BatchUploader
+from backend.uploader.core.upload_checkpoint import UploadCheckpoint
+from backend.uploader.models.upload_result import UploadResult
+
+
+class Interrupted(BaseException):
+    """Stands in for the uploader process dying mid-upload."""
+
+
+class RecordingClient:
+    """Client double that records committed MERGE commands."""
+
+    def __init__(self, die_at_batch=None, fail_batches=()):
+        self.die_at_batch = die_at_batch
+        self.fail_batches = set(fail_batches)
+        self.batches = []
+
+    async def execute_cypher_batch(self, commands, batch_size=100, job_id=None):
+        result = UploadResult(job_id=job_id or "unknown")
+        if not commands[0].startswith("MERGE"):  # Schema bootstrap
+            return result
+        number = len(self.batches) + 1
+        if number == self.die_at_batch:
+            raise Interrupted()
+        self.batches.append(commands)
+        if number in self.fail_batches:
+            result.add_error("Neo.ClientError.General.Unknown")
+        return result
+
+
+def write_cypher(path, count):
+    lines = ["// Generated by the transformer"]
+    for index in range(count):
+        lines.append(f"MERGE (m:Module {{unique_key: 'module:{index}'}})")
+        lines.append(f"SET m.path = '{index}.py';")
+    path.write_text("\n".join(lines) + "\n")
+    return [f"MERGE (m:Module {{unique_key: 'module:{index}'}}) SET m.path = '{index}.py';" for index in range(count)]
+
+
+def upload(client, cypher_file, checkpoint_file, resume=False):
+    uploader = BatchUploader(client, batch_size=3, adaptive_batches=False)
+    return asyncio.run(uploader.upload_from_file(str(cypher_file), "job-1", validate_before_upload=False,
+                                                 checkpoint_path=str(checkpoint_file), resume=resume))
+
+
+class TestResumableUploads:
+    """Test cases for upload checkpoints in BatchUploader."""
+
+    def test_resume_after_interruption(self, tmp_path):
+        """Test that a resumed upload sends only the batches after the last committed one."""
+        cypher_file = tmp_path / "cypher_commands.cypher"
+        checkpoint_file = tmp_path / "upload_checkpoint_job-1.json"
+        commands = write_cypher(cypher_file, 10)
+
+        first = RecordingClient(die_at_batch=3)
+        with pytest.raises(Interrupted):
+            upload(first, cypher_file, checkpoint_file)
+
+        checkpoint = UploadCheckpoint.load(checkpoint_file)
+        assert (checkpoint.batch_number, checkpoint.commands_committed, checkpoint.completed) == (2, 6, False)
+        assert cypher_file.read_bytes()[checkpoint.byte_offset:].startswith(b"MERGE (m:Module {unique_key: 'module:6'})")
+
+        second = RecordingClient()
+        result = upload(second, cypher_file, checkpoint_file, resume=True)
+
+        assert result.success and result.resumed_from_batch == 2
+        assert [command for batch in first.batches + second.batches for command in batch] == commands
+        assert result.total_commands_executed == 10
+        assert UploadCheckpoint.load(checkpoint_file).completed
+        assert json.loads(checkpoint_file.read_text())["batch_number"] == 4
+
+    def test_failed_batch_holds_checkpoint(self, tmp_path):
+        """Test that the checkpoint stops before a failed batch even if later batches commit."""
+        cypher_file = tmp_path / "cypher_commands.cypher"
+        checkpoint_file = tmp_path / "checkpoint.json"
+        commands = write_cypher(cypher_file, 9)
+
+        result = upload(RecordingClient(fail_batches={2}), cypher_file, checkpoint_file)
+
+        assert not result.success
+        checkpoint = UploadCheckpoint.load(checkpoint_file)
+        assert (checkpoint.batch_number, checkpoint.completed) == (1, False)
+
+        retry = RecordingClient()
+        assert upload(retry, cypher_file, checkpoint_file, resume=True).success
+        assert [command for batch in retry.batches for command in batch] == commands[3:]
+
+    def test_changed_input_refuses_resume(self, tmp_path):
+        """Test that a checkpoint is not applied to a file it was not taken from."""
+        cypher_file = tmp_path / "cypher_commands.cypher"
+        checkpoint_file = tmp_path / "checkpoint.json"
+        write_cypher(cypher_file, 6)
+        with pytest.raises(Interrupted):
+            upload(RecordingClient(die_at_batch=2), cypher_file, checkpoint_file)
+
+        cypher_file.write_text(cypher_file.read_text().replace("module:1'", "module:X'"))
+        client = RecordingClient()
+        result = upload(client, cypher_file, checkpoint_file, resume=True)
+
+        assert not result.success and client.batches == []
+        assert "does not match the checkpoint" in result.errors[0]
+
+    def test_completed_upload_resumes_to_nothing(self, tmp_path):
+        """Test that resuming a completed upload sends nothing, and a fresh run starts over."""
+        cypher_file = tmp_path / "cypher_commands.cypher"
+        checkpoint_file = tmp_path / "checkpoint.json"
+        write_cypher(cypher_file, 4)
+        assert upload(RecordingClient(), cypher_file, checkpoint_file).success
+
+        resumed = RecordingClient()
+        assert upload(resumed, cypher_file, checkpoint_file, resume=True).success
+        assert resumed.batches == []
+
+        rerun = RecordingClient()
+        assert upload(rerun, cypher_file, checkpoint_file).success
+        assert len(rerun.batches) == 2